@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import json
 import time
 import traceback
@@ -26,6 +27,7 @@ from langflow.api.utils import (
 from langflow.api.v1.schemas import FlowDataRequest, ResultDataResponse, VertexBuildResponse
 from langflow.events.event_manager import EventManager
 from langflow.exceptions.component import ComponentBuildError
+from langflow.helpers.flow import release_run_subflows
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
@@ -76,13 +78,22 @@ async def start_flow_build(
     return job_id
 
 
+# Seconds a polling request waits for the next event of a job kept in the event log
+EVENT_POLLING_TIMEOUT = 30.0
+
+
 async def get_flow_events_response(
     *,
     job_id: str,
     queue_service: JobQueueService,
     event_delivery: EventDeliveryType,
+    cursor: int | None = None,
 ):
     """Get events for a specific build job, either as a stream or single event."""
+    if queue_service.event_log is not None:
+        return await get_logged_flow_events_response(
+            job_id=job_id, queue_service=queue_service, event_delivery=event_delivery, cursor=cursor
+        )
     try:
         main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
@@ -142,6 +153,60 @@ async def get_flow_events_response(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
 
 
+async def get_logged_flow_events_response(
+    *,
+    job_id: str,
+    queue_service: JobQueueService,
+    event_delivery: EventDeliveryType,
+    cursor: int | None = None,
+):
+    """Get the events of a build job from the event log, which any worker can serve.
+
+    Polling requests return the events after ``cursor``, or after the last events returned for the
+    job when no cursor is given, and the cursor to continue from in the ``X-Event-Cursor`` header.
+    """
+    event_log = queue_service.event_log
+    if not await queue_service.job_exists(job_id):
+        await logger.aerror(f"Job not found: {job_id}")
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
+
+        async def consume_and_yield() -> AsyncIterator[str]:
+            async for event in event_log.stream(job_id, cursor or 0):
+                yield event.data.decode("utf-8")
+
+        def on_disconnect() -> None:
+            logger.debug("Client disconnected, closing tasks")
+            # The build can only be cancelled from the worker running it
+            with contextlib.suppress(JobQueueNotFoundError):
+                _, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
+                if event_task is not None:
+                    event_task.cancel()
+                event_manager.on_end(data={})
+
+        return DisconnectHandlerStreamingResponse(
+            consume_and_yield(),
+            media_type="application/x-ndjson",
+            on_disconnect=on_disconnect,
+        )
+
+    shared_cursor = cursor is None
+    if cursor is None:
+        cursor = await event_log.get_cursor(job_id)
+    try:
+        events = await event_log.wait(job_id, cursor, timeout=EVENT_POLLING_TIMEOUT)
+    except asyncio.CancelledError as exc:
+        await logger.ainfo(f"Event polling was cancelled for job {job_id}")
+        raise HTTPException(status_code=499, detail="Event polling was cancelled") from exc
+    if events:
+        cursor = events[-1].seq
+        if shared_cursor:
+            await event_log.set_cursor(job_id, cursor)
+    content = "\n".join(event.data.decode("utf-8") for event in events if not event.is_end)
+    return Response(content=content, media_type="application/x-ndjson", headers={"X-Event-Cursor": str(cursor)})
+
+
 async def create_flow_response(
     queue: asyncio.Queue,
     event_manager: EventManager,
@@ -489,6 +554,8 @@ async def generate_flow_events(
         )
         event_manager.on_error(data=error_message.data)
         raise
+    finally:
+        release_run_subflows(graph)
 
     event_manager.on_end(data={})
     await graph.end_all_traces()
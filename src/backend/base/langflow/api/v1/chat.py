@@ -203,12 +203,18 @@ async def get_build_events(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     *,
     event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+    cursor: int | None = None,
 ):
-    """Get events for a specific build job."""
+    """Get events for a specific build job.
+
+    With a job event log configured, ``cursor`` is the sequence number of the last event received,
+    returned in the ``X-Event-Cursor`` header of polling responses.
+    """
     return await get_flow_events_response(
         job_id=job_id,
         queue_service=queue_service,
         event_delivery=event_delivery,
+        cursor=cursor,
     )
 
 
@@ -644,7 +644,9 @@ async def experimental_run_flow(
 
     if session_id:
         try:
-            session_data = await session_service.load_session(session_id, flow_id=flow_id_str)
+            session_data = await session_service.load_session(
+                session_id, flow_id=flow_id_str, flow_version=flow.updated_at
+            )
         except Exception as exc:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
         graph, _artifacts = session_data or (None, None)
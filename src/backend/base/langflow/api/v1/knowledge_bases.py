@@ -6,6 +6,7 @@ from pathlib import Path
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 from langchain_chroma import Chroma
+from lfx.base.vectorstores.registry import vector_store_registry
 from lfx.log import logger
 from pydantic import BaseModel
 
@@ -398,6 +399,7 @@ async def delete_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -
 
         # Delete the entire knowledge base directory
         shutil.rmtree(kb_path)
+        vector_store_registry.invalidate(kb_path)
 
     except HTTPException:
         raise
@@ -428,6 +430,7 @@ async def delete_knowledge_bases_bulk(request: BulkDeleteRequest, current_user:
             try:
                 # Delete the entire knowledge base directory
                 shutil.rmtree(kb_path)
+                vector_store_registry.invalidate(kb_path)
                 deleted_count += 1
             except (OSError, PermissionError) as e:
                 await logger.aexception("Error deleting knowledge base '%s': %s", kb_name, e)
@@ -33,7 +33,7 @@ from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_variable_service, session_scope
-from langflow.utils.voice_utils import BYTES_PER_24K_FRAME, VAD_SAMPLE_RATE_16K, resample_24k_to_16k
+from langflow.utils.voice_utils import VAD_SAMPLE_RATE_16K, StreamingResampler
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 
@@ -771,34 +771,39 @@ async def flow_as_tool_websocket(
 
             # Setup for VAD processing.
             vad_queue: asyncio.Queue = asyncio.Queue()
-            vad_audio_buffer = bytearray()
             bot_speaking_flag = [False]
 
             async def process_vad_audio() -> None:
-                nonlocal vad_audio_buffer
                 last_speech_time = datetime.now(tz=timezone.utc)
                 vad = get_vad()
-                while True:
-                    base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
+                resampler = StreamingResampler()
+
+                def detect_speech(chunks: list[str]) -> bool:
+                    """Decode, resample and run the VAD on the chunks received, in a worker thread."""
                     has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
-                        except Exception as e:  # noqa: BLE001
-                            await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
+                    for base64_data in chunks:
+                        for frame_16k in resampler.feed(base64.b64decode(base64_data)):
+                            try:
+                                has_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K) or has_speech
+                            except Exception as e:  # noqa: BLE001
+                                logger.error(f"[ERROR] VAD processing failed: {e}")
+                    return has_speech
+
+                while True:
+                    # Process every chunk already queued at once, with a single hop to the worker thread
+                    chunks = [await vad_queue.get()]
+                    while not vad_queue.empty():
+                        chunks.append(vad_queue.get_nowait())
+                    try:
+                        has_speech = await asyncio.to_thread(detect_speech, chunks)
+                    except ValueError as e:
+                        await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
+                        continue
                     if has_speech:
+                        logger.trace("!", end="")
+                        if bot_speaking_flag[0]:
+                            msg_handler.openai_send({"type": "response.cancel"})
+                            bot_speaking_flag[0] = False
                         last_speech_time = datetime.now(tz=timezone.utc)
                         logger.trace(".", end="")
                     else:
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
+import orjson
 from fastapi import HTTPException
 from lfx.log.logger import logger
 from pydantic.v1 import BaseModel, Field, create_model
@@ -14,6 +18,7 @@ from langflow.services.deps import get_settings_service, session_scope
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
+    from datetime import datetime
 
     from lfx.graph.graph.base import Graph
     from lfx.graph.schema import RunOutputs
@@ -44,30 +49,155 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
         raise ValueError(msg) from e
 
 
-async def load_flow(
-    user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
-) -> Graph:
-    from lfx.graph.graph.base import Graph
+@dataclass
+class PreparedSubflow:
+    """A flow loaded from the database, ready to be turned into fresh graphs cheaply.
+
+    The payload is kept serialized so that every instance gets its own copy to tweak, and the
+    component classes compiled for the first instance are reused by the following ones.
+    """
+
+    flow_id: str
+    version: datetime | None
+    payload: bytes = field(repr=False)
+    component_classes: dict[str, type] = field(default_factory=dict)
+
+    def instantiate(self, user_id: str, tweaks: dict | None = None) -> Graph:
+        from lfx.custom.eval import reuse_component_classes
+        from lfx.graph.graph.base import Graph
+
+        from langflow.processing.process import process_tweaks
+
+        graph_data = orjson.loads(self.payload)
+        if tweaks:
+            graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
+        with reuse_component_classes(self.component_classes):
+            return Graph.from_payload(graph_data, flow_id=self.flow_id, user_id=user_id)
+
+
+class SubflowGraphCache:
+    """Prepared subflows reused by Run Flow, Sub Flow and flow tools.
+
+    Within a cache scope, such as the run of the parent flow, a subflow is read from the database
+    once and every further invocation only builds a fresh graph from the prepared payload. A scope
+    is released when its run ends, and at most ``max_scopes`` are kept for runs that never do.
+    Across runs, up to ``max_size`` subflows are kept per worker and reused as long as the flow's
+    ``updated_at`` did not change.
+    """
+
+    max_scopes = 64
+
+    def __init__(self) -> None:
+        self._flows: OrderedDict[str, PreparedSubflow] = OrderedDict()
+        self._scopes: OrderedDict[str, dict[tuple, PreparedSubflow]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, flow_id: str, version: datetime | None) -> PreparedSubflow | None:
+        with self._lock:
+            prepared = self._flows.get(flow_id)
+            if prepared is None or version is None or prepared.version != version:
+                return None
+            self._flows.move_to_end(flow_id)
+            return prepared
+
+    def set(self, prepared: PreparedSubflow, max_size: int) -> None:
+        if max_size <= 0 or prepared.version is None:
+            return
+        with self._lock:
+            self._flows[prepared.flow_id] = prepared
+            self._flows.move_to_end(prepared.flow_id)
+            while len(self._flows) > max_size:
+                self._flows.popitem(last=False)
+
+    def get_for_scope(self, cache_scope: str, key: tuple) -> PreparedSubflow | None:
+        with self._lock:
+            if (scope_flows := self._scopes.get(cache_scope)) is None:
+                return None
+            self._scopes.move_to_end(cache_scope)
+            return scope_flows.get(key)
+
+    def set_for_scope(self, cache_scope: str, key: tuple, prepared: PreparedSubflow) -> None:
+        with self._lock:
+            self._scopes.setdefault(cache_scope, {})[key] = prepared
+            self._scopes.move_to_end(cache_scope)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+
+    def release_scope(self, cache_scope: str) -> None:
+        """Drop the subflows prepared under ``cache_scope``."""
+        with self._lock:
+            self._scopes.pop(cache_scope, None)
+
+    def invalidate(self, flow_id: str | UUID | None = None) -> None:
+        """Drop the prepared copies of ``flow_id``, or of every flow when it is None."""
+        with self._lock:
+            if flow_id is None:
+                self._flows.clear()
+                self._scopes.clear()
+                return
+            flow_id = str(flow_id)
+            self._flows.pop(flow_id, None)
+            for scope_flows in self._scopes.values():
+                for key in [key for key, prepared in scope_flows.items() if prepared.flow_id == flow_id]:
+                    del scope_flows[key]
+
+
+subflow_graph_cache = SubflowGraphCache()
+
+
+def release_run_subflows(graph: Graph) -> None:
+    """Release the subflows prepared during the run of ``graph`` once that run has ended."""
+    try:
+        run_id = graph.run_id
+    except ValueError:
+        return
+    subflow_graph_cache.release_scope(run_id)
 
-    from langflow.processing.process import process_tweaks
 
+async def get_prepared_subflow(
+    user_id: str, flow_id: str | None = None, flow_name: str | None = None, cache_scope: str | None = None
+) -> PreparedSubflow:
     if not flow_id and not flow_name:
         msg = "Flow ID or Flow Name is required"
         raise ValueError(msg)
+    scope_key = (str(user_id), str(flow_id) if flow_id else None, flow_name)
+    if cache_scope and (prepared := subflow_graph_cache.get_for_scope(cache_scope, scope_key)):
+        return prepared
+
     if not flow_id and flow_name:
         flow_id = await find_flow(flow_name, user_id)
         if not flow_id:
             msg = f"Flow {flow_name} not found"
             raise ValueError(msg)
 
+    uuid_flow_id = UUID(flow_id) if isinstance(flow_id, str) else flow_id
+    cache_size = get_settings_service().settings.subflow_graph_cache_size
+    prepared = None
     async with session_scope() as session:
-        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
-    if not graph_data:
-        msg = f"Flow {flow_id} not found"
-        raise ValueError(msg)
-    if tweaks:
-        graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
-    return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id)
+        if cache_size > 0:
+            version = (await session.exec(select(Flow.updated_at).where(Flow.id == uuid_flow_id))).first()
+            prepared = subflow_graph_cache.get(str(flow_id), version)
+        if prepared is None:
+            flow = await session.get(Flow, uuid_flow_id)
+            if not flow or not flow.data:
+                msg = f"Flow {flow_id} not found"
+                raise ValueError(msg)
+            prepared = PreparedSubflow(flow_id=str(flow_id), version=flow.updated_at, payload=orjson.dumps(flow.data))
+            subflow_graph_cache.set(prepared, cache_size)
+    if cache_scope:
+        subflow_graph_cache.set_for_scope(cache_scope, scope_key, prepared)
+    return prepared
+
+
+async def load_flow(
+    user_id: str,
+    flow_id: str | None = None,
+    flow_name: str | None = None,
+    tweaks: dict | None = None,
+    cache_scope: str | None = None,
+) -> Graph:
+    prepared = await get_prepared_subflow(user_id, flow_id, flow_name, cache_scope=cache_scope)
+    return prepared.instantiate(user_id, tweaks)
 
 
 async def find_flow(flow_name: str, user_id: str) -> str | None:
@@ -88,12 +218,13 @@ async def run_flow(
     run_id: str | None = None,
     session_id: str | None = None,
     graph: Graph | None = None,
+    cache_scope: str | None = None,
 ) -> list[RunOutputs]:
     if user_id is None:
         msg = "Session is invalid"
         raise ValueError(msg)
     if graph is None:
-        graph = await load_flow(user_id, flow_id, flow_name, tweaks)
+        graph = await load_flow(user_id, flow_id, flow_name, tweaks, cache_scope=cache_scope)
     if run_id:
         graph.set_run_id(UUID(run_id))
     if session_id:
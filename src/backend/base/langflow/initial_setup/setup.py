@@ -1,7 +1,9 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
+import os
 import re
 import shutil
 import zipfile
@@ -9,7 +11,7 @@ from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, gettempdir
 from typing import AnyStr
 from uuid import UUID
 
@@ -19,6 +21,7 @@ import orjson
 import sqlalchemy as sa
 from aiofile import async_open
 from emoji import demojize, purely_emoji
+from filelock import FileLock, Timeout
 from lfx.base.constants import (
     FIELD_FORMAT_ATTRIBUTES,
     NODE_FORMAT_ATTRIBUTES,
@@ -1095,38 +1098,187 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
     return FolderRead.model_validate(folder_obj, from_attributes=True)
 
 
+def _get_fs_flows_sync_lock() -> FileLock:
+    """Return the lock that elects a single process to sync filesystem-backed flows.
+
+    The lock file name is derived from the database URL, so every worker of the same
+    deployment contends for the same lock while unrelated instances do not.
+    """
+    database_url = get_settings_service().settings.database_url or ""
+    digest = hashlib.sha256(database_url.encode()).hexdigest()[:16]
+    lock_file = Path(gettempdir()) / f"langflow_fs_flows_sync_{digest}.lock"
+    return FileLock(lock_file, timeout=0, thread_local=False)
+
+
+def _get_awatch():
+    """Return ``watchfiles.awatch`` if available, otherwise ``None`` to fall back to polling."""
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        return None
+    return awatch
+
+
+async def _get_fs_flow_paths() -> dict[UUID, str]:
+    """Fetch only the ids and paths of filesystem-backed flows."""
+    async with session_scope() as session:
+        stmt = select(Flow.id, Flow.fs_path).where(col(Flow.fs_path).is_not(None))
+        return {flow_id: fs_path for flow_id, fs_path in (await session.exec(stmt)).all()}
+
+
+def _resolve_fs_flow_paths(flow_paths: dict[UUID, str]) -> tuple[dict[UUID, str], set[str]]:
+    """Normalize flow paths and collect their existing parent directories. Meant to run in a worker thread."""
+    resolved = {flow_id: os.path.normcase(os.path.abspath(fs_path)) for flow_id, fs_path in flow_paths.items()}
+    dirs = {os.path.dirname(fs_path) for fs_path in resolved.values()}
+    return resolved, {directory for directory in dirs if os.path.isdir(directory)}
+
+
+def _stat_fs_flow_paths(flow_paths: dict[UUID, str]) -> dict[UUID, float]:
+    """Return the modification time of every existing flow file. Meant to run in a worker thread."""
+    mtimes = {}
+    for flow_id, fs_path in flow_paths.items():
+        try:
+            mtimes[flow_id] = Path(fs_path).stat().st_mtime
+        except OSError:
+            continue
+    return mtimes
+
+
+async def _update_flow_from_fs(flow_id: UUID, fs_path: str) -> None:
+    path = anyio.Path(fs_path)
+    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
+    async with session_scope() as session:
+        flow = await session.get(Flow, flow_id)
+        if flow is None:
+            return
+        try:
+            for field_name in ("name", "description", "data", "locked"):
+                if new_value := update_data.get(field_name):
+                    setattr(flow, field_name, new_value)
+            if folder_id := update_data.get("folder_id"):
+                flow.folder_id = UUID(folder_id)
+            flow.updated_at = datetime.now(tz=timezone.utc)
+            await session.commit()
+        except Exception:  # noqa: BLE001
+            await logger.aexception(f"Couldn't update flow {flow_id} in database from path {path}")
+
+
+async def _sync_fs_flows(flow_paths: dict[UUID, str], flow_mtimes: dict[UUID, float]) -> None:
+    """Update the given flows from their files if they changed since they were last synced."""
+    if not flow_paths:
+        return
+    mtimes = await asyncio.to_thread(_stat_fs_flow_paths, flow_paths)
+    for flow_id, new_mtime in mtimes.items():
+        if new_mtime <= flow_mtimes.get(flow_id, 0):
+            continue
+        fs_path = flow_paths[flow_id]
+        try:
+            await _update_flow_from_fs(flow_id, fs_path)
+        except Exception:  # noqa: BLE001
+            await logger.aexception(f"Error while handling flow file {fs_path}")
+        flow_mtimes[flow_id] = new_mtime
+
+
+class _FsFlowsSyncState:
+    """Tracks the filesystem-backed flows and which of them still need an explicit stat.
+
+    A flow only relies on watcher events once it has been stat-ed while its directory was
+    already being watched; until then it stays unverified and is stat-ed on every refresh.
+    Without a watcher nothing is ever watched, which degrades to plain mtime polling.
+    """
+
+    def __init__(self) -> None:
+        self.flow_paths: dict[UUID, str] = {}
+        self.resolved_paths: dict[UUID, str] = {}
+        self.flow_mtimes: dict[UUID, float] = {}
+        self.unverified: set[UUID] = set()
+        self.dirs: set[str] = set()
+        self.watched_dirs: set[str] = set()
+
+    async def refresh(self) -> bool:
+        """Reload flow paths and stat new or unverified flows. Returns True if the watched directories changed."""
+        flow_paths = await _get_fs_flow_paths()
+        to_check = self.unverified | {
+            flow_id for flow_id, fs_path in flow_paths.items() if self.flow_paths.get(flow_id) != fs_path
+        }
+        to_check &= flow_paths.keys()
+        self.flow_paths = flow_paths
+        self.flow_mtimes = {flow_id: mtime for flow_id, mtime in self.flow_mtimes.items() if flow_id in flow_paths}
+        self.resolved_paths, self.dirs = await asyncio.to_thread(_resolve_fs_flow_paths, flow_paths)
+        await _sync_fs_flows({flow_id: flow_paths[flow_id] for flow_id in to_check}, self.flow_mtimes)
+        self.unverified = {
+            flow_id for flow_id in to_check if os.path.dirname(self.resolved_paths[flow_id]) not in self.watched_dirs
+        }
+        return self.dirs != self.watched_dirs
+
+    async def handle_changes(self, changed_paths: set[str]) -> None:
+        changed = {os.path.normcase(path) for path in changed_paths}
+        flow_paths = {
+            flow_id: self.flow_paths[flow_id]
+            for flow_id, resolved_path in self.resolved_paths.items()
+            if resolved_path in changed
+        }
+        await _sync_fs_flows(flow_paths, self.flow_mtimes)
+
+
+async def _watch_fs_flows(polling_interval: float) -> None:
+    """Keep filesystem-backed flows in sync, reacting to file change events when possible.
+
+    Uses ``watchfiles`` (inotify on Linux) with debounced events, and only re-queries the
+    flow ids and paths once per polling interval to pick up added or removed flows.
+    """
+    awatch = _get_awatch()
+    if awatch is None:
+        await logger.adebug("watchfiles is not installed, polling flow files for changes")
+    interval_ms = max(int(polling_interval * 1000), 1)
+    debounce_ms = min(interval_ms, 1600)
+    loop = asyncio.get_running_loop()
+    state = _FsFlowsSyncState()
+    while True:
+        await state.refresh()
+        if awatch is None or not state.dirs:
+            await asyncio.sleep(polling_interval)
+            continue
+        state.watched_dirs = state.dirs
+        last_refresh = loop.time()
+        try:
+            async for changes in awatch(
+                *state.watched_dirs,
+                debounce=debounce_ms,
+                step=min(50, debounce_ms),
+                rust_timeout=interval_ms,
+                yield_on_timeout=True,
+            ):
+                if changes:
+                    await state.handle_changes({path for _, path in changes})
+                if loop.time() - last_refresh < polling_interval:
+                    continue
+                last_refresh = loop.time()
+                if await state.refresh():
+                    break
+        finally:
+            # Writes may be missed while no watcher is running, so stat everything again
+            state.watched_dirs = set()
+            state.unverified = set(state.flow_paths)
+
+
 async def sync_flows_from_fs():
-    flow_mtimes = {}
+    """Sync flows that have an ``fs_path`` with the contents of their files.
+
+    Only one process per deployment runs the sync; the other workers keep retrying to
+    acquire the lock so that one of them takes over if the current syncer exits.
+    """
     fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
+    lock = _get_fs_flows_sync_lock()
     try:
         while True:
             try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        path = anyio.Path(flow.fs_path)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.commit()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        await logger.aexception(
-                                            f"Couldn't update flow {flow.id} in database from path {path}"
-                                        )
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            await logger.aexception(f"Error while handling flow file {path}")
+                await asyncio.to_thread(lock.acquire)
+            except Timeout:
+                await asyncio.sleep(fs_flows_polling_interval)
+                continue
+            try:
+                await _watch_fs_flows(fs_flows_polling_interval)
             except asyncio.CancelledError:
                 await logger.adebug("Flow sync cancelled")
                 break
@@ -1138,7 +1290,7 @@ async def sync_flows_from_fs():
             except Exception:  # noqa: BLE001
                 await logger.aexception("Error while syncing flows from database")
                 break
-
-            await asyncio.sleep(fs_flows_polling_interval)
+            finally:
+                lock.release()
     except asyncio.CancelledError:
         await logger.adebug("Flow sync task cancelled")
@@ -144,7 +144,7 @@ def get_lifespan(*, fix_migration=False, version=None):
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI):
-        from lfx.interface.components import get_and_cache_all_types_dict
+        from lfx.interface.components import cache_component_types, get_and_cache_all_types_dict
 
         configure()
 
@@ -190,7 +190,7 @@ def get_lifespan(*, fix_migration=False, version=None):
 
             current_time = asyncio.get_event_loop().time()
             await logger.adebug("Caching types")
-            all_types_dict = await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
+            await cache_component_types(get_settings_service(), telemetry_service)
             await logger.adebug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             # Use file-based lock to prevent multiple workers from creating duplicate starter projects concurrently.
@@ -207,6 +207,8 @@ def get_lifespan(*, fix_migration=False, version=None):
             lock = FileLock(lock_file, timeout=1)
             try:
                 with lock:
+                    # Only the worker updating the starter projects needs every component decoded
+                    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
                     await create_or_update_starter_projects(all_types_dict)
                     await logger.adebug(
                         f"Starter projects created/updated in {asyncio.get_event_loop().time() - current_time:.2f}s"
@@ -7,7 +7,7 @@ from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from lfx.log.logger import logger
 from lfx.utils.async_helpers import run_until_complete
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -117,6 +117,18 @@ async def aget_messages(
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+async def _messages_from_reads(message_reads: list[MessageRead]) -> list[Message]:
+    """Convert persisted rows back into Message objects.
+
+    Building a Message with files checks each file on disk, so when any row has files the whole
+    batch is converted in a single worker thread instead of one thread hop per message.
+    """
+    payloads = [message.model_dump() for message in message_reads]
+    if any(payload.get("files") for payload in payloads):
+        return await asyncio.to_thread(lambda: [Message(**payload) for payload in payloads])
+    return [Message(**payload) for payload in payloads]
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
@@ -145,7 +157,7 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
             messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+        return await _messages_from_reads(messages_models)
     except Exception as e:
         await logger.aexception(e)
         raise
@@ -181,11 +193,63 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
         return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
 
 
+def _decode_json_field(value):
+    """Decode a JSON column value that may still be a serialized string."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _messagetable_to_row(message: MessageTable) -> dict:
+    """Build the insert parameters for a message, decoding JSON fields exactly once."""
+    return {
+        "id": message.id,
+        "timestamp": message.timestamp,
+        "sender": message.sender,
+        "sender_name": message.sender_name,
+        "session_id": message.session_id,
+        "context_id": message.context_id,
+        "text": message.text,
+        "files": message.files or [],
+        "error": message.error,
+        "edit": message.edit,
+        "flow_id": message.flow_id,
+        "properties": _decode_json_field(message.properties),
+        "category": message.category,
+        "content_blocks": [_decode_json_field(block) for block in message.content_blocks or []],
+    }
+
+
+def _supports_bulk_returning(session: AsyncSession) -> bool:
+    bind = session.bind
+    dialect = getattr(bind, "dialect", None)
+    return bool(dialect is not None and getattr(dialect, "insert_executemany_returning", False))
+
+
+async def _bulk_insert_messagetables(messages: list[MessageTable], session: AsyncSession) -> list[MessageRead]:
+    """Insert all messages with a single executemany statement.
+
+    When the database supports ``INSERT ... RETURNING`` for executemany (SQLite >= 3.35, PostgreSQL)
+    the persisted rows are read back by the same statement, which replaces a ``session.refresh`` per
+    message. Otherwise the rows are built from the inserted values, which are all generated client-side.
+    """
+    rows = [_messagetable_to_row(message) for message in messages]
+    if not rows:
+        return []
+    if _supports_bulk_returning(session):
+        stmt = insert(MessageTable).returning(MessageTable, sort_by_parameter_order=True)
+        inserted = (await session.exec(stmt, params=rows)).scalars().all()
+        for message in inserted:
+            message.category = message.category or ""
+        return [MessageRead.model_validate(message, from_attributes=True) for message in inserted]
+    await session.exec(insert(MessageTable), params=rows)
+    for row in rows:
+        row["category"] = row["category"] or ""
+    return [MessageRead.model_validate(row) for row in rows]
+
+
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
     try:
         try:
-            for message in messages:
-                session.add(message)
+            message_reads = await _bulk_insert_messagetables(messages, session)
             await session.commit()
             # This is a hack.
             # We are doing this because build_public_tmp causes the CancelledError to be raised
@@ -193,8 +257,6 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         except asyncio.CancelledError:
             await session.rollback()
             return await aadd_messagetables(messages, session)
-        for message in messages:
-            await session.refresh(message)
     except asyncio.CancelledError as e:
         await logger.aexception(e)
         error_msg = "Operation cancelled"
@@ -203,14 +265,7 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         await logger.aexception(e)
         raise
 
-    new_messages = []
-    for msg in messages:
-        msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
-        msg.content_blocks = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]  # type: ignore[arg-type]
-        msg.category = msg.category or ""
-        new_messages.append(msg)
-
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    return message_reads
 
 
 def delete_messages(session_id: str | None = None, context_id: str | None = None) -> None:
@@ -7,6 +7,7 @@ from lfx.log.logger import logger
 from lfx.processing.utils import validate_and_repair_json
 from pydantic import BaseModel
 
+from langflow.helpers.flow import release_run_subflows
 from langflow.schema.graph import InputValue, Tweaks
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.deps import get_settings_service
@@ -49,16 +50,19 @@ async def run_graph_internal(
 
     fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
     graph.session_id = effective_session_id
-    run_outputs = await graph.arun(
-        inputs=inputs_list,
-        inputs_components=components,
-        types=types,
-        outputs=outputs or [],
-        stream=stream,
-        session_id=effective_session_id or "",
-        fallback_to_env_vars=fallback_to_env_vars,
-        event_manager=event_manager,
-    )
+    try:
+        run_outputs = await graph.arun(
+            inputs=inputs_list,
+            inputs_components=components,
+            types=types,
+            outputs=outputs or [],
+            stream=stream,
+            session_id=effective_session_id or "",
+            fallback_to_env_vars=fallback_to_env_vars,
+            event_manager=event_manager,
+        )
+    finally:
+        release_run_subflows(graph)
     return run_outputs, effective_session_id
 
 
@@ -110,15 +114,18 @@ async def run_graph(
         components.append(input_value_request.components or [])
         inputs_list.append({INPUT_FIELD_NAME: input_value_request.input_value})
         types.append(input_value_request.type)
-    return await graph.arun(
-        inputs_list,
-        inputs_components=components,
-        types=types,
-        outputs=outputs or [],
-        stream=stream,
-        session_id=session_id,
-        fallback_to_env_vars=fallback_to_env_vars,
-    )
+    try:
+        return await graph.arun(
+            inputs_list,
+            inputs_components=components,
+            types=types,
+            outputs=outputs or [],
+            stream=stream,
+            session_id=session_id,
+            fallback_to_env_vars=fallback_to_env_vars,
+        )
+    finally:
+        release_run_subflows(graph)
 
 
 def validate_input(
@@ -3,6 +3,7 @@ import random
 import warnings
 from collections.abc import Coroutine
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
@@ -539,10 +540,15 @@ def ensure_valid_key(s: str) -> bytes:
     return key
 
 
+@lru_cache(maxsize=8)
+def _get_fernet_for_key(secret_key: str) -> Fernet:
+    return Fernet(ensure_valid_key(secret_key))
+
+
 def get_fernet(settings_service: SettingsService):
+    # Deriving the key and building the cipher is done once per secret key, not on every call
     secret_key: str = settings_service.auth_settings.SECRET_KEY.get_secret_value()
-    valid_key = ensure_valid_key(secret_key)
-    return Fernet(valid_key)
+    return _get_fernet_for_key(secret_key)
 
 
 def encrypt_api_key(api_key: str, settings_service: SettingsService):
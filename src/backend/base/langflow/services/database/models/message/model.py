@@ -91,14 +91,16 @@ class MessageBase(SQLModel):
         # async iterator so we simply add it as an empty string
         message_text = "" if not isinstance(message.text, str) else message.text
 
+        # Dump to JSON-compatible dicts rather than JSON strings so the rows can be
+        # inserted as-is without decoding them again before persisting
         properties = (
-            message.properties.model_dump_json()
-            if hasattr(message.properties, "model_dump_json")
+            message.properties.model_dump(mode="json")
+            if hasattr(message.properties, "model_dump")
             else message.properties
         )
         content_blocks = []
         for content_block in message.content_blocks or []:
-            content = content_block.model_dump_json() if hasattr(content_block, "model_dump_json") else content_block
+            content = content_block.model_dump(mode="json") if hasattr(content_block, "model_dump") else content_block
             content_blocks.append(content)
 
         if isinstance(flow_id, str):
@@ -54,7 +54,8 @@ class ServiceManager(BaseServiceManager):
         for name in service_names:
             try:
                 # Special handling for services that are in lfx module
-                base_module = "lfx.services" if name in ["settings", "mcp_composer"] else "langflow.services"
+                lfx_services = ["settings", "mcp_composer", "http_client"]
+                base_module = "lfx.services" if name in lfx_services else "langflow.services"
                 module_name = f"{base_module}.{name}.factory"
                 module = importlib.import_module(module_name)
 
@@ -0,0 +1,324 @@
+"""Event logs shared by the workers serving build jobs.
+
+The worker running a build appends its events to the log with increasing sequence numbers, and
+any worker can read them back from a cursor, stream them or long-poll for the next ones. This
+lets ``/build/{job_id}/events`` be served by any worker, without sticky sessions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    import aiosqlite
+    from redis.asyncio import StrictRedis
+
+
+class JobEvent(NamedTuple):
+    """An event of a build job. ``data`` is None for the event marking the end of the job."""
+
+    seq: int
+    data: bytes | None
+
+    @property
+    def is_end(self) -> bool:
+        return self.data is None
+
+
+class JobEventLog(ABC):
+    """Append-only log of the events of build jobs, with bounded retention.
+
+    Args:
+        max_events: Number of events kept per job. Older events are dropped first.
+        ttl: Seconds a job's events are kept after its last event.
+        poll_interval: Seconds between reads when waiting for events appended by another worker.
+    """
+
+    def __init__(self, *, max_events: int = 10_000, ttl: float = 3600, poll_interval: float = 0.05) -> None:
+        self.max_events = max_events
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        # Wakes up readers in this worker as soon as an event is appended here
+        self._appended: dict[str, asyncio.Event] = {}
+
+    @abstractmethod
+    async def create(self, job_id: str) -> None:
+        """Register a job, so that it exists before its first event."""
+
+    @abstractmethod
+    async def _append(self, job_id: str, values: Sequence[bytes | None]) -> int:
+        """Append ``values`` to the job's events and return the sequence number of the last one."""
+
+    @abstractmethod
+    async def read(self, job_id: str, cursor: int = 0, limit: int = 1000) -> list[JobEvent]:
+        """Return up to ``limit`` events of the job with a sequence number greater than ``cursor``."""
+
+    @abstractmethod
+    async def exists(self, job_id: str) -> bool:
+        """Return whether the job is known to the log."""
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        """Drop the job and its events."""
+
+    @abstractmethod
+    async def get_cursor(self, job_id: str) -> int:
+        """Return the shared cursor of the job, used by readers that do not keep their own."""
+
+    @abstractmethod
+    async def set_cursor(self, job_id: str, cursor: int) -> None:
+        """Move the shared cursor of the job."""
+
+    async def prune(self) -> None:  # noqa: B027
+        """Drop the jobs whose events expired. Backends that expire keys themselves have nothing to do."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the resources of the log."""
+
+    async def append(self, job_id: str, values: Sequence[bytes | None]) -> int:
+        """Append ``values`` to the job's events, in order.
+
+        Returns:
+            The sequence number of the last event appended.
+        """
+        seq = await self._append(job_id, values)
+        if (appended := self._appended.get(job_id)) is not None:
+            appended.set()
+        return seq
+
+    async def wait(self, job_id: str, cursor: int = 0, timeout: float = 30.0, limit: int = 1000) -> list[JobEvent]:
+        """Return the events after ``cursor``, waiting up to ``timeout`` seconds for one if there are none yet."""
+        deadline = time.monotonic() + timeout
+        while True:
+            appended = self._appended.setdefault(job_id, asyncio.Event())
+            appended.clear()
+            events = await self.read(job_id, cursor, limit)
+            remaining = deadline - time.monotonic()
+            if events or remaining <= 0:
+                return events
+            try:
+                await asyncio.wait_for(appended.wait(), min(self.poll_interval, remaining))
+            except asyncio.TimeoutError:
+                continue
+
+    async def stream(self, job_id: str, cursor: int = 0) -> AsyncIterator[JobEvent]:
+        """Yield the events after ``cursor`` as they are appended, until the end of the job."""
+        while True:
+            for event in await self.wait(job_id, cursor):
+                if event.is_end:
+                    return
+                cursor = event.seq
+                yield event
+
+
+class SQLiteJobEventLog(JobEventLog):
+    """Event log in a SQLite database, shared by the workers of a single host."""
+
+    def __init__(self, path: str | Path, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self._connection: aiosqlite.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        if self._connection is None:
+            import aiosqlite
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = await aiosqlite.connect(self.path, isolation_level=None)
+            # WAL lets readers of other workers run while the worker running the job appends
+            await connection.execute("PRAGMA journal_mode=WAL")
+            await connection.execute("PRAGMA synchronous=NORMAL")
+            await connection.execute("PRAGMA busy_timeout=5000")
+            await connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_event_jobs "
+                "(job_id TEXT PRIMARY KEY, last_seq INTEGER NOT NULL, cursor INTEGER NOT NULL, updated_at REAL)"
+            )
+            await connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_events "
+                "(job_id TEXT NOT NULL, seq INTEGER NOT NULL, data BLOB, PRIMARY KEY (job_id, seq))"
+            )
+            self._connection = connection
+        return self._connection
+
+    async def create(self, job_id: str) -> None:
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute(
+                "INSERT OR IGNORE INTO job_event_jobs VALUES (?, 0, 0, ?)",
+                (job_id, time.time()),
+            )
+
+    async def _append(self, job_id: str, values: Sequence[bytes | None]) -> int:
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute("BEGIN IMMEDIATE")
+            try:
+                await connection.execute(
+                    "INSERT OR IGNORE INTO job_event_jobs VALUES (?, 0, 0, ?)",
+                    (job_id, time.time()),
+                )
+                async with connection.execute(
+                    "SELECT last_seq FROM job_event_jobs WHERE job_id = ?", (job_id,)
+                ) as cursor:
+                    (last_seq,) = await cursor.fetchone()
+                await connection.executemany(
+                    "INSERT INTO job_events VALUES (?, ?, ?)",
+                    [(job_id, last_seq + offset, value) for offset, value in enumerate(values, start=1)],
+                )
+                last_seq += len(values)
+                await connection.execute(
+                    "UPDATE job_event_jobs SET last_seq = ?, updated_at = ? WHERE job_id = ?",
+                    (last_seq, time.time(), job_id),
+                )
+                await connection.execute(
+                    "DELETE FROM job_events WHERE job_id = ? AND seq <= ?",
+                    (job_id, last_seq - self.max_events),
+                )
+            except BaseException:
+                await connection.execute("ROLLBACK")
+                raise
+            await connection.execute("COMMIT")
+            return last_seq
+
+    async def read(self, job_id: str, cursor: int = 0, limit: int = 1000) -> list[JobEvent]:
+        async with self._lock:
+            connection = await self._connect()
+            async with connection.execute(
+                "SELECT seq, data FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, cursor, limit),
+            ) as rows:
+                return [JobEvent(seq, data) for seq, data in await rows.fetchall()]
+
+    async def exists(self, job_id: str) -> bool:
+        async with self._lock:
+            connection = await self._connect()
+            async with connection.execute("SELECT 1 FROM job_event_jobs WHERE job_id = ?", (job_id,)) as rows:
+                return await rows.fetchone() is not None
+
+    async def delete(self, job_id: str) -> None:
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute("DELETE FROM job_events WHERE job_id = ?", (job_id,))
+            await connection.execute("DELETE FROM job_event_jobs WHERE job_id = ?", (job_id,))
+        self._appended.pop(job_id, None)
+
+    async def get_cursor(self, job_id: str) -> int:
+        async with self._lock:
+            connection = await self._connect()
+            async with connection.execute("SELECT cursor FROM job_event_jobs WHERE job_id = ?", (job_id,)) as rows:
+                row = await rows.fetchone()
+        return row[0] if row else 0
+
+    async def set_cursor(self, job_id: str, cursor: int) -> None:
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute("UPDATE job_event_jobs SET cursor = ? WHERE job_id = ?", (cursor, job_id))
+
+    async def prune(self) -> None:
+        expired_before = time.time() - self.ttl
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute(
+                "DELETE FROM job_events WHERE job_id IN (SELECT job_id FROM job_event_jobs WHERE updated_at < ?)",
+                (expired_before,),
+            )
+            await connection.execute("DELETE FROM job_event_jobs WHERE updated_at < ?", (expired_before,))
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+
+class RedisJobEventLog(JobEventLog):
+    """Event log in Redis streams, shared by workers on any host.
+
+    Each job has a stream of events whose entry ids are ``<seq>-0``, so readers can block on
+    ``XREAD`` from their cursor. Keys expire ``ttl`` seconds after the last event.
+    """
+
+    def __init__(self, client: StrictRedis, *, prefix: str = "langflow:job_events", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_settings(cls, *, host: str, port: int, db: int, url: str | None, **kwargs) -> RedisJobEventLog:
+        # Redis is a main dependency, no need to import check
+        from redis.asyncio import StrictRedis
+
+        client = StrictRedis.from_url(url) if url else StrictRedis(host=host, port=port, db=db)
+        return cls(client, **kwargs)
+
+    def _keys(self, job_id: str) -> tuple[str, str, str]:
+        key = f"{self.prefix}:{job_id}"
+        return f"{key}:events", f"{key}:seq", f"{key}:cursor"
+
+    async def create(self, job_id: str) -> None:
+        _, seq_key, _ = self._keys(job_id)
+        await self._client.set(seq_key, 0, nx=True, ex=int(self.ttl))
+
+    async def _append(self, job_id: str, values: Sequence[bytes | None]) -> int:
+        events_key, seq_key, cursor_key = self._keys(job_id)
+        last_seq = await self._client.incrby(seq_key, len(values))
+        async with self._client.pipeline(transaction=True) as pipe:
+            for seq, value in enumerate(values, start=last_seq - len(values) + 1):
+                fields = {"end": 1} if value is None else {"data": value}
+                pipe.xadd(events_key, fields, id=f"{seq}-0", maxlen=self.max_events, approximate=False)
+            for key in (events_key, seq_key, cursor_key):
+                pipe.expire(key, int(self.ttl))
+            await pipe.execute()
+        return last_seq
+
+    @staticmethod
+    def _to_events(entries) -> list[JobEvent]:
+        events = []
+        for entry_id, fields in entries:
+            seq = int((entry_id.decode() if isinstance(entry_id, bytes) else entry_id).split("-", 1)[0])
+            events.append(JobEvent(seq, None if b"end" in fields else fields[b"data"]))
+        return events
+
+    async def read(self, job_id: str, cursor: int = 0, limit: int = 1000) -> list[JobEvent]:
+        events_key, _, _ = self._keys(job_id)
+        return self._to_events(await self._client.xrange(events_key, min=f"{cursor + 1}-0", count=limit))
+
+    async def wait(self, job_id: str, cursor: int = 0, timeout: float = 30.0, limit: int = 1000) -> list[JobEvent]:
+        events_key, _, _ = self._keys(job_id)
+        response = await self._client.xread(
+            {events_key: f"{cursor}-0"}, count=limit, block=max(int(timeout * 1000), 1)
+        )
+        if not response:
+            return []
+        _, entries = response[0]
+        return self._to_events(entries)
+
+    async def exists(self, job_id: str) -> bool:
+        _, seq_key, _ = self._keys(job_id)
+        return bool(await self._client.exists(seq_key))
+
+    async def delete(self, job_id: str) -> None:
+        await self._client.delete(*self._keys(job_id))
+
+    async def get_cursor(self, job_id: str) -> int:
+        _, _, cursor_key = self._keys(job_id)
+        cursor = await self._client.get(cursor_key)
+        return int(cursor) if cursor else 0
+
+    async def set_cursor(self, job_id: str, cursor: int) -> None:
+        _, _, cursor_key = self._keys(job_id)
+        await self._client.set(cursor_key, cursor, ex=int(self.ttl))
+
+    async def close(self) -> None:
+        try:
+            await self._client.aclose()
+        except Exception as exc:  # noqa: BLE001
+            await logger.adebug(f"Error closing the Redis job event log: {exc}")
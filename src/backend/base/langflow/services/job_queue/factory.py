@@ -1,11 +1,36 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
+from langflow.services.job_queue.event_log import RedisJobEventLog, SQLiteJobEventLog
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        retention = {"max_events": settings.job_event_log_max_events, "ttl": settings.job_event_log_ttl}
+        if settings.job_event_log == "sqlite":
+            path = settings.job_event_log_path or Path(settings.config_dir or ".") / "job_events.db"
+            return JobQueueService(event_log=SQLiteJobEventLog(path, **retention))
+        if settings.job_event_log == "redis":
+            event_log = RedisJobEventLog.from_settings(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                **retention,
+            )
+            return JobQueueService(event_log=event_log)
         return JobQueueService()
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+from typing import TYPE_CHECKING
 
 from lfx.log.logger import logger
 
 from langflow.events.event_manager import EventManager
 from langflow.services.base import Service
 
+if TYPE_CHECKING:
+    from langflow.services.job_queue.event_log import JobEventLog
+
 
 class JobQueueNotFoundError(Exception):
     """Exception raised when a job queue is not found."""
@@ -41,6 +46,8 @@ class JobQueueService(Service):
               * The cleanup timestamp (if any).
         _cleanup_task (asyncio.Task | None): Background task for periodic cleanup.
         _closed (bool): Flag indicating whether the service is currently active.
+        event_log (JobEventLog | None): Log the events of each job are forwarded to, so that any worker can
+            serve them. When None, events are only available from the worker running the job.
         CLEANUP_GRACE_PERIOD (int): Number of seconds to wait after a task is marked for cleanup
             before actually removing it. This grace period allows for:
               * Pending operations to complete
@@ -61,13 +68,18 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, event_log: JobEventLog | None = None) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            event_log (JobEventLog | None): Log shared by the workers the events of each job are forwarded to.
         """
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
+        self._forwarders: dict[str, asyncio.Task] = {}
+        self.event_log = event_log
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
@@ -117,6 +129,8 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        if self.event_log is not None:
+            await self.event_log.close()
         await logger.adebug("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
@@ -182,8 +196,46 @@ class JobQueueService(Service):
         # Initiate the new asynchronous task.
         task = asyncio.create_task(task_coro)
         self._queues[job_id] = (main_queue, event_manager, task, None)
+        if self.event_log is not None:
+            if (forwarder := self._forwarders.pop(job_id, None)) is not None:
+                forwarder.cancel()
+            self._forwarders[job_id] = asyncio.create_task(self._forward_events(job_id, main_queue, task))
         logger.debug(f"New task started for job_id {job_id}")
 
+    async def job_exists(self, job_id: str) -> bool:
+        """Check whether the job runs in this worker or, with an event log, in any worker.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+        """
+        if job_id in self._queues:
+            return True
+        return self.event_log is not None and await self.event_log.exists(job_id)
+
+    async def _forward_events(self, job_id: str, queue: asyncio.Queue, task: asyncio.Task) -> None:
+        """Move the events of a job from its queue to the event log, until the end of the job.
+
+        The events available at once are appended together. The end of the job is recorded when the
+        end marker is put in the queue, or when the task finishes without putting it, for example
+        when it fails or is cancelled.
+        """
+        await self.event_log.create(job_id)
+        while True:
+            if queue.empty() and task.done():
+                await self.event_log.append(job_id, [None])
+                return
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                continue
+            values = [getter.result()[1]]
+            while values[-1] is not None and not queue.empty():
+                values.append(queue.get_nowait()[1])
+            await self.event_log.append(job_id, values)
+            if values[-1] is None:
+                return
+
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
@@ -237,6 +289,13 @@ class JobQueueService(Service):
                 await logger.aerror(f"Error in task for job_id {job_id}: {exc}")
             await logger.adebug(f"Task cancellation complete for job_id {job_id}")
 
+        # Stop forwarding events once the end of the cancelled task has been recorded
+        if (forwarder := self._forwarders.pop(job_id, None)) is not None:
+            if not forwarder.done():
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(asyncio.shield(forwarder), timeout=1)
+            forwarder.cancel()
+
         # Clear the queue since we just cancelled the task or it has completed
         items_cleared = 0
         while not main_queue.empty():
@@ -274,6 +333,8 @@ class JobQueueService(Service):
     async def _cleanup_old_queues(self) -> None:
         """Scan all registered job queues and clean up those with completed or failed tasks."""
         current_time = asyncio.get_running_loop().time()
+        if self.event_log is not None:
+            await self.event_log.prune()
 
         for job_id in list(self._queues.keys()):
             _, _, task, cleanup_time = self._queues[job_id]
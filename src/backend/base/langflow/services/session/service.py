@@ -5,7 +5,7 @@ from lfx.services.cache.utils import CacheMiss
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService
-from langflow.services.session.utils import compute_dict_hash, session_id_generator
+from langflow.services.session.utils import get_graph_fingerprint, session_id_generator
 
 if TYPE_CHECKING:
     from langflow.services.cache.base import CacheService
@@ -17,7 +17,7 @@ class SessionService(Service):
     def __init__(self, cache_service) -> None:
         self.cache_service: CacheService | AsyncBaseCacheService = cache_service
 
-    async def load_session(self, key, flow_id: str, data_graph: dict | None = None):
+    async def load_session(self, key, flow_id: str, data_graph: dict | None = None, flow_version=None):
         # Check if the data is cached
         if isinstance(self.cache_service, AsyncBaseCacheService):
             value = await self.cache_service.get(key)
@@ -27,7 +27,7 @@ class SessionService(Service):
             return value
 
         if key is None:
-            key = self.generate_key(session_id=None, data_graph=data_graph)
+            key = self.generate_key(session_id=None, data_graph=data_graph, flow_id=flow_id, flow_version=flow_version)
         if data_graph is None:
             return None, None
         # If not cached, build the graph and cache it
@@ -40,16 +40,17 @@ class SessionService(Service):
         return graph, artifacts
 
     @staticmethod
-    def build_key(session_id, data_graph) -> str:
-        json_hash = compute_dict_hash(data_graph)
+    def build_key(session_id, data_graph, flow_id=None, flow_version=None) -> str:
+        # The fingerprint is remembered per flow version when the flow id and version are given
+        json_hash = get_graph_fingerprint(data_graph, flow_id=flow_id, flow_version=flow_version)
         return f"{session_id}{':' if session_id else ''}{json_hash}"
 
-    def generate_key(self, session_id, data_graph):
+    def generate_key(self, session_id, data_graph, flow_id=None, flow_version=None):
         # Hash the JSON and combine it with the session_id to create a unique key
         if session_id is None:
             # generate a 5 char session_id to concatenate with the json_hash
             session_id = session_id_generator()
-        return self.build_key(session_id, data_graph=data_graph)
+        return self.build_key(session_id, data_graph=data_graph, flow_id=flow_id, flow_version=flow_version)
 
     async def update_session(self, session_id, value) -> None:
         if isinstance(self.cache_service, AsyncBaseCacheService):
@@ -1,10 +1,22 @@
 import hashlib
 import random
 import string
+import threading
+
+import orjson
+from cachetools import LRUCache
 
 from langflow.services.cache.utils import filter_json
 from langflow.services.database.models.base import orjson_dumps
 
+# Number of flow versions whose fingerprint is remembered
+GRAPH_FINGERPRINT_CACHE_SIZE = 1024
+# Template keys that change how a field is resolved at run time, besides its value
+EXECUTION_FIELD_KEYS = ("value", "load_from_db", "file_path")
+
+_graph_fingerprints: LRUCache = LRUCache(maxsize=GRAPH_FINGERPRINT_CACHE_SIZE)
+_graph_fingerprints_lock = threading.Lock()
+
 
 def session_id_generator(size=6):
     return "".join(random.SystemRandom().choices(string.ascii_uppercase + string.digits, k=size))
@@ -16,3 +28,55 @@ def compute_dict_hash(graph_data):
     cleaned_graph_json = orjson_dumps(graph_data, sort_keys=True)
 
     return hashlib.sha256(cleaned_graph_json.encode("utf-8")).hexdigest()
+
+
+def _node_structure(node: dict) -> tuple:
+    data = node.get("data") or {}
+    component = data.get("node") or {}
+    fields = {
+        name: [field.get(key) for key in EXECUTION_FIELD_KEYS]
+        for name, field in (component.get("template") or {}).items()
+        if isinstance(field, dict)
+    }
+    outputs = [
+        [output.get("name"), output.get("selected"), output.get("cache")]
+        for output in component.get("outputs") or []
+        if isinstance(output, dict)
+    ]
+    return node.get("id"), data.get("type"), component.get("frozen"), fields, outputs
+
+
+def _edge_structure(edge: dict) -> str:
+    ends = (edge.get("source"), edge.get("target"), edge.get("sourceHandle"), edge.get("targetHandle"))
+    return orjson.dumps(ends, option=orjson.OPT_SORT_KEYS, default=str).decode()
+
+
+def compute_graph_fingerprint(graph_data: dict) -> str:
+    """Return a hash of the parts of a flow that change how it runs.
+
+    Unlike :func:`compute_dict_hash`, the layout of the flow and the display properties of its
+    fields are ignored, so it only serializes the ids, types and field values of the nodes and the
+    ends of the edges. Flows that run the same share a fingerprint.
+    """
+    nodes = sorted((_node_structure(node) for node in graph_data.get("nodes") or []), key=lambda node: str(node[0]))
+    edges = sorted(_edge_structure(edge) for edge in graph_data.get("edges") or [])
+    payload = orjson.dumps([nodes, edges], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def get_graph_fingerprint(graph_data: dict, flow_id: str | None = None, flow_version: object | None = None) -> str:
+    """Return the fingerprint of a flow, computed once per ``flow_id`` and ``flow_version``.
+
+    ``flow_version`` must change whenever the flow is saved, e.g. its ``updated_at``. The fingerprint
+    is computed on each call when either is missing.
+    """
+    if flow_id is None or flow_version is None:
+        return compute_graph_fingerprint(graph_data)
+    key = (str(flow_id), str(flow_version))
+    with _graph_fingerprints_lock:
+        fingerprint = _graph_fingerprints.get(key)
+    if fingerprint is None:
+        fingerprint = compute_graph_fingerprint(graph_data)
+        with _graph_fingerprints_lock:
+            _graph_fingerprints[key] = fingerprint
+    return fingerprint
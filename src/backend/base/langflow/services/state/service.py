@@ -1,5 +1,7 @@
-from collections import defaultdict
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 
 from lfx.log.logger import logger
@@ -7,6 +9,9 @@ from lfx.services.settings.service import SettingsService
 
 from langflow.services.base import Service
 
+# Number of independently locked shards the states of the runs are spread over
+STATE_SHARDS = 32
+
 
 class StateService(Service):
     name = "state_service"
@@ -20,6 +25,9 @@ class StateService(Service):
     def get_state(self, key, run_id: str):
         raise NotImplementedError
 
+    def clear_run(self, run_id: str) -> None:
+        raise NotImplementedError
+
     def subscribe(self, key, observer: Callable) -> None:
         raise NotImplementedError
 
@@ -30,46 +38,116 @@ class StateService(Service):
         raise NotImplementedError
 
 
+class _StateShard:
+    """The states of a subset of the runs, least recently used first."""
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # run_id -> (time of the last use, states of the run)
+        self.runs: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+
 class InMemoryStateService(StateService):
+    """Keeps the state of each run in memory, sharded by run id.
+
+    Runs only contend for the lock of their shard. The state of a run is dropped by ``clear_run``
+    when the run ends, or once it was not used for ``run_state_ttl`` seconds or is the least
+    recently used beyond ``run_state_max_runs`` runs. Observers are notified after the state was
+    changed and its lock released, from a background thread if ``run_state_async_observers`` is set.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.states: dict[str, dict] = {}
-        self.observers: dict[str, list[Callable]] = defaultdict(list)
+        settings = settings_service.settings
+        self.ttl = settings.run_state_ttl
+        self.max_runs_per_shard = max(1, -(-settings.run_state_max_runs // STATE_SHARDS))
+        self._shards = [_StateShard() for _ in range(STATE_SHARDS)]
+        # Lists of observers are replaced, never modified, so they can be notified without a lock
+        self.observers: dict[str, tuple[Callable, ...]] = {}
         self.lock = Lock()
+        self._notifier = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-observers")
+            if settings.run_state_async_observers
+            else None
+        )
+
+    def _shard(self, run_id: str) -> _StateShard:
+        return self._shards[hash(run_id) % STATE_SHARDS]
+
+    def _run_states(self, shard: _StateShard, run_id: str) -> dict:
+        """Return the states of ``run_id``, creating them if needed. Must be called with the shard lock held."""
+        now = time.monotonic()
+        entry = shard.runs.pop(run_id, None)
+        states = entry[1] if entry is not None else {}
+        shard.runs[run_id] = (now, states)
+        # Runs are ordered by last use, expired ones are at the front
+        while len(shard.runs) > self.max_runs_per_shard or now - next(iter(shard.runs.values()))[0] > self.ttl:
+            shard.runs.popitem(last=False)
+        return states
 
     def append_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            if key not in self.states[run_id]:
-                self.states[run_id][key] = []
-            elif not isinstance(self.states[run_id][key], list):
-                self.states[run_id][key] = [self.states[run_id][key]]
-            self.states[run_id][key].append(new_state)
-            self.notify_append_observers(key, new_state)
+        shard = self._shard(run_id)
+        with shard.lock:
+            states = self._run_states(shard, run_id)
+            if key not in states:
+                states[key] = []
+            elif not isinstance(states[key], list):
+                states[key] = [states[key]]
+            states[key].append(new_state)
+        self._notify(self.notify_append_observers, key, new_state)
 
     def update_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            self.states[run_id][key] = new_state
-            self.notify_observers(key, new_state)
+        shard = self._shard(run_id)
+        with shard.lock:
+            self._run_states(shard, run_id)[key] = new_state
+        self._notify(self.notify_observers, key, new_state)
 
     def get_state(self, key, run_id: str):
-        with self.lock:
-            return self.states.get(run_id, {}).get(key, "")
+        shard = self._shard(run_id)
+        with shard.lock:
+            entry = shard.runs.pop(run_id, None)
+            now = time.monotonic()
+            if entry is None or now - entry[0] > self.ttl:
+                return ""
+            shard.runs[run_id] = (now, entry[1])
+            return entry[1].get(key, "")
+
+    def clear_run(self, run_id: str) -> None:
+        """Drop the state of a run, e.g. when it ended."""
+        shard = self._shard(run_id)
+        with shard.lock:
+            shard.runs.pop(run_id, None)
+
+    def __len__(self) -> int:
+        return sum(len(shard.runs) for shard in self._shards)
 
     def subscribe(self, key, observer: Callable) -> None:
         with self.lock:
-            if observer not in self.observers[key]:
-                self.observers[key].append(observer)
+            observers = self.observers.get(key, ())
+            if observer not in observers:
+                self.observers[key] = (*observers, observer)
+
+    def _notify(self, notify: Callable, key, new_state) -> None:
+        if key not in self.observers:
+            return
+        if self._notifier is None:
+            notify(key, new_state)
+        else:
+            self._notifier.submit(self._notify_in_background, notify, key, new_state)
+
+    @staticmethod
+    def _notify_in_background(notify: Callable, key, new_state) -> None:
+        try:
+            notify(key, new_state)
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error notifying the observers of key {key}")
 
     def notify_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
+        for callback in self.observers.get(key, ()):
             callback(key, new_state, append=False)
 
     def notify_append_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
+        for callback in self.observers.get(key, ()):
             try:
                 callback(key, new_state, append=True)
             except Exception:  # noqa: BLE001
@@ -78,6 +156,14 @@ class InMemoryStateService(StateService):
 
     def unsubscribe(self, key, observer: Callable) -> None:
         with self.lock:
-            if observer in self.observers[key]:
-                # Use list.remove() since observers[key] is a list
-                self.observers[key].remove(observer)
+            observers = self.observers.get(key, ())
+            if observer in observers:
+                remaining = tuple(callback for callback in observers if callback != observer)
+                if remaining:
+                    self.observers[key] = remaining
+                else:
+                    del self.observers[key]
+
+    async def teardown(self) -> None:
+        if self._notifier is not None:
+            self._notifier.shutdown(wait=True)
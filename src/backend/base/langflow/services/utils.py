@@ -229,6 +229,7 @@ def register_all_service_factories() -> None:
     from lfx.services.manager import get_service_manager
 
     service_manager = get_service_manager()
+    from lfx.services.http_client import factory as http_client_factory
     from lfx.services.mcp_composer import factory as mcp_composer_factory
     from lfx.services.settings import factory as settings_factory
 
@@ -264,6 +265,7 @@ def register_all_service_factories() -> None:
     service_manager.register_factory(shared_component_cache_factory.SharedComponentCacheServiceFactory())
     service_manager.register_factory(auth_factory.AuthServiceFactory())
     service_manager.register_factory(mcp_composer_factory.MCPComposerServiceFactory())
+    service_manager.register_factory(http_client_factory.HTTPClientServiceFactory())
     service_manager.set_factory_registered()
 
 
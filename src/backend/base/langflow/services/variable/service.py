@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import os
+import threading
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
+from lfx.base.models.model_registry import model_instance_registry
 from lfx.log.logger import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -15,16 +18,44 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from lfx.services.settings.service import SettingsService
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+# Decrypted values kept per worker, so that a flow run does not query and decrypt each variable again
+VARIABLE_CACHE_SIZE = 4096
+
+
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        ttl = settings_service.settings.variable_cache_ttl
+        # Maps (user id, variable name) to the type and the decrypted value of the variable
+        self._cache: TTLCache[tuple[str, str], tuple[str | None, str]] | None = (
+            TTLCache(maxsize=VARIABLE_CACHE_SIZE, ttl=ttl) if ttl > 0 else None
+        )
+        self._cache_lock = threading.Lock()
+
+    def _get_cached(self, user_id: UUID | str, name: str) -> tuple[str | None, str] | None:
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            return self._cache.get((str(user_id), name))
+
+    def _decrypt_and_cache(self, user_id: UUID | str, variable: Variable) -> tuple[str | None, str]:
+        entry = (variable.type, auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service))
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache[str(user_id), variable.name] = entry
+        return entry
+
+    def _forget_cached(self, user_id: UUID | str, name: str) -> None:
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.pop((str(user_id), name), None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -59,24 +90,55 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
+        cached = self._get_cached(user_id, name)
+        if cached is None:
+            # we get the credential from the database
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
 
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+
+            # we decrypt the value
+            cached = self._decrypt_and_cache(user_id, variable)
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        type_, value = cached
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
+        return value
+
+    async def get_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> dict[str, str]:
+        """Return the decrypted values of the variables of a user with the given names.
+
+        The variables that are not cached are loaded with a single query and cached, so that the
+        following ``get_variable`` calls for them do not query the database. Variables that do not
+        exist, are empty or cannot be decrypted are left out.
+        """
+        names = list(dict.fromkeys(names))
+        values = {}
+        missing = []
+        for name in names:
+            cached = self._get_cached(user_id, name)
+            if cached is None:
+                missing.append(name)
+            else:
+                values[name] = cached[1]
 
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if missing:
+            stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+            for variable in (await session.exec(stmt)).all():
+                if not variable.value:
+                    continue
+                try:
+                    values[variable.name] = self._decrypt_and_cache(user_id, variable)[1]
+                except Exception as e:  # noqa: BLE001
+                    await logger.adebug(f"Decryption failed for variable '{variable.name}': {e}")
+        return {name: values[name] for name in names if name in values}
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -103,6 +165,18 @@ class DatabaseVariableService(VariableService, Service):
         variables = await self.get_all(user_id=user_id, session=session)
         return [variable.name for variable in variables if variable]
 
+    async def _forget_models_using(self, variable: Variable) -> None:
+        """Drop the cached language models built with the current value of ``variable``."""
+        if not variable.value:
+            return
+        try:
+            value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        except Exception as e:  # noqa: BLE001
+            await logger.adebug(f"Decryption failed for variable '{variable.name}': {e}. Assuming plaintext.")
+            value = variable.value
+        if value:
+            model_instance_registry.invalidate(value)
+
     async def update_variable(
         self,
         user_id: UUID | str,
@@ -115,10 +189,12 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{name} variable not found."
             raise ValueError(msg)
+        await self._forget_models_using(variable)
         encrypted = auth_utils.encrypt_api_key(value, settings_service=self.settings_service)
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self._forget_cached(user_id, name)
         await session.refresh(variable)
         return variable
 
@@ -131,6 +207,8 @@ class DatabaseVariableService(VariableService, Service):
     ):
         query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
         db_variable = (await session.exec(query)).one()
+        await self._forget_models_using(db_variable)
+        previous_name = db_variable.name
         db_variable.updated_at = datetime.now(timezone.utc)
 
         variable.value = variable.value or ""
@@ -144,6 +222,9 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.commit()
         await session.refresh(db_variable)
+        # The update can rename the variable
+        self._forget_cached(user_id, previous_name)
+        self._forget_cached(user_id, db_variable.name)
         return db_variable
 
     @override
@@ -158,8 +239,10 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{name} variable not found."
             raise ValueError(msg)
+        await self._forget_models_using(variable)
         await session.delete(variable)
         await session.commit()
+        self._forget_cached(user_id, name)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -168,8 +251,11 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
+        await self._forget_models_using(variable)
+        name = variable.name
         await session.delete(variable)
         await session.commit()
+        self._forget_cached(user_id, name)
 
     async def create_variable(
         self,
@@ -191,4 +277,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.commit()
         await session.refresh(variable)
+        self._forget_cached(user_id, name)
         return variable
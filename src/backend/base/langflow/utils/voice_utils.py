@@ -1,5 +1,6 @@
 import asyncio
 import base64
+from collections.abc import Iterator
 from pathlib import Path
 
 import numpy as np
@@ -43,35 +44,79 @@ def resample_24k_to_16k(frame_24k_bytes):
     return frame_16k.tobytes()
 
 
-# def resample_24k_to_16k(frame_24k_bytes: bytes) -> bytes:
-#    """
-#    Convert one 20ms chunk (960 bytes @ 24kHz) to 20ms @ 16kHz (640 bytes).
-#    Raises ValueError if the frame is not exactly 960 bytes.
-#    """
-#    if len(frame_24k_bytes) != BYTES_PER_24K_FRAME:
-#        raise ValueError(
-#            f"Expected exactly {BYTES_PER_24K_FRAME} bytes for a 20ms 24k frame, "
-#            f"but got {len(frame_24k_bytes)}"
-#        )
-#    # Convert bytes -> int16 array (480 samples)
-#    samples_24k = np.frombuffer(frame_24k_bytes, dtype=np.int16)
-#
-#    # Resample 24k => 16k (ratio=2/3)
-#    # Should get 320 samples out if the chunk was exactly 480 samples in
-#    samples_16k = resample_poly(samples_24k, up=2, down=3)
-#
-#    # Round & convert to int16
-#    samples_16k = np.rint(samples_16k).astype(np.int16)
-#
-#    # Convert back to bytes
-#    frame_16k_bytes = samples_16k.tobytes()
-#    if len(frame_16k_bytes) != BYTES_PER_16K_FRAME:
-#        raise ValueError(
-#            f"Expected exactly {BYTES_PER_16K_FRAME} bytes after resampling "
-#            f"to 20ms@16kHz, got {len(frame_16k_bytes)}"
-#        )
-#    return frame_16k_bytes
-#
+# Low-pass filter of the 24kHz to 16kHz resampler, designed like scipy.signal.resample_poly(up=2, down=3)
+RESAMPLE_UP = 2
+RESAMPLE_DOWN = 3
+RESAMPLE_HALF_LEN = 10 * RESAMPLE_DOWN
+RESAMPLE_KAISER_BETA = 5.0
+
+
+class StreamingResampler:
+    """Polyphase resampler of a stream of 24kHz PCM16 audio to 16kHz, in 20ms frames.
+
+    Unlike ``resample_24k_to_16k``, which resamples each frame on its own, the filter state is
+    carried from one frame to the next, so that frame boundaries do not add artifacts. Only the
+    two phases of the filter that produce output samples are computed, into buffers allocated
+    once per stream. The output lags the input by the delay of the filter, about 0.6ms.
+
+    A resampler holds the state of one stream and is not thread-safe.
+    """
+
+    def __init__(self) -> None:
+        from numpy.lib.stride_tricks import sliding_window_view
+        from scipy.signal import firwin
+
+        taps = firwin(
+            2 * RESAMPLE_HALF_LEN + 1, 1 / RESAMPLE_DOWN, window=("kaiser", RESAMPLE_KAISER_BETA)
+        ) * RESAMPLE_UP
+        taps = np.pad(taps, (0, -len(taps) % RESAMPLE_UP))
+        # Output sample 2j is computed from the even taps and input samples up to 3j, output
+        # sample 2j+1 from the odd taps and input samples up to 3j+1.
+        self._phases = [np.ascontiguousarray(taps[phase::RESAMPLE_UP][::-1], dtype=np.float32) for phase in (0, 1)]
+        self._history = len(self._phases[0]) - 1
+        samples_per_frame = BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE
+        self._buffer = np.zeros(self._history + samples_per_frame, dtype=np.float32)
+        windows = sliding_window_view(self._buffer, len(self._phases[0]))
+        self._windows = [windows[phase:samples_per_frame:RESAMPLE_DOWN] for phase in (0, 1)]
+        self._output = np.empty(BYTES_PER_16K_FRAME // BYTES_PER_SAMPLE, dtype=np.float32)
+        self._output_phases = [self._output[phase::RESAMPLE_UP] for phase in (0, 1)]
+        self._output_16k = np.empty(len(self._output), dtype=np.int16)
+        # Samples received after the last whole frame
+        self._pending = bytearray()
+
+    def resample(self, frame_24k_bytes) -> bytes:
+        """Resample the next 20ms frame of the stream, 960 bytes at 24kHz, to 640 bytes at 16kHz.
+
+        Raises:
+            ValueError: If the input frame is not exactly 960 bytes
+        """
+        if len(frame_24k_bytes) != BYTES_PER_24K_FRAME:
+            msg = f"Expected exactly {BYTES_PER_24K_FRAME} bytes for 24kHz frame, got {len(frame_24k_bytes)}"
+            raise ValueError(msg)
+        self._buffer[self._history :] = np.frombuffer(frame_24k_bytes, dtype=np.int16)
+        for windows, phase, output in zip(self._windows, self._phases, self._output_phases, strict=True):
+            np.matmul(windows, phase, out=output)
+        self._buffer[: self._history] = self._buffer[-self._history :]
+        np.rint(self._output, out=self._output)
+        np.clip(self._output, -32768, 32767, out=self._output)
+        np.copyto(self._output_16k, self._output, casting="unsafe")
+        return self._output_16k.tobytes()
+
+    def feed(self, audio_24k_bytes) -> Iterator[bytes]:
+        """Yield the 16kHz frames of every whole 20ms frame received, keeping the rest for the next call."""
+        audio = memoryview(audio_24k_bytes).cast("B")
+        offset = 0
+        if self._pending:
+            offset = min(len(audio), BYTES_PER_24K_FRAME - len(self._pending))
+            self._pending += audio[:offset]
+            if len(self._pending) < BYTES_PER_24K_FRAME:
+                return
+            yield self.resample(self._pending)
+            self._pending.clear()
+        while len(audio) - offset >= BYTES_PER_24K_FRAME:
+            yield self.resample(audio[offset : offset + BYTES_PER_24K_FRAME])
+            offset += BYTES_PER_24K_FRAME
+        self._pending += audio[offset:]
 
 
 async def write_audio_to_file(audio_base64: str, filename: str = "output_audio.raw") -> None:
@@ -0,0 +1,37 @@
+"""Stand-in for a language model in benchmark flows.
+
+The source of this module is stored as the code of the component in the flows it is used in, so
+it must only hold this component and import nothing outside of lfx and the standard library.
+"""
+
+import asyncio
+import hashlib
+
+from lfx.custom import Component
+from lfx.io import FloatInput, IntInput, MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class FakeLanguageModelComponent(Component):
+    display_name = "Fake Language Model"
+    description = "Answers with deterministic text after a fixed delay. Used by the flow benchmark harness."
+    icon = "bot"
+    name = "FakeLanguageModel"
+
+    inputs = [
+        MessageTextInput(name="input_value", display_name="Input"),
+        FloatInput(name="latency", display_name="Latency", info="Seconds to wait before answering.", value=0.0),
+        IntInput(name="response_words", display_name="Response Words", value=50),
+    ]
+
+    outputs = [
+        Output(display_name="Response", name="text_output", method="text_response"),
+    ]
+
+    async def text_response(self) -> Message:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        digest = hashlib.sha256(str(self.input_value).encode()).hexdigest()
+        text = " ".join(digest[index % 56 : index % 56 + 8] for index in range(self.response_words))
+        self.status = text
+        return Message(text=text)
@@ -0,0 +1,364 @@
+"""Runs workloads through lfx and the Langflow API and builds the benchmark report.
+
+A runner executes one run of a workload in one mode: ``lfx`` builds the graph and runs it
+in-process, ``api_run`` calls ``/api/v1/run`` and ``api_build`` calls ``/api/v1/build`` and reads
+its events. The report is a JSON document with one result per workload and mode, and
+:func:`compare_reports` diffs it against a stored baseline.
+"""
+
+import asyncio
+import copy
+import platform
+import subprocess
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+import orjson
+from lfx.events.event_manager import create_default_event_manager
+from lfx.graph import Graph
+from lfx.processing.process import run_graph_internal
+from lfx.schema.schema import InputValueRequest
+
+from tests.flow_benchmark.metrics import PhaseTimer, current_rss_mb, peak_rss_mb, summarize
+from tests.flow_benchmark.workloads import Workload
+
+REPORT_FORMAT = 1
+SLOWEST_VERTICES = 10
+
+# Metrics compared against a baseline, as a path in a result and whether higher is better
+COMPARED_METRICS: dict[tuple[str, ...], bool] = {
+    ("throughput_per_s",): True,
+    ("latency_s", "p50"): False,
+    ("latency_s", "p95"): False,
+    ("latency_s", "p99"): False,
+    ("rss_mb", "peak"): False,
+    ("allocations", "peak_bytes"): False,
+}
+
+
+class LfxRunner:
+    """Builds the graph of the workload and runs it in-process, like ``lfx run`` does."""
+
+    mode = "lfx"
+
+    def __init__(self) -> None:
+        self._flow_ids: dict[str, str] = {}
+
+    async def prepare(self, workload: Workload) -> None:
+        self._flow_ids[workload.name] = str(uuid.uuid4())
+
+    async def run_once(self, workload: Workload) -> None:
+        flow_id = self._flow_ids[workload.name]
+        graph = Graph.from_payload(copy.deepcopy(workload.flow["data"]), flow_id=flow_id, flow_name=workload.name)
+        event_manager = create_default_event_manager(asyncio.Queue())
+        await run_graph_internal(
+            graph,
+            flow_id,
+            inputs=[InputValueRequest(input_value=workload.input_value, type="chat")],
+            outputs=[],
+            event_manager=event_manager,
+        )
+
+
+class LangflowFlows:
+    """Uploads each workload once to a Langflow server and remembers the id of its flow."""
+
+    def __init__(self, client: httpx.AsyncClient, headers: dict[str, str]) -> None:
+        self.client = client
+        self.headers = headers
+        self._flow_ids: dict[str, str] = {}
+
+    async def flow_id(self, workload: Workload) -> str:
+        if workload.name not in self._flow_ids:
+            payload = {"name": f"{workload.name} {uuid.uuid4().hex[:8]}", "data": workload.flow["data"]}
+            response = await self.client.post("api/v1/flows/", json=payload, headers=self.headers)
+            _raise_for_status(response)
+            self._flow_ids[workload.name] = response.json()["id"]
+        return self._flow_ids[workload.name]
+
+
+class ApiRunRunner:
+    """Runs the workload through ``POST /api/v1/run/{flow_id}``."""
+
+    mode = "api_run"
+
+    def __init__(self, flows: LangflowFlows) -> None:
+        self.flows = flows
+
+    async def prepare(self, workload: Workload) -> None:
+        await self.flows.flow_id(workload)
+
+    async def run_once(self, workload: Workload) -> None:
+        flow_id = await self.flows.flow_id(workload)
+        response = await self.flows.client.post(
+            f"api/v1/run/{flow_id}",
+            params={"stream": "false"},
+            json={"input_value": workload.input_value, "input_type": "chat", "output_type": "chat"},
+            headers=self.flows.headers,
+        )
+        _raise_for_status(response)
+
+
+class ApiBuildRunner:
+    """Builds the workload through ``POST /api/v1/build/{flow_id}/flow`` and reads all of its events."""
+
+    mode = "api_build"
+
+    def __init__(self, flows: LangflowFlows) -> None:
+        self.flows = flows
+
+    async def prepare(self, workload: Workload) -> None:
+        await self.flows.flow_id(workload)
+
+    async def run_once(self, workload: Workload) -> None:
+        flow_id = await self.flows.flow_id(workload)
+        async with self.flows.client.stream(
+            "POST",
+            f"api/v1/build/{flow_id}/flow",
+            params={"event_delivery": "direct"},
+            json={"inputs": {"input_value": workload.input_value, "type": "chat"}},
+            headers=self.flows.headers,
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                _raise_for_status(response)
+            # A failed build sends an error event but does not close the stream
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                event = orjson.loads(line)
+                if event.get("event") == "error":
+                    data = event.get("data") or {}
+                    msg = f"Build failed: {data.get('text') if isinstance(data, dict) else data}"
+                    raise RuntimeError(msg)
+                if event.get("event") == "end":
+                    return
+        msg = "Build ended without an end event"
+        raise RuntimeError(msg)
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.is_error:
+        msg = f"{response.request.method} {response.request.url.path} returned {response.status_code}: {response.text}"
+        raise RuntimeError(msg[:500])
+
+
+def _error_summary(exc: BaseException) -> str:
+    message = str(exc).strip().splitlines()
+    return f"{type(exc).__name__}: {message[0] if message else ''}"[:300]
+
+
+async def measure(
+    runner,
+    workload: Workload,
+    timer: PhaseTimer,
+    *,
+    runs: int,
+    warmup: int = 1,
+    concurrency: int = 1,
+    timeout: float | None = None,
+    measure_allocations: bool = True,
+) -> dict:
+    """Run ``workload`` with ``runner`` and return its result in the benchmark report.
+
+    Raises:
+        Exception: If the workload cannot be prepared or a warmup run fails.
+    """
+
+    async def run_once() -> None:
+        await asyncio.wait_for(runner.run_once(workload), timeout)
+
+    await runner.prepare(workload)
+    for _ in range(warmup):
+        await run_once()
+
+    latencies: list[float] = []
+    errors: list[str] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_run() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await run_once()
+            except Exception as exc:  # noqa: BLE001
+                errors.append(_error_summary(exc))
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    timer.reset()
+    start = time.perf_counter()
+    await asyncio.gather(*(timed_run() for _ in range(runs)))
+    wall = time.perf_counter() - start
+    phases = {phase: seconds / runs for phase, seconds in timer.durations().items()}
+    slowest_vertices = sorted(
+        ((name, summarize(durations)) for name, durations in timer.vertex_durations.items()),
+        key=lambda item: item[1]["p50"],
+        reverse=True,
+    )[:SLOWEST_VERTICES]
+
+    allocations = None
+    if measure_allocations:
+        tracemalloc.start()
+        try:
+            baseline_bytes = tracemalloc.get_traced_memory()[0]
+            await run_once()
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        allocations = {"peak_bytes": peak_bytes - baseline_bytes, "retained_bytes": current_bytes - baseline_bytes}
+
+    return {
+        "workload": workload.name,
+        "mode": runner.mode,
+        "runs": runs,
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "throughput_per_s": len(latencies) / wall if wall else None,
+        "latency_s": summarize(latencies),
+        "phases_s": phases,
+        "slowest_vertices_s": {name: {"p50": stats["p50"], "p95": stats["p95"]} for name, stats in slowest_vertices},
+        "rss_mb": {"current": current_rss_mb(), "peak": peak_rss_mb()},
+        "allocations": allocations,
+    }
+
+
+async def run_benchmark(
+    workloads: list[Workload],
+    runners: list,
+    *,
+    runs: int,
+    warmup: int = 1,
+    concurrency: int = 1,
+    timeout: float | None = None,
+    measure_allocations: bool = True,
+    config: dict | None = None,
+    log=print,
+) -> dict:
+    """Measure every workload with every runner and return the report.
+
+    Workloads that fail to prepare or whose warmup fails are listed as skipped with the reason,
+    e.g. a starter project using a provider that has no stand-in.
+    """
+    results = []
+    skipped = []
+    timer = PhaseTimer()
+    timer.install()
+    try:
+        for workload in workloads:
+            for runner in runners:
+                try:
+                    result = await measure(
+                        runner,
+                        workload,
+                        timer,
+                        runs=runs,
+                        warmup=warmup,
+                        concurrency=concurrency,
+                        timeout=timeout,
+                        measure_allocations=measure_allocations,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    reason = _error_summary(exc)
+                    skipped.append({"workload": workload.name, "mode": runner.mode, "reason": reason})
+                    log(f"{workload.name} [{runner.mode}] skipped: {reason}")
+                    continue
+                results.append(result)
+                latency = result["latency_s"]
+                log(
+                    f"{workload.name} [{runner.mode}] p50 {latency.get('p50', 0) * 1000:.1f}ms "
+                    f"p99 {latency.get('p99', 0) * 1000:.1f}ms, {result['throughput_per_s'] or 0:.1f} runs/s, "
+                    f"{result['errors']} errors"
+                )
+    finally:
+        timer.uninstall()
+
+    return {
+        "format": REPORT_FORMAT,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "config": config or {},
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def _environment() -> dict:
+    from importlib.metadata import PackageNotFoundError, version
+
+    environment = {"python": platform.python_version(), "platform": platform.platform()}
+    for package in ("lfx", "langflow-base"):
+        try:
+            environment[package] = version(package)
+        except PackageNotFoundError:
+            environment[package] = None
+    try:
+        environment["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        environment["git_commit"] = None
+    return environment
+
+
+def _metric(result: dict, path: tuple[str, ...]) -> float | None:
+    value = result
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value if isinstance(value, int | float) else None
+
+
+def compare_reports(current: dict, baseline: dict, *, threshold: float = 0.1) -> list[dict]:
+    """Return how the metrics of ``current`` changed from ``baseline``, for the results both have.
+
+    A metric is a regression when it got worse by more than ``threshold``, a fraction of its
+    baseline value.
+    """
+    baseline_results = {(result["workload"], result["mode"]): result for result in baseline.get("results", [])}
+    comparison = []
+    for result in current.get("results", []):
+        baseline_result = baseline_results.get((result["workload"], result["mode"]))
+        if baseline_result is None:
+            continue
+        for path, higher_is_better in COMPARED_METRICS.items():
+            before = _metric(baseline_result, path)
+            after = _metric(result, path)
+            if before is None or after is None or before == 0:
+                continue
+            change = (after - before) / before
+            worse = -change if higher_is_better else change
+            comparison.append(
+                {
+                    "workload": result["workload"],
+                    "mode": result["mode"],
+                    "metric": ".".join(path),
+                    "baseline": before,
+                    "current": after,
+                    "change": change,
+                    "regression": worse > threshold,
+                }
+            )
+    return comparison
+
+
+def format_comparison(comparison: list[dict]) -> str:
+    """Return the comparison as a plain text table."""
+    lines = [f"{'workload':<40} {'mode':<10} {'metric':<24} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for row in comparison:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['workload']:<40} {row['mode']:<10} {row['metric']:<24} "
+            f"{row['baseline']:>12.4g} {row['current']:>12.4g} {row['change']:>+8.1%}{flag}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,220 @@
+"""Measurements taken by the benchmark harness while flows run.
+
+:class:`PhaseTimer` wraps the functions where the engine spends its time, so that a run can be
+split into vertex builds, scheduling, serialization, database persistence and event emission.
+Functions are replaced in every loaded module that imported them by name, and nested calls
+within the same phase are only counted once.
+"""
+
+import contextvars
+import functools
+import importlib
+import inspect
+import resource
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Functions timed for each phase, as "module:qualified name". Missing ones are skipped, so the
+# same phases work whether or not Langflow is installed next to lfx.
+PHASE_TARGETS: dict[str, list[str]] = {
+    "serialization": [
+        "lfx.serialization.serialization:serialize",
+    ],
+    "db_persistence": [
+        "lfx.graph.utils:log_vertex_build",
+        "lfx.graph.utils:log_transaction",
+        "langflow.memory:astore_message",
+        "langflow.memory:aupdate_messages",
+        "langflow.memory:aadd_messagetables",
+    ],
+    "event_emission": [
+        "lfx.events.event_manager:EventManager.send_event",
+    ],
+}
+
+VERTEX_BUILD_TARGET = "lfx.graph.graph.base:Graph.build_vertex"
+
+
+def _resolve(target: str):
+    module_name, _, qualname = target.partition(":")
+    try:
+        owner = importlib.import_module(module_name)
+    except ImportError:
+        return None, None, None
+    *path, name = qualname.split(".")
+    for attribute in path:
+        owner = getattr(owner, attribute, None)
+        if owner is None:
+            return None, None, None
+    function = inspect.getattr_static(owner, name, None)
+    if function is None:
+        return None, None, None
+    return owner, name, function
+
+
+def _union_duration(intervals: list[tuple[float, float]]) -> float:
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+class PhaseTimer:
+    """Times the phases of flow runs while installed.
+
+    Phases are accumulated over a measurement window started by :meth:`reset`, which may hold
+    several concurrent runs. The build durations of each vertex in the window are kept in
+    :attr:`vertex_durations`.
+    """
+
+    def __init__(self) -> None:
+        self.vertex_durations: dict[str, list[float]] = defaultdict(list)
+        self._totals: dict[str, float] = defaultdict(float)
+        self._intervals: list[tuple[float, float]] = []
+        self._window_start = time.perf_counter()
+        self._patches: list[tuple[object, str, object]] = []
+        self._depth = {phase: contextvars.ContextVar(f"{phase}_depth", default=0) for phase in PHASE_TARGETS}
+
+    def install(self) -> None:
+        for phase, targets in PHASE_TARGETS.items():
+            for target in targets:
+                owner, name, function = _resolve(target)
+                if function is not None:
+                    self._patch(owner, name, function, self._wrap_phase(phase, function))
+        owner, name, function = _resolve(VERTEX_BUILD_TARGET)
+        if function is not None:
+            self._patch(owner, name, function, self._wrap_vertex_build(function))
+
+    def uninstall(self) -> None:
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+
+    def reset(self) -> None:
+        """Start a new measurement window."""
+        self.vertex_durations.clear()
+        self._totals.clear()
+        self._intervals.clear()
+        self._window_start = time.perf_counter()
+
+    def durations(self) -> dict[str, float]:
+        """Return the seconds spent in each phase since :meth:`reset`.
+
+        Scheduling is the time of the window during which no vertex was being built.
+        """
+        wall = time.perf_counter() - self._window_start
+        durations = {phase: self._totals.get(phase, 0.0) for phase in PHASE_TARGETS}
+        durations["vertex_build"] = sum(end - start for start, end in self._intervals)
+        durations["scheduling"] = max(wall - _union_duration(self._intervals), 0.0) if self._intervals else 0.0
+        return durations
+
+    def _patch(self, owner, name: str, original, wrapper) -> None:
+        if inspect.isclass(owner):
+            self._patches.append((owner, name, original))
+            setattr(owner, name, wrapper)
+            return
+        # Module level functions are also replaced where they were imported by name
+        for module in list(sys.modules.values()):
+            namespace = getattr(module, "__dict__", None)
+            if namespace is None:
+                continue
+            for attribute, value in list(namespace.items()):
+                if value is original:
+                    self._patches.append((module, attribute, original))
+                    setattr(module, attribute, wrapper)
+
+    def _wrap_phase(self, phase: str, function):
+        depth = self._depth[phase]
+        totals = self._totals
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def timed_coroutine(*args, **kwargs):
+                outermost = depth.get() == 0
+                token = depth.set(depth.get() + 1)
+                start = time.perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    if outermost:
+                        totals[phase] += time.perf_counter() - start
+                    depth.reset(token)
+
+            return timed_coroutine
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            outermost = depth.get() == 0
+            token = depth.set(depth.get() + 1)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                if outermost:
+                    totals[phase] += time.perf_counter() - start
+                depth.reset(token)
+
+        return timed
+
+    def _wrap_vertex_build(self, function):
+        intervals = self._intervals
+        vertex_durations = self.vertex_durations
+
+        @functools.wraps(function)
+        async def timed_build_vertex(graph, vertex_id, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await function(graph, vertex_id, *args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                intervals.append((start, end))
+                vertex = graph.get_vertex(vertex_id)
+                vertex_durations[f"{vertex.display_name} ({vertex.base_name})"].append(end - start)
+
+        return timed_build_vertex
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """Return the mean, extremes and p50/p95/p99 of ``values``."""
+    if not values:
+        return {}
+    if len(values) == 1:
+        quantiles = values * 99
+    else:
+        quantiles = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "mean": statistics.fmean(values),
+        "min": min(values),
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "max": max(values),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of the process, in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> float | None:
+    """Return the current resident set size of the process in megabytes, where /proc is available."""
+    statm = Path("/proc/self/statm")
+    if not statm.exists():
+        return None
+    resident_pages = int(statm.read_text().split()[1])
+    return resident_pages * resource.getpagesize() / 1024 / 1024
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Flow execution benchmark.
+
+Runs starter projects and synthetic graphs in-process with lfx and through the Langflow API,
+with local stand-ins for language models, embeddings and HTTP services, and writes a JSON report.
+
+Usage (from src/backend):
+    python -m tests.flow_benchmark.run_benchmark --output report.json
+    python -m tests.flow_benchmark.run_benchmark --workloads synthetic --sizes 8,64 --modes lfx
+    python -m tests.flow_benchmark.run_benchmark --workloads starter --starter-projects "Basic Prompting"
+    python -m tests.flow_benchmark.run_benchmark --baseline baseline.json --threshold 0.15
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+import orjson
+
+MODES = ("lfx", "api_run", "api_build")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark flow execution in lfx and the Langflow API.")
+    parser.add_argument(
+        "--workloads", default="synthetic", help="Comma separated workload kinds: synthetic, starter"
+    )
+    parser.add_argument("--starter-projects", default="", help="Comma separated starter project names (default: all)")
+    parser.add_argument("--sizes", default="8,64", help="Widths and depths of the synthetic graphs (default: 8,64)")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma separated modes: {', '.join(MODES)}")
+    parser.add_argument("--runs", type=int, default=20, help="Measured runs per workload and mode (default: 20)")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured runs before measuring (default: 2)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Runs in flight at once (default: 1)")
+    parser.add_argument(
+        "--model-latency", type=float, default=0.0, help="Seconds each fake language model waits (default: 0)"
+    )
+    parser.add_argument(
+        "--provider-latency", type=float, default=0.0, help="Seconds the stub provider waits per request (default: 0)"
+    )
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds before a run fails (default: 300)")
+    parser.add_argument("--no-allocations", action="store_true", help="Skip the traced run measuring allocations")
+    parser.add_argument("--host", help="Benchmark the API of a running Langflow server instead of an in-process one")
+    parser.add_argument("--api-key", default=os.getenv("API_KEY"), help="API key for --host (default: $API_KEY)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare the report with this baseline report")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative change counted as a regression (default: 0.1)"
+    )
+    return parser.parse_args(argv)
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _configure_environment(work_dir: Path, stub_url: str) -> None:
+    """Point Langflow and lfx at a scratch database and the providers at the stub server.
+
+    Must run before any settings are loaded. The database is always the scratch one, so that a
+    benchmark never writes to the database of an install, or to a default one in the package tree.
+    """
+    from tests.flow_benchmark.stub_server import stand_in_environment
+
+    os.environ.update(stand_in_environment(stub_url))
+    os.environ["LANGFLOW_DATABASE_URL"] = f"sqlite:///{work_dir / 'benchmark.db'}"
+    os.environ["LANGFLOW_CONFIG_DIR"] = str(work_dir)
+    os.environ["LANGFLOW_SAVE_DB_IN_CONFIG_DIR"] = "true"
+    os.environ.setdefault("LANGFLOW_AUTO_LOGIN", "true")
+    os.environ.setdefault("LANGFLOW_CREATE_STARTER_PROJECTS", "false")
+    os.environ.setdefault("LANGFLOW_LOG_LEVEL", "critical")
+    # Telemetry requests would be measured as part of the runs
+    os.environ.setdefault("DO_NOT_TRACK", "true")
+
+
+async def _start_in_process_server(stack: AsyncExitStack) -> tuple[str, dict[str, str]]:
+    """Serve Langflow from this process and return its URL and headers with a new API key.
+
+    The server shares the event loop of the benchmark, so that lfx runs use the same services.
+    """
+    import httpx
+    import uvicorn
+    from langflow.main import create_app
+
+    from tests.flow_benchmark.stub_server import free_port
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="critical"))
+    serve_task = asyncio.create_task(server.serve())
+
+    async def stop() -> None:
+        server.should_exit = True
+        await serve_task
+
+    stack.push_async_callback(stop)
+    while not server.started:
+        if serve_task.done():
+            serve_task.result()
+            msg = "Langflow did not start"
+            raise RuntimeError(msg)
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{port}/"
+    async with httpx.AsyncClient(base_url=url) as client:
+        response = await client.get("api/v1/auto_login")
+        response.raise_for_status()
+        token_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        response = await client.post("api/v1/api_key/", json={"name": "flow benchmark"}, headers=token_headers)
+        response.raise_for_status()
+    return url, {"x-api-key": response.json()["api_key"]}
+
+
+def _build_workloads(args: argparse.Namespace) -> list:
+    from tests.flow_benchmark.workloads import deep_workload, starter_project_workloads, wide_workload
+
+    kinds = _split(args.workloads)
+    workloads = []
+    if "synthetic" in kinds:
+        for size in (int(size) for size in _split(args.sizes)):
+            workloads.append(wide_workload(size, latency=args.model_latency))
+            workloads.append(deep_workload(size, latency=args.model_latency))
+    if "starter" in kinds:
+        workloads.extend(starter_project_workloads(_split(args.starter_projects) or None))
+    return workloads
+
+
+def _has_langflow() -> bool:
+    # src/backend/langflow is a namespace package, so check for the server itself
+    try:
+        return importlib.util.find_spec("langflow.main") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+async def benchmark(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from tests.flow_benchmark.stub_server import StubServer
+
+    modes = _split(args.modes)
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        msg = f"Unknown modes: {', '.join(sorted(unknown))}"
+        raise SystemExit(msg)
+
+    with tempfile.TemporaryDirectory(prefix="flow-benchmark-") as work_dir, StubServer(args.provider_latency) as stub:
+        _configure_environment(Path(work_dir), stub.url)
+        from tests.flow_benchmark.harness import ApiBuildRunner, ApiRunRunner, LangflowFlows, LfxRunner, run_benchmark
+
+        workloads = _build_workloads(args)
+        async with AsyncExitStack() as stack:
+            url, headers = args.host, {"x-api-key": args.api_key} if args.api_key else {}
+            has_langflow = _has_langflow()
+            # lfx runs use the database of the in-process server when Langflow is installed
+            if has_langflow and ("lfx" in modes or not args.host):
+                in_process_url, in_process_headers = await _start_in_process_server(stack)
+                if not args.host:
+                    url, headers = in_process_url, in_process_headers
+
+            runners = []
+            if "lfx" in modes:
+                runners.append(LfxRunner())
+            api_modes = [mode for mode in modes if mode != "lfx"]
+            if api_modes and url is None:
+                print("Langflow is not installed, only the lfx mode can run", file=sys.stderr)
+            elif api_modes:
+                client = await stack.enter_async_context(httpx.AsyncClient(base_url=url, timeout=args.timeout))
+                flows = LangflowFlows(client, headers)
+                runners.extend(
+                    {"api_run": ApiRunRunner, "api_build": ApiBuildRunner}[mode](flows) for mode in api_modes
+                )
+
+            config = {
+                key: str(value) if isinstance(value, Path) else value
+                for key, value in vars(args).items()
+                if key not in {"api_key", "output", "baseline"}
+            }
+            return await run_benchmark(
+                workloads,
+                runners,
+                runs=args.runs,
+                warmup=args.warmup,
+                concurrency=args.concurrency,
+                timeout=args.timeout,
+                measure_allocations=not args.no_allocations,
+                config=config,
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(benchmark(args))
+
+    if args.output:
+        args.output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        from tests.flow_benchmark.harness import compare_reports, format_comparison
+
+        baseline = orjson.loads(args.baseline.read_bytes())
+        comparison = compare_reports(report, baseline, threshold=args.threshold)
+        print(format_comparison(comparison))
+        regressions = [row for row in comparison if row["regression"]]
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Local stand-in for the HTTP services that benchmark flows call.
+
+It answers OpenAI-compatible chat completion and embedding requests with deterministic content,
+and every other request with a small JSON document, so that flows using OpenAI models or making
+HTTP requests run without network access or credentials. Providers are pointed at it through
+the environment variables returned by :func:`stand_in_environment`.
+"""
+
+import asyncio
+import hashlib
+import socket
+import threading
+import time
+
+import orjson
+import uvicorn
+
+EMBEDDING_DIMENSIONS = 1536
+
+
+def _completion_text(body: dict) -> str:
+    messages = body.get("messages") or [{"content": ""}]
+    digest = hashlib.sha256(orjson.dumps(messages[-1].get("content"))).hexdigest()
+    return " ".join(digest[index : index + 8] for index in range(0, 56, 8))
+
+
+def _embedding(text: str) -> list[float]:
+    digest = hashlib.sha512(text.encode()).digest()
+    return [digest[index % len(digest)] / 255 for index in range(EMBEDDING_DIMENSIONS)]
+
+
+def _chat_completion(body: dict) -> dict:
+    return {
+        "id": "chatcmpl-benchmark",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "benchmark"),
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": _completion_text(body)}, "finish_reason": "stop"}
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 8, "total_tokens": 9},
+    }
+
+
+def _chat_completion_chunks(body: dict) -> list[bytes]:
+    chunks = []
+    for word in _completion_text(body).split(" "):
+        chunk = {
+            "id": "chatcmpl-benchmark",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "benchmark"),
+            "choices": [{"index": 0, "delta": {"role": "assistant", "content": word + " "}, "finish_reason": None}],
+        }
+        chunks.append(b"data: " + orjson.dumps(chunk) + b"\n\n")
+    chunks.append(b"data: [DONE]\n\n")
+    return chunks
+
+
+def _embeddings(body: dict) -> dict:
+    texts = body.get("input") or []
+    if isinstance(texts, str):
+        texts = [texts]
+    return {
+        "object": "list",
+        "data": [
+            {"object": "embedding", "index": index, "embedding": _embedding(str(text))}
+            for index, text in enumerate(texts)
+        ],
+        "model": body.get("model", "benchmark"),
+        "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)},
+    }
+
+
+class StubApp:
+    """ASGI app answering like the providers the flows are configured with.
+
+    Args:
+        latency: Seconds to wait before answering each request, to model a remote service.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.requests = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        payload = orjson.loads(body) if body.startswith(b"{") else {}
+        path = scope["path"]
+        if path.endswith("/chat/completions") and payload.get("stream"):
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/event-stream")]}
+            )
+            for chunk in _chat_completion_chunks(payload):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if path.endswith("/chat/completions"):
+            response = _chat_completion(payload)
+        elif path.endswith("/embeddings"):
+            response = _embeddings(payload)
+        else:
+            response = {"ok": True, "method": scope["method"], "path": path}
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": orjson.dumps(response)})
+
+
+def free_port() -> int:
+    """Return a local TCP port that is free at the time of the call."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StubServer:
+    """Runs a :class:`StubApp` on a free local port in a background thread."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.app = StubApp(latency)
+        self.url = ""
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "StubServer":
+        port = free_port()
+        self._server = uvicorn.Server(uvicorn.Config(self.app, host="127.0.0.1", port=port, log_level="error"))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def stand_in_environment(url: str) -> dict[str, str]:
+    """Return the environment variables pointing model providers at the stub server at ``url``."""
+    return {
+        "OPENAI_API_KEY": "sk-benchmark",
+        "OPENAI_BASE_URL": f"{url}/v1",
+        "OPENAI_API_BASE": f"{url}/v1",
+    }
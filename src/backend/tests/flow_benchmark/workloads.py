@@ -0,0 +1,81 @@
+"""Flows run by the benchmark harness.
+
+Workloads are flow documents in the format of the flows API, so that the same flow can be run
+in-process by lfx and through the Langflow endpoints. They are either the bundled starter
+projects or synthetic graphs made of fake language models, with a configurable width and depth.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+
+from tests.flow_benchmark.fake_language_model import FakeLanguageModelComponent
+
+STARTER_PROJECTS_DIR = Path(__file__).resolve().parents[2] / "base" / "langflow" / "initial_setup" / "starter_projects"
+
+DEFAULT_INPUT = "Summarize the benefits of running flows locally."
+
+
+@dataclass
+class Workload:
+    """A flow to benchmark and the input it is run with."""
+
+    name: str
+    flow: dict
+    input_value: str = DEFAULT_INPUT
+
+
+def starter_project_workloads(names: list[str] | None = None) -> list[Workload]:
+    """Return the bundled starter projects, or only the ones named in ``names``."""
+    workloads = []
+    for path in sorted(STARTER_PROJECTS_DIR.glob("*.json")):
+        if names and path.stem not in names:
+            continue
+        flow = json.loads(path.read_text(encoding="utf-8"))
+        workloads.append(Workload(name=f"starter/{path.stem}", flow=flow))
+    return workloads
+
+
+def deep_workload(depth: int, *, latency: float = 0.0) -> Workload:
+    """Return a chain of ``depth`` fake language models, each answering the previous one."""
+    chat_input = ChatInput(_id="chat_input")
+    previous = chat_input.message_response
+    for index in range(depth):
+        model = FakeLanguageModelComponent(_id=f"model_{index}", latency=latency)
+        model.set(input_value=previous)
+        previous = model.text_response
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=previous)
+    name = f"synthetic/deep-{depth}"
+    return Workload(name=name, flow=Graph(chat_input, chat_output).dump(name=name))
+
+
+def wide_workload(width: int, *, latency: float = 0.0) -> Workload:
+    """Return ``width`` fake language models answering the same input, combined pairwise into one output."""
+    chat_input = ChatInput(_id="chat_input")
+    level = []
+    for index in range(width):
+        model = FakeLanguageModelComponent(_id=f"model_{index}", latency=latency)
+        model.set(input_value=chat_input.message_response)
+        level.append(model.text_response)
+
+    combined = 0
+    while len(level) > 1:
+        next_level = []
+        for first, second in zip(level[::2], level[1::2], strict=False):
+            combine = CombineTextComponent(_id=f"combine_{combined}")
+            combine.set(text1=first, text2=second)
+            next_level.append(combine.combine_texts)
+            combined += 1
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=level[0])
+    name = f"synthetic/wide-{width}"
+    return Workload(name=name, flow=Graph(chat_input, chat_output).dump(name=name))
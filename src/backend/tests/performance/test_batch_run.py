@@ -0,0 +1,64 @@
+import asyncio
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from lfx.components.processing.batch_run import BatchRunComponent
+from lfx.schema.dataframe import DataFrame
+
+NUM_ROWS = 100_000
+CHUNK_SIZE = 1_000
+LATENCY = 0.01
+RATE_LIMIT_EVERY = 10
+
+
+class RateLimitError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Too many requests")
+        self.response = httpx.Response(429, headers={"retry-after": "0.05"})
+
+
+class FakeChatModel:
+    """A chat model answering every batch after ``LATENCY`` seconds and rate limiting every few calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.rate_limited = 0
+
+    def with_config(self, *_, **__):
+        return self
+
+    async def abatch(self, conversations):
+        self.calls += 1
+        await asyncio.sleep(LATENCY)
+        if self.calls % RATE_LIMIT_EVERY == 0:
+            self.rate_limited += 1
+            raise RateLimitError
+        return [SimpleNamespace(content=f"echo {messages[-1]['content']}") for messages in conversations]
+
+
+@pytest.mark.benchmark
+async def test_batch_run_large_input():
+    """Benchmark a 100k row batch run against a fake model with latency and rate limit errors."""
+    df = DataFrame({"text": [f"row {i}" for i in range(NUM_ROWS)], "id": range(NUM_ROWS)})
+    model = FakeChatModel()
+    component = BatchRunComponent(model=model, df=df, column_name="text", chunk_size=CHUNK_SIZE)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = await component.run_batch()
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(result) == NUM_ROWS
+    assert result["model_response"].iloc[-1] == f"echo row {NUM_ROWS - 1}"
+    assert model.rate_limited > 0
+
+    print(f"\n{NUM_ROWS} rows in {duration:.2f}s: {NUM_ROWS / duration:.0f} rows/s")
+    print(f"{model.calls} model calls, {model.rate_limited} rate limited")
+    print(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB")
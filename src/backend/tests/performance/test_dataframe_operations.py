@@ -0,0 +1,84 @@
+import gc
+import time
+
+import pandas as pd
+import pytest
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame, DataFrameBuffer, dataframe_to_records
+from lfx.serialization.serialization import serialize
+
+SIZES = (10_000, 100_000, 1_000_000)
+# add_row copies the DataFrame on each call, it is only measured on a small frame
+ADD_ROW_SIZE = 2_000
+
+
+def _row(index: int) -> dict:
+    text = f"Chunk {index} of a document about topic {index % 97}"
+    return {"text": text, "source": f"doc_{index % 50}.pdf", "page": index}
+
+
+def _elapsed(function, repeat: int = 1) -> tuple[float, object]:
+    """Return the best time of ``repeat`` calls, each after a garbage collection, and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _build_with_add_row(size: int) -> DataFrame:
+    frame = DataFrame()
+    for index in range(size):
+        frame = frame.add_row(_row(index))
+    return frame
+
+
+def _build_with_buffer(size: int) -> DataFrame:
+    buffer = DataFrameBuffer()
+    for index in range(size):
+        buffer.append(_row(index))
+    return buffer.to_dataframe()
+
+
+@pytest.mark.benchmark
+def test_dataframe_append_conversion_and_serialization():
+    """Build, convert and serialize DataFrames of 10k to 1M rows, as before and with the new paths."""
+    add_row_s, _ = _elapsed(lambda: _build_with_add_row(ADD_ROW_SIZE))
+    print(f"\nadd_row: {add_row_s / ADD_ROW_SIZE * 1e6:.0f}us per row at {ADD_ROW_SIZE:,} rows, growing with the frame")
+
+    for size in SIZES:
+        buffer_s, frame = _elapsed(lambda size=size: _build_with_buffer(size))
+        assert len(frame) == size
+
+        old_to_data_s, old_data = _elapsed(
+            lambda frame=frame: [Data(data=row) for row in frame.to_dict(orient="records")], repeat=2
+        )
+        new_to_data_s, new_data = _elapsed(frame.to_data_list, repeat=2)
+        assert old_data[-1] == new_data[-1]
+        from_data_s, _ = _elapsed(lambda new_data=new_data: DataFrame(new_data))
+
+        old_records_s, old_records = _elapsed(lambda frame=frame: frame.to_dict(orient="records"), repeat=2)
+        new_records_s, new_records = _elapsed(lambda frame=frame: dataframe_to_records(frame), repeat=2)
+        assert old_records == new_records
+        serialize_s, serialized = _elapsed(lambda frame=frame: serialize(frame, max_items=None, max_length=None))
+        assert len(serialized) == size
+
+        arrow_frame = frame.with_arrow_strings()
+        object_mb = frame.memory_usage(deep=True).sum() / 1024**2
+        arrow_mb = arrow_frame.memory_usage(deep=True).sum() / 1024**2
+
+        print(f"{size:,} rows:")
+        print(f"  append with a buffer: {buffer_s * 1000:.0f}ms ({buffer_s / size * 1e6:.2f}us per row)")
+        print(f"  to_data_list: {old_to_data_s * 1000:.0f}ms before, {new_to_data_s * 1000:.0f}ms after")
+        print(f"  DataFrame(list[Data]): {from_data_s * 1000:.0f}ms")
+        print(f"  records: {old_records_s * 1000:.0f}ms with to_dict, {new_records_s * 1000:.0f}ms by column")
+        print(f"  serialize: {serialize_s * 1000:.0f}ms")
+        print(f"  memory: {object_mb:.1f}MB with Python strings, {arrow_mb:.1f}MB with Arrow strings")
+
+        # Creating a Data object per row dominates, the records are only a part of it
+        assert new_to_data_s < old_to_data_s * 1.25
+        assert new_records_s < old_records_s
+        assert isinstance(arrow_frame["text"].dtype, pd.StringDtype)
+        assert arrow_mb < object_mb / 2
@@ -0,0 +1,69 @@
+import random
+import time
+
+import pytest
+from lfx.graph.graph.execution_plan import ExecutionPlanCache
+from lfx.graph.graph.utils import find_cycle_vertices, get_sorted_vertices
+
+GRAPH_SIZES = [50, 500, 5_000]
+NUM_LOOKUPS = 20
+
+
+def _synthetic_graph(num_vertices: int, seed: int = 0):
+    """Build a random flow-like DAG where each vertex takes one to three inputs from earlier vertices."""
+    rng = random.Random(seed)
+    vertices_ids = [f"{rng.choice(['Prompt', 'Agent', 'Parser', 'TextInput'])}-{i}" for i in range(num_vertices)]
+    successor_map: dict[str, list[str]] = {vertex_id: [] for vertex_id in vertices_ids}
+    predecessor_map: dict[str, list[str]] = {vertex_id: [] for vertex_id in vertices_ids}
+    for index in range(1, num_vertices):
+        target = vertices_ids[index]
+        for source_index in {rng.randrange(max(0, index - 20), index) for _ in range(rng.randint(1, 3))}:
+            successor_map[vertices_ids[source_index]].append(target)
+            predecessor_map[target].append(vertices_ids[source_index])
+    in_degree_map = {vertex_id: len(predecessors) for vertex_id, predecessors in predecessor_map.items()}
+    return vertices_ids, in_degree_map, successor_map, predecessor_map
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_vertices", GRAPH_SIZES)
+def test_execution_plan_lookup_vs_recompute(num_vertices):
+    """Compare sorting a synthetic graph with looking its plan up in the execution plan cache."""
+    vertices_ids, in_degree_map, successor_map, predecessor_map = _synthetic_graph(num_vertices)
+    edges = [(source, target) for source, targets in successor_map.items() for target in targets]
+    cycle_vertices = set(find_cycle_vertices(edges))
+    cache = ExecutionPlanCache()
+
+    def sort():
+        return get_sorted_vertices(
+            vertices_ids=vertices_ids,
+            cycle_vertices=cycle_vertices,
+            in_degree_map=in_degree_map,
+            successor_map=successor_map,
+            predecessor_map=predecessor_map,
+            get_vertex_predecessors=predecessor_map.__getitem__,
+            get_vertex_successors=successor_map.__getitem__,
+            is_cyclic=bool(cycle_vertices),
+        )
+
+    def plan_key():
+        return ExecutionPlanCache.make_key(
+            vertices_ids, in_degree_map, successor_map, predecessor_map, cycle_vertices, is_cyclic=False
+        )
+
+    start = time.perf_counter()
+    first_layer, remaining_layers = sort()
+    recompute = time.perf_counter() - start
+    cache.set(plan_key(), first_layer, remaining_layers)
+
+    start = time.perf_counter()
+    for _ in range(NUM_LOOKUPS):
+        plan = cache.get(plan_key())
+    lookup = (time.perf_counter() - start) / NUM_LOOKUPS
+
+    assert plan == (first_layer, remaining_layers)
+    assert sum(len(layer) for layer in [first_layer, *remaining_layers]) == num_vertices
+
+    print(
+        f"\n{num_vertices} vertices: recompute {recompute * 1000:.2f}ms, "
+        f"plan lookup {lookup * 1000:.3f}ms ({recompute / lookup:.0f}x)"
+    )
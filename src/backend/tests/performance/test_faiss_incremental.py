@@ -0,0 +1,81 @@
+import time
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+NUM_DOCUMENTS = 5_000
+NEW_DOCUMENTS = 50
+DIMENSION = 256
+SEARCHES = 50
+# Simulated latency of the embedding model per document
+EMBEDDING_DOCUMENT_LATENCY = 0.000_2
+
+
+class FakeEmbeddings(Embeddings):
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(EMBEDDING_DOCUMENT_LATENCY * len(texts))
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        seed = sum(map(ord, text))
+        return [((seed * (dimension + 1)) % 101) / 100 for dimension in range(DIMENSION)]
+
+
+def _corpus(size: int):
+    from lfx.schema.data import Data
+
+    return [Data(text=f"document {index} about topic {index % 37}", source="benchmark") for index in range(size)]
+
+
+def _rebuild_and_load(path, docs, embedding) -> float:
+    """Ingest and search as the component used to: embed every document, then load the index per search."""
+    from langchain_community.vectorstores import FAISS
+
+    start = time.perf_counter()
+    FAISS.from_documents([doc.to_lc_document() for doc in docs], embedding).save_local(str(path), "benchmark")
+    for index in range(SEARCHES):
+        store = FAISS.load_local(str(path), embedding, "benchmark", allow_dangerous_deserialization=True)
+        store.similarity_search(f"topic {index}", k=4)
+    return time.perf_counter() - start
+
+
+def _incremental_and_cached(path, docs, embedding) -> float:
+    from lfx.components.FAISS.faiss import FaissVectorStoreComponent
+
+    start = time.perf_counter()
+    FaissVectorStoreComponent(
+        persist_directory=str(path), index_name="benchmark", embedding=embedding, ingest_data=docs
+    ).build_vector_store()
+    for index in range(SEARCHES):
+        FaissVectorStoreComponent(
+            persist_directory=str(path),
+            index_name="benchmark",
+            embedding=embedding,
+            search_query=f"topic {index}",
+        ).search_documents()
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_faiss_reingestion_and_search(tmp_path):
+    """Re-run a FAISS flow whose input gained a few documents, then search it repeatedly."""
+    pytest.importorskip("faiss")
+    from lfx.base.vectorstores.registry import vector_store_registry
+
+    embedding = FakeEmbeddings()
+    docs = _corpus(NUM_DOCUMENTS)
+    more_docs = docs + _corpus(NUM_DOCUMENTS + NEW_DOCUMENTS)[NUM_DOCUMENTS:]
+
+    (tmp_path / "before").mkdir()
+    _rebuild_and_load(tmp_path / "before", docs, embedding)
+    before_s = _rebuild_and_load(tmp_path / "before", more_docs, embedding)
+
+    vector_store_registry.clear()
+    _incremental_and_cached(tmp_path / "after", docs, embedding)
+    after_s = _incremental_and_cached(tmp_path / "after", more_docs, embedding)
+
+    print(f"\n{NUM_DOCUMENTS} indexed documents, {NEW_DOCUMENTS} new ones and {SEARCHES} searches:")
+    print(f"  rebuild, load per search: {before_s * 1000:.0f}ms")
+    print(f"  add new documents, cached index: {after_s * 1000:.0f}ms")
+
+    assert after_s < before_s / 5
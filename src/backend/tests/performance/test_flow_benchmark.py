@@ -0,0 +1,44 @@
+import copy
+
+import pytest
+
+from tests.flow_benchmark.harness import (
+    ApiBuildRunner,
+    ApiRunRunner,
+    LangflowFlows,
+    LfxRunner,
+    compare_reports,
+    run_benchmark,
+)
+from tests.flow_benchmark.workloads import deep_workload, wide_workload
+
+
+@pytest.mark.benchmark
+async def test_flow_benchmark_harness(client, created_api_key):
+    """Run the flow benchmark harness on small synthetic graphs in every mode and diff the report with itself."""
+    flows = LangflowFlows(client, {"x-api-key": created_api_key.api_key})
+    report = await run_benchmark(
+        [wide_workload(4), deep_workload(4)],
+        [LfxRunner(), ApiRunRunner(flows), ApiBuildRunner(flows)],
+        runs=3,
+        warmup=1,
+    )
+
+    assert report["skipped"] == []
+    assert {(result["workload"], result["mode"]) for result in report["results"]} == {
+        (workload, mode)
+        for workload in ("synthetic/wide-4", "synthetic/deep-4")
+        for mode in ("lfx", "api_run", "api_build")
+    }
+    for result in report["results"]:
+        assert result["errors"] == 0
+        assert result["latency_s"]["p50"] > 0
+        assert result["phases_s"]["vertex_build"] > 0
+        assert result["slowest_vertices_s"]
+        assert result["allocations"]["peak_bytes"] > 0
+
+    assert not any(row["regression"] for row in compare_reports(report, report))
+    slower = copy.deepcopy(report)
+    slower["results"][0]["latency_s"]["p50"] *= 2
+    regressions = [row for row in compare_reports(slower, report) if row["regression"]]
+    assert [row["metric"] for row in regressions] == ["latency_s.p50"]
@@ -0,0 +1,95 @@
+import shutil
+import subprocess
+import tempfile
+import time
+from unittest.mock import patch
+
+import pytest
+
+NUM_FILES = 2_000
+FILE_SIZE = 2_048
+RUNS = 5
+FILE_FILTER = "*.py,*.md"
+CONTENT_FILTER = r"def \w+"
+
+
+def _git(repo, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],  # noqa: S607
+        check=True,
+        capture_output=True,
+    )
+
+
+def _make_repository(path) -> None:
+    path.mkdir()
+    _git(path, "init", "-b", "main")
+    for index in range(NUM_FILES):
+        directory = path / f"package_{index % 20}"
+        directory.mkdir(exist_ok=True)
+        suffix = (".py", ".md", ".txt", ".json")[index % 4]
+        body = f"def function_{index}():\n    return {index}\n" if index % 3 else f"value = {index}\n"
+        (directory / f"module_{index}{suffix}").write_text(body * (FILE_SIZE // len(body)), encoding="utf-8")
+    _git(path, "add", ".")
+    _git(path, "commit", "-m", "Initial commit")
+
+
+def _clone_and_load(component) -> int:
+    """Load as the component used to: clone into a new directory, then read and filter every file."""
+    from langchain_community.document_loaders.git import GitLoader
+
+    clone_dir = tempfile.mkdtemp(prefix="langflow_clone_")
+    shutil.rmtree(clone_dir)
+    try:
+        loader = GitLoader(
+            repo_path=clone_dir,
+            clone_url=component.clone_url,
+            branch=component.branch,
+            file_filter=component.build_combined_filter(FILE_FILTER, CONTENT_FILTER),
+        )
+        return len(list(loader.lazy_load()))
+    finally:
+        shutil.rmtree(clone_dir, ignore_errors=True)
+
+
+@pytest.mark.benchmark
+def test_git_remote_loading_per_run(tmp_path):
+    """Load a remote repository of 2,000 files several times, as before and from its mirror."""
+    pytest.importorskip("git")
+    from lfx.base.git.mirror import GitBlobCache, GitMirrorCache
+    from lfx.components.git import GitLoaderComponent
+
+    _make_repository(tmp_path / "remote")
+    component = GitLoaderComponent(
+        repo_source="Remote",
+        clone_url=(tmp_path / "remote").as_uri(),
+        branch="main",
+        file_filter=FILE_FILTER,
+        content_filter=CONTENT_FILTER,
+    )
+
+    start = time.perf_counter()
+    before_counts = {_clone_and_load(component) for _ in range(RUNS)}
+    before_s = (time.perf_counter() - start) / RUNS
+
+    mirror_cache = GitMirrorCache(tmp_path / "mirrors")
+    with (
+        patch("lfx.components.git.git.get_git_mirror_cache", return_value=mirror_cache),
+        patch("lfx.components.git.git.get_git_blob_cache", return_value=GitBlobCache()),
+    ):
+        start = time.perf_counter()
+        first_count = len(component.load_remote_documents())
+        first_s = time.perf_counter() - start
+        with patch.object(GitBlobCache, "read_blob", wraps=GitBlobCache.read_blob) as read_blob:
+            start = time.perf_counter()
+            after_counts = {len(component.load_remote_documents()) for _ in range(RUNS - 1)}
+            after_s = (time.perf_counter() - start) / (RUNS - 1)
+
+    print(f"\n{NUM_FILES} files, per run:")
+    print(f"  clone and read every file: {before_s * 1000:.0f}ms")
+    print(f"  first run from the mirror: {first_s * 1000:.0f}ms")
+    print(f"  later runs from the mirror: {after_s * 1000:.0f}ms, {read_blob.call_count} files read")
+
+    assert before_counts == after_counts == {first_count}
+    assert read_blob.call_count == 0
+    assert after_s < before_s / 2
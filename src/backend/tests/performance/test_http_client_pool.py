@@ -0,0 +1,90 @@
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+import uvicorn
+from lfx.components.data.api_request import APIRequestComponent
+from lfx.services.http_client.service import HTTPClientService
+
+NUM_NODES = 50
+NUM_RUNS = 20
+
+
+async def _stub_app(scope, receive, send):  # noqa: ARG001
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+
+@pytest.fixture(scope="module")
+def stub_server_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(_stub_app, host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}/api"
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+async def _run_flow(url: str) -> list[float]:
+    """Run a flow of ``NUM_NODES`` parallel API Request nodes and return the latency of each request."""
+
+    async def run_node() -> float:
+        component = APIRequestComponent(url_input=url, method="GET", timeout=10)
+        start = time.perf_counter()
+        result = await component.make_api_request()
+        assert result.data["result"] == {"ok": True}
+        return time.perf_counter() - start
+
+    return list(await asyncio.gather(*(run_node() for _ in range(NUM_NODES))))
+
+
+async def _measure(url: str) -> tuple[float, float]:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        latencies.extend(await _run_flow(url))
+    duration = time.perf_counter() - start
+    return len(latencies) / duration, statistics.quantiles(latencies, n=100)[98]
+
+
+@pytest.mark.benchmark
+async def test_api_request_shared_client_vs_client_per_request(stub_server_url, monkeypatch):
+    """Benchmark flows of API Request nodes with a client per request and with the pooled client."""
+
+    @asynccontextmanager
+    async def new_client():
+        async with httpx.AsyncClient() as client:
+            yield client
+
+    monkeypatch.setattr("lfx.components.data.api_request.borrow_http_client", new_client)
+    per_request_rps, per_request_p99 = await _measure(stub_server_url)
+
+    service = HTTPClientService()
+
+    @asynccontextmanager
+    async def shared_client():
+        yield service.get_client()
+
+    monkeypatch.setattr("lfx.components.data.api_request.borrow_http_client", shared_client)
+    try:
+        shared_rps, shared_p99 = await _measure(stub_server_url)
+    finally:
+        await service.teardown()
+
+    print(f"\nclient per request: {per_request_rps:.0f} req/s, p99 {per_request_p99 * 1000:.1f}ms")
+    print(f"shared client: {shared_rps:.0f} req/s, p99 {shared_p99 * 1000:.1f}ms")
+
+    assert shared_rps > 0
+    assert per_request_rps > 0
@@ -0,0 +1,71 @@
+import asyncio
+import multiprocessing
+import statistics
+import time
+
+import orjson
+import pytest
+from langflow.services.job_queue.event_log import SQLiteJobEventLog
+
+NUM_EVENTS = 200
+EVENT_INTERVAL = 0.005
+JOB_ID = "benchmark-job"
+
+
+def _read_events(path: str, ready, results) -> None:
+    """Stream the job's events in another worker process and report the delay of each one."""
+
+    async def read() -> list[float]:
+        event_log = SQLiteJobEventLog(path, poll_interval=0.005)
+        latencies = []
+        try:
+            ready.set()
+            async for event in event_log.stream(JOB_ID):
+                latencies.append(time.time() - orjson.loads(event.data)["sent_at"])
+        finally:
+            await event_log.close()
+        return latencies
+
+    results.put(asyncio.run(read()))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_workers", [2, 4, 8])
+async def test_job_event_fan_out_across_workers(tmp_path, num_workers):
+    """Benchmark the delay between a build appending events and readers in other workers receiving them."""
+    path = str(tmp_path / "job_events.db")
+    event_log = SQLiteJobEventLog(path)
+    await event_log.create(JOB_ID)
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    readers = []
+    for _ in range(num_workers):
+        ready = context.Event()
+        process = context.Process(target=_read_events, args=(path, ready, results))
+        process.start()
+        readers.append((process, ready))
+    for _, ready in readers:
+        await asyncio.to_thread(ready.wait, 60)
+
+    try:
+        for index in range(NUM_EVENTS):
+            await event_log.append(JOB_ID, [orjson.dumps({"index": index, "sent_at": time.time()})])
+            await asyncio.sleep(EVENT_INTERVAL)
+        await event_log.append(JOB_ID, [None])
+
+        latencies = []
+        for _ in readers:
+            worker_latencies = await asyncio.to_thread(results.get, True, 60)
+            assert len(worker_latencies) == NUM_EVENTS
+            latencies.extend(worker_latencies)
+    finally:
+        for process, _ in readers:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        await event_log.close()
+
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(f"\n{num_workers} reader workers: fan-out p50 {p50 * 1000:.1f}ms, p99 {p99 * 1000:.1f}ms")
@@ -0,0 +1,80 @@
+import sys
+import time
+
+import pytest
+import structlog
+
+from tests.flow_benchmark.harness import LfxRunner, measure
+from tests.flow_benchmark.metrics import PhaseTimer
+from tests.flow_benchmark.workloads import wide_workload
+
+WIDTH = 32
+RUNS = 20
+LOG_CALLS = 2_000
+
+logger_module = sys.modules["lfx.log.logger"]
+
+
+@pytest.fixture
+def log_stream(tmp_path):
+    """Yield a file to log to, restoring the logging configuration afterwards."""
+    config = structlog.get_config()
+    with (tmp_path / "benchmark.log").open("w") as stream:
+        yield stream
+        logger_module.flush_logs()
+        structlog.configure(**config)
+
+
+async def _time_async_calls(level: str) -> float:
+    """Return the seconds a coroutine waits per enabled log call at ``level``."""
+    log = structlog.get_logger()
+    method = getattr(log, f"a{level.lower()}")
+    start = time.perf_counter()
+    for index in range(LOG_CALLS):
+        await method("Building vertex %s", index, vertex_id=f"vertex-{index}")
+    return (time.perf_counter() - start) / LOG_CALLS
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("level", ["INFO", "DEBUG"])
+async def test_async_log_call_latency(level, log_stream):
+    """Compare the time a coroutine spends in an enabled log call with the synchronous and the queued pipeline."""
+    latencies = {}
+    for log_queue in (False, True):
+        logger_module.configure(log_level=level, output_file=log_stream, log_queue=log_queue, cache=False)
+        await _time_async_calls(level)
+        latencies[log_queue] = await _time_async_calls(level)
+        logger_module.flush_logs()
+
+    print(
+        f"\n{level}: {latencies[False] * 1e6:.1f}us per call with the synchronous pipeline, "
+        f"{latencies[True] * 1e6:.1f}us with the queued pipeline"
+    )
+    assert latencies[True] < latencies[False] / 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("client")
+async def test_logging_overhead_per_run(log_stream):
+    """Report the latency logging adds to runs of a busy flow at INFO and DEBUG, with both pipelines."""
+    workload = wide_workload(WIDTH)
+    timer = PhaseTimer()
+
+    async def p50(level: str, *, log_queue: bool) -> float:
+        logger_module.configure(log_level=level, output_file=log_stream, log_queue=log_queue, cache=False)
+        result = await measure(LfxRunner(), workload, timer, runs=RUNS, warmup=2, measure_allocations=False)
+        logger_module.flush_logs()
+        assert result["errors"] == 0, result["first_error"]
+        return result["latency_s"]["p50"]
+
+    for log_queue in (False, True):
+        pipeline = "queued" if log_queue else "synchronous"
+        baseline = await p50("CRITICAL", log_queue=log_queue)
+        for level in ("INFO", "DEBUG"):
+            latency = await p50(level, log_queue=log_queue)
+            print(
+                f"\n{level} with the {pipeline} pipeline: p50 {latency * 1000:.2f}ms per run, "
+                f"{(latency - baseline) * 1000:+.2f}ms over logging disabled"
+            )
+
+    assert log_stream.tell() > 0
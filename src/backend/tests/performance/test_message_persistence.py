@@ -0,0 +1,38 @@
+import time
+
+import pytest
+from langflow.memory import aadd_messagetables
+from langflow.services.database.models.message.model import MessageTable
+from sqlmodel import func, select
+
+NUM_MESSAGES = 10_000
+
+
+@pytest.mark.benchmark
+async def test_aadd_messagetables_bulk_insert(async_session):
+    """Benchmark persisting 10k messages in a single aadd_messagetables call."""
+    messages = [
+        MessageTable(
+            text=f"Message {i}",
+            sender="User",
+            sender_name="User",
+            session_id="benchmark_session",
+            files=[],
+            properties={"text_color": "blue"},
+            category="message",
+            content_blocks=[],
+        )
+        for i in range(NUM_MESSAGES)
+    ]
+
+    start_time = time.perf_counter()
+    added_messages = await aadd_messagetables(messages, async_session)
+    duration = time.perf_counter() - start_time
+
+    print(f"\naadd_messagetables inserted {NUM_MESSAGES} messages in {duration:.4f}s")
+
+    assert len(added_messages) == NUM_MESSAGES
+    assert [message.id for message in added_messages] == [message.id for message in messages]
+    assert added_messages[-1].text == f"Message {NUM_MESSAGES - 1}"
+    count = (await async_session.exec(select(func.count()).select_from(MessageTable))).one()
+    assert count == NUM_MESSAGES
@@ -0,0 +1,101 @@
+import os
+import socket
+import statistics
+import threading
+import time
+
+import orjson
+import pytest
+import uvicorn
+from lfx.base.models.model_registry import ModelInstanceRegistry
+
+pytest.importorskip("langchain_openai")
+
+NUM_RUNS = 200
+
+COMPLETION = orjson.dumps(
+    {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stub",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+)
+
+
+async def _stub_app(scope, receive, send):
+    """Answer every request with the same OpenAI chat completion."""
+    if scope["type"] != "http":
+        return
+    more_body = True
+    while more_body:
+        message = await receive()
+        more_body = message.get("more_body", False)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": COMPLETION})
+
+
+@pytest.fixture(scope="module")
+def stub_server_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(_stub_app, host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}/v1"
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+def _open_sockets() -> int:
+    fd_dir = "/proc/self/fd"
+    if not os.path.isdir(fd_dir):
+        return -1
+    count = 0
+    for fd in os.listdir(fd_dir):
+        try:
+            count += os.readlink(os.path.join(fd_dir, fd)).startswith("socket:")
+        except OSError:
+            continue
+    return count
+
+
+async def _measure(get_model) -> tuple[float, float, int]:
+    latencies = []
+    for _ in range(NUM_RUNS):
+        start = time.perf_counter()
+        model = get_model()
+        result = await model.ainvoke("ping")
+        assert result.content == "ok"
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies), statistics.quantiles(latencies, n=100)[98], _open_sockets()
+
+
+@pytest.mark.benchmark
+async def test_agent_runs_with_fresh_models_vs_registry(stub_server_url):
+    """Benchmark agent-like runs building a fresh ChatOpenAI each time and reusing one from the registry."""
+    from langchain_openai import ChatOpenAI
+
+    params = {"model_name": "stub", "api_key": "sk-stub", "base_url": stub_server_url, "temperature": 0.1}
+
+    def build():
+        return ChatOpenAI(**params)
+
+    sockets_before = _open_sockets()
+    fresh_p50, fresh_p99, fresh_sockets = await _measure(build)
+
+    registry = ModelInstanceRegistry()
+    pooled_p50, pooled_p99, pooled_sockets = await _measure(
+        lambda: registry.get_or_create("OpenAIModelComponent", params, build, secret_names=["api_key"])
+    )
+
+    print(f"\nopen sockets before: {sockets_before}")
+    print(f"fresh model per run: p50 {fresh_p50 * 1000:.2f}ms, p99 {fresh_p99 * 1000:.2f}ms, sockets {fresh_sockets}")
+    print(f"registry: p50 {pooled_p50 * 1000:.2f}ms, p99 {pooled_p99 * 1000:.2f}ms, sockets {pooled_sockets}")
+
+    assert len(registry) == 1
@@ -0,0 +1,149 @@
+import json
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.flow_benchmark.metrics import current_rss_mb
+
+NUM_DOCUMENTS = 100_000
+DIMENSION = 64
+BATCH_SIZE = 500
+# Simulated latency of the embedding model per request and per document, and of OpenSearch per bulk request
+EMBEDDING_REQUEST_LATENCY = 0.002
+EMBEDDING_DOCUMENT_LATENCY = 0.000_01
+BULK_REQUEST_LATENCY = 0.001
+
+
+def _fakes():
+    from langchain_core.embeddings import Embeddings
+    from opensearchpy.serializer import JSONSerializer
+
+    class FakeEmbeddings(Embeddings):
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            time.sleep(EMBEDDING_REQUEST_LATENCY + EMBEDDING_DOCUMENT_LATENCY * len(texts))
+            return [[(len(text) + dimension) / 100 for dimension in range(DIMENSION)] for text in texts]
+
+        def embed_query(self, text: str) -> list[float]:
+            return [len(text) / 100] * DIMENSION
+
+    class FakeOpenSearch:
+        def __init__(self) -> None:
+            self.transport = MagicMock(serializer=JSONSerializer())
+            self.indices = MagicMock(**{"exists.return_value": True})
+            self.indexed = 0
+
+        def bulk(self, body: str, *_args, **_kwargs) -> dict:
+            time.sleep(BULK_REQUEST_LATENCY)
+            count = body.count("\n") // 2
+            self.indexed += count
+            return {"errors": False, "items": [{"index": {"status": 201}} for _ in range(count)]}
+
+    return FakeEmbeddings(), FakeOpenSearch()
+
+
+def _ingest_all_at_once(docs, embedding, client) -> None:
+    """Ingest as the component used to: embed the whole corpus, then send one list of actions."""
+    from opensearchpy import helpers
+
+    texts = []
+    metadatas = []
+    for doc_obj in docs:
+        data_copy = json.loads(doc_obj.model_dump_json())
+        texts.append(data_copy.pop(doc_obj.text_key, doc_obj.default_value))
+        metadatas.append(data_copy)
+    vectors = embedding.embed_documents(texts)
+    requests = [
+        {
+            "_op_type": "index",
+            "_index": "benchmark",
+            "_id": str(uuid.uuid4()),
+            "vector": vector,
+            "text": text,
+            **metadata,
+        }
+        for text, metadata, vector in zip(texts, metadatas, vectors, strict=True)
+    ]
+    helpers.bulk(client, requests, max_chunk_bytes=1024 * 1024)
+
+
+def _ingest_pipelined(docs, embedding, client) -> None:
+    from lfx.components.elastic.opensearch import OpenSearchVectorStoreComponent
+
+    component = OpenSearchVectorStoreComponent(
+        ingest_data=docs,
+        embedding=embedding,
+        index_name="benchmark",
+        vector_field="vector",
+        username="admin",
+        password="admin",  # noqa: S106
+        ingest_batch_size=BATCH_SIZE,
+    )
+    component.log = MagicMock()
+    component._add_documents_to_vector_store(client)
+
+
+def _run(variant: str, results) -> None:
+    # Imported before measuring, like the component is when the flow runs
+    from lfx.components.elastic.opensearch import OpenSearchVectorStoreComponent  # noqa: F401
+    from lfx.schema.data import Data
+    from opensearchpy import helpers  # noqa: F401
+
+    docs = [Data(text=f"document {index} " * 8, source="benchmark", page=index) for index in range(NUM_DOCUMENTS)]
+    embedding, client = _fakes()
+    rss_before = current_rss_mb()
+    peak_rss = rss_before
+    done = threading.Event()
+
+    def sample_rss() -> None:
+        nonlocal peak_rss
+        while not done.wait(0.01):
+            peak_rss = max(peak_rss, current_rss_mb())
+
+    sampler = threading.Thread(target=sample_rss)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        {"all_at_once": _ingest_all_at_once, "pipelined": _ingest_pipelined}[variant](docs, embedding, client)
+    finally:
+        elapsed = time.perf_counter() - start
+        done.set()
+        sampler.join()
+    results.put((client.indexed / elapsed, peak_rss - rss_before, client.indexed))
+
+
+def _measure(variant: str) -> tuple[float, float, int]:
+    """Ingest in a new process, so that memory freed by the other variant is not reused."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_run, args=(variant, results))
+    process.start()
+    try:
+        while True:
+            try:
+                return results.get(timeout=1)
+            except queue.Empty:
+                if not process.is_alive():
+                    msg = f"The {variant} ingestion process exited with code {process.exitcode}"
+                    raise RuntimeError(msg) from None
+    finally:
+        process.join()
+
+
+@pytest.mark.benchmark
+def test_opensearch_ingest_throughput_and_memory():
+    """Ingest 100k documents with a fake embedding model and OpenSearch client, as before and pipelined."""
+    before_rate, before_rss, before_indexed = _measure("all_at_once")
+    after_rate, after_rss, after_indexed = _measure("pipelined")
+
+    print(f"\n{NUM_DOCUMENTS} documents with {DIMENSION} dimensions:")
+    print(f"  embed all, then index: {before_rate:,.0f} docs/s, peak RSS +{before_rss:.0f}MB")
+    print(f"  pipelined batches of {BATCH_SIZE}: {after_rate:,.0f} docs/s, peak RSS +{after_rss:.0f}MB")
+
+    assert before_indexed == after_indexed == NUM_DOCUMENTS
+    assert after_rate > before_rate
+    assert after_rss < before_rss / 2
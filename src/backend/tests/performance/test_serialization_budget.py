@@ -0,0 +1,112 @@
+import time
+import tracemalloc
+
+import pytest
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.message import Message
+from lfx.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from lfx.serialization.serialization import serialize, serialize_to_json
+
+NUM_ROWS = 100_000
+NUM_MESSAGES = 1_000
+NESTING = 200
+MAX_BYTES = 64_000
+REPEAT = 5
+
+
+def _large_dataframe() -> DataFrame:
+    return DataFrame(
+        {
+            "id": range(NUM_ROWS),
+            "text": ["lorem ipsum dolor sit amet " * 4] * NUM_ROWS,
+            "score": [0.5] * NUM_ROWS,
+        }
+    )
+
+
+def _deep_dict(depth: int) -> dict:
+    node: dict = {"leaf": "x" * 50, "values": list(range(20))}
+    for level in range(depth):
+        node = {"level": level, "child": node, "siblings": [{"index": index} for index in range(5)]}
+    return node
+
+
+def _measure(function) -> tuple[float, float]:
+    """Return the CPU seconds of one call and the peak megabytes it allocated."""
+    function()
+    start = time.process_time()
+    for _ in range(REPEAT):
+        function()
+    cpu = (time.process_time() - start) / REPEAT
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return cpu, peak / 1024 / 1024
+
+
+# Payload, CPU seconds and peak megabytes allowed with the default limits and with a byte budget
+PAYLOADS = {
+    "large_dataframe": (_large_dataframe, 0.05, 2.0),
+    "large_data": (lambda: Data(data={"rows": _large_dataframe().to_dict(orient="records")}), 0.05, 2.0),
+    "deep_dict": (lambda: _deep_dict(NESTING), 0.05, 2.0),
+    "message_list": (
+        lambda: [
+            Message(text=f"message {index} " * 20, sender="User", sender_name="User") for index in range(NUM_MESSAGES)
+        ],
+        0.5,
+        10.0,
+    ),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("payload_name", list(PAYLOADS))
+def test_serialization_stays_within_cpu_and_allocation_targets(payload_name):
+    """Serialize realistic vertex outputs with the limits used for builds and transactions."""
+    make_payload, max_cpu, max_peak_mb = PAYLOADS[payload_name]
+    payload = make_payload()
+
+    limited_cpu, limited_peak = _measure(lambda: serialize(payload, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH))
+    budget_cpu, budget_peak = _measure(
+        lambda: serialize(payload, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH, max_bytes=MAX_BYTES)
+    )
+    json_cpu, json_peak = _measure(
+        lambda: serialize_to_json(payload, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH, max_bytes=MAX_BYTES)
+    )
+
+    print(f"\n{payload_name}:")
+    print(f"  item and length limits: {limited_cpu * 1000:.2f}ms CPU, {limited_peak:.2f}MB peak")
+    print(f"  with a {MAX_BYTES} byte budget: {budget_cpu * 1000:.2f}ms CPU, {budget_peak:.2f}MB peak")
+    print(f"  to JSON bytes: {json_cpu * 1000:.2f}ms CPU, {json_peak:.2f}MB peak")
+
+    assert limited_cpu < max_cpu
+    assert limited_peak < max_peak_mb
+    # The byte budget bounds the work, whatever the size of the payload
+    assert budget_cpu < 0.05
+    assert budget_peak < 1.0
+    assert json_cpu < 0.05
+    assert len(serialize_to_json(payload, max_bytes=MAX_BYTES)) < 2 * MAX_BYTES
+
+
+@pytest.mark.benchmark
+def test_large_data_is_not_dumped_before_truncation():
+    """Compare with dumping the whole model first, as the serializer used to."""
+    data = Data(data={"rows": _large_dataframe().to_dict(orient="records")})
+
+    eager_cpu, eager_peak = _measure(
+        lambda: serialize(data.model_dump(), MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH)
+    )
+    lazy_cpu, lazy_peak = _measure(lambda: serialize(data, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH))
+
+    print(f"\nmodel_dump first: {eager_cpu * 1000:.2f}ms CPU, {eager_peak:.2f}MB peak")
+    print(f"fields read while walking: {lazy_cpu * 1000:.2f}ms CPU, {lazy_peak:.2f}MB peak")
+
+    assert serialize(data, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH) == serialize(
+        data.model_dump(), MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH
+    )
+    assert lazy_cpu < eager_cpu / 5
+    assert lazy_peak < eager_peak / 10
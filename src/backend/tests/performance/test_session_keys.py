@@ -0,0 +1,56 @@
+import copy
+import json
+import time
+from pathlib import Path
+
+import pytest
+from langflow.services.session.utils import compute_dict_hash, compute_graph_fingerprint, get_graph_fingerprint
+
+STARTER_PROJECT = (
+    Path(__file__).parents[2] / "base" / "langflow" / "initial_setup" / "starter_projects" / "Vector Store RAG.json"
+)
+NODE_COUNTS = (10, 50, 100, 500)
+RUNS = 20
+
+
+def _flow(num_nodes: int) -> dict:
+    """Return a flow of ``num_nodes`` nodes copied from a starter project, with their edges."""
+    template = json.loads(STARTER_PROJECT.read_text(encoding="utf-8"))["data"]
+    nodes = []
+    edges = []
+    for copy_index in range(num_nodes // len(template["nodes"]) + 1):
+        for node in template["nodes"]:
+            nodes.append({**copy.deepcopy(node), "id": f"{node['id']}-{copy_index}"})
+        for edge in template["edges"]:
+            source, target = f"{edge['source']}-{copy_index}", f"{edge['target']}-{copy_index}"
+            edges.append({**copy.deepcopy(edge), "source": source, "target": target})
+    node_ids = {node["id"] for node in nodes[:num_nodes]}
+    edges = [edge for edge in edges if edge["source"] in node_ids and edge["target"] in node_ids]
+    return {"nodes": nodes[:num_nodes], "edges": edges, "viewport": {"x": 0, "y": 0, "zoom": 1}}
+
+
+def _per_key_ms(function, flows: list[dict]) -> float:
+    start = time.perf_counter()
+    for flow in flows:
+        function(flow)
+    return (time.perf_counter() - start) * 1000 / len(flows)
+
+
+@pytest.mark.benchmark
+def test_session_key_computation():
+    """Compute the session key of flows of 10 to 500 nodes, each request with its own copy of the flow."""
+    print(f"\n{'nodes':>6} {'full hash':>12} {'fingerprint':>12} {'memoized':>12}")
+    for num_nodes in NODE_COUNTS:
+        flow = _flow(num_nodes)
+        # Each request loads its own copy of the flow, and the full hash removes the layout of its nodes
+        full_hash_ms = _per_key_ms(compute_dict_hash, [copy.deepcopy(flow) for _ in range(RUNS)])
+        fingerprint_ms = _per_key_ms(compute_graph_fingerprint, [flow] * RUNS)
+        get_graph_fingerprint(flow, flow_id=f"flow-{num_nodes}", flow_version=1)
+        memoized_ms = _per_key_ms(
+            lambda flow, num_nodes=num_nodes: get_graph_fingerprint(flow, flow_id=f"flow-{num_nodes}", flow_version=1),
+            [flow] * RUNS,
+        )
+        print(f"{num_nodes:>6} {full_hash_ms:>10.2f}ms {fingerprint_ms:>10.2f}ms {memoized_ms:>10.4f}ms")
+
+        assert fingerprint_ms < full_hash_ms
+        assert memoized_ms < fingerprint_ms / 10
@@ -0,0 +1,45 @@
+import sqlite3
+import time
+
+import pytest
+from langchain_community.utilities import SQLDatabase
+from lfx.base.data.sql_engines import sql_engine_registry
+from lfx.components.data.sql_executor import SQLComponent
+
+NUM_TABLES = 50
+NUM_QUERIES = 50
+QUERY = "SELECT * FROM table_0 WHERE id < 100"
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    db_path = tmp_path / "benchmark.db"
+    conn = sqlite3.connect(db_path)
+    for i in range(NUM_TABLES):
+        conn.execute(f"CREATE TABLE table_{i} (id INTEGER PRIMARY KEY, name TEXT, value REAL)")
+        conn.executemany(f"INSERT INTO table_{i} VALUES (?, ?, ?)", [(j, f"name_{j}", j / 3) for j in range(1000)])
+    conn.commit()
+    conn.close()
+    yield f"sqlite:///{db_path}"
+    sql_engine_registry.clear()
+
+
+@pytest.mark.benchmark
+def test_sql_component_repeated_queries(database_url):
+    """Benchmark repeated queries with a new SQLDatabase per run and with the engine registry."""
+    start = time.perf_counter()
+    for _ in range(NUM_QUERIES):
+        db = SQLDatabase.from_uri(database_url)
+        rows = db.run(QUERY, fetch="cursor").fetchall()
+        db._engine.dispose()
+    per_run_duration = time.perf_counter() - start
+    assert len(rows) == 100
+
+    start = time.perf_counter()
+    for _ in range(NUM_QUERIES):
+        result = SQLComponent(database_url=database_url, query=QUERY).run_sql_query()
+    registry_duration = time.perf_counter() - start
+    assert len(result) == 100
+
+    print(f"\nSQLDatabase per run: {per_run_duration / NUM_QUERIES * 1000:.2f}ms per query")
+    print(f"Engine registry: {registry_duration / NUM_QUERIES * 1000:.2f}ms per query")
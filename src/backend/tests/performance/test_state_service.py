@@ -0,0 +1,127 @@
+import multiprocessing
+import queue
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.flow_benchmark.metrics import current_rss_mb
+
+NUM_RUNS = 200_000
+THREADS = 8
+KEYS = ("topic", "history", "answer")
+# Size of the states written by each run, in characters
+STATE_SIZE = 200
+
+
+class GlobalLockStateService:
+    """The state service as it was: one lock for every run, observers notified under it, nothing dropped."""
+
+    def __init__(self) -> None:
+        self.states: dict[str, dict] = {}
+        self.observers: dict[str, list] = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def append_state(self, key, new_state, run_id: str) -> None:
+        with self.lock:
+            states = self.states.setdefault(run_id, {})
+            if key not in states:
+                states[key] = []
+            elif not isinstance(states[key], list):
+                states[key] = [states[key]]
+            states[key].append(new_state)
+            for callback in self.observers[key]:
+                callback(key, new_state, append=True)
+
+    def update_state(self, key, new_state, run_id: str) -> None:
+        with self.lock:
+            self.states.setdefault(run_id, {})[key] = new_state
+            for callback in self.observers[key]:
+                callback(key, new_state, append=False)
+
+    def get_state(self, key, run_id: str):
+        with self.lock:
+            return self.states.get(run_id, {}).get(key, "")
+
+    def subscribe(self, key, observer) -> None:
+        with self.lock:
+            self.observers[key].append(observer)
+
+    def clear_run(self, run_id: str) -> None:
+        """Not available before, runs were never dropped."""
+
+
+def _run(service, run_index: int) -> None:
+    run_id = f"run-{run_index}"
+    payload = f"{run_index}".ljust(STATE_SIZE, "x")
+    for key in KEYS:
+        service.update_state(key, payload, run_id=run_id)
+        service.append_state(key, payload, run_id=run_id)
+        service.get_state(key, run_id=run_id)
+    # Half of the runs end normally, the others are left to the TTL and the maximum number of runs
+    if run_index % 2:
+        service.clear_run(run_id)
+
+
+def _soak(variant: str, results) -> None:
+    """Put the runs per second, the growth of RSS in MB and the runs kept over ``NUM_RUNS`` parallel runs."""
+    from langflow.services.state.service import InMemoryStateService
+
+    if variant == "sharded":
+        settings = SimpleNamespace(run_state_ttl=60.0, run_state_max_runs=10_000, run_state_async_observers=False)
+        service = InMemoryStateService(MagicMock(settings=settings))
+    else:
+        service = GlobalLockStateService()
+    service.subscribe("answer", lambda _key, _state, *, append: time.sleep(0) if append else None)
+
+    def worker(first_run: int) -> None:
+        for run_index in range(first_run, NUM_RUNS, THREADS):
+            _run(service, run_index)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(THREADS)]
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    runs_kept = len(service) if variant == "sharded" else len(service.states)
+    results.put((NUM_RUNS / elapsed, current_rss_mb() - rss_before, runs_kept))
+
+
+def _measure(variant: str) -> tuple[float, float, int]:
+    """Soak in a new process, so that memory freed by the other variant is not reused."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_soak, args=(variant, results))
+    process.start()
+    try:
+        while True:
+            try:
+                return results.get(timeout=1)
+            except queue.Empty:
+                if not process.is_alive():
+                    msg = f"The {variant} soak process exited with code {process.exitcode}"
+                    raise RuntimeError(msg) from None
+    finally:
+        process.join()
+
+
+@pytest.mark.benchmark
+def test_state_service_soak():
+    """Run 200k runs from 8 threads against the state service, before and after sharding."""
+    before_rate, before_rss, before_kept = _measure("global_lock")
+    after_rate, after_rss, after_kept = _measure("sharded")
+
+    print(f"\n{NUM_RUNS} runs from {THREADS} threads:")
+    print(f"  one lock: {before_rate:,.0f} runs/s, RSS +{before_rss:.0f}MB, {before_kept} runs kept")
+    print(f"  sharded: {after_rate:,.0f} runs/s, RSS +{after_rss:.0f}MB, {after_kept} runs kept")
+
+    assert before_kept == NUM_RUNS
+    assert after_kept <= 10_000
+    assert after_rss < before_rss / 4
+    assert after_rate > before_rate * 0.8
@@ -0,0 +1,96 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langflow.services.auth import utils as auth_utils
+from langflow.services.deps import get_db_service, get_settings_service, session_scope
+from langflow.services.variable.service import DatabaseVariableService
+from lfx.custom.custom_component.custom_component import CustomComponent
+from lfx.interface.initialize.loading import update_params_with_load_from_db_fields
+from sqlalchemy import event
+
+NUM_COMPONENTS = 15
+FIELDS_PER_COMPONENT = 3
+NUM_VARIABLES = 20
+RUNS = 10
+
+
+def _component_params(index: int) -> dict:
+    return {
+        f"field_{field}": f"BENCHMARK_KEY_{(index * FIELDS_PER_COMPONENT + field) % NUM_VARIABLES}"
+        for field in range(FIELDS_PER_COMPONENT)
+    }
+
+
+class _QueryCounter:
+    def __init__(self, engine) -> None:
+        self.engine = engine.sync_engine
+        self.count = 0
+
+    def __call__(self, *_args) -> None:
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        event.remove(self.engine, "before_cursor_execute", self)
+
+
+async def _resolve_flow_variables(user_id) -> None:
+    """Resolve the credential fields of every component of the flow, as a run builds its vertices."""
+    for index in range(NUM_COMPONENTS):
+        params = _component_params(index)
+        resolved = await update_params_with_load_from_db_fields(CustomComponent(_user_id=user_id), params, list(params))
+        assert all(value.startswith("secret-") for value in resolved.values())
+
+
+async def _measure(user_id, *, before_run=None) -> tuple[float, float]:
+    """Return the seconds and the queries of one run, averaged over the runs."""
+    counter = _QueryCounter(get_db_service().engine)
+    elapsed = 0.0
+    with counter:
+        for _ in range(RUNS):
+            if before_run:
+                before_run()
+            start = time.perf_counter()
+            await _resolve_flow_variables(user_id)
+            elapsed += time.perf_counter() - start
+    return elapsed / RUNS, counter.count / RUNS
+
+
+@pytest.mark.benchmark
+async def test_variable_resolution_per_run(active_user):
+    """Resolve the credentials of a flow with many model and tool components on SQLite."""
+    settings_service = get_settings_service()
+    service = DatabaseVariableService(settings_service)
+    async with session_scope() as session:
+        for index in range(NUM_VARIABLES):
+            await service.create_variable(active_user.id, f"BENCHMARK_KEY_{index}", f"secret-{index}", session=session)
+
+    with patch.object(settings_service.settings, "variable_cache_ttl", 0):
+        uncached_service = DatabaseVariableService(settings_service)
+    variable_service = "lfx.custom.custom_component.custom_component.get_variable_service"
+
+    # As before: one query and one new Fernet per field
+    with (
+        patch(variable_service, return_value=uncached_service),
+        patch("lfx.interface.initialize.loading.prefetch_load_from_db_variables", AsyncMock()),
+        patch.object(auth_utils, "_get_fernet_for_key", auth_utils._get_fernet_for_key.__wrapped__),
+    ):
+        per_field_s, per_field_queries = await _measure(active_user.id)
+
+    with patch(variable_service, return_value=service):
+        cold_s, cold_queries = await _measure(active_user.id, before_run=service._cache.clear)
+        warm_s, warm_queries = await _measure(active_user.id)
+
+    print(f"\n{NUM_COMPONENTS} components with {FIELDS_PER_COMPONENT} credential fields each, per run:")
+    print(f"  one query per field: {per_field_s * 1000:.1f}ms, {per_field_queries:.0f} queries")
+    print(f"  one query per component: {cold_s * 1000:.1f}ms, {cold_queries:.0f} queries")
+    print(f"  cached values: {warm_s * 1000:.1f}ms, {warm_queries:.0f} queries")
+
+    assert per_field_queries >= NUM_COMPONENTS * FIELDS_PER_COMPONENT
+    assert cold_queries <= NUM_COMPONENTS
+    assert warm_queries == 0
+    assert warm_s < per_field_s / 2
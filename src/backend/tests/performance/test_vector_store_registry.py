@@ -0,0 +1,86 @@
+import hashlib
+import time
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from lfx.base.vectorstores.registry import CachedQueryEmbeddings, QueryEmbeddingCache, VectorStoreRegistry
+
+NUM_DOCUMENTS = 2_000
+NUM_QUERIES = 20
+EMBEDDING_LATENCY = 0.05
+DIMENSIONS = 64
+
+
+class FakeRemoteEmbeddings(Embeddings):
+    """Deterministic embeddings that wait like a call to a remote provider."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
+    @staticmethod
+    def _embed(text: str) -> list[float]:
+        digest = hashlib.sha512(text.encode()).digest()
+        return [byte / 255 for byte in digest[:DIMENSIONS]]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        time.sleep(self.latency)
+        return self._embed(text)
+
+
+@pytest.mark.benchmark
+def test_hot_queries_only_pay_the_vector_search(tmp_path):
+    """Compare opening the store and embedding the query on every search with the registry and cache."""
+    chroma_module = pytest.importorskip("langchain_chroma")
+    persist_directory = str(tmp_path / "kb")
+    chroma_module.Chroma.from_texts(
+        [f"document {index}" for index in range(NUM_DOCUMENTS)],
+        FakeRemoteEmbeddings(),
+        persist_directory=persist_directory,
+        collection_name="benchmark_kb",
+    )
+    queries = [f"query {index % 5}" for index in range(NUM_QUERIES)]
+
+    def open_store(embeddings):
+        return chroma_module.Chroma(
+            persist_directory=persist_directory, embedding_function=embeddings, collection_name="benchmark_kb"
+        )
+
+    start = time.perf_counter()
+    for query in queries:
+        cold_results = open_store(FakeRemoteEmbeddings(EMBEDDING_LATENCY)).similarity_search(query, k=5)
+    cold = (time.perf_counter() - start) / NUM_QUERIES
+
+    registry = VectorStoreRegistry()
+    cache = QueryEmbeddingCache()
+    key = VectorStoreRegistry.make_key(persist_directory, "benchmark_kb", {"provider": "fake"})
+
+    def registered_store():
+        return registry.get_or_create(
+            key,
+            persist_directory,
+            lambda: open_store(CachedQueryEmbeddings(FakeRemoteEmbeddings(EMBEDDING_LATENCY), "fake", cache)),
+        )
+
+    for query in set(queries):
+        registered_store().similarity_search(query, k=5)
+    start = time.perf_counter()
+    for query in queries:
+        hot_results = registered_store().similarity_search(query, k=5)
+    hot = (time.perf_counter() - start) / NUM_QUERIES
+
+    store = open_store(FakeRemoteEmbeddings())
+    vectors = {query: FakeRemoteEmbeddings._embed(query) for query in queries}
+    start = time.perf_counter()
+    for query in queries:
+        store.similarity_search_by_vector(vectors[query], k=5)
+    search = (time.perf_counter() - start) / NUM_QUERIES
+
+    assert hot_results == cold_results
+    assert hot < EMBEDDING_LATENCY < cold
+    print(
+        f"\ncold query {cold * 1000:.1f}ms, hot query {hot * 1000:.2f}ms, "
+        f"vector search alone {search * 1000:.2f}ms"
+    )
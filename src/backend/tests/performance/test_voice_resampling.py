@@ -0,0 +1,116 @@
+import asyncio
+import base64
+import time
+
+import numpy as np
+import pytest
+from langflow.utils.voice_utils import BYTES_PER_24K_FRAME, SAMPLE_RATE_24K, StreamingResampler, resample_24k_to_16k
+
+AUDIO_SECONDS = 10
+# Clients send about 100ms of audio per message
+CHUNK_BYTES = 4800
+SESSIONS = 50
+SESSION_SECONDS = 2
+
+
+def _synthetic_chunks(seconds: float) -> list[str]:
+    """Base64 chunks of speech-like PCM16 at 24kHz: a few tones under noise."""
+    rng = np.random.default_rng(42)
+    t = np.arange(int(SAMPLE_RATE_24K * seconds)) / SAMPLE_RATE_24K
+    signal = sum(np.sin(2 * np.pi * frequency * t) for frequency in (220, 440, 1250)) * 4000
+    audio = (signal + rng.normal(0, 800, len(t))).astype(np.int16).tobytes()
+    return [
+        base64.b64encode(audio[offset : offset + CHUNK_BYTES]).decode() for offset in range(0, len(audio), CHUNK_BYTES)
+    ]
+
+
+def _process_per_frame(chunks: list[str]) -> int:
+    """Process the chunks as voice mode used to: copy frames out of a buffer and resample each on its own."""
+    buffer = bytearray()
+    frames = 0
+    for base64_data in chunks:
+        buffer.extend(base64.b64decode(base64_data))
+        while len(buffer) >= BYTES_PER_24K_FRAME:
+            frame_24k = buffer[:BYTES_PER_24K_FRAME]
+            del buffer[:BYTES_PER_24K_FRAME]
+            resample_24k_to_16k(frame_24k)
+            frames += 1
+    return frames
+
+
+def _process_streaming(chunks: list[str], resampler: StreamingResampler | None = None) -> int:
+    resampler = resampler or StreamingResampler()
+    frames = 0
+    for base64_data in chunks:
+        for _ in resampler.feed(base64.b64decode(base64_data)):
+            frames += 1
+    return frames
+
+
+def _cpu_ms_per_audio_second(process, chunks: list[str]) -> float:
+    process(chunks)
+    best = float("inf")
+    for _ in range(3):
+        start = time.thread_time()
+        process(chunks)
+        best = min(best, time.thread_time() - start)
+    return best * 1000 / AUDIO_SECONDS
+
+
+async def _max_loop_lag_ms(process, *, off_loop: bool) -> float:
+    """Stream audio of many sessions at once and return the longest the event loop was blocked."""
+    chunks = _synthetic_chunks(SESSION_SECONDS)
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - start - 0.001)
+
+    async def session() -> None:
+        resampler = StreamingResampler()
+        for chunk in chunks:
+            if off_loop:
+                await asyncio.to_thread(process, [chunk], resampler)
+            else:
+                process([chunk])
+            await asyncio.sleep(0)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*(session() for _ in range(SESSIONS)))
+    done.set()
+    await monitor
+    return lag * 1000
+
+
+@pytest.mark.benchmark
+def test_voice_resampling_cpu_per_audio_second():
+    """Decode and resample synthetic 24kHz PCM to 16kHz, per frame as before and streaming."""
+    chunks = _synthetic_chunks(AUDIO_SECONDS)
+    assert _process_per_frame(chunks) == _process_streaming(chunks) == AUDIO_SECONDS * 50
+
+    before = _cpu_ms_per_audio_second(_process_per_frame, chunks)
+    after = _cpu_ms_per_audio_second(_process_streaming, chunks)
+
+    print(f"\nDecoding and resampling {AUDIO_SECONDS}s of audio in {CHUNK_BYTES}-byte chunks:")
+    print(f"  FFT per frame:       {before:.2f}ms CPU per audio second, ~{1000 / before:,.0f} sessions per core")
+    print(f"  streaming polyphase: {after:.2f}ms CPU per audio second, ~{1000 / after:,.0f} sessions per core")
+
+    assert after < before
+
+
+@pytest.mark.benchmark
+def test_voice_resampling_event_loop_lag():
+    """Stream audio of many concurrent sessions and measure how long the event loop is blocked."""
+    before = asyncio.run(_max_loop_lag_ms(_process_per_frame, off_loop=False))
+    after = asyncio.run(_max_loop_lag_ms(_process_streaming, off_loop=True))
+
+    print(f"\n{SESSIONS} sessions streaming {SESSION_SECONDS}s of audio at once:")
+    print(f"  resampled on the event loop:   max loop lag {before:.1f}ms")
+    print(f"  resampled in a worker thread:  max loop lag {after:.1f}ms")
+
+    assert after < before
@@ -101,6 +101,27 @@ async def test_aadd_messagetables(async_session):
     assert added_messages[0].text == "New Test message"
 
 
+@pytest.mark.usefixtures("client")
+async def test_aadd_messagetables_preserves_order_and_decodes_json(async_session):
+    messages = [
+        MessageTable(
+            text=f"Message {i}",
+            sender="User",
+            sender_name="User",
+            session_id="bulk_session_id",
+            properties='{"text_color": "red"}',
+            content_blocks=['{"title": "Block", "contents": []}'],
+        )
+        for i in range(3)
+    ]
+    added_messages = await aadd_messagetables(messages, async_session)
+    assert [message.id for message in added_messages] == [message.id for message in messages]
+    assert [message.text for message in added_messages] == ["Message 0", "Message 1", "Message 2"]
+    assert added_messages[0].properties.text_color == "red"
+    assert added_messages[0].content_blocks[0].title == "Block"
+    assert added_messages[0].category == ""
+
+
 @pytest.mark.usefixtures("client")
 def test_delete_messages():
     session_id = "new_session_id"
@@ -1,12 +1,13 @@
-from unittest.mock import Mock, patch
-
+import httpx
 import pytest
-import requests
+import respx
 from lfx.components.data.news_search import NewsSearchComponent
 from lfx.schema import DataFrame
 
 from tests.base import ComponentTestBaseWithoutClient
 
+NEWS_RSS_URL = "https://news.google.com/rss"
+
 
 class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
@@ -21,7 +22,7 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
     def file_names_mapping(self):
         return []
 
-    def test_successful_news_search(self):
+    async def test_successful_news_search(self):
         # Mock Google News RSS feed content
         mock_rss_content = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -42,13 +43,10 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
             </channel>
         </rss>
         """
-        mock_response = Mock()
-        mock_response.content = mock_rss_content.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-
-        with patch("requests.get", return_value=mock_response):
+        with respx.mock:
+            respx.get(url__startswith=NEWS_RSS_URL).mock(return_value=httpx.Response(200, text=mock_rss_content))
             component = NewsSearchComponent(query="OpenAI")
-            result = component.search_news()
+            result = await component.search_news()
             assert isinstance(result, DataFrame)
             news_results_df = result
             assert len(news_results_df) == 2
@@ -56,17 +54,18 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
             assert news_results_df.iloc[0]["title"] == "Test News 1"
             assert news_results_df.iloc[1]["title"] == "Test News 2"
 
-    def test_news_search_error(self):
-        with patch("requests.get", side_effect=requests.RequestException("Network error")):
+    async def test_news_search_error(self):
+        with respx.mock:
+            respx.get(url__startswith=NEWS_RSS_URL).mock(side_effect=httpx.ConnectError("Network error"))
             component = NewsSearchComponent(query="OpenAI")
-            result = component.search_news()
+            result = await component.search_news()
             assert isinstance(result, DataFrame)
             news_results_df = result
             assert len(news_results_df) == 1
             assert news_results_df.iloc[0]["title"] == "Error"
             assert "Network error" in news_results_df.iloc[0]["summary"]
 
-    def test_empty_news_results(self):
+    async def test_empty_news_results(self):
         # Mock empty RSS feed
         mock_rss_content = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -75,13 +74,10 @@ class TestNewsSearchComponent(ComponentTestBaseWithoutClient):
             </channel>
         </rss>
         """
-        mock_response = Mock()
-        mock_response.content = mock_rss_content.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-
-        with patch("requests.get", return_value=mock_response):
+        with respx.mock:
+            respx.get(url__startswith=NEWS_RSS_URL).mock(return_value=httpx.Response(200, text=mock_rss_content))
             component = NewsSearchComponent(query="OpenAI")
-            result = component.search_news()
+            result = await component.search_news()
             assert isinstance(result, DataFrame)
             news_results_df = result
             assert len(news_results_df) == 1
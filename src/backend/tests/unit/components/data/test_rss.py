@@ -1,7 +1,6 @@
-from unittest.mock import Mock, patch
-
+import httpx
 import pytest
-import requests
+import respx
 from lfx.components.data.rss import RSSReaderComponent
 from lfx.schema import DataFrame
 
@@ -26,7 +25,7 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         """Return an empty list since this component doesn't have version-specific files."""
         return []
 
-    def test_successful_rss_fetch(self):
+    async def test_successful_rss_fetch(self):
         # Mock RSS feed content
         mock_rss_content = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -48,14 +47,10 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         </rss>
         """
 
-        # Mock the requests.get response
-        mock_response = Mock()
-        mock_response.content = mock_rss_content.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-
-        with patch("requests.get", return_value=mock_response):
+        with respx.mock:
+            respx.get("https://example.com/feed.xml").mock(return_value=httpx.Response(200, text=mock_rss_content))
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
-            result = component.read_rss()
+            result = await component.read_rss()
 
             assert isinstance(result, DataFrame)
             assert len(result) == 2
@@ -63,7 +58,7 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
             assert result.iloc[0]["title"] == "Test Article 1"
             assert result.iloc[1]["title"] == "Test Article 2"
 
-    def test_rss_fetch_with_missing_fields(self):
+    async def test_rss_fetch_with_missing_fields(self):
         # Mock RSS feed content with missing fields
         mock_rss_content = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -79,13 +74,10 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         </rss>
         """
 
-        mock_response = Mock()
-        mock_response.content = mock_rss_content.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-
-        with patch("requests.get", return_value=mock_response):
+        with respx.mock:
+            respx.get("https://example.com/feed.xml").mock(return_value=httpx.Response(200, text=mock_rss_content))
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
-            result = component.read_rss()
+            result = await component.read_rss()
 
             assert isinstance(result, DataFrame)
             assert len(result) == 1
@@ -93,11 +85,12 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
             assert result.iloc[0]["link"] == ""
             assert result.iloc[0]["summary"] == ""
 
-    def test_rss_fetch_error(self):
+    async def test_rss_fetch_error(self):
         # Mock a failed request
-        with patch("requests.get", side_effect=requests.RequestException("Network error")):
+        with respx.mock:
+            respx.get("https://example.com/feed.xml").mock(side_effect=httpx.ConnectError("Network error"))
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
-            result = component.read_rss()
+            result = await component.read_rss()
 
             assert isinstance(result, DataFrame)
             assert len(result) == 1
@@ -106,7 +99,7 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
             assert result.iloc[0]["published"] == ""
             assert "Network error" in result.iloc[0]["summary"]
 
-    def test_empty_rss_feed(self):
+    async def test_empty_rss_feed(self):
         # Mock empty RSS feed
         mock_rss_content = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -116,13 +109,10 @@ class TestRSSReaderComponent(ComponentTestBaseWithoutClient):
         </rss>
         """
 
-        mock_response = Mock()
-        mock_response.content = mock_rss_content.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-
-        with patch("requests.get", return_value=mock_response):
+        with respx.mock:
+            respx.get("https://example.com/feed.xml").mock(return_value=httpx.Response(200, text=mock_rss_content))
             component = RSSReaderComponent(rss_url="https://example.com/feed.xml")
-            result = component.read_rss()
+            result = await component.read_rss()
 
             assert isinstance(result, DataFrame)
             assert len(result) == 0
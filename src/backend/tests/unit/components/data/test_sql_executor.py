@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 
 import pytest
+from lfx.base.data.sql_engines import sql_engine_registry
 from lfx.components.data.sql_executor import SQLComponent
 from lfx.schema import DataFrame, Message
 
@@ -30,6 +31,8 @@ class TestSQLComponent(ComponentTestBaseWithoutClient):
         conn.close()
         yield str(db_path)
 
+        # Pooled connections would keep the deleted file open
+        sql_engine_registry.clear()
         Path(db_path).unlink()
 
     @pytest.fixture
@@ -101,3 +104,39 @@ class TestSQLComponent(ComponentTestBaseWithoutClient):
         assert "name" in result.columns
         assert result.iloc[0]["id"] == 1
         assert result.iloc[0]["name"] == "name_test"
+
+    def test_run_sql_query_with_max_rows(self, component_class: type[SQLComponent], default_kwargs):
+        """Test that the result table is cut at max_rows."""
+        default_kwargs["query"] = (
+            "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n LIMIT 2500) SELECT x FROM n"
+        )
+        default_kwargs["max_rows"] = 1200
+        component = component_class(**default_kwargs)
+
+        result = component.run_sql_query()
+
+        assert len(result) == 1200
+        assert list(result.columns) == ["x"]
+        assert result.iloc[-1]["x"] == 1200
+
+    def test_run_sql_query_without_rows(self, component_class: type[SQLComponent], default_kwargs):
+        """Test a statement that returns no rows."""
+        default_kwargs["query"] = "UPDATE test SET name = 'updated' WHERE id = 1"
+        component = component_class(**default_kwargs)
+
+        result = component.run_sql_query()
+
+        assert isinstance(result, DataFrame)
+        assert result.empty
+        updated = component_class(**default_kwargs | {"query": "SELECT name FROM test"}).run_sql_query()
+        assert updated.iloc[0]["name"] == "updated"
+
+    def test_components_share_engine(self, component_class: type[SQLComponent], default_kwargs):
+        """Test that components targeting the same database reuse its engine and SQLDatabase."""
+        first = component_class(**default_kwargs)
+        first.run_sql_query()
+        second = component_class(**default_kwargs)
+        second.run_sql_query()
+
+        assert first.engine is second.engine
+        assert first.db is second.db
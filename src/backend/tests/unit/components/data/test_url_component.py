@@ -1,3 +1,4 @@
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -40,7 +41,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         with patch("langchain_community.document_loaders.RecursiveUrlLoader.load") as mock:
             yield mock
 
-    def test_url_component_basic_functionality(self, mock_recursive_loader):
+    async def test_url_component_basic_functionality(self, mock_recursive_loader):
         """Test basic URLComponent functionality."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
@@ -57,7 +58,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         )
         mock_recursive_loader.return_value = [mock_doc]
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert isinstance(data_frame, DataFrame)
         assert len(data_frame) == 1
 
@@ -69,7 +70,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert row["content_type"] == "text/html"
         assert row["language"] == "en"
 
-    def test_url_component_multiple_urls(self, mock_recursive_loader):
+    async def test_url_component_multiple_urls(self, mock_recursive_loader):
         """Test URLComponent with multiple URL inputs."""
         # Setup component with multiple URLs
         component = URLComponent()
@@ -104,7 +105,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         mock_recursive_loader.return_value = mock_docs
 
         # Execute component
-        result = component.fetch_content()
+        result = await component.fetch_content()
 
         # Verify results
         assert isinstance(result, DataFrame)
@@ -124,7 +125,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert second_row["title"] == "Second Page"
         assert second_row["description"] == "Second Description"
 
-    def test_url_component_format_options(self, mock_recursive_loader):
+    async def test_url_component_format_options(self, mock_recursive_loader):
         """Test URLComponent with different format options."""
         component = URLComponent()
 
@@ -142,7 +143,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
                 },
             )
         ]
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "extracted text"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
@@ -160,11 +161,11 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
                 },
             )
         ]
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "<html>raw html</html>"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
-    def test_url_component_missing_metadata(self, mock_recursive_loader):
+    async def test_url_component_missing_metadata(self, mock_recursive_loader):
         """Test URLComponent with missing metadata fields."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"]})
@@ -175,7 +176,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         )
         mock_recursive_loader.return_value = [mock_doc]
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         row = data_frame.iloc[0]
         assert row["text"] == "test content"
         assert row["url"] == "https://example.com"
@@ -184,26 +185,49 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert row["content_type"] == ""  # Default empty string
         assert row["language"] == ""  # Default empty string
 
-    def test_url_component_error_handling(self, mock_recursive_loader):
+    async def test_url_component_error_handling(self, mock_recursive_loader):
         """Test error handling in URLComponent."""
         component = URLComponent()
 
         # Test empty URLs
         component.set_attributes({"urls": []})
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test request exception
         component.set_attributes({"urls": ["https://example.com"]})
         mock_recursive_loader.side_effect = Exception("Connection error")
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test no documents found
         mock_recursive_loader.side_effect = None
         mock_recursive_loader.return_value = []
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
+
+    async def test_url_component_crawls_concurrently_in_input_order(self):
+        """Test that URLs are crawled concurrently and the documents keep the input order."""
+        component = URLComponent()
+        urls = [f"https://example{i}.com" for i in range(4)]
+        component.set_attributes({"urls": urls})
+
+        def create_loader(url):
+            def load():
+                # Later URLs finish first
+                time.sleep(0.05 * (len(urls) - urls.index(url)))
+                return [Mock(page_content=f"Content from {url}", metadata={"source": url})]
+
+            return Mock(load=load)
+
+        with patch.object(URLComponent, "_create_loader", side_effect=create_loader):
+            start = time.perf_counter()
+            data_frame = await component.fetch_content()
+            duration = time.perf_counter() - start
+
+        assert list(data_frame["url"]) == urls
+        # Sequential crawling would take 0.5s
+        assert duration < 0.4
 
     def test_url_component_ensure_url(self):
         """Test URLComponent's ensure_url method."""
@@ -1,7 +1,9 @@
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
+import httpx
 import pandas as pd
 import pytest
+import respx
 from lfx.components.data.web_search import WebSearchComponent
 from lfx.schema import DataFrame
 
@@ -112,34 +114,34 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
         assert result["query"]["info"] == "RSS feed URL to parse"
         assert result["query"]["display_name"] == "RSS Feed URL"
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_web_search_success(self, mock_get):
+    @respx.mock
+    async def test_perform_web_search_success(self):
         """Test successful web search."""
         component = WebSearchComponent()
         component.query = "test query"
         component.timeout = 5
 
         # Mock DuckDuckGo response
-        mock_response = Mock()
-        mock_response.text = """
+        respx.get(url__startswith="https://html.duckduckgo.com/html/").mock(
+            return_value=httpx.Response(
+                200,
+                text="""
         <html>
             <div class="result">
                 <a class="result__a" href="?uddg=https%3A%2F%2Fexample.com">Test Title</a>
                 <a class="result__snippet">Test snippet content</a>
             </div>
         </html>
-        """
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status.return_value = None
-
+        """,
+                headers={"content-type": "text/html"},
+            )
+        )
         # Mock the page fetch
-        mock_page_response = Mock()
-        mock_page_response.text = "<html><body>Page content</body></html>"
-        mock_page_response.raise_for_status.return_value = None
-
-        mock_get.side_effect = [mock_response, mock_page_response]
+        respx.get("https://example.com").mock(
+            return_value=httpx.Response(200, text="<html><body>Page content</body></html>")
+        )
 
-        result = component.perform_web_search()
+        result = await component.perform_web_search()
 
         assert isinstance(result, DataFrame)
         assert len(result) == 1
@@ -147,51 +149,74 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
         assert result.iloc[0]["snippet"] == "Test snippet content"
         assert "Page content" in result.iloc[0]["content"]
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_web_search_no_results(self, mock_get):
-        """Test web search with no results."""
+    @respx.mock
+    async def test_perform_web_search_keeps_result_order(self):
+        """Test that result pages fetched concurrently keep the order of the search results."""
         component = WebSearchComponent()
         component.query = "test query"
         component.timeout = 5
 
-        mock_response = Mock()
-        mock_response.text = ""
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status.return_value = None
+        hosts = [f"site{i}.example.com" for i in range(5)]
+        links = "".join(
+            f'<div class="result"><a class="result__a" href="https://{host}/">{host}</a></div>' for host in hosts
+        )
+        respx.get(url__startswith="https://html.duckduckgo.com/html/").mock(
+            return_value=httpx.Response(200, text=f"<html>{links}</html>", headers={"content-type": "text/html"})
+        )
+        for host in hosts:
+            respx.get(f"https://{host}/").mock(
+                return_value=httpx.Response(200, text=f"<html><body>Page of {host}</body></html>")
+            )
+
+        result = await component.perform_web_search()
+
+        assert list(result["title"]) == hosts
+        assert [content.split()[-1] for content in result["content"]] == hosts
+
+    @respx.mock
+    async def test_perform_web_search_no_results(self):
+        """Test web search with no results."""
+        component = WebSearchComponent()
+        component.query = "test query"
+        component.timeout = 5
 
-        mock_get.return_value = mock_response
+        respx.get(url__startswith="https://html.duckduckgo.com/html/").mock(
+            return_value=httpx.Response(200, text="", headers={"content-type": "text/html"})
+        )
 
-        result = component.perform_web_search()
+        result = await component.perform_web_search()
 
         assert isinstance(result, DataFrame)
         assert "No results found" in result.iloc[0]["snippet"]
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_web_search_request_error(self, mock_get):
+    @respx.mock
+    async def test_perform_web_search_request_error(self):
         """Test web search with request error."""
         component = WebSearchComponent()
         component.query = "test query"
         component.timeout = 5
 
-        from requests import RequestException
-
-        mock_get.side_effect = RequestException("Connection error")
+        respx.get(url__startswith="https://html.duckduckgo.com/html/").mock(
+            side_effect=httpx.ConnectError("Connection error")
+        )
 
-        result = component.perform_web_search()
+        result = await component.perform_web_search()
 
         assert isinstance(result, DataFrame)
         assert "Connection error" in result.iloc[0]["snippet"]
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_news_search_with_query(self, mock_get):
+    @respx.mock
+    async def test_perform_news_search_with_query(self):
         """Test news search with query."""
         component = WebSearchComponent()
         component.query = "test news"
         component.timeout = 5
 
         # Mock RSS response
-        mock_response = Mock()
-        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        respx.get(url__startswith="https://news.google.com/rss").mock(
+            return_value=httpx.Response(
+                200,
+                content=b"""<?xml version="1.0" encoding="UTF-8"?>
         <rss>
             <channel>
                 <item>
@@ -202,11 +227,11 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
                 </item>
             </channel>
         </rss>
-        """
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        """,
+            )
+        )
 
-        result = component.perform_news_search()
+        result = await component.perform_news_search()
 
         assert isinstance(result, DataFrame)
         assert len(result) == 1
@@ -214,16 +239,18 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
         assert result.iloc[0]["link"] == "https://news.example.com"
         assert result.iloc[0]["summary"] == "Test news description"
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_news_search_with_topic(self, mock_get):
+    @respx.mock
+    async def test_perform_news_search_with_topic(self):
         """Test news search with topic."""
         component = WebSearchComponent()
         component.topic = "TECHNOLOGY"
         component.timeout = 5
 
         # Mock RSS response
-        mock_response = Mock()
-        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        route = respx.get(url__startswith="https://news.google.com/rss").mock(
+            return_value=httpx.Response(
+                200,
+                content=b"""<?xml version="1.0" encoding="UTF-8"?>
         <rss>
             <channel>
                 <item>
@@ -234,40 +261,41 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
                 </item>
             </channel>
         </rss>
-        """
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        """,
+            )
+        )
 
-        result = component.perform_news_search()
+        result = await component.perform_news_search()
 
         assert isinstance(result, DataFrame)
         assert len(result) == 1
         # Check that the URL was constructed with topic
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args[0][0]
-        assert "topic/TECHNOLOGY" in call_args
+        assert route.call_count == 1
+        assert "topic/TECHNOLOGY" in str(route.calls.last.request.url)
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_news_search_no_params(self, mock_get):  # noqa: ARG002
+    @respx.mock
+    async def test_perform_news_search_no_params(self):
         """Test news search with no parameters."""
         component = WebSearchComponent()
         component.timeout = 5
 
-        result = component.perform_news_search()
+        result = await component.perform_news_search()
 
         assert isinstance(result, DataFrame)
         assert "No search parameters provided" in result.iloc[0]["summary"]
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_rss_read_success(self, mock_get):
+    @respx.mock
+    async def test_perform_rss_read_success(self):
         """Test successful RSS feed reading."""
         component = WebSearchComponent()
         component.query = "https://example.com/feed.rss"
         component.timeout = 5
 
         # Mock RSS response
-        mock_response = Mock()
-        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        respx.get("https://example.com/feed.rss").mock(
+            return_value=httpx.Response(
+                200,
+                content=b"""<?xml version="1.0" encoding="UTF-8"?>
         <rss>
             <channel>
                 <item>
@@ -284,133 +312,131 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
                 </item>
             </channel>
         </rss>
-        """
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        """,
+            )
+        )
 
-        result = component.perform_rss_read()
+        result = await component.perform_rss_read()
 
         assert isinstance(result, DataFrame)
         assert len(result) == 2
         assert result.iloc[0]["title"] == "RSS Item 1"
         assert result.iloc[1]["title"] == "RSS Item 2"
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_rss_read_empty_response(self, mock_get):
+    @respx.mock
+    async def test_perform_rss_read_empty_response(self):
         """Test RSS read with empty response."""
         component = WebSearchComponent()
         component.query = "https://example.com/feed.rss"
         component.timeout = 5
 
-        mock_response = Mock()
-        mock_response.content = b""
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        respx.get("https://example.com/feed.rss").mock(return_value=httpx.Response(200, content=b""))
 
-        result = component.perform_rss_read()
+        result = await component.perform_rss_read()
 
         assert isinstance(result, DataFrame)
         assert "Empty response received" in result.iloc[0]["summary"]
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_perform_rss_read_invalid_xml(self, mock_get):
+    @respx.mock
+    async def test_perform_rss_read_invalid_xml(self):
         """Test RSS read with invalid XML - returns empty DataFrame when no items found."""
         component = WebSearchComponent()
         component.query = "https://example.com/feed.rss"
         component.timeout = 5
 
-        mock_response = Mock()
-        mock_response.content = b"This is not valid XML"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        respx.get("https://example.com/feed.rss").mock(
+            return_value=httpx.Response(200, content=b"This is not valid XML")
+        )
 
-        result = component.perform_rss_read()
+        result = await component.perform_rss_read()
 
         assert isinstance(result, DataFrame)
         # When no RSS items are found, it returns an empty DataFrame
         assert len(result) == 0
 
-    def test_perform_rss_read_no_url(self):
+    async def test_perform_rss_read_no_url(self):
         """Test RSS read with no URL provided."""
         component = WebSearchComponent()
         component.query = ""
 
-        result = component.perform_rss_read()
+        result = await component.perform_rss_read()
 
         assert isinstance(result, DataFrame)
         assert "No RSS URL provided" in result.iloc[0]["summary"]
 
     @patch.object(WebSearchComponent, "perform_web_search")
-    def test_perform_search_web_mode(self, mock_web_search):
+    async def test_perform_search_web_mode(self, mock_web_search):
         """Test perform_search routes to web search in Web mode."""
         component = WebSearchComponent()
         component.search_mode = "Web"
 
         mock_web_search.return_value = DataFrame(pd.DataFrame([{"result": "web"}]))
 
-        result = component.perform_search()
+        result = await component.perform_search()
 
         mock_web_search.assert_called_once()
         assert result.iloc[0]["result"] == "web"
 
     @patch.object(WebSearchComponent, "perform_news_search")
-    def test_perform_search_news_mode(self, mock_news_search):
+    async def test_perform_search_news_mode(self, mock_news_search):
         """Test perform_search routes to news search in News mode."""
         component = WebSearchComponent()
         component.search_mode = "News"
 
         mock_news_search.return_value = DataFrame(pd.DataFrame([{"result": "news"}]))
 
-        result = component.perform_search()
+        result = await component.perform_search()
 
         mock_news_search.assert_called_once()
         assert result.iloc[0]["result"] == "news"
 
     @patch.object(WebSearchComponent, "perform_rss_read")
-    def test_perform_search_rss_mode(self, mock_rss_read):
+    async def test_perform_search_rss_mode(self, mock_rss_read):
         """Test perform_search routes to RSS read in RSS mode."""
         component = WebSearchComponent()
         component.search_mode = "RSS"
 
         mock_rss_read.return_value = DataFrame(pd.DataFrame([{"result": "rss"}]))
 
-        result = component.perform_search()
+        result = await component.perform_search()
 
         mock_rss_read.assert_called_once()
         assert result.iloc[0]["result"] == "rss"
 
     @patch.object(WebSearchComponent, "perform_web_search")
-    def test_perform_search_fallback(self, mock_web_search):
+    async def test_perform_search_fallback(self, mock_web_search):
         """Test perform_search falls back to web search for unknown mode."""
         component = WebSearchComponent()
         component.search_mode = "UnknownMode"
 
         mock_web_search.return_value = DataFrame(pd.DataFrame([{"result": "fallback"}]))
 
-        result = component.perform_search()
+        result = await component.perform_search()
 
         mock_web_search.assert_called_once()
         assert result.iloc[0]["result"] == "fallback"
 
-    def test_empty_query_error(self):
+    async def test_empty_query_error(self):
         """Test that empty query raises ValueError."""
         component = WebSearchComponent()
         component.query = ""
         component.timeout = 5
 
         with pytest.raises(ValueError, match="Empty search query"):
-            component.perform_web_search()
+            await component.perform_web_search()
 
-    @patch("lfx.components.data.web_search.requests.get")
-    def test_news_search_with_location(self, mock_get):
+    @respx.mock
+    async def test_news_search_with_location(self):
         """Test news search with location parameter."""
         component = WebSearchComponent()
         component.location = "San Francisco"
         component.timeout = 5
 
         # Mock RSS response
-        mock_response = Mock()
-        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        route = respx.get(url__startswith="https://news.google.com/rss").mock(
+            return_value=httpx.Response(
+                200,
+                content=b"""<?xml version="1.0" encoding="UTF-8"?>
         <rss>
             <channel>
                 <item>
@@ -421,14 +447,14 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
                 </item>
             </channel>
         </rss>
-        """
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        """,
+            )
+        )
 
-        result = component.perform_news_search()
+        result = await component.perform_news_search()
 
         assert isinstance(result, DataFrame)
         # Check that the URL was constructed with location
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args[0][0]
-        assert "geo/San%20Francisco" in call_args or "geo/San+Francisco" in call_args
+        assert route.call_count == 1
+        call_url = str(route.calls.last.request.url)
+        assert "geo/San%20Francisco" in call_url or "geo/San+Francisco" in call_url
@@ -1,7 +1,12 @@
+import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from lfx.base.git.mirror import GitBlobCache, GitMirrorCache, mirror_key, normalize_clone_url
 from lfx.components.git import GitLoaderComponent
 
 
@@ -132,3 +137,120 @@ def test_combined_filter(git_component, test_files):
     )
     assert not filter_func(str(temp_dir / "nonexistent.txt"))  # Non-existent file
     assert not filter_func(str(temp_dir / "no_access" / "secret.txt"))  # No permission
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],  # noqa: S607
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def remote_repo(tmp_path):
+    """A repository to clone from, with text files, a binary file and a file in a subdirectory."""
+    pytest.importorskip("git")
+    repo = tmp_path / "remote"
+    repo.mkdir()
+    _git(repo, "init", "-b", "main")
+    (repo / "app.py").write_text("import langchain\nclass AppComponent:\n    pass\n", encoding="utf-8")
+    (repo / "README.md").write_text("# Readme\n", encoding="utf-8")
+    (repo / "logo.bin").write_bytes(b"PNG\x00data")
+    (repo / "docs").mkdir()
+    (repo / "docs" / "guide.txt").write_text("A guide", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "Initial commit")
+    return repo
+
+
+@pytest.fixture
+def caches(tmp_path):
+    mirror_cache = GitMirrorCache(tmp_path / "mirrors")
+    blob_cache = GitBlobCache()
+    with (
+        patch("lfx.components.git.git.get_git_mirror_cache", return_value=mirror_cache),
+        patch("lfx.components.git.git.get_git_blob_cache", return_value=blob_cache),
+    ):
+        yield mirror_cache, blob_cache
+
+
+def _remote_component(repo: Path, **kwargs) -> GitLoaderComponent:
+    return GitLoaderComponent(repo_source="Remote", clone_url=repo.as_uri(), branch="main", **kwargs)
+
+
+def test_clone_urls_of_the_same_repository_share_a_mirror():
+    assert normalize_clone_url("https://GitHub.com/org/repo.git/") == "https://github.com/org/repo"
+    assert normalize_clone_url("git@github.com:org/repo.git") == "git@github.com:org/repo"
+    # Local repositories named .git are other repositories
+    assert normalize_clone_url("file:///srv/repo.git") == "file:///srv/repo.git"
+    assert mirror_key("https://github.com/org/repo", "main") == mirror_key("https://GITHUB.com/org/repo.git", "main")
+    assert mirror_key("https://github.com/org/repo", "main") != mirror_key("https://github.com/org/repo", "dev")
+
+
+async def test_remote_files_are_loaded_and_filtered(remote_repo, caches):
+    data = await _remote_component(remote_repo).load_documents()
+
+    assert sorted(item.data["file_path"] for item in data) == ["README.md", "app.py", "docs/guide.txt"]
+    guide = next(item for item in data if item.data["file_path"] == "docs/guide.txt")
+    assert guide.text == "A guide"
+    assert guide.data["file_name"] == "guide.txt"
+    assert guide.data["file_type"] == ".txt"
+
+    component = _remote_component(remote_repo, file_filter="*.py,*.txt", content_filter=r"class.*Component")
+    assert [item.data["file_path"] for item in await component.load_documents()] == ["app.py"]
+
+
+async def test_unchanged_files_are_not_read_again(remote_repo, caches):
+    _, blob_cache = caches
+    await _remote_component(remote_repo).load_documents()
+
+    with patch.object(GitBlobCache, "read_blob", wraps=GitBlobCache.read_blob) as read_blob:
+        assert len(await _remote_component(remote_repo).load_documents()) == 3
+        assert read_blob.call_count == 0
+
+        (remote_repo / "docs" / "guide.txt").write_text("An updated guide", encoding="utf-8")
+        _git(remote_repo, "commit", "-am", "Update the guide")
+        data = await _remote_component(remote_repo).load_documents()
+
+    assert read_blob.call_count == 1
+    assert "An updated guide" in [item.text for item in data]
+
+
+def test_concurrent_runs_share_one_fetch(remote_repo, caches):
+    fetch = GitMirrorCache._fetch
+
+    def slow_fetch(*args):
+        time.sleep(0.2)
+        return fetch(*args)
+
+    barrier = threading.Barrier(4)
+    results = []
+
+    def run():
+        barrier.wait()
+        results.append(len(_remote_component(remote_repo).load_remote_documents()))
+
+    with patch.object(GitMirrorCache, "_fetch", side_effect=slow_fetch) as fetches:
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == [3, 3, 3, 3]
+    assert fetches.call_count == 1
+
+
+def test_least_recently_used_mirrors_are_evicted(remote_repo, tmp_path):
+    mirror_cache = GitMirrorCache(tmp_path / "mirrors")
+    with mirror_cache.open(remote_repo.as_uri(), "main"):
+        pass
+    mirror_size = sum(file.stat().st_size for file in (tmp_path / "mirrors").rglob("*") if file.is_file())
+    mirror_cache.max_size = mirror_size + mirror_size // 2
+
+    _git(remote_repo, "checkout", "-b", "dev")
+    with mirror_cache.open(remote_repo.as_uri(), "dev"):
+        pass
+
+    assert [path.stem for path in (tmp_path / "mirrors").glob("*.git")] == [mirror_key(remote_repo.as_uri(), "dev")]
@@ -1,4 +1,5 @@
-from unittest.mock import patch
+import uuid
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from lfx.components.logic.flow_tool import FlowToolComponent
@@ -229,3 +230,28 @@ class TestFlowToolComponent(ComponentTestBaseWithClient):
             pytest.raises(KeyError),
         ):
             await component.get_flow_names()
+
+    async def test_tool_runs_prepared_flow_in_scope_of_parent_run(self):
+        """Test that a tool scoped to the parent run runs a fresh graph of the prepared flow on each call."""
+        from lfx.base.tools.flow_tool import FlowTool
+        from lfx.graph.graph.base import Graph
+        from lfx.graph.vertex.base import Vertex
+
+        FlowTool.model_rebuild(_types_namespace={"Graph": Graph, "Vertex": Vertex})
+        graph = Graph()
+        graph.set_run_id(uuid.uuid4())
+        tool_kwargs = {"name": "tool", "description": "Tool", "graph": graph, "flow_id": "flow", "user_id": "user"}
+        scoped = FlowTool(**tool_kwargs, cache_scope="run")
+        unscoped = FlowTool(**tool_kwargs)
+
+        with patch("lfx.base.tools.flow_tool.run_flow", new=AsyncMock(return_value=[])) as mock_run_flow:
+            await scoped._arun()
+            scoped_kwargs = mock_run_flow.call_args.kwargs
+            await unscoped._arun()
+            unscoped_kwargs = mock_run_flow.call_args.kwargs
+
+        assert scoped_kwargs["graph"] is None
+        assert scoped_kwargs["cache_scope"] == "run"
+        assert scoped_kwargs["flow_id"] == "flow"
+        assert unscoped_kwargs["graph"] is graph
+        assert unscoped_kwargs["cache_scope"] is None
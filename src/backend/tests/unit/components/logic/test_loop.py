@@ -7,10 +7,12 @@ from httpx import AsyncClient
 from langflow.memory import aget_messages
 from langflow.services.database.models.flow import FlowCreate
 from lfx.components.data.url import URLComponent
-from lfx.components.input_output import ChatOutput
+from lfx.components.input_output import ChatOutput, TextInputComponent
 from lfx.components.logic import LoopComponent
 from lfx.components.openai.openai_chat_model import OpenAIModelComponent
 from lfx.components.processing import (
+    JSONCleaner,
+    MessageToDataComponent,
     ParserComponent,
     PromptComponent,
     SplitTextComponent,
@@ -248,3 +250,53 @@ async def test_loop_flow():
     results = [result async for result in flow.async_start()]
     result_order = [result.vertex.id.split("-")[0] for result in results if hasattr(result, "vertex")]
     assert result_order == expected_execution_order
+
+
+def parallel_loop_flow(text: str, *, parallel: bool) -> Graph:
+    """Loop over the paragraphs of ``text``, cleaning each one as JSON in the loop body."""
+    text_input = TextInputComponent(_id="text")
+    text_input.set(input_value=text)
+    split_text = SplitTextComponent(_id="split")
+    split_text.set(data_inputs=text_input.text_response, chunk_size=5, chunk_overlap=0, separator="\n\n")
+    loop = LoopComponent(_id="loop")
+    loop.set(data=split_text.split_text)
+    if parallel:
+        loop.set(parallel=True, max_concurrency=3)
+    parser = ParserComponent(_id="parser")
+    parser.set(input_data=loop.item_output, pattern="{text}", sep="\n")
+    json_cleaner = JSONCleaner(_id="cleaner")
+    json_cleaner.set(json_str=parser.parse_combined_text)
+    to_data = MessageToDataComponent(_id="to_data")
+    to_data.set(message=json_cleaner.clean_json)
+    loop.set(item=to_data.convert_message_to_data)
+    output = ParserComponent(_id="output")
+    output.set(input_data=loop.done_output, pattern="{text}", sep="|")
+
+    graph = Graph()
+    graph.add_component(output)
+    graph.initialize()
+    return Graph.from_payload(graph.dump())
+
+
+async def test_parallel_loop_keeps_input_order():
+    text = "\n\n".join(f'{{"item": {i}}}' for i in range(6))
+    results = {}
+    for parallel in (False, True):
+        graph = parallel_loop_flow(text, parallel=parallel)
+        vertex_ids = [result.vertex.id async for result in graph.async_start() if hasattr(result, "vertex")]
+        results[parallel] = graph.get_vertex("output").results["parsed_text"].text
+        if parallel:
+            # The loop body is run once per item outside of the flow graph
+            assert vertex_ids == ["text", "split", "loop", "output"]
+
+    assert results[True] == results[False] == "|".join(f'{{"item": {i}}}' for i in range(6))
+
+
+async def test_parallel_loop_collects_failures():
+    graph = parallel_loop_flow('{"item": 0}\n\nnot json\n\n{"item": 2}', parallel=True)
+    async for _ in graph.async_start():
+        pass
+
+    rows = graph.get_vertex("loop").results["done"].to_dict(orient="records")
+    assert [row.get("text") for row in rows[::2]] == ['{"item": 0}', '{"item": 2}']
+    assert "Missing '{' or '}'" in rows[1]["error"]
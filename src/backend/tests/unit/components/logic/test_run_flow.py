@@ -0,0 +1,23 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from lfx.components.logic.run_flow import RunFlowComponent
+from lfx.graph.graph.base import Graph
+
+
+async def test_run_flow_scopes_subflow_cache_by_parent_run_without_sharing_its_run_id():
+    """Test that the run id of the parent only scopes the subflow cache and is not given to the subflow."""
+    graph = Graph()
+    graph.set_run_id(uuid.uuid4())
+    graph.session_id = "session"
+    component = RunFlowComponent(_user_id=str(uuid.uuid4()), flow_name_selected="Subflow")
+    component._vertex = SimpleNamespace(graph=graph)
+
+    with patch("lfx.components.logic.run_flow.run_flow", new=AsyncMock(return_value=[])) as mock_run_flow:
+        await component.run_flow_with_tweaks()
+
+    kwargs = mock_run_flow.call_args.kwargs
+    assert kwargs["cache_scope"] == graph.run_id
+    assert kwargs.get("run_id") is None
+    assert kwargs["flow_name"] == "Subflow"
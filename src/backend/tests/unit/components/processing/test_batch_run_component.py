@@ -8,6 +8,30 @@ from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
 
 
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class RecordingModel(MockLanguageModel):
+    """A mock model that records the batches it receives and can fail on given calls."""
+
+    def __init__(self, failures=None, **kwargs):
+        super().__init__(**kwargs)
+        self._batches = []
+        self._failures = failures or {}
+
+    @property
+    def batches(self):
+        return self._batches
+
+    async def abatch(self, messages, *args, **kwargs):
+        call = len(self._batches)
+        self._batches.append([msg_list[-1]["content"] for msg_list in messages])
+        if call in self._failures:
+            raise self._failures[call]
+        return await super().abatch(messages, *args, **kwargs)
+
+
 class TestBatchRunComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
     def component_class(self):
@@ -256,3 +280,72 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_rows_are_processed_in_chunks(self):
+        model = RecordingModel()
+        component = BatchRunComponent(
+            model=model,
+            df=DataFrame({"text": [f"row {i}" for i in range(5)]}),
+            column_name="text",
+            chunk_size=2,
+        )
+
+        result = await component.run_batch()
+
+        assert model.batches == [["row 0", "row 1"], ["row 2", "row 3"], ["row 4"]]
+        assert result["batch_index"].tolist() == [0, 1, 2, 3, 4]
+        assert result["model_response"].tolist() == [f"Response for row {i}" for i in range(5)]
+        assert [log.message for log in component._logs if log.name == "progress"] == [
+            "Processed 2/5 rows",
+            "Processed 4/5 rows",
+            "Processed 5/5 rows",
+        ]
+
+    async def test_rate_limited_chunk_is_retried(self, monkeypatch):
+        monkeypatch.setattr("lfx.components.processing.batch_run.backoff_delay", lambda *_, **__: 0)
+        model = RecordingModel(failures={1: RateLimitError("Too many requests")})
+        component = BatchRunComponent(
+            model=model,
+            df=DataFrame({"text": ["a", "b", "c"]}),
+            column_name="text",
+            chunk_size=2,
+            requests_per_minute=600,
+        )
+
+        result = await component.run_batch()
+
+        assert model.batches == [["a", "b"], ["c"], ["c"]]
+        assert result["model_response"].tolist() == ["Response for a", "Response for b", "Response for c"]
+
+    async def test_rate_limit_error_is_raised_after_max_retries(self, monkeypatch):
+        monkeypatch.setattr("lfx.components.processing.batch_run.backoff_delay", lambda *_, **__: 0)
+        model = RecordingModel(failures=dict.fromkeys([0, 1], RateLimitError("Too many requests")))
+        component = BatchRunComponent(
+            model=model,
+            df=DataFrame({"text": ["a"]}),
+            column_name="text",
+            max_retries=1,
+        )
+
+        with pytest.raises(RateLimitError):
+            await component.run_batch()
+        assert len(model.batches) == 2
+
+    async def test_failed_run_resumes_from_last_completed_chunk(self):
+        test_df = DataFrame({"text": [f"resume {i}" for i in range(5)]})
+        failing_model = RecordingModel(failures={1: RuntimeError("Connection lost")})
+        with pytest.raises(RuntimeError, match="Connection lost"):
+            await BatchRunComponent(model=failing_model, df=test_df, column_name="text", chunk_size=2).run_batch()
+
+        model = RecordingModel()
+        component = BatchRunComponent(model=model, df=test_df, column_name="text", chunk_size=2)
+        result = await component.run_batch()
+
+        assert model.batches == [["resume 2", "resume 3"], ["resume 4"]]
+        assert result["batch_index"].tolist() == [0, 1, 2, 3, 4]
+        assert result["model_response"].tolist() == [f"Response for resume {i}" for i in range(5)]
+
+        # The checkpoint is dropped once the run completes
+        model = RecordingModel()
+        await BatchRunComponent(model=model, df=test_df, column_name="text", chunk_size=2).run_batch()
+        assert len(model.batches) == 3
@@ -0,0 +1,176 @@
+import threading
+
+import orjson
+import pytest
+from langchain_core.embeddings import Embeddings
+from lfx.base.vectorstores.registry import vector_store_registry
+from lfx.components.FAISS.faiss import FaissVectorStoreComponent, document_hash
+from lfx.schema.data import Data
+
+pytest.importorskip("faiss")
+
+
+class FakeEmbeddings(Embeddings):
+    """Embeds each text from its characters, recording the texts embedded as documents."""
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class ModelEmbeddings(FakeEmbeddings):
+    """Embeds texts like ``FakeEmbeddings``, padded to ``size`` dimensions, as the model named ``model``."""
+
+    def __init__(self, model: str, size: int = 3) -> None:
+        super().__init__()
+        self.model = model
+        self.size = size
+
+    def embed_query(self, text: str) -> list[float]:
+        return [*super().embed_query(text), *[0.0] * (self.size - 3)]
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    vector_store_registry.clear()
+    yield
+    vector_store_registry.clear()
+
+
+def _component(tmp_path, embedding: Embeddings, docs: list[Data], **kwargs) -> FaissVectorStoreComponent:
+    return FaissVectorStoreComponent(
+        persist_directory=str(tmp_path),
+        index_name="test_index",
+        embedding=embedding,
+        ingest_data=docs,
+        **kwargs,
+    )
+
+
+def test_only_new_documents_are_embedded(tmp_path):
+    embedding = FakeEmbeddings()
+    docs = [Data(text=f"document {index}") for index in range(5)]
+    store = _component(tmp_path, embedding, [*docs, docs[0]]).build_vector_store()
+
+    assert embedding.embedded == [f"document {index}" for index in range(5)]
+    assert set(store.index_to_docstore_id.values()) == {document_hash(doc.to_lc_document()) for doc in docs}
+
+    embedding.embedded.clear()
+    store = _component(tmp_path, embedding, [*docs, Data(text="document 5")]).build_vector_store()
+
+    assert embedding.embedded == ["document 5"]
+    assert store.index.ntotal == 6
+    assert not list(tmp_path.glob(".test_index-*"))
+
+
+def test_unchanged_input_reuses_the_loaded_index(tmp_path):
+    embedding = FakeEmbeddings()
+    docs = [Data(text=f"document {index}") for index in range(3)]
+    _component(tmp_path, embedding, docs).build_vector_store()
+    embedding.embedded.clear()
+
+    first = _component(tmp_path, embedding, docs).build_vector_store()
+    second = _component(tmp_path, embedding, []).build_vector_store()
+
+    assert embedding.embedded == []
+    assert first.index is second.index
+    assert second.index.ntotal == 3
+
+
+def test_search_sees_documents_added_by_another_process(tmp_path):
+    from langchain_community.vectorstores import FAISS
+
+    embedding = FakeEmbeddings()
+    _component(tmp_path, embedding, [Data(text="alpha")]).build_vector_store()
+    component = _component(tmp_path, embedding, [], search_query="beta", number_of_results=1)
+    assert [data.text for data in component.search_documents()] == ["alpha"]
+
+    # Another worker rewrites the index, the loaded one must not be used anymore
+    texts = ["alpha", "beta"]
+    FAISS.from_texts(texts, embedding).save_local(str(tmp_path), "test_index")
+
+    component = _component(tmp_path, embedding, [], search_query="beta", number_of_results=1)
+    assert [data.text for data in component.search_documents()] == ["beta"]
+
+
+def test_documents_indexed_under_random_ids_are_not_embedded_again(tmp_path):
+    from langchain_community.vectorstores import FAISS
+
+    embedding = FakeEmbeddings()
+    docs = [Data(text=f"document {index}") for index in range(3)]
+    FAISS.from_documents([doc.to_lc_document() for doc in docs], embedding).save_local(str(tmp_path), "test_index")
+    embedding.embedded.clear()
+
+    store = _component(tmp_path, embedding, [*docs, Data(text="document 3")]).build_vector_store()
+
+    assert embedding.embedded == ["document 3"]
+    assert store.index.ntotal == 4
+
+
+def test_building_without_documents_or_index_fails(tmp_path):
+    with pytest.raises(ValueError, match="no documents to index"):
+        _component(tmp_path, FakeEmbeddings(), []).build_vector_store()
+
+
+def test_index_built_with_another_embedding_model_is_rebuilt(tmp_path):
+    docs = [Data(text=f"document {index}") for index in range(3)]
+    _component(tmp_path, ModelEmbeddings("small"), docs).build_vector_store()
+    assert orjson.loads((tmp_path / "test_index.embedding.json").read_bytes())["model"] == "small"
+
+    embedding = ModelEmbeddings("large", size=5)
+    component = _component(tmp_path, embedding, [], search_query="document 1", number_of_results=1)
+    assert component.load_index(tmp_path) is None
+    assert [data.text for data in component.search_documents()] == ["document 1"]
+
+    assert sorted(embedding.embedded) == [f"document {index}" for index in range(3)]
+    assert component.load_index(tmp_path).index.d == 5
+    fingerprint = orjson.loads((tmp_path / "test_index.embedding.json").read_bytes())
+    assert (fingerprint["model"], fingerprint["dimension"]) == ("large", 5)
+
+
+def test_documents_of_another_dimension_rebuild_the_index(tmp_path):
+    _component(tmp_path, ModelEmbeddings("model"), [Data(text="alpha")]).build_vector_store()
+
+    embedding = ModelEmbeddings("model", size=4)
+    store = _component(tmp_path, embedding, [Data(text="beta")]).build_vector_store()
+
+    assert store.index.d == 4
+    assert store.index.ntotal == 2
+    assert embedding.embedded.count("alpha") == 1
+
+
+def test_registry_keys_differ_by_embedding(tmp_path):
+    first = _component(tmp_path, ModelEmbeddings("small"), [])
+    second = _component(tmp_path, ModelEmbeddings("large"), [])
+
+    assert first._registry_key(tmp_path) != second._registry_key(tmp_path)
+    assert first._registry_key(tmp_path) == _component(tmp_path, ModelEmbeddings("small"), [])._registry_key(tmp_path)
+
+
+def test_concurrent_builds_keep_every_document(tmp_path):
+    embedding = FakeEmbeddings()
+    _component(tmp_path, embedding, [Data(text="seed")]).build_vector_store()
+    errors: list[Exception] = []
+
+    def build(worker: int) -> None:
+        try:
+            docs = [Data(text=f"worker {worker} document {index}") for index in range(5)]
+            _component(tmp_path, embedding, docs).build_vector_store()
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=build, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    vector_store_registry.clear()
+    assert _component(tmp_path, embedding, []).load_index(tmp_path).index.ntotal == 21
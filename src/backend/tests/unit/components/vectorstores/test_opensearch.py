@@ -0,0 +1,196 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from lfx.components.elastic.opensearch import OpenSearchVectorStoreComponent
+from lfx.schema.data import Data
+from opensearchpy.serializer import JSONSerializer
+
+
+class FakeEmbeddings(Embeddings):
+    """Embeds each text as its length, recording the batches and how many run at once."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.batches: list[list[str]] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.batches.append(texts)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text)), 1.0]
+
+
+class FakeIndices:
+    """Records the indices created, like the ``indices`` API of the OpenSearch client."""
+
+    def __init__(self, existing: frozenset[str] = frozenset()) -> None:
+        self.existing = set(existing)
+        self.created: dict[str, dict] = {}
+
+    def exists(self, index: str) -> bool:
+        return index in self.existing
+
+    def create(self, index: str, body: dict) -> None:
+        self.existing.add(index)
+        self.created[index] = body
+
+
+class FakeOpenSearch:
+    """Answers bulk requests like OpenSearch, failing the documents whose text is in ``fail_texts``."""
+
+    def __init__(self, fail_texts: frozenset[str] = frozenset(), indices: frozenset[str] = frozenset()) -> None:
+        self.transport = MagicMock(serializer=JSONSerializer())
+        self.indices = FakeIndices(indices)
+        self.fail_texts = fail_texts
+        self.bulk_requests = 0
+        self.documents: list[dict] = []
+
+    def bulk(self, body: str, *_args, **_kwargs) -> dict:
+        self.bulk_requests += 1
+        lines = body.splitlines()
+        items = []
+        for action_line, document_line in zip(lines[::2], lines[1::2], strict=True):
+            action = json.loads(action_line)["index"]
+            document = json.loads(document_line)
+            if document["text"] in self.fail_texts:
+                items.append({"index": {"_id": action["_id"], "status": 400, "error": {"type": "mapper_parsing"}}})
+            else:
+                self.documents.append(document)
+                items.append({"index": {"_id": action["_id"], "status": 201}})
+        return {"errors": any(item["index"]["status"] >= 300 for item in items), "items": items}
+
+
+def _component(embedding: Embeddings, docs: list[Data], **kwargs) -> OpenSearchVectorStoreComponent:
+    component = OpenSearchVectorStoreComponent(
+        ingest_data=docs,
+        embedding=embedding,
+        index_name="test-index",
+        username="admin",
+        password="admin",  # noqa: S106
+        **kwargs,
+    )
+    component.log = MagicMock()
+    return component
+
+
+def test_documents_are_embedded_and_indexed_in_batches():
+    docs = [Data(text=f"document {index}", source="test") for index in range(25)]
+    embedding = FakeEmbeddings()
+    client = FakeOpenSearch()
+    component = _component(
+        embedding, docs, ingest_batch_size=10, docs_metadata=[{"key": "category", "value": "tests"}]
+    )
+
+    component._add_documents_to_vector_store(client)
+
+    assert [len(batch) for batch in embedding.batches] == [10, 10, 5]
+    assert client.bulk_requests == 3
+    assert [document["text"] for document in client.documents] == [f"document {index}" for index in range(25)]
+    assert client.documents[3]["chunk_embedding"] == [float(len("document 3")), 1.0]
+    assert client.documents[3]["source"] == "test"
+    assert client.documents[3]["category"] == "tests"
+    component.log.assert_any_call("Successfully indexed 25 documents.")
+
+
+def test_embedding_runs_ahead_of_indexing_with_bounded_concurrency():
+    docs = [Data(text=f"document {index}") for index in range(40)]
+    embedding = FakeEmbeddings(delay=0.02)
+    client = FakeOpenSearch()
+    component = _component(embedding, docs, ingest_batch_size=5, embedding_concurrency=3)
+
+    component._add_documents_to_vector_store(client)
+
+    assert len(client.documents) == 40
+    assert 1 < embedding.max_running <= 3
+
+
+def test_failed_documents_are_reported_without_stopping_the_others():
+    docs = [Data(text=f"document {index}") for index in range(10)]
+    client = FakeOpenSearch(fail_texts=frozenset({"document 2", "document 7"}))
+    component = _component(FakeEmbeddings(), docs, ingest_batch_size=4)
+
+    component._add_documents_to_vector_store(client)
+
+    assert len(client.documents) == 8
+    failure_logs = [call.args[0] for call in component.log.call_args_list if "Failed to index" in str(call.args[0])]
+    assert len(failure_logs) == 1
+    assert failure_logs[0].startswith("Failed to index 2 documents")
+    component.log.assert_any_call("Successfully indexed 8 documents.")
+
+
+def test_ingestion_fails_when_no_document_is_indexed():
+    docs = [Data(text="document")]
+    client = FakeOpenSearch(fail_texts=frozenset({"document"}))
+    component = _component(FakeEmbeddings(), docs)
+
+    with pytest.raises(ValueError, match="Failed to index all 1 documents"):
+        component._add_documents_to_vector_store(client)
+
+
+def test_embedding_errors_are_raised():
+    class FailingEmbeddings(FakeEmbeddings):
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            msg = "embedding service unavailable"
+            raise RuntimeError(msg)
+
+    component = _component(FailingEmbeddings(), [Data(text=f"document {index}") for index in range(10)])
+
+    with pytest.raises(RuntimeError, match="embedding service unavailable"):
+        component._add_documents_to_vector_store(FakeOpenSearch())
+
+
+def test_missing_index_is_created_with_the_configured_knn_mapping():
+    docs = [Data(text=f"document {index}") for index in range(3)]
+    client = FakeOpenSearch()
+    component = _component(FakeEmbeddings(), docs, engine="faiss", space_type="innerproduct", ef_construction=256, m=24)
+
+    component._add_documents_to_vector_store(client)
+
+    vector_mapping = client.indices.created["test-index"]["mappings"]["properties"]["chunk_embedding"]
+    assert vector_mapping["dimension"] == 2
+    assert vector_mapping["method"] == {
+        "name": "hnsw",
+        "space_type": "innerproduct",
+        "engine": "faiss",
+        "parameters": {"ef_construction": 256, "m": 24},
+    }
+    assert len(client.documents) == 3
+
+
+def test_existing_index_is_left_as_it_is():
+    client = FakeOpenSearch(indices=frozenset({"test-index"}))
+    component = _component(FakeEmbeddings(), [Data(text="document")])
+
+    component._add_documents_to_vector_store(client)
+
+    assert client.indices.created == {}
+    assert len(client.documents) == 1
+
+
+def test_progress_is_logged_after_each_batch():
+    docs = [Data(text=f"document {index}") for index in range(25)]
+    client = FakeOpenSearch(fail_texts=frozenset({"document 3"}))
+    component = _component(FakeEmbeddings(), docs, ingest_batch_size=10)
+
+    component._add_documents_to_vector_store(client)
+
+    progress = [call.args[0] for call in component.log.call_args_list if str(call.args[0]).startswith("Processed")]
+    assert progress == [
+        "Processed 10 of 25 documents: 9 indexed, 1 failed.",
+        "Processed 20 of 25 documents: 19 indexed, 1 failed.",
+    ]
+    component.log.assert_any_call("Successfully indexed 24 documents.")
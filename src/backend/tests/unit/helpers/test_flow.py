@@ -1,5 +1,8 @@
 """Unit tests for the langflow.helpers.flow module."""
 
+import uuid
+
+import orjson
 import pytest
 from lfx.utils.langflow_utils import has_langflow_memory
 
@@ -85,3 +88,97 @@ class TestDynamicImport:
 
         # Helper module should be the langflow implementation
         assert is_helper_module(run_flow, _LANGFLOW_HELPER_MODULE_FLOW)
+
+
+class TestSubflowGraphCache:
+    """Test the reuse of prepared subflows by load_flow."""
+
+    @pytest.fixture(autouse=True)
+    def clear_subflow_graph_cache(self):
+        from langflow.helpers.flow import subflow_graph_cache
+
+        subflow_graph_cache.invalidate()
+        yield
+        subflow_graph_cache.invalidate()
+
+    @pytest.fixture
+    async def subflow(self, client, json_memory_chatbot_no_llm, logged_in_headers):
+        data = orjson.loads(json_memory_chatbot_no_llm)["data"]
+        response = await client.post(
+            "api/v1/flows/", json={"name": "Subflow", "data": data}, headers=logged_in_headers
+        )
+        assert response.status_code == 201
+        yield response.json()
+        await client.delete(f"api/v1/flows/{response.json()['id']}", headers=logged_in_headers)
+
+    @pytest.fixture
+    def subflow_graph_cache_size(self, client, monkeypatch):  # noqa: ARG002
+        from langflow.services.deps import get_settings_service
+
+        monkeypatch.setattr(get_settings_service().settings, "subflow_graph_cache_size", 4)
+
+    async def test_load_flow_reuses_prepared_subflow_within_scope(self, subflow, active_user):
+        from langflow.helpers.flow import get_prepared_subflow, load_flow
+
+        user_id = str(active_user.id)
+        flow_id = subflow["id"]
+
+        first = await load_flow(user_id, flow_id=flow_id, cache_scope="run-1")
+        second = await load_flow(user_id, flow_id=flow_id, cache_scope="run-1")
+        prepared = await get_prepared_subflow(user_id, flow_id=flow_id, cache_scope="run-1")
+
+        assert first is not second
+        assert [vertex.id for vertex in first.vertices] == [vertex.id for vertex in second.vertices]
+        assert prepared is await get_prepared_subflow(user_id, flow_id=flow_id, cache_scope="run-1")
+        assert prepared is not await get_prepared_subflow(user_id, flow_id=flow_id, cache_scope="run-2")
+        assert prepared.component_classes
+
+    async def test_tweaks_do_not_leak_between_instances(self, subflow, active_user):
+        from langflow.helpers.flow import load_flow
+
+        user_id = str(active_user.id)
+        flow_id = subflow["id"]
+        chat_input_id = next(node["id"] for node in subflow["data"]["nodes"] if node["id"].startswith("ChatInput"))
+
+        tweaked = await load_flow(
+            user_id, flow_id=flow_id, tweaks={chat_input_id: {"input_value": "tweaked"}}, cache_scope="run-1"
+        )
+        plain = await load_flow(user_id, flow_id=flow_id, cache_scope="run-1")
+
+        assert tweaked.get_vertex(chat_input_id).raw_params["input_value"] == "tweaked"
+        assert plain.get_vertex(chat_input_id).raw_params.get("input_value") != "tweaked"
+
+    async def test_scope_is_released_when_run_ends(self, subflow, active_user):
+        from langflow.helpers.flow import get_prepared_subflow, release_run_subflows, subflow_graph_cache
+        from lfx.graph.graph.base import Graph
+
+        user_id = str(active_user.id)
+        flow_id = subflow["id"]
+        graph = Graph()
+        graph.set_run_id(uuid.uuid4())
+        scope_key = (user_id, flow_id, None)
+
+        await get_prepared_subflow(user_id, flow_id=flow_id, cache_scope=graph.run_id)
+        await get_prepared_subflow(user_id, flow_id=flow_id, cache_scope="other-run")
+        release_run_subflows(graph)
+        release_run_subflows(Graph())
+
+        assert subflow_graph_cache.get_for_scope(graph.run_id, scope_key) is None
+        assert subflow_graph_cache.get_for_scope("other-run", scope_key) is not None
+
+    @pytest.mark.usefixtures("subflow_graph_cache_size")
+    async def test_worker_cache_is_invalidated_on_update(self, client, subflow, active_user, logged_in_headers):
+        from langflow.helpers.flow import get_prepared_subflow
+
+        user_id = str(active_user.id)
+        flow_id = subflow["id"]
+
+        first = await get_prepared_subflow(user_id, flow_id=flow_id)
+        assert first is await get_prepared_subflow(user_id, flow_id=flow_id)
+
+        response = await client.patch(
+            f"api/v1/flows/{flow_id}", json={"description": "updated"}, headers=logged_in_headers
+        )
+        assert response.status_code == 200
+
+        assert first is not await get_prepared_subflow(user_id, flow_id=flow_id)
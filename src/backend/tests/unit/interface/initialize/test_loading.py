@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from lfx.interface.initialize.loading import (
+    get_load_from_db_variable_names,
     update_params_with_load_from_db_fields,
     update_table_params_with_load_from_db_fields,
 )
@@ -523,3 +524,67 @@ async def test_update_table_params_handles_user_id_not_set_error():
             await update_table_params_with_load_from_db_fields(
                 custom_component, params, "table_data", fallback_to_env_vars=True
             )
+
+
+def test_get_load_from_db_variable_names():
+    params = {
+        "api_key": "OPENAI_API_KEY",
+        "other_key": "OPENAI_API_KEY",
+        "empty_key": "",
+        "headers": [
+            {"key": "Authorization", "value": "AUTH_TOKEN"},
+            {"key": "X-Api", "value": "API_TOKEN"},
+            "not a row",
+        ],
+        "headers_load_from_db_columns": ["value"],
+    }
+
+    names = get_load_from_db_variable_names(params, ["api_key", "other_key", "empty_key", "missing", "table:headers"])
+
+    assert names == ["OPENAI_API_KEY", "AUTH_TOKEN", "API_TOKEN"]
+
+
+@pytest.mark.asyncio
+async def test_update_params_prefetches_variables_of_all_fields_at_once():
+    """Test that the variables of every field are loaded together before each field is resolved."""
+    from lfx.custom.custom_component.custom_component import CustomComponent
+
+    custom_component = MagicMock(spec=CustomComponent)
+    custom_component.prefetch_variables = AsyncMock()
+    custom_component.get_variable = AsyncMock(side_effect=lambda name, **_: f"{name}-value")
+
+    params = {
+        "api_key": "KEY_1",
+        "other_key": "KEY_2",
+        "headers": [{"value": "KEY_3"}],
+        "headers_load_from_db_columns": ["value"],
+    }
+
+    with patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope:
+        session = MagicMock()
+        mock_session_scope.return_value.__aenter__.return_value = session
+
+        result = await update_params_with_load_from_db_fields(
+            custom_component, params, ["api_key", "other_key", "table:headers"]
+        )
+
+    custom_component.prefetch_variables.assert_awaited_once_with(["KEY_1", "KEY_2", "KEY_3"], session)
+    assert result["api_key"] == "KEY_1-value"
+    assert result["headers"] == [{"value": "KEY_3-value"}]
+
+
+@pytest.mark.asyncio
+async def test_update_params_resolves_fields_when_prefetch_fails():
+    """Test that a failing prefetch does not stop the fields from being resolved one by one."""
+    from lfx.custom.custom_component.custom_component import CustomComponent
+
+    custom_component = MagicMock(spec=CustomComponent)
+    custom_component.prefetch_variables = AsyncMock(side_effect=RuntimeError("Database unavailable"))
+    custom_component.get_variable = AsyncMock(return_value="db-value")
+
+    with patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope:
+        mock_session_scope.return_value.__aenter__.return_value = MagicMock()
+
+        result = await update_params_with_load_from_db_fields(custom_component, {"api_key": "KEY"}, ["api_key"])
+
+    assert result["api_key"] == "db-value"
@@ -324,8 +324,9 @@ class TestSerializationHypothesis:
         df_long = pd.DataFrame({"A": range(MAX_ITEMS_LENGTH + 100)})
         result = serialize(df_long, max_items=MAX_ITEMS_LENGTH)
         assert isinstance(result, list)
-        assert len(result) == MAX_ITEMS_LENGTH
-        assert all("A" in row for row in result)
+        assert len(result) == MAX_ITEMS_LENGTH + 1
+        assert all("A" in row for row in result[:-1])
+        assert result[-1] == "... [truncated 100 items]"
 
     def test_series_serialization(self) -> None:
         """Test serialization of pandas Series."""
@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+from langflow.services.job_queue.event_log import JobEvent, RedisJobEventLog, SQLiteJobEventLog
+from langflow.services.job_queue.service import JobQueueService
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+async def event_log(request, tmp_path):
+    if request.param == "sqlite":
+        log = SQLiteJobEventLog(tmp_path / "job_events.db", max_events=5, poll_interval=0.01)
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        log = RedisJobEventLog(fakeredis.FakeAsyncRedis(), max_events=5)
+    yield log
+    await log.close()
+
+
+async def test_events_are_appended_with_sequence_numbers(event_log):
+    await event_log.create("job")
+    assert await event_log.exists("job")
+    assert not await event_log.exists("other")
+
+    assert await event_log.append("job", [b"a", b"b"]) == 2
+    assert await event_log.append("job", [b"c", None]) == 4
+
+    assert await event_log.read("job") == [JobEvent(1, b"a"), JobEvent(2, b"b"), JobEvent(3, b"c"), JobEvent(4, None)]
+    assert await event_log.read("job", cursor=2, limit=1) == [JobEvent(3, b"c")]
+
+
+async def test_oldest_events_are_dropped(event_log):
+    for index in range(20):
+        await event_log.append("job", [str(index).encode()])
+
+    events = await event_log.read("job")
+    assert [event.seq for event in events] == [16, 17, 18, 19, 20]
+    assert events[-1] == JobEvent(20, b"19")
+
+
+async def test_wait_returns_as_soon_as_an_event_is_appended(event_log):
+    await event_log.create("job")
+
+    async def append_later():
+        await asyncio.sleep(0.1)
+        await event_log.append("job", [b"late"])
+
+    task = asyncio.create_task(append_later())
+    start = time.monotonic()
+    events = await event_log.wait("job", cursor=0, timeout=5)
+    await task
+
+    assert events == [JobEvent(1, b"late")]
+    assert time.monotonic() - start < 2
+    assert await event_log.wait("job", cursor=1, timeout=0.1) == []
+
+
+async def test_stream_stops_at_the_end_of_the_job(event_log):
+    await event_log.append("job", [b"a", b"b", None])
+    assert [event.data async for event in event_log.stream("job")] == [b"a", b"b"]
+    assert [event.data async for event in event_log.stream("job", cursor=1)] == [b"b"]
+
+
+async def test_shared_cursor_and_delete(event_log):
+    await event_log.create("job")
+    assert await event_log.get_cursor("job") == 0
+    await event_log.set_cursor("job", 3)
+    assert await event_log.get_cursor("job") == 3
+
+    await event_log.delete("job")
+    assert not await event_log.exists("job")
+
+
+async def test_expired_jobs_are_pruned(tmp_path):
+    event_log = SQLiteJobEventLog(tmp_path / "job_events.db", ttl=0)
+    try:
+        await event_log.append("job", [b"a"])
+        await event_log.prune()
+        assert not await event_log.exists("job")
+        assert await event_log.read("job") == []
+    finally:
+        await event_log.close()
+
+
+async def test_service_forwards_job_events_to_the_log(tmp_path):
+    event_log = SQLiteJobEventLog(tmp_path / "job_events.db", poll_interval=0.01)
+    service = JobQueueService(event_log=event_log)
+    _, event_manager = service.create_queue("job")
+
+    async def build():
+        event_manager.on_token(data={"chunk": "hello"})
+        event_manager.on_end(data={})
+        await event_manager.queue.put((None, None, time.time()))
+
+    service.start_job("job", build())
+    events = [event.data async for event in event_log.stream("job")]
+
+    assert [b'"token"' in data for data in events] == [True, False]
+    assert await service.job_exists("job")
+    await service.stop()
+
+
+async def test_end_is_recorded_when_the_job_fails(tmp_path):
+    event_log = SQLiteJobEventLog(tmp_path / "job_events.db", poll_interval=0.01)
+    service = JobQueueService(event_log=event_log)
+    _, event_manager = service.create_queue("job")
+
+    async def build():
+        event_manager.on_token(data={"chunk": "hello"})
+        msg = "Build failed"
+        raise RuntimeError(msg)
+
+    service.start_job("job", build())
+    events = await asyncio.wait_for(event_log.wait("job", cursor=1, timeout=5), timeout=5)
+
+    assert events == [JobEvent(2, None)]
+    await service.stop()
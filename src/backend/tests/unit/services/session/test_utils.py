@@ -0,0 +1,110 @@
+import copy
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.session import utils
+from langflow.services.session.service import SessionService
+from langflow.services.session.utils import compute_graph_fingerprint, get_graph_fingerprint
+from lfx.graph.graph.base import Graph
+
+
+@pytest.fixture
+def graph_data() -> dict:
+    def node(node_id: str, component_type: str, value: str) -> dict:
+        return {
+            "id": node_id,
+            "position": {"x": 10, "y": 20},
+            "selected": False,
+            "data": {
+                "type": component_type,
+                "node": {
+                    "display_name": component_type,
+                    "template": {
+                        "input_value": {"value": value, "display_name": "Input", "info": "The input"},
+                        "code": {"value": f"class {component_type}: ..."},
+                        "_type": "Component",
+                    },
+                    "outputs": [{"name": "message", "selected": "Message", "cache": True}],
+                },
+            },
+        }
+
+    return {
+        "nodes": [node("ChatInput-1", "ChatInput", "hello"), node("ChatOutput-2", "ChatOutput", "")],
+        "edges": [
+            {
+                "source": "ChatInput-1",
+                "target": "ChatOutput-2",
+                "sourceHandle": {"id": "ChatInput-1", "name": "message"},
+                "targetHandle": {"fieldName": "input_value", "id": "ChatOutput-2"},
+                "selected": True,
+            }
+        ],
+        "viewport": {"x": 0, "y": 0, "zoom": 1},
+    }
+
+
+def test_fingerprint_ignores_layout_and_display_properties(graph_data):
+    fingerprint = compute_graph_fingerprint(graph_data)
+    moved = copy.deepcopy(graph_data)
+    moved["viewport"]["zoom"] = 2
+    moved["nodes"].reverse()
+    for node in moved["nodes"]:
+        node["position"] = {"x": 500, "y": 500}
+        node["data"]["node"]["display_name"] = "Renamed"
+        node["data"]["node"]["template"]["input_value"]["info"] = "Another description"
+    moved["edges"][0]["selected"] = False
+    moved["edges"][0]["sourceHandle"] = {"name": "message", "id": "ChatInput-1"}
+
+    assert compute_graph_fingerprint(moved) == fingerprint
+    # The flow is not modified
+    assert graph_data["nodes"][0]["position"] == {"x": 10, "y": 20}
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda graph: graph["nodes"][0]["data"]["node"]["template"]["input_value"].update(value="bye"),
+        lambda graph: graph["nodes"][1]["data"]["node"]["template"]["code"].update(value="class Changed: ..."),
+        lambda graph: graph["nodes"][0]["data"]["node"]["outputs"][0].update(cache=False),
+        lambda graph: graph["edges"][0].update(target="ChatOutput-3"),
+        lambda graph: graph["edges"].clear(),
+    ],
+)
+def test_fingerprint_changes_with_what_runs(graph_data, change):
+    fingerprint = compute_graph_fingerprint(graph_data)
+    change(graph_data)
+
+    assert compute_graph_fingerprint(graph_data) != fingerprint
+
+
+def test_fingerprint_is_computed_once_per_flow_version(graph_data):
+    with patch.object(utils, "compute_graph_fingerprint", wraps=compute_graph_fingerprint) as compute:
+        first = get_graph_fingerprint(graph_data, flow_id="flow-1", flow_version="2024-01-01T00:00:00")
+        assert get_graph_fingerprint(graph_data, flow_id="flow-1", flow_version="2024-01-01T00:00:00") == first
+        assert compute.call_count == 1
+
+        get_graph_fingerprint(graph_data, flow_id="flow-1", flow_version="2024-01-02T00:00:00")
+        get_graph_fingerprint(graph_data)
+        assert compute.call_count == 3
+
+
+async def test_load_session_reuses_the_fingerprint_of_the_flow_version(graph_data):
+    session_service = SessionService(AsyncInMemoryCache())
+
+    with (
+        patch.object(utils, "compute_graph_fingerprint", wraps=compute_graph_fingerprint) as compute,
+        patch.object(Graph, "from_payload", return_value=MagicMock()),
+    ):
+        for _ in range(3):
+            await session_service.load_session(None, flow_id="flow-3", data_graph=graph_data, flow_version=1)
+
+    assert compute.call_count == 1
+
+
+def test_identical_flows_share_session_keys(graph_data):
+    key = SessionService.build_key("session", graph_data, flow_id="flow-1", flow_version=1)
+
+    assert key == f"session:{compute_graph_fingerprint(graph_data)}"
+    assert SessionService.build_key("session", copy.deepcopy(graph_data), flow_id="flow-2", flow_version=1) == key
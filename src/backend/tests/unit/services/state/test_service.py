@@ -0,0 +1,85 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langflow.services.state.service import STATE_SHARDS, InMemoryStateService
+
+
+def _service(ttl: float = 3600.0, max_runs: int = 10_000, *, async_observers: bool = False) -> InMemoryStateService:
+    settings = SimpleNamespace(
+        run_state_ttl=ttl, run_state_max_runs=max_runs, run_state_async_observers=async_observers
+    )
+    return InMemoryStateService(MagicMock(settings=settings))
+
+
+def test_states_are_kept_per_run():
+    service = _service()
+    service.update_state("topic", "cats", run_id="run-1")
+    service.update_state("history", "first", run_id="run-1")
+    service.append_state("history", "second", run_id="run-1")
+    service.append_state("history", "other", run_id="run-2")
+
+    assert service.get_state("topic", run_id="run-1") == "cats"
+    assert service.get_state("history", run_id="run-1") == ["first", "second"]
+    assert service.get_state("history", run_id="run-2") == ["other"]
+    assert service.get_state("topic", run_id="run-2") == ""
+
+    service.clear_run("run-1")
+
+    assert service.get_state("topic", run_id="run-1") == ""
+    assert len(service) == 1
+
+
+def test_unused_runs_expire():
+    service = _service(ttl=0.05)
+    service.update_state("topic", "cats", run_id="run-1")
+    time.sleep(0.1)
+
+    assert service.get_state("topic", run_id="run-1") == ""
+    service.update_state("topic", "dogs", run_id="run-2")
+    assert len(service) == 1
+
+
+def test_least_recently_used_runs_are_dropped_beyond_the_maximum():
+    service = _service(max_runs=STATE_SHARDS)
+    for index in range(1_000):
+        service.update_state("topic", index, run_id=f"run-{index}")
+
+    assert len(service) <= STATE_SHARDS
+    assert service.get_state("topic", run_id="run-999") == 999
+
+
+def test_observers_are_notified_after_the_state_is_released():
+    service = _service()
+    notifications = []
+
+    def observer(key, new_state, *, append):
+        # Reading the state from an observer used to deadlock
+        notifications.append((key, new_state, append, service.get_state(key, run_id="run-1")))
+
+    service.subscribe("topic", observer)
+    service.update_state("topic", "cats", run_id="run-1")
+    service.append_state("topic", "dogs", run_id="run-1")
+    service.unsubscribe("topic", observer)
+    service.update_state("topic", "birds", run_id="run-1")
+
+    assert notifications == [("topic", "cats", False, "cats"), ("topic", "dogs", True, ["cats", "dogs"])]
+
+
+async def test_observers_can_be_notified_in_the_background():
+    service = _service(async_observers=True)
+    notifications = []
+    threads = set()
+
+    def observer(key, new_state, *, append):
+        threads.add(threading.current_thread())
+        notifications.append((new_state, append))
+
+    service.subscribe("topic", observer)
+    for index in range(100):
+        service.append_state("topic", index, run_id="run-1")
+    await service.teardown()
+
+    assert notifications == [(index, True) for index in range(100)]
+    assert threading.current_thread() not in threads
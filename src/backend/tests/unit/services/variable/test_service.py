@@ -7,6 +7,7 @@ from langflow.services.database.models.variable.model import VariableUpdate
 from langflow.services.deps import get_settings_service
 from langflow.services.variable.constants import CREDENTIAL_TYPE
 from langflow.services.variable.service import DatabaseVariableService
+from lfx.base.models.model_registry import model_instance_registry
 from lfx.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
@@ -142,6 +143,18 @@ async def test_update_variable(service, session: AsyncSession):
     assert isinstance(result.updated_at, datetime)
 
 
+async def test_update_variable_drops_models_built_with_old_value(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "OPENAI_API_KEY", "sk-old", session=session)
+    params = {"model_name": "gpt-4o-mini", "api_key": "sk-old"}
+    model = model_instance_registry.get_or_create("OpenAI", params, object, secret_names=["api_key"])
+
+    await service.update_variable(user_id, "OPENAI_API_KEY", "sk-new", session=session)
+
+    assert model_instance_registry.get_or_create("OpenAI", params, object, secret_names=["api_key"]) is not model
+    model_instance_registry.clear()
+
+
 async def test_update_variable__valueerror(service, session: AsyncSession):
     user_id = uuid4()
     name = "name"
@@ -240,3 +253,56 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variables_loads_all_variables_with_one_query(service, session: AsyncSession):
+    user_id = uuid4()
+    for index in range(5):
+        await service.create_variable(user_id, f"name{index}", f"value{index}", session=session)
+    names = [f"name{index}" for index in range(5)]
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        result = await service.get_variables(user_id, [*names, "missing", "name0"], session=session)
+        values = [await service.get_variable(user_id, name, "", session=session) for name in names]
+
+    assert result == {f"name{index}": f"value{index}" for index in range(5)}
+    assert values == [f"value{index}" for index in range(5)]
+    assert exec_spy.call_count == 1
+
+
+async def test_get_variable_uses_cached_value_until_it_changes(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        assert await service.get_variable(user_id, "name", "", session=session) == "value"
+    assert exec_spy.call_count == 0
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+    # Other users do not see the cached value
+    with pytest.raises(ValueError, match="name variable not found."):
+        await service.get_variable(uuid4(), "name", "", session=session)
+
+
+async def test_get_variable_checks_type_of_cached_credential(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", type_=CREDENTIAL_TYPE, session=session)
+    await service.get_variables(user_id, ["name"], session=session)
+
+    with pytest.raises(TypeError, match="purpose is to prevent the exposure of value"):
+        await service.get_variable(user_id, "name", "session_id", session=session)
+
+
+async def test_variable_cache_is_disabled_with_zero_ttl(session: AsyncSession):
+    settings_service = get_settings_service()
+    with patch.object(settings_service.settings, "variable_cache_ttl", 0):
+        service = DatabaseVariableService(settings_service)
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    await service.get_variable(user_id, "name", "", session=session)
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        assert await service.get_variable(user_id, "name", "", session=session) == "value"
+    assert exec_spy.call_count == 1
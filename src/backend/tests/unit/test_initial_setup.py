@@ -278,8 +278,12 @@ def set_fs_flows_polling_interval():
     os.unsetenv("LANGFLOW_FS_FLOWS_POLLING_INTERVAL")
 
 
-@pytest.mark.usefixtures("set_fs_flows_polling_interval")
-async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
+@pytest.fixture
+def disable_fs_watcher(monkeypatch):
+    monkeypatch.setattr("langflow.initial_setup.setup._get_awatch", lambda: None)
+
+
+async def _assert_flow_synced_from_fs(client: AsyncClient, logged_in_headers):
     flow_file = Path(tempfile.tempdir) / f"{uuid.uuid4()}.json"
     try:
         basic_case = {
@@ -314,3 +318,13 @@ async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
         assert result["locked"] is True
     finally:
         await flow_file.unlink(missing_ok=True)
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval")
+async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
+    await _assert_flow_synced_from_fs(client, logged_in_headers)
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval", "disable_fs_watcher")
+async def test_sync_flows_from_fs_polling_fallback(client: AsyncClient, logged_in_headers):
+    await _assert_flow_synced_from_fs(client, logged_in_headers)
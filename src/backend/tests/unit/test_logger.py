@@ -11,9 +11,11 @@ This test suite covers all aspects of the logger module including:
 
 import builtins
 import contextlib
+import io
 import json
 import logging
 import os
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -24,10 +26,13 @@ from lfx.log.logger import (
     LOG_LEVEL_MAP,
     VALID_LOG_LEVELS,
     InterceptHandler,
+    LogRingBuffer,
+    LogWriter,
     SizedLogBuffer,
     add_serialized,
     buffer_writer,
     configure,
+    flush_logs,
     log_buffer,
     remove_exception_in_production,
     setup_gunicorn_logger,
@@ -949,3 +954,136 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def test_ring_buffer_overwrites_oldest_entries():
+    ring = LogRingBuffer(3)
+    for index in range(5):
+        ring.append((index, f"Log {index}"))
+
+    assert len(ring) == 3
+    assert list(ring) == [(2, "Log 2"), (3, "Log 3"), (4, "Log 4")]
+    assert ring[0] == (2, "Log 2")
+    assert ring[-1] == (4, "Log 4")
+    assert ring.slice(1, 10) == [(3, "Log 3"), (4, "Log 4")]
+    assert ring.bisect(3) == 1
+    assert ring.bisect(10) == 3
+    with pytest.raises(IndexError):
+        ring[3]
+
+
+def test_ring_buffer_resize_keeps_most_recent_entries():
+    ring = LogRingBuffer(4)
+    for index in range(6):
+        ring.append((index, f"Log {index}"))
+
+    ring.resize(2)
+
+    assert list(ring) == [(4, "Log 4"), (5, "Log 5")]
+    ring.append((6, "Log 6"))
+    assert list(ring) == [(5, "Log 5"), (6, "Log 6")]
+
+
+def test_lookups_after_buffer_wraps_around(sized_log_buffer):
+    sized_log_buffer.max = 10
+    for i in range(25):
+        sized_log_buffer.write(json.dumps({"text": f"Log {i}", "record": {"time": {"timestamp": 1625097600 + i}}}))
+
+    assert list(sized_log_buffer.get_last_n(2).values()) == ["Log 23", "Log 24"]
+    before = sized_log_buffer.get_before_timestamp(1625097620000, lines=3)
+    assert list(before.values()) == ["Log 17", "Log 18", "Log 19"]
+    assert list(sized_log_buffer.get_after_timestamp(1625097620000, lines=2).values()) == ["Log 20", "Log 21"]
+    # Timestamps older than the buffer return nothing before them
+    assert sized_log_buffer.get_before_timestamp(1625097600000, lines=3) == {}
+    # Timestamps newer than the buffer return the last entries
+    assert list(sized_log_buffer.get_before_timestamp(1725097600000, lines=1).values()) == ["Log 24"]
+
+
+class TestQueuedLogging:
+    """Tests for the queued logging pipeline."""
+
+    def teardown_method(self):
+        flush_logs()
+        structlog.reset_defaults()
+        structlog.configure()
+
+    def test_records_are_written_by_the_log_writer(self):
+        stream = io.StringIO()
+        configure(log_level="INFO", output_file=stream, log_env="container_json", cache=False, log_queue=True)
+
+        structlog.get_logger().info("queued message", key="value")
+        structlog.get_logger().debug("filtered message")
+
+        assert flush_logs()
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["event"] for line in lines] == ["queued message"]
+        assert lines[0]["key"] == "value"
+
+    async def test_async_methods_do_not_use_the_executor(self):
+        import asyncio
+
+        stream = io.StringIO()
+        configure(log_level="DEBUG", output_file=stream, log_env="container_json", cache=False, log_queue=True)
+        log = structlog.get_logger()
+
+        with patch.object(asyncio.get_running_loop(), "run_in_executor") as run_in_executor:
+            await log.adebug("async %s", "message")
+            await log.ainfo("another message")
+
+        run_in_executor.assert_not_called()
+        flush_logs()
+        assert [json.loads(line)["event"] for line in stream.getvalue().splitlines()][-2:] == [
+            "async message",
+            "another message",
+        ]
+
+    def test_exception_info_is_rendered_on_the_calling_thread(self):
+        stream = io.StringIO()
+        configure(log_level="ERROR", output_file=stream, cache=False, log_queue=True)
+
+        logger_module = sys.modules["lfx.log.logger"]
+        with patch.object(logger_module, "DEV", True):  # noqa: FBT003
+            try:
+                msg = "failure"
+                raise ValueError(msg)
+            except ValueError:
+                structlog.get_logger().exception("it failed")
+
+        flush_logs()
+        assert "ValueError" in stream.getvalue()
+
+    def test_log_queue_false_keeps_synchronous_pipeline(self):
+        stream = io.StringIO()
+        configure(log_level="INFO", output_file=stream, log_env="container_json", cache=False, log_queue=False)
+
+        structlog.get_logger().info("direct message")
+
+        assert "direct message" in stream.getvalue()
+
+    def test_records_are_dropped_when_the_queue_stays_full(self):
+        import threading
+
+        writer = LogWriter(max_queue_size=1, put_timeout=0.01)
+        release = threading.Event()
+        lines = []
+
+        class BlockingSink:
+            def write(self, _method_name, line):
+                release.wait(5)
+                lines.append(line)
+
+            def flush(self):
+                pass
+
+        sink = BlockingSink()
+        writer.submit(sink, "info", None, "first")
+        # Wait until the writer took the first record and blocks on it
+        while writer._queue.qsize():
+            pass
+        writer.submit(sink, "info", None, "second")
+        writer.submit(sink, "info", None, "third")
+        release.set()
+
+        assert writer.flush()
+        assert writer.dropped == 1
+        assert lines == ["first", "1 log records were dropped because the log writer fell behind", "second"]
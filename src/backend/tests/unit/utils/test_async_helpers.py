@@ -1,7 +1,9 @@
 from unittest.mock import Mock, patch
 
+import asyncio
+
 import pytest
-from lfx.utils.async_helpers import run_until_complete, timeout_context
+from lfx.utils.async_helpers import bounded_map, run_until_complete, timeout_context
 
 
 class TestTimeoutContext:
@@ -180,3 +182,58 @@ class TestRunUntilComplete:
 
         # Verify executor was still called
         mock_executor.submit.assert_called_once()
+
+
+class TestBoundedMap:
+    """Test cases for bounded_map function."""
+
+    async def test_yields_results_in_input_order(self):
+        async def work(item):
+            await asyncio.sleep(0.01 * (5 - item))
+            return item * 2
+
+        results = [result async for result in bounded_map(work, range(5), max_concurrency=5)]
+        assert results == [0, 2, 4, 6, 8]
+
+    async def test_limits_concurrency_and_per_key_concurrency(self):
+        running = {"total": 0, "a": 0, "b": 0}
+        peak = dict.fromkeys(running, 0)
+
+        async def work(item):
+            for name in ("total", item[0]):
+                running[name] += 1
+                peak[name] = max(peak[name], running[name])
+            await asyncio.sleep(0.01)
+            for name in ("total", item[0]):
+                running[name] -= 1
+            return item
+
+        items = [f"{key}{i}" for key in "ab" for i in range(6)]
+        results = [
+            result
+            async for result in bounded_map(work, items, max_concurrency=3, key=lambda item: item[0], max_per_key=2)
+        ]
+
+        assert results == items
+        assert peak["total"] == 3
+        assert peak["a"] <= 2
+        assert peak["b"] <= 2
+
+    async def test_cancels_pending_calls_on_error(self):
+        cancelled = []
+
+        async def work(item):
+            if item == 0:
+                msg = "boom"
+                raise ValueError(msg)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        with pytest.raises(ValueError, match="boom"):
+            async for _ in bounded_map(work, range(3), max_concurrency=3):
+                pass
+        assert sorted(cancelled) == [1, 2]
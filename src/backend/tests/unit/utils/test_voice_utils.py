@@ -10,6 +10,7 @@ from langflow.utils.voice_utils import (
     FRAME_DURATION_MS,
     SAMPLE_RATE_24K,
     VAD_SAMPLE_RATE_16K,
+    StreamingResampler,
     _write_bytes_to_file,
     resample_24k_to_16k,
     write_audio_to_file,
@@ -172,6 +173,91 @@ class TestResample24kTo16k:
         assert target_samples == 320  # int(480 * 2 / 3)
 
 
+class TestStreamingResampler:
+    """Test the streaming polyphase resampler."""
+
+    @staticmethod
+    def _tone(seconds: float) -> np.ndarray:
+        t = np.arange(int(SAMPLE_RATE_24K * seconds)) / SAMPLE_RATE_24K
+        return (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+    def test_resample_frame_size(self):
+        """Test that each 20ms frame at 24kHz gives a 20ms frame at 16kHz."""
+        resampler = StreamingResampler()
+
+        result = resampler.resample(self._tone(0.02).tobytes())
+
+        assert len(result) == BYTES_PER_16K_FRAME
+
+    def test_resample_invalid_frame_size(self):
+        """Test error handling for frames that are not 960 bytes."""
+        resampler = StreamingResampler()
+
+        with pytest.raises(ValueError, match=f"Expected exactly {BYTES_PER_24K_FRAME} bytes"):
+            resampler.resample(b"\x00" * 100)
+
+    def test_stream_matches_resampling_whole_signal(self):
+        """Test that frames resampled one at a time match the whole signal filtered at once."""
+        from scipy.signal import firwin, upfirdn
+
+        samples = self._tone(0.5)
+        resampler = StreamingResampler()
+        audio = samples.tobytes()
+
+        frames = [
+            resampler.resample(audio[offset : offset + BYTES_PER_24K_FRAME])
+            for offset in range(0, len(audio), BYTES_PER_24K_FRAME)
+        ]
+        result = np.frombuffer(b"".join(frames), dtype=np.int16)
+
+        taps = firwin(61, 1 / 3, window=("kaiser", 5.0)) * 2
+        expected = upfirdn(taps, samples.astype(np.float64), 2, 3)[: len(result)]
+        assert len(result) == len(samples) * 2 // 3
+        # Equal up to rounding, without artifacts at the frame boundaries
+        assert np.abs(result - np.rint(expected)).max() <= 1
+
+    def test_feed_buffers_partial_frames(self):
+        """Test that chunks that are not whole frames give the same frames as whole frames."""
+        audio = self._tone(0.2).tobytes()
+        framed = StreamingResampler()
+        chunked = StreamingResampler()
+
+        expected = [
+            framed.resample(audio[offset : offset + BYTES_PER_24K_FRAME])
+            for offset in range(0, len(audio), BYTES_PER_24K_FRAME)
+        ]
+        result = [frame for offset in range(0, len(audio), 700) for frame in chunked.feed(audio[offset : offset + 700])]
+
+        assert result == expected
+
+    def test_feed_keeps_incomplete_frame(self):
+        """Test that no frame is given until a whole frame was received."""
+        resampler = StreamingResampler()
+        audio = self._tone(0.02).tobytes()
+
+        assert list(resampler.feed(audio[:500])) == []
+        assert len(list(resampler.feed(audio[500:]))) == 1
+
+    def test_streams_are_independent(self):
+        """Test that the filter state of a stream does not leak into another one."""
+        audio = self._tone(0.02).tobytes()
+        busy = StreamingResampler()
+        busy.resample(self._tone(0.02)[::-1].tobytes())
+
+        assert busy.resample(audio) != StreamingResampler().resample(audio)
+        assert StreamingResampler().resample(audio) == StreamingResampler().resample(audio)
+
+    def test_resample_clips_to_int16(self):
+        """Test that overshoot of the filter on full scale input is clipped."""
+        samples = np.array([32767, -32768] * 240, dtype=np.int16)
+        resampler = StreamingResampler()
+
+        result = np.frombuffer(resampler.resample(samples.tobytes()), dtype=np.int16)
+
+        assert result.dtype == np.int16
+        assert len(result) == BYTES_PER_16K_FRAME // BYTES_PER_SAMPLE
+
+
 class TestWriteAudioToFile:
     """Test cases for write_audio_to_file function."""
 
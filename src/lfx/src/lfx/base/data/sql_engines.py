@@ -0,0 +1,143 @@
+"""Process-wide registry of SQLAlchemy engines shared by the SQL components.
+
+Creating an engine means resolving the dialect, importing the driver and opening a fresh pool,
+and ``SQLDatabase`` reflects the schema when it is created. Doing that on every component build
+makes repeated queries pay the full connection setup each time. Engines are kept here instead,
+keyed by a hash of the normalized URI and engine options, with bounded pools, and engines that
+have not been used for a while are disposed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from langchain_community.utilities import SQLDatabase
+    from sqlalchemy.engine import URL, Engine
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 5
+DEFAULT_POOL_RECYCLE = 1800
+
+
+def normalize_database_url(database_url: str) -> URL:
+    """Parse ``database_url``, accepting the ``postgres://`` scheme used by many providers."""
+    database_url = database_url.strip()
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+    return make_url(database_url)
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in {None, "", ":memory:"}
+
+
+class SQLEngineEntry:
+    """An engine of the registry and the ``SQLDatabase`` wrapping it."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.last_used = time.monotonic()
+        self._database: SQLDatabase | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def database(self) -> SQLDatabase:
+        """The ``SQLDatabase`` of the engine, created once so its schema reflection is reused."""
+        if self._database is None:
+            with self._lock:
+                if self._database is None:
+                    from langchain_community.utilities import SQLDatabase
+
+                    # Tables are only reflected when their info is requested, and then kept
+                    self._database = SQLDatabase(self.engine, lazy_table_reflection=True)
+        return self._database
+
+
+class SQLEngineRegistry:
+    """Keeps one engine per database URI and engine options.
+
+    Args:
+        max_engines: Maximum number of engines kept open. The least recently used one is
+            disposed when a new engine would exceed it.
+        idle_timeout: Seconds after which an unused engine is disposed.
+    """
+
+    def __init__(self, max_engines: int = 16, idle_timeout: float = 600.0) -> None:
+        self.max_engines = max_engines
+        self.idle_timeout = idle_timeout
+        self._entries: OrderedDict[str, SQLEngineEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: URL, engine_kwargs: dict[str, Any]) -> str:
+        rendered_url = url.render_as_string(hide_password=False)
+        options = orjson.dumps(engine_kwargs, option=orjson.OPT_SORT_KEYS, default=repr)
+        return hashlib.sha256(rendered_url.encode() + b"\0" + options).hexdigest()
+
+    @staticmethod
+    def _create_engine(url: URL, engine_kwargs: dict[str, Any]) -> Engine:
+        options: dict[str, Any] = {"pool_pre_ping": True}
+        if not _is_memory_sqlite(url):
+            options |= {
+                "pool_size": DEFAULT_POOL_SIZE,
+                "max_overflow": DEFAULT_MAX_OVERFLOW,
+                "pool_recycle": DEFAULT_POOL_RECYCLE,
+            }
+        return create_engine(url, **(options | engine_kwargs))
+
+    def get(self, database_url: str, **engine_kwargs: Any) -> SQLEngineEntry:
+        """Return the entry for ``database_url``, creating its engine on first use."""
+        url = normalize_database_url(database_url)
+        key = self.make_key(url, engine_kwargs)
+        with self._lock:
+            self._evict_idle()
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = SQLEngineEntry(self._create_engine(url, engine_kwargs))
+                while len(self._entries) > self.max_engines:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._dispose(evicted)
+            else:
+                self._entries.move_to_end(key)
+            entry.last_used = time.monotonic()
+            return entry
+
+    def _evict_idle(self) -> None:
+        if self.idle_timeout <= 0:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        for key in [key for key, entry in self._entries.items() if entry.last_used < deadline]:
+            self._dispose(self._entries.pop(key))
+
+    @staticmethod
+    def _dispose(entry: SQLEngineEntry) -> None:
+        try:
+            # Connections checked out by a running query are left open until they are returned
+            entry.engine.dispose()
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Failed to dispose SQL engine: {e}")
+
+    def clear(self) -> None:
+        """Dispose every engine of the registry."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            self._dispose(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+sql_engine_registry = SQLEngineRegistry()
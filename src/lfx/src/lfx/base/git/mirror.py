@@ -0,0 +1,278 @@
+"""Mirrors of remote Git repositories and a cache of their files, shared by the runs of Git components.
+
+Loading a remote repository used to clone it into a temporary directory, read and filter every
+file and delete the clone. Mirrors are kept on disk per clone URL and branch and updated with
+shallow fetches, and the text of files and the content filters they match are cached by blob SHA,
+so files that did not change since the last run are not read again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterator
+
+    from git import Repo
+
+# Ref of the mirror that points to the fetched commit of the branch
+MIRROR_REF = "refs/heads/mirror"
+# Files kept next to the Git data of a mirror
+FETCHED_FILE = "langflow-fetched"
+USED_FILE = "langflow-used"
+SIZE_FILE = "langflow-size"
+SYMLINK_MODE = "120000"
+BINARY_CHECK_SIZE = 1024
+
+
+def normalize_clone_url(clone_url: str) -> str:
+    """Return the clone URL without the differences that do not change the repository it points to.
+
+    The host is lowercased and trailing slashes are removed, as well as the ``.git`` suffix of
+    remote repositories.
+    """
+    clone_url = clone_url.strip()
+    parts = urlsplit(clone_url)
+    if not parts.netloc:
+        # Local paths, file:// URLs and scp-like addresses such as git@github.com:org/repo.git
+        clone_url = clone_url.rstrip("/")
+        is_remote = "@" in clone_url and parts.scheme != "file"
+        return clone_url.removesuffix(".git") if is_remote else clone_url
+    userinfo, _, host = parts.netloc.rpartition("@")
+    netloc = f"{userinfo}@{host.lower()}" if userinfo else host.lower()
+    path = parts.path.rstrip("/")
+    if parts.scheme != "file":
+        path = path.removesuffix(".git")
+    return urlunsplit((parts.scheme.lower(), netloc, path, parts.query, ""))
+
+
+def mirror_key(clone_url: str, branch: str | None) -> str:
+    """Return the key of the mirror of ``branch`` of the repository at ``clone_url``."""
+    payload = f"{normalize_clone_url(clone_url)}\0{branch or ''}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class GitMirrorCache:
+    """Shallow mirrors of remote branches, kept in ``directory`` and evicted least recently used first.
+
+    Mirrors are locked with a file lock while they are fetched and read, so that the runs of all
+    the workers of a host can share them. Runs waiting for the fetch of another run use its result
+    instead of fetching again.
+
+    Args:
+        directory: Directory of the mirrors.
+        max_size: Maximum size in bytes of the mirrors. The least recently used ones that are not
+            locked are deleted beyond it.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = 2048 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def _lock(self, key: str, timeout: float = -1):
+        from filelock import FileLock
+
+        return FileLock(self.directory / f"{key}.lock", timeout=timeout)
+
+    @contextmanager
+    def open(self, clone_url: str, branch: str | None) -> Iterator[tuple[Repo, str]]:
+        """Fetch ``branch`` into its mirror and yield the mirror and the fetched commit.
+
+        The mirror is locked until the context exits. ``branch`` defaults to the HEAD of the remote.
+        """
+        key = mirror_key(clone_url, branch)
+        path = self.directory / f"{key}.git"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        requested_at = time.time_ns()
+        with self._lock(key):
+            try:
+                fetched_at = (path / FETCHED_FILE).stat().st_mtime_ns
+            except FileNotFoundError:
+                fetched_at = 0
+            if fetched_at >= requested_at:
+                from git import Repo
+
+                repo = Repo(path)
+            else:
+                repo = self._fetch(path, clone_url, branch)
+            (path / USED_FILE).touch()
+            try:
+                yield repo, repo.git.rev_parse(MIRROR_REF)
+            finally:
+                repo.close()
+        self.evict()
+
+    @staticmethod
+    def _fetch(path: Path, clone_url: str, branch: str | None) -> Repo:
+        from git import Repo
+
+        created = not (path / "HEAD").exists()
+        repo = Repo.init(path, bare=True) if created else Repo(path)
+        # Never wait for credentials on a terminal
+        repo.git.update_environment(GIT_TERMINAL_PROMPT="0")
+        started = time.perf_counter()
+        try:
+            # The URL is not saved as a remote, it may hold credentials
+            repo.git.fetch("--depth=1", "--no-tags", "--force", clone_url, f"{branch or 'HEAD'}:{MIRROR_REF}")
+        except Exception:
+            repo.close()
+            if created:
+                shutil.rmtree(path, ignore_errors=True)
+            raise
+        size = sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+        (path / SIZE_FILE).write_text(str(size))
+        fetched_at = time.time_ns()
+        (path / FETCHED_FILE).touch()
+        os.utime(path / FETCHED_FILE, ns=(fetched_at, fetched_at))
+        elapsed = time.perf_counter() - started
+        logger.debug(f"Fetched {branch or 'HEAD'} into the Git mirror {path.name} in {elapsed:.2f}s")
+        return repo
+
+    def evict(self) -> int:
+        """Delete the least recently used mirrors beyond the maximum size. Returns how many were deleted."""
+        from filelock import Timeout
+
+        mirrors = []
+        for path in self.directory.glob("*.git"):
+            try:
+                mirrors.append(((path / USED_FILE).stat().st_mtime_ns, int((path / SIZE_FILE).read_text()), path))
+            except (OSError, ValueError):
+                continue
+        total = sum(size for _, size, _ in mirrors)
+        deleted = 0
+        for _, size, path in sorted(mirrors):
+            if total <= self.max_size:
+                break
+            try:
+                with self._lock(path.stem, timeout=0):
+                    shutil.rmtree(path, ignore_errors=True)
+            except Timeout:
+                # In use by another run
+                continue
+            total -= size
+            deleted += 1
+        if deleted:
+            logger.debug(f"Deleted {deleted} Git mirror(s) from {self.directory}")
+        return deleted
+
+
+def iter_blobs(repo: Repo, commit: str) -> Iterator[tuple[str, str]]:
+    """Yield the path and the blob SHA of every file of ``commit``, skipping symlinks and submodules."""
+    for entry in repo.git.ls_tree("-r", "-z", commit).split("\0"):
+        if not entry:
+            continue
+        info, _, file_path = entry.partition("\t")
+        mode, object_type, sha = info.split()
+        if object_type == "blob" and mode != SYMLINK_MODE:
+            yield file_path, sha
+
+
+class GitBlobCache:
+    """LRU cache of the text of Git blobs and of the content filters they match, keyed by blob SHA.
+
+    Binary files and files that are not UTF-8 are cached as None.
+
+    Args:
+        max_size: Maximum number of characters of text kept.
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        self.max_size = max_size
+        self._size = 0
+        self._blobs: OrderedDict[str, tuple[str | None, dict[str, bool]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def read_blob(repo: Repo, sha: str) -> bytes:
+        return repo.odb.stream(bytes.fromhex(sha)).read()
+
+    def get_text(self, repo: Repo, sha: str) -> str | None:
+        """Return the text of the blob ``sha``, reading it from ``repo`` on a miss."""
+        with self._lock:
+            entry = self._blobs.get(sha)
+            if entry is not None:
+                self._blobs.move_to_end(sha)
+                return entry[0]
+
+        content = self.read_blob(repo, sha)
+        text = None
+        if b"\x00" not in content[:BINARY_CHECK_SIZE]:
+            try:
+                text = content.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        with self._lock:
+            if sha not in self._blobs:
+                self._blobs[sha] = (text, {})
+                self._size += len(text or "")
+            self._blobs.move_to_end(sha)
+            while self._size > self.max_size and len(self._blobs) > 1:
+                evicted_text, _ = self._blobs.popitem(last=False)[1]
+                self._size -= len(evicted_text or "")
+        return text
+
+    def matches(self, sha: str, text: str, pattern: re.Pattern) -> bool:
+        """Return whether ``pattern`` is found in ``text``, the text of the blob ``sha``."""
+        with self._lock:
+            entry = self._blobs.get(sha)
+            decisions = entry[1] if entry is not None else {}
+            matched = decisions.get(pattern.pattern)
+        if matched is None:
+            matched = bool(pattern.search(text))
+            with self._lock:
+                decisions[pattern.pattern] = matched
+        return matched
+
+    def clear(self) -> None:
+        """Drop every blob."""
+        with self._lock:
+            self._blobs.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+
+_git_mirror_cache: GitMirrorCache | None = None
+_git_blob_cache = GitBlobCache()
+_git_mirror_cache_lock = threading.Lock()
+
+
+def get_git_mirror_cache() -> GitMirrorCache:
+    """Return the mirror cache of the process, configured from the settings on first use."""
+    global _git_mirror_cache  # noqa: PLW0603
+    if _git_mirror_cache is None:
+        with _git_mirror_cache_lock:
+            if _git_mirror_cache is None:
+                from lfx.services.deps import get_settings_service
+
+                settings_service = get_settings_service()
+                settings = settings_service.settings if settings_service is not None else None
+                if settings is not None and settings.git_mirror_cache_dir:
+                    directory = Path(settings.git_mirror_cache_dir)
+                elif settings is not None and settings.config_dir:
+                    directory = Path(settings.config_dir) / "git_mirrors"
+                else:
+                    from platformdirs import user_cache_dir
+
+                    directory = Path(user_cache_dir("langflow")) / "git_mirrors"
+                max_size = settings.git_mirror_cache_max_size if settings is not None else 2048
+                _git_mirror_cache = GitMirrorCache(directory, max_size=max_size * 1024 * 1024)
+    return _git_mirror_cache
+
+
+def get_git_blob_cache() -> GitBlobCache:
+    """Return the blob cache of the process."""
+    return _git_blob_cache
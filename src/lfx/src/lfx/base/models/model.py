@@ -9,6 +9,7 @@ from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, System
 from langchain_core.output_parsers import BaseOutputParser
 
 from lfx.base.constants import STREAM_INFO_TEXT
+from lfx.base.models.model_registry import build_model_from_component
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing import LanguageModel
 from lfx.inputs.inputs import BoolInput, InputTypes, MessageInput, MultilineInput
@@ -372,4 +373,4 @@ class LCModelComponent(Component):
             for component_input in inputs
         }
 
-        return component.set(**input_data).build_model()
+        return build_model_from_component(component, input_data, inputs)
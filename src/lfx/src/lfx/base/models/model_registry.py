@@ -0,0 +1,175 @@
+"""Process-wide registry of language model instances.
+
+LangChain chat models open their own HTTP client and connection pool, and some of them load a
+tokenizer, when they are created. Building a fresh model on every agent run throws that away.
+Models are kept here instead, keyed by provider, model name, a hash of the other parameters and
+a fingerprint of the credentials, so that runs with the same settings share a warm instance.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import orjson
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from lfx.custom.custom_component.component import Component
+    from lfx.field_typing import LanguageModel
+    from lfx.inputs.inputs import InputTypes
+
+T = TypeVar("T")
+
+# Fingerprints are salted per process, so that they cannot be matched against hashes of known keys
+_FINGERPRINT_SALT = os.urandom(16)
+
+
+def fingerprint(value: str) -> str:
+    """Return a salted fingerprint of ``value``, used instead of the value to identify credentials."""
+    return hmac.new(_FINGERPRINT_SALT, value.encode(), hashlib.sha256).hexdigest()
+
+
+def _current_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class ModelEntry(Generic[T]):
+    """A model of the registry and what is needed to tell whether it is still usable."""
+
+    def __init__(self, model: T, value_fingerprints: frozenset[str], loop: asyncio.AbstractEventLoop | None) -> None:
+        self.model = model
+        self.value_fingerprints = value_fingerprints
+        self.created_at = self.last_used = time.monotonic()
+        self._loop_ref = weakref.ref(loop) if loop is not None else None
+
+    def usable_in(self, loop: asyncio.AbstractEventLoop | None) -> bool:
+        # Async HTTP clients are bound to the event loop they were first used in
+        if self._loop_ref is None:
+            return loop is None
+        entry_loop = self._loop_ref()
+        return entry_loop is loop and not entry_loop.is_closed()
+
+
+class ModelInstanceRegistry:
+    """Keeps one model instance per provider, parameters and credentials.
+
+    Args:
+        max_size: Maximum number of models kept. The least recently used one is dropped when a
+            new model would exceed it.
+        ttl: Seconds after which a model is built again, so that long-lived instances do not
+            hold on to stale connections or settings forever.
+    """
+
+    def __init__(self, max_size: int = 32, ttl: float = 1800.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, ModelEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        params: dict[str, Any],
+        secret_names: Iterable[str] = (),
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> str:
+        secret_names = set(secret_names)
+        public_params = {name: value for name, value in params.items() if name not in secret_names}
+        credentials = sorted(
+            (name, fingerprint(str(value))) for name, value in params.items() if name in secret_names and value
+        )
+        model_name = params.get("model_name") or params.get("model") or ""
+        payload = orjson.dumps(
+            [provider, str(model_name), public_params, credentials, id(loop) if loop is not None else None],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=repr,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_or_create(
+        self,
+        provider: str,
+        params: dict[str, Any],
+        factory: Callable[[], T],
+        *,
+        secret_names: Iterable[str] = (),
+    ) -> T:
+        """Return the model registered for ``provider`` and ``params``, building it with ``factory`` if needed.
+
+        Args:
+            provider: Name of the model provider.
+            params: Parameters the model is built from.
+            factory: Builds the model from ``params`` when the registry has no usable instance.
+            secret_names: Names of the parameters holding credentials. Only their fingerprint is kept.
+        """
+        loop = _current_loop()
+        key = self.make_key(provider, params, secret_names, loop)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.created_at < self.ttl and entry.usable_in(loop):
+                self._entries.move_to_end(key)
+                entry.last_used = now
+                return entry.model
+
+        model = factory()
+        value_fingerprints = frozenset(fingerprint(value) for value in params.values() if isinstance(value, str))
+        with self._lock:
+            self._entries[key] = ModelEntry(model, value_fingerprints, loop)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return model
+
+    def invalidate(self, value: str) -> int:
+        """Drop the models built with a parameter equal to ``value``, such as a global variable that changed.
+
+        Returns:
+            The number of models dropped.
+        """
+        value_fingerprint = fingerprint(value)
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if value_fingerprint in entry.value_fingerprints]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            logger.debug(f"Dropped {len(keys)} cached language models")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every model of the registry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+model_instance_registry = ModelInstanceRegistry()
+
+
+def build_model_from_component(
+    component: Component, params: dict[str, Any], inputs: Sequence[InputTypes]
+) -> LanguageModel:
+    """Return the model ``component`` builds from ``params``, reusing a registered instance when possible."""
+    secret_names = [input_.name for input_ in inputs if getattr(input_, "password", False)]
+    return model_instance_registry.get_or_create(
+        type(component).__name__,
+        params,
+        lambda: component.set(**params).build_model(),
+        secret_names=secret_names,
+    )
@@ -0,0 +1,85 @@
+"""Client-side rate limiting for language model calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+RATE_LIMIT_STATUS_CODE = 429
+RATE_LIMIT_ERROR_NAMES = ("RateLimit", "ResourceExhausted", "TooManyRequests", "Throttling")
+
+
+class AsyncTokenBucket:
+    """A token bucket refilled continuously at ``rate_per_minute`` tokens per minute.
+
+    ``acquire`` waits until the bucket holds the requested amount. Amounts larger than the bucket
+    capacity are let through once the bucket is full and leave it in debt, so that the long-run rate
+    never exceeds the budget.
+
+    Args:
+        rate_per_minute: Tokens added to the bucket per minute.
+        capacity: Maximum number of tokens held by the bucket. Defaults to ``rate_per_minute``.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None) -> None:
+        if rate_per_minute <= 0:
+            msg = "rate_per_minute must be greater than 0"
+            raise ValueError(msg)
+        self.max_rate = rate_per_minute / 60
+        self.rate = self.max_rate
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until ``amount`` tokens are available and take them."""
+        needed = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= amount
+
+    def slow_down(self, factor: float = 0.5) -> None:
+        """Reduce the refill rate after the provider rejected a request for going too fast."""
+        self.rate = max(self.rate * factor, self.max_rate / 100)
+
+    def speed_up(self, factor: float = 1.1) -> None:
+        """Move the refill rate back towards the configured rate."""
+        self.rate = min(self.rate * factor, self.max_rate)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return whether ``error`` is a provider rejecting a request for exceeding its rate limits."""
+    response = getattr(error, "response", None)
+    if RATE_LIMIT_STATUS_CODE in {getattr(error, "status_code", None), getattr(response, "status_code", None)}:
+        return True
+    return any(name in type(error).__name__ for name in RATE_LIMIT_ERROR_NAMES)
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Return the delay requested by the ``Retry-After`` header of a rate limit error, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, error: BaseException | None = None, *, base: float = 1.0, cap: float = 60.0) -> float:
+    """Return how long to wait before retry ``attempt`` (starting at 0), with full jitter.
+
+    The ``Retry-After`` delay of ``error`` is used instead when the provider sent one.
+    """
+    if error is not None and (delay := retry_after(error)) is not None:
+        return min(delay, cap)
+    return random.uniform(0, min(cap, base * 2**attempt))  # noqa: S311
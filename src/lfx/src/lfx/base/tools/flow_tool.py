@@ -25,6 +25,8 @@ class FlowTool(BaseTool):
     flow_id: str | None = None
     user_id: str | None = None
     session_id: str | None = None
+    # Run ID of the parent flow; when set, every call runs a fresh graph of the flow prepared in that run
+    cache_scope: str | None = None
     inputs: list[Vertex] = []
     get_final_results_only: bool = True
 
@@ -61,11 +63,12 @@ class FlowTool(BaseTool):
 
         run_outputs = run_until_complete(
             run_flow(
-                graph=self.graph,
+                graph=self._graph_for_run(),
                 tweaks={key: {"input_value": value} for key, value in tweaks.items()},
                 flow_id=self.flow_id,
                 user_id=self.user_id,
                 session_id=self.session_id,
+                cache_scope=self.cache_scope,
             )
         )
         if not run_outputs:
@@ -79,6 +82,12 @@ class FlowTool(BaseTool):
                     data.extend(build_data_from_result_data(output))
         return format_flow_output_data(data)
 
+    def _graph_for_run(self) -> Graph | None:
+        """The graph to run, or None to have ``run_flow`` build a fresh one from the prepared flow."""
+        if self.cache_scope and self.flow_id:
+            return None
+        return self.graph
+
     def validate_inputs(self, args_names: list[dict[str, str]], args: Any, kwargs: Any):
         """Validate the inputs."""
         if len(args) > 0 and len(args) != len(args_names):
@@ -118,7 +127,8 @@ class FlowTool(BaseTool):
             user_id=self.user_id,
             run_id=run_id,
             session_id=self.session_id,
-            graph=self.graph,
+            graph=self._graph_for_run(),
+            cache_scope=self.cache_scope,
         )
         if not run_outputs:
             return "No output"
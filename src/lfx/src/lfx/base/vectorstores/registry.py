@@ -0,0 +1,226 @@
+"""Process-wide reuse of vector store handles and query embeddings.
+
+Opening a vector store means building an embeddings client and opening the collection, and every
+search embeds its query with a call to the embedding provider. Retrieval components used to pay
+for all of that on each run. The registry keeps opened stores keyed by their location and
+embedding configuration, and the query embedding cache remembers the vectors of queries that were
+already embedded, optionally in a directory shared by the workers of a host. Stores kept in files,
+like FAISS indexes, are registered with a signature of their files and reopened when they change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from langchain_core.embeddings import Embeddings
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from langchain_core.vectorstores import VectorStore
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings, keyed by embedding model and a hash of the query text.
+
+    Args:
+        max_size: Maximum number of embeddings kept in memory.
+        directory: Optional directory of an on-disk tier. Embeddings missing from memory are looked
+            up there before calling the provider, so they survive restarts and are shared by the
+            workers of a host.
+    """
+
+    def __init__(self, max_size: int = 1024, directory: str | Path | None = None) -> None:
+        self.max_size = max_size
+        self._embeddings: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        if directory is not None:
+            from diskcache import Cache
+
+            self._disk = Cache(str(directory))
+
+    def get(self, model_key: str, text: str) -> list[float] | None:
+        """Return the cached embedding of ``text`` for ``model_key``, or None."""
+        key = (model_key, _text_hash(text))
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is not None:
+                self._embeddings.move_to_end(key)
+                return embedding
+        if self._disk is None:
+            return None
+        embedding = self._disk.get(":".join(key))
+        if embedding is not None:
+            self._remember(key, embedding)
+        return embedding
+
+    def set(self, model_key: str, text: str, embedding: list[float]) -> None:
+        """Store the embedding of ``text`` for ``model_key``."""
+        key = (model_key, _text_hash(text))
+        embedding = list(embedding)
+        self._remember(key, embedding)
+        if self._disk is not None:
+            self._disk.set(":".join(key), embedding)
+
+    def _remember(self, key: tuple[str, str], embedding: list[float]) -> None:
+        with self._lock:
+            self._embeddings[key] = embedding
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_size:
+                self._embeddings.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every embedding, including the ones on disk."""
+        with self._lock:
+            self._embeddings.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """Embeddings that look queries up in a :class:`QueryEmbeddingCache` before embedding them.
+
+    Documents are always embedded by the wrapped model, since they are rarely embedded twice.
+    """
+
+    def __init__(self, embeddings: Embeddings, model_key: str, cache: QueryEmbeddingCache | None = None) -> None:
+        self.embeddings = embeddings
+        self.model_key = model_key
+        self.cache = cache if cache is not None else get_query_embedding_cache()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        embedding = self.cache.get(self.model_key, text)
+        if embedding is None:
+            embedding = self.embeddings.embed_query(text)
+            self.cache.set(self.model_key, text, embedding)
+        return embedding
+
+    async def aembed_query(self, text: str) -> list[float]:
+        embedding = self.cache.get(self.model_key, text)
+        if embedding is None:
+            embedding = await self.embeddings.aembed_query(text)
+            self.cache.set(self.model_key, text, embedding)
+        return embedding
+
+
+class VectorStoreRegistry:
+    """Keeps opened vector stores, keyed by location and embedding configuration.
+
+    Args:
+        max_size: Maximum number of stores kept open. The least recently used one is dropped when
+            a new store would exceed it.
+    """
+
+    def __init__(self, max_size: int = 16) -> None:
+        self.max_size = max_size
+        self._stores: OrderedDict[str, tuple[str, VectorStore, Hashable | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(location: str | Path, collection_name: str, embedding_config: dict[str, Any]) -> str:
+        """Return the key of a store from its location, collection and embedding configuration.
+
+        Credentials must be passed as fingerprints, the configuration is hashed but not salted.
+        """
+        payload = orjson.dumps(
+            {"location": str(location), "collection": collection_name, "embedding": embedding_config},
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_or_create(
+        self,
+        key: str,
+        location: str | Path,
+        factory: Callable[[], VectorStore],
+        *,
+        signature: Hashable | None = None,
+    ) -> VectorStore:
+        """Return the store registered under ``key``, opening it with ``factory`` on a miss.
+
+        ``signature`` identifies the version of a store kept in files, e.g. the modification times
+        and sizes of its files. A store registered with another signature is opened again.
+        """
+        with self._lock:
+            entry = self._stores.get(key)
+            if entry is not None and entry[2] == signature:
+                self._stores.move_to_end(key)
+                return entry[1]
+
+        store = factory()
+        with self._lock:
+            # Another caller may have opened the same version meanwhile, keep the first one
+            entry = self._stores.get(key)
+            if entry is None or entry[2] != signature:
+                entry = (str(location), store, signature)
+                self._stores[key] = entry
+            self._stores.move_to_end(key)
+            while len(self._stores) > self.max_size:
+                self._stores.popitem(last=False)
+        return entry[1]
+
+    def invalidate(self, location: str | Path) -> int:
+        """Drop the stores opened at ``location``, e.g. after it was deleted. Returns how many were dropped."""
+        location = str(location)
+        with self._lock:
+            keys = [key for key, (store_location, *_) in self._stores.items() if store_location == location]
+            for key in keys:
+                del self._stores[key]
+        if keys:
+            logger.debug(f"Dropped {len(keys)} vector store handle(s) opened at {location}")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every store."""
+        with self._lock:
+            self._stores.clear()
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+
+vector_store_registry = VectorStoreRegistry()
+
+_query_embedding_cache: QueryEmbeddingCache | None = None
+_query_embedding_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Return the query embedding cache of the process, configured from the settings on first use."""
+    global _query_embedding_cache  # noqa: PLW0603
+    if _query_embedding_cache is None:
+        with _query_embedding_cache_lock:
+            if _query_embedding_cache is None:
+                from lfx.services.deps import get_settings_service
+
+                settings_service = get_settings_service()
+                if settings_service is None:
+                    _query_embedding_cache = QueryEmbeddingCache()
+                else:
+                    _query_embedding_cache = QueryEmbeddingCache(
+                        max_size=settings_service.settings.query_embedding_cache_size,
+                        directory=settings_service.settings.query_embedding_cache_dir,
+                    )
+    return _query_embedding_cache
@@ -1,11 +1,48 @@
+import hashlib
+import os
+import re
+import tempfile
 from pathlib import Path
 
+import orjson
 from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from lfx.base.vectorstores.registry import VectorStoreRegistry, vector_store_registry
 from lfx.helpers.data import docs_to_data
 from lfx.io import BoolInput, HandleInput, IntInput, StrInput
+from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.utils.helpers import write_bytes_atomic
+
+# Documents are stored under the hash of their content, which tells the ones already indexed
+CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+# Attributes naming the model of an embedding, in the order they are looked up
+EMBEDDING_MODEL_ATTRIBUTES = ("model", "model_name", "deployment", "repo_id")
+
+
+def document_hash(document: Document) -> str:
+    """Return the hash of the text and metadata of a document."""
+    payload = orjson.dumps(
+        {"page_content": document.page_content, "metadata": document.metadata},
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def embedding_fingerprint(embedding: Embeddings) -> dict[str, str | int | None]:
+    """Return the class, model and requested dimensions of an embedding, which tell the indexes its vectors fit."""
+    models = (getattr(embedding, name, None) for name in EMBEDDING_MODEL_ATTRIBUTES)
+    model = next((model for model in models if model), None)
+    dimensions = getattr(embedding, "dimensions", None)
+    return {
+        "class": f"{type(embedding).__module__}.{type(embedding).__qualname__}",
+        "model": str(model) if model is not None else None,
+        "dimensions": dimensions if isinstance(dimensions, int) else None,
+    }
 
 
 class FaissVectorStoreComponent(LCVectorStoreComponent):
@@ -63,40 +100,182 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             return Path(self.resolve_path(self.persist_directory))
         return Path()
 
+    def _index_files(self, path: Path) -> tuple[Path, Path]:
+        return path / f"{self.index_name}.faiss", path / f"{self.index_name}.pkl"
+
+    def _index_signature(self, path: Path) -> tuple[int, ...] | None:
+        """Return the modification times and sizes of the index files, or None if there is no index."""
+        try:
+            stats = [file.stat() for file in self._index_files(path)]
+        except FileNotFoundError:
+            return None
+        return tuple(value for stat in stats for value in (stat.st_mtime_ns, stat.st_size))
+
+    def _fingerprint_file(self, path: Path) -> Path:
+        return path / f"{self.index_name}.embedding.json"
+
+    def _stored_fingerprint(self, path: Path) -> dict | None:
+        """Return the fingerprint of the embedding the index at ``path`` was built with, if it was saved."""
+        try:
+            return orjson.loads(self._fingerprint_file(path).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def _embedding_matches(self, path: Path) -> bool:
+        """Return whether the index at ``path`` was built with the embedding of this component.
+
+        Indexes saved without a fingerprint are assumed to match, the dimension of the vectors is
+        still checked when documents are added.
+        """
+        stored = self._stored_fingerprint(path)
+        if stored is None:
+            return True
+        stored.pop("dimension", None)
+        return stored == embedding_fingerprint(self.embedding)
+
+    def _registry_key(self, path: Path) -> str:
+        embedding_config = {"store": "faiss", **embedding_fingerprint(self.embedding)}
+        return VectorStoreRegistry.make_key(path.resolve(), self.index_name, embedding_config)
+
+    def _lock(self, path: Path):
+        """Return a lock of the index at ``path``, held by the runs of every worker while they update it."""
+        from filelock import FileLock
+
+        return FileLock(path / f".{self.index_name}.lock")
+
+    def _with_embedding(self, store: FAISS) -> FAISS:
+        """Return a store sharing the index of ``store`` that embeds queries with the embedding of this component."""
+        return FAISS(
+            embedding_function=self.embedding,
+            index=store.index,
+            docstore=store.docstore,
+            index_to_docstore_id=store.index_to_docstore_id,
+            relevance_score_fn=store.override_relevance_score_fn,
+            normalize_L2=store._normalize_L2,
+            distance_strategy=store.distance_strategy,
+        )
+
+    def _load_local(self, path: Path) -> FAISS:
+        return FAISS.load_local(
+            folder_path=str(path),
+            embeddings=self.embedding,
+            index_name=self.index_name,
+            allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+        )
+
+    def load_index(self, path: Path) -> FAISS | None:
+        """Return the index saved at ``path``, kept open across runs until its files change.
+
+        Returns None if there is no index at ``path`` or if it was built with another embedding.
+        """
+        signature = self._index_signature(path)
+        if signature is None or not self._embedding_matches(path):
+            return None
+        store = vector_store_registry.get_or_create(
+            self._registry_key(path), path / self.index_name, lambda: self._load_local(path), signature=signature
+        )
+        return self._with_embedding(store)
+
+    def _save_index(self, store: FAISS, path: Path) -> None:
+        """Save the index next to the current one and move it in place, followed by its embedding fingerprint.
+
+        The docstore is replaced before the index. Documents are only appended, so a reader
+        between the two replacements finds every vector of the old index in the new docstore.
+        """
+        with tempfile.TemporaryDirectory(dir=path, prefix=f".{self.index_name}-") as temp_dir:
+            store.save_local(temp_dir, self.index_name)
+            index_file, docstore_file = self._index_files(path)
+            temp_index_file, temp_docstore_file = self._index_files(Path(temp_dir))
+            os.replace(temp_docstore_file, docstore_file)
+            os.replace(temp_index_file, index_file)
+        fingerprint = {**embedding_fingerprint(self.embedding), "dimension": store.index.d}
+        write_bytes_atomic(self._fingerprint_file(path), orjson.dumps(fingerprint))
+        vector_store_registry.get_or_create(
+            self._registry_key(path), path / self.index_name, lambda: store, signature=self._index_signature(path)
+        )
+
+    @staticmethod
+    def _indexed_hashes(store: FAISS) -> set[str]:
+        ids = set(store.index_to_docstore_id.values())
+        if all(CONTENT_HASH_PATTERN.fullmatch(_id) for _id in ids):
+            return ids
+        # Indexes saved before documents were stored under their hash
+        return {document_hash(store.docstore.search(_id)) for _id in ids}
+
+    def _stored_documents(self, path: Path) -> dict[str, Document]:
+        """Return the documents of the index at ``path`` by their hash, whatever embedding it was built with."""
+        if self._index_signature(path) is None:
+            return {}
+        store = self._load_local(path)
+        documents = (store.docstore.search(_id) for _id in store.index_to_docstore_id.values())
+        return {document_hash(document): document for document in documents}
+
+    @staticmethod
+    def _add_documents(store: FAISS, documents: dict[str, Document], embeddings: Embeddings) -> bool:
+        """Embed and add ``documents`` to ``store``, unless their vectors have another dimension than its index.
+
+        Returns whether the documents were added.
+        """
+        texts = [document.page_content for document in documents.values()]
+        vectors = embeddings.embed_documents(texts)
+        if any(len(vector) != store.index.d for vector in vectors):
+            return False
+        store.add_embeddings(
+            zip(texts, vectors, strict=True),
+            metadatas=[document.metadata for document in documents.values()],
+            ids=list(documents),
+        )
+        return True
+
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
-        """Builds the FAISS object."""
+        """Builds the FAISS object, embedding and adding only the documents that are not indexed yet.
+
+        An index built with another embedding is rebuilt from its documents and the new ones.
+        """
         path = self.get_persist_directory()
         path.mkdir(parents=True, exist_ok=True)
 
         # Convert DataFrame to Data if needed using parent's method
         self.ingest_data = self._prepare_ingest_data()
 
-        documents = []
+        documents: dict[str, Document] = {}
         for _input in self.ingest_data or []:
-            if isinstance(_input, Data):
-                documents.append(_input.to_lc_document())
-            else:
-                documents.append(_input)
+            document = _input.to_lc_document() if isinstance(_input, Data) else _input
+            documents.setdefault(document_hash(document), document)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
+        with self._lock(path):
+            existing = self.load_index(path)
+            if existing is not None:
+                # Load a copy to add to, the cached index may be searched meanwhile
+                indexed = self._indexed_hashes(existing)
+                new_documents = {key: document for key, document in documents.items() if key not in indexed}
+                if not new_documents:
+                    return existing
+                faiss = self._load_local(path)
+                if self._add_documents(faiss, new_documents, self.embedding):
+                    self._save_index(faiss, path)
+                    logger.debug(f"Added {len(new_documents)} documents to the FAISS index '{self.index_name}'")
+                    return faiss
+
+            # There is no index yet, or its vectors do not come from the embedding of this component
+            documents = {**self._stored_documents(path), **documents}
+            if not documents:
+                msg = f"There are no documents to index and no FAISS index named '{self.index_name}' in {path}."
+                raise ValueError(msg)
+            faiss = FAISS.from_documents(
+                documents=list(documents.values()), embedding=self.embedding, ids=list(documents)
+            )
+            self._save_index(faiss, path)
+        logger.debug(f"Built the FAISS index '{self.index_name}' with {len(documents)} documents")
         return faiss
 
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
         path = self.get_persist_directory()
-        index_path = path / f"{self.index_name}.faiss"
-
-        if not index_path.exists():
+        vector_store = self.load_index(path)
+        if vector_store is None:
             vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
-                folder_path=str(path),
-                embeddings=self.embedding,
-                index_name=self.index_name,
-                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-            )
 
         if not vector_store:
             msg = "Failed to load the FAISS index."
@@ -13,6 +13,7 @@ from lfx.base.models.model_input_constants import (
     MODEL_PROVIDERS_LIST,
     MODELS_METADATA,
 )
+from lfx.base.models.model_registry import build_model_from_component
 from lfx.base.models.model_utils import get_model_name
 from lfx.components.helpers.current_date import CurrentDateComponent
 from lfx.components.helpers.memory import MemoryComponent
@@ -483,7 +484,7 @@ class AgentComponent(ToolCallingAgentComponent):
         for input_ in inputs:
             if hasattr(self, f"{prefix}{input_.name}"):
                 model_kwargs[input_.name] = getattr(self, f"{prefix}{input_.name}")
-        return component.set(**model_kwargs).build_model()
+        return build_model_from_component(component, model_kwargs, inputs)
 
     def set_component_params(self, component):
         provider_info = MODEL_PROVIDERS_DICT.get(self.agent_llm)
@@ -28,6 +28,7 @@ from lfx.base.models.model_input_constants import (
     MODEL_PROVIDERS_DICT,
     MODELS_METADATA,
 )
+from lfx.base.models.model_registry import build_model_from_component
 from lfx.base.models.model_utils import get_model_name
 from lfx.components.agents.agent import LCToolsAgentComponent
 from lfx.components.helpers.current_date import CurrentDateComponent
@@ -824,7 +825,7 @@ class CugaComponent(ToolCallingAgentComponent):
         for input_ in inputs:
             if hasattr(self, f"{prefix}{input_.name}"):
                 model_kwargs[input_.name] = getattr(self, f"{prefix}{input_.name}")
-        return component.set(**model_kwargs).build_model()
+        return build_model_from_component(component, model_kwargs, inputs)
 
     def set_component_params(self, component):
         """Set component parameters based on provider.
@@ -27,6 +27,7 @@ from lfx.io import (
 from lfx.schema.data import Data
 from lfx.schema.dotdict import dotdict
 from lfx.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
+from lfx.utils.request_utils import borrow_http_client
 
 # Define fields for each mode
 MODE_FIELDS = {
@@ -448,7 +449,7 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
+        async with borrow_http_client() as client:
             result = await self.make_request(
                 client,
                 method,
@@ -1,12 +1,13 @@
 from urllib.parse import quote_plus
 
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from lfx.custom import Component
 from lfx.io import IntInput, MessageTextInput, Output
 from lfx.schema import DataFrame
+from lfx.utils.request_utils import borrow_http_client
 
 
 class NewsSearchComponent(Component):
@@ -84,7 +85,7 @@ class NewsSearchComponent(Component):
 
     outputs = [Output(name="articles", display_name="News Articles", method="search_news")]
 
-    def search_news(self) -> DataFrame:
+    async def search_news(self) -> DataFrame:
         # Defaults
         hl = getattr(self, "hl", None) or "en-US"
         gl = getattr(self, "gl", None) or "US"
@@ -128,11 +129,12 @@ class NewsSearchComponent(Component):
             )
 
         try:
-            response = requests.get(rss_url, timeout=self.timeout)
+            async with borrow_http_client() as client:
+                response = await client.get(rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed to fetch news: {e}"
             self.log(self.status)
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
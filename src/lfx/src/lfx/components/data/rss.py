@@ -1,11 +1,12 @@
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from lfx.custom import Component
 from lfx.io import IntInput, MessageTextInput, Output
 from lfx.log.logger import logger
 from lfx.schema import DataFrame
+from lfx.utils.request_utils import borrow_http_client
 
 
 class RSSReaderComponent(Component):
@@ -36,9 +37,10 @@ class RSSReaderComponent(Component):
 
     outputs = [Output(name="articles", display_name="Articles", method="read_rss")]
 
-    def read_rss(self) -> DataFrame:
+    async def read_rss(self) -> DataFrame:
         try:
-            response = requests.get(self.rss_url, timeout=self.timeout)
+            async with borrow_http_client() as client:
+                response = await client.get(self.rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             if not response.content.strip():
                 msg = "Empty response received"
@@ -51,7 +53,7 @@ class RSSReaderComponent(Component):
                 raise ValueError(msg) from e
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except (requests.RequestException, ValueError) as e:
+        except (httpx.HTTPError, ValueError) as e:
             self.status = f"Failed to fetch RSS: {e}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
 
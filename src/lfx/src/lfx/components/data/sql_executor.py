@@ -1,19 +1,24 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from langchain_community.utilities import SQLDatabase
+import pandas as pd
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from lfx.custom.custom_component.component_with_cache import ComponentWithCache
-from lfx.io import BoolInput, MessageTextInput, MultilineInput, Output
+from lfx.base.data.sql_engines import sql_engine_registry
+from lfx.custom.custom_component.component import Component
+from lfx.io import BoolInput, IntInput, MessageTextInput, MultilineInput, Output
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
-from lfx.services.cache.utils import CacheMiss
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Result
+    from langchain_community.utilities import SQLDatabase
+    from sqlalchemy.engine import Engine
 
+# Rows fetched from the cursor at a time when building the result table
+RESULT_PAGE_SIZE = 1000
 
-class SQLComponent(ComponentWithCache):
+
+class SQLComponent(Component):
     """A sql component."""
 
     display_name = "SQL Database"
@@ -26,27 +31,30 @@ class SQLComponent(ComponentWithCache):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.db: SQLDatabase = None
+        self.engine: Engine = None
 
     def maybe_create_db(self):
         if self.database_url != "":
-            if self._shared_component_cache:
-                cached_db = self._shared_component_cache.get(self.database_url)
-                if not isinstance(cached_db, CacheMiss):
-                    self.db = cached_db
-                    return
-                self.log("Connecting to database")
             try:
-                self.db = SQLDatabase.from_uri(self.database_url)
+                # Engines and their pools are shared by every run that targets the same database
+                entry = sql_engine_registry.get(self.database_url)
+                self.engine = entry.engine
+                self.db = entry.database
             except Exception as e:
                 msg = f"An error occurred while connecting to the database: {e}"
                 raise ValueError(msg) from e
-            if self._shared_component_cache:
-                self._shared_component_cache.set(self.database_url, self.db)
 
     inputs = [
         MessageTextInput(name="database_url", display_name="Database URL", required=True),
         MultilineInput(name="query", display_name="SQL Query", tool_mode=True, required=True),
         BoolInput(name="include_columns", display_name="Include Columns", value=True, tool_mode=True, advanced=True),
+        IntInput(
+            name="max_rows",
+            display_name="Max Rows",
+            value=0,
+            info="Maximum number of rows in the result table. 0 means no limit.",
+            advanced=True,
+        ),
         BoolInput(
             name="add_error",
             display_name="Add Error",
@@ -84,18 +92,30 @@ class SQLComponent(ComponentWithCache):
 
         return Message(text=result)
 
-    def __execute_query(self) -> list[dict[str, Any]]:
+    def __execute_query(self) -> DataFrame:
         self.maybe_create_db()
+        max_rows = self.max_rows or 0
         try:
-            cursor: Result[Any] = self.db.run(self.query, fetch="cursor")
-            return [x._asdict() for x in cursor.fetchall()]
+            with self.engine.begin() as connection:
+                result = connection.execute(text(self.query).execution_options(stream_results=True))
+                if not result.returns_rows:
+                    return DataFrame()
+                columns = list(result.keys())
+                rows = []
+                # Read the cursor a page at a time, so a row limit never loads the whole result
+                while partition := result.fetchmany(RESULT_PAGE_SIZE):
+                    rows.extend(tuple(row) for row in partition)
+                    if max_rows and len(rows) >= max_rows:
+                        del rows[max_rows:]
+                        break
+                result.close()
         except SQLAlchemyError as e:
             msg = f"An error occurred while running the SQL Query: {e}"
             self.log(msg)
             raise ValueError(msg) from e
+        return DataFrame(pd.DataFrame.from_records(rows, columns=columns))
 
     def run_sql_query(self) -> DataFrame:
-        result = self.__execute_query()
-        df_result = DataFrame(result)
+        df_result = self.__execute_query()
         self.status = df_result
         return df_result
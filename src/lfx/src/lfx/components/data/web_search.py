@@ -4,18 +4,24 @@ This component consolidates Web Search, News Search, and RSS Reader into a singl
 component with tabs for different search modes.
 """
 
+import asyncio
 import re
 from typing import Any
 from urllib.parse import parse_qs, quote_plus, unquote, urlparse
 
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from lfx.custom import Component
 from lfx.io import IntInput, MessageTextInput, Output, TabInput
 from lfx.schema import DataFrame
-from lfx.utils.request_utils import get_user_agent
+from lfx.utils.async_helpers import bounded_map
+from lfx.utils.request_utils import borrow_http_client, get_user_agent
+
+# Result pages fetched at once, and at once from the same host
+MAX_CONCURRENT_FETCHES = 10
+MAX_FETCHES_PER_HOST = 2
 
 
 class WebSearchComponent(Component):
@@ -151,7 +157,33 @@ class WebSearchComponent(Component):
         """Remove HTML tags from text."""
         return BeautifulSoup(html_string, "html.parser").get_text(separator=" ", strip=True)
 
-    def perform_web_search(self) -> DataFrame:
+    @staticmethod
+    def _parse_search_results(html: str) -> list[dict[str, str]]:
+        """Extract the title, decoded link and snippet of each DuckDuckGo result."""
+        soup = BeautifulSoup(html, "html.parser")
+        results = []
+        for result in soup.select("div.result"):
+            title_tag = result.select_one("a.result__a")
+            snippet_tag = result.select_one("a.result__snippet")
+            if title_tag:
+                raw_link = title_tag.get("href", "")
+                parsed = urlparse(raw_link)
+                uddg = parse_qs(parsed.query).get("uddg", [""])[0]
+                results.append(
+                    {
+                        "title": title_tag.get_text(strip=True),
+                        "link": unquote(uddg) if uddg else raw_link,
+                        "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
+                    }
+                )
+        return results
+
+    @staticmethod
+    def _extract_page_text(html: str) -> str:
+        """Return the text of a result page."""
+        return BeautifulSoup(html, "lxml").get_text(separator=" ", strip=True)
+
+    async def perform_web_search(self) -> DataFrame:
         """Perform DuckDuckGo web search."""
         query = self._sanitize_query(self.query)
         if not query:
@@ -162,52 +194,50 @@ class WebSearchComponent(Component):
         params = {"q": query, "kl": "us-en"}
         url = "https://html.duckduckgo.com/html/"
 
-        try:
-            response = requests.get(url, params=params, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            self.status = f"Failed request: {e!s}"
-            return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "snippet": str(e), "content": ""}]))
-
-        if not response.text or "text/html" not in response.headers.get("content-type", "").lower():
-            self.status = "No results found"
-            return DataFrame(
-                pd.DataFrame([{"title": "Error", "link": "", "snippet": "No results found", "content": ""}])
-            )
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        results = []
+        async with borrow_http_client() as client:
+            try:
+                response = await client.get(
+                    url, params=params, headers=headers, timeout=self.timeout, follow_redirects=True
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                self.status = f"Failed request: {e!s}"
+                return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "snippet": str(e), "content": ""}]))
+
+            if not response.text or "text/html" not in response.headers.get("content-type", "").lower():
+                self.status = "No results found"
+                return DataFrame(
+                    pd.DataFrame([{"title": "Error", "link": "", "snippet": "No results found", "content": ""}])
+                )
 
-        for result in soup.select("div.result"):
-            title_tag = result.select_one("a.result__a")
-            snippet_tag = result.select_one("a.result__snippet")
-            if title_tag:
-                raw_link = title_tag.get("href", "")
-                parsed = urlparse(raw_link)
-                uddg = parse_qs(parsed.query).get("uddg", [""])[0]
-                decoded_link = unquote(uddg) if uddg else raw_link
+            search_results = await asyncio.to_thread(self._parse_search_results, response.text)
 
+            async def fetch_result(result: dict[str, str]) -> dict[str, str]:
+                link = result["link"]
                 try:
-                    final_url = self.ensure_url(decoded_link)
-                    page = requests.get(final_url, headers=headers, timeout=self.timeout)
+                    final_url = self.ensure_url(link)
+                    page = await client.get(final_url, headers=headers, timeout=self.timeout, follow_redirects=True)
                     page.raise_for_status()
-                    content = BeautifulSoup(page.text, "lxml").get_text(separator=" ", strip=True)
-                except requests.RequestException as e:
-                    final_url = decoded_link
+                    content = await asyncio.to_thread(self._extract_page_text, page.text)
+                except httpx.HTTPError as e:
+                    final_url = link
                     content = f"(Failed to fetch: {e!s}"
-
-                results.append(
-                    {
-                        "title": title_tag.get_text(strip=True),
-                        "link": final_url,
-                        "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
-                        "content": content,
-                    }
-                )
+                return {**result, "link": final_url, "content": content}
+
+            results = []
+            async for result in bounded_map(
+                fetch_result,
+                search_results,
+                max_concurrency=MAX_CONCURRENT_FETCHES,
+                key=lambda result: urlparse(result["link"]).netloc,
+                max_per_key=MAX_FETCHES_PER_HOST,
+            ):
+                results.append(result)
+                self.log(f"Fetched {len(results)}/{len(search_results)} result pages.")
 
         return DataFrame(pd.DataFrame(results))
 
-    def perform_news_search(self) -> DataFrame:
+    async def perform_news_search(self) -> DataFrame:
         """Perform Google News search."""
         query = getattr(self, "query", "")
         hl = getattr(self, "hl", "en-US") or "en-US"
@@ -243,11 +273,12 @@ class WebSearchComponent(Component):
             )
 
         try:
-            response = requests.get(rss_url, timeout=self.timeout)
+            async with borrow_http_client() as client:
+                response = await client.get(rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed to fetch news: {e}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
 
@@ -269,7 +300,7 @@ class WebSearchComponent(Component):
 
         return DataFrame(pd.DataFrame(articles))
 
-    def perform_rss_read(self) -> DataFrame:
+    async def perform_rss_read(self) -> DataFrame:
         """Read RSS feed."""
         rss_url = getattr(self, "query", "")
         if not rss_url:
@@ -278,7 +309,8 @@ class WebSearchComponent(Component):
             )
 
         try:
-            response = requests.get(rss_url, timeout=self.timeout)
+            async with borrow_http_client() as client:
+                response = await client.get(rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             if not response.content.strip():
                 msg = "Empty response received"
@@ -293,7 +325,7 @@ class WebSearchComponent(Component):
 
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except (requests.RequestException, ValueError) as e:
+        except (httpx.HTTPError, ValueError) as e:
             self.status = f"Failed to fetch RSS: {e}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
 
@@ -312,15 +344,15 @@ class WebSearchComponent(Component):
         self.log(f"Fetched {len(df_articles)} articles.")
         return DataFrame(df_articles)
 
-    def perform_search(self) -> DataFrame:
+    async def perform_search(self) -> DataFrame:
         """Main search method that routes to appropriate search function based on mode."""
         search_mode = getattr(self, "search_mode", "Web")
 
         if search_mode == "Web":
-            return self.perform_web_search()
+            return await self.perform_web_search()
         if search_mode == "News":
-            return self.perform_news_search()
+            return await self.perform_news_search()
         if search_mode == "RSS":
-            return self.perform_rss_read()
+            return await self.perform_rss_read()
         # Fallback to web search
-        return self.perform_web_search()
+        return await self.perform_web_search()
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import json
 import uuid
-from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any
 
+import orjson
 from opensearchpy import OpenSearch, helpers
 
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
@@ -12,6 +16,12 @@ from lfx.io import BoolInput, DropdownInput, HandleInput, IntInput, MultilineInp
 from lfx.log import logger
 from lfx.schema.data import Data
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Number of failed documents listed in the ingestion summary
+MAX_REPORTED_FAILURES = 10
+
 
 @vector_store_connection
 class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
@@ -57,6 +67,8 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         "ef_construction",
         "m",
         "docs_metadata",
+        "ingest_batch_size",
+        "embedding_concurrency",
     ]
 
     inputs = [
@@ -146,6 +158,26 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         ),
         *LCVectorStoreComponent.inputs,  # includes search_query, add_documents, etc.
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
+        IntInput(
+            name="ingest_batch_size",
+            display_name="Ingest Batch Size",
+            value=500,
+            info=(
+                "Number of documents embedded in one request to the embedding model and indexed in one bulk "
+                "operation. Only this many documents per batch are held in memory with their vectors."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="embedding_concurrency",
+            display_name="Embedding Concurrency",
+            value=2,
+            info=(
+                "Number of batches embedded at the same time. "
+                "Embedding the next batches overlaps with indexing the current one."
+            ),
+            advanced=True,
+        ),
         StrInput(
             name="vector_field",
             display_name="Vector Field Name",
@@ -283,7 +315,8 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
                         "type": "knn_vector",
                         "dimension": dim,
                         "method": {
-                            "name": "disk_ann",
+                            # jvector builds DiskANN graphs, the other engines build HNSW graphs
+                            "name": "disk_ann" if engine == "jvector" else "hnsw",
                             "space_type": space_type,
                             "engine": engine,
                             "parameters": {"ef_construction": ef_construction, "m": m},
@@ -293,6 +326,27 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
             },
         }
 
+    def _ensure_index(self, client: OpenSearch, dim: int, engine: str) -> None:
+        """Create the index with the k-NN mapping of the configured engine, unless it already exists.
+
+        Args:
+            client: OpenSearch client instance
+            dim: Dimensionality of the vector embeddings
+            engine: Vector search engine of the vector field
+        """
+        if client.indices.exists(index=self.index_name):
+            return
+        mapping = self._default_text_mapping(
+            dim=dim,
+            engine=engine,
+            space_type=self.space_type or "l2",
+            ef_construction=self.ef_construction or 512,
+            m=self.m or 16,
+            vector_field=self.vector_field,
+        )
+        client.indices.create(index=self.index_name, body=mapping)
+        self.log(f"Created index '{self.index_name}' with a {dim}-dimension '{engine}' vector field.")
+
     def _validate_aoss_with_engines(self, *, is_aoss: bool, engine: str) -> None:
         """Validate engine compatibility with Amazon OpenSearch Serverless (AOSS).
 
@@ -321,68 +375,89 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         """
         return http_auth is not None and hasattr(http_auth, "service") and http_auth.service == "aoss"
 
-    def _bulk_ingest_embeddings(
+    def _bulk_actions(
         self,
-        client: OpenSearch,
         index_name: str,
-        embeddings: list[list[float]],
-        texts: list[str],
-        metadatas: list[dict] | None = None,
-        ids: list[str] | None = None,
+        batches: Iterable[tuple[list[str], list[dict], list[list[float]]]],
         vector_field: str = "vector_field",
         text_field: str = "text",
-        mapping: dict | None = None,
-        max_chunk_bytes: int | None = 1 * 1024 * 1024,
         *,
         is_aoss: bool = False,
-    ) -> list[str]:
-        """Efficiently ingest multiple documents with embeddings into OpenSearch.
+    ) -> Iterator[tuple[str, str]]:
+        """Yield the bulk index actions of embedded batches of documents.
 
-        This method uses bulk operations to insert documents with their vector
-        embeddings and metadata into the specified OpenSearch index.
+        Actions are serialized here with orjson, the bulk helper sends serialized actions as they are
+        instead of encoding each one with the standard library.
 
         Args:
-            client: OpenSearch client instance
             index_name: Target index for document storage
-            embeddings: List of vector embeddings for each document
-            texts: List of document texts
-            metadatas: Optional metadata dictionaries for each document
-            ids: Optional document IDs (UUIDs generated if not provided)
+            batches: Texts, metadata dictionaries and vector embeddings of each batch
             vector_field: Field name for storing vector embeddings
             text_field: Field name for storing document text
-            mapping: Optional index mapping configuration
-            max_chunk_bytes: Maximum size per bulk request chunk
             is_aoss: Whether using Amazon OpenSearch Serverless
 
+        Yields:
+            The action and the source of each document, with a generated UUID as its ID
+        """
+        for texts, metadatas, embeddings in batches:
+            for text, metadata, embedding in zip(texts, metadatas, embeddings, strict=True):
+                _id = str(uuid.uuid4())
+                action: dict[str, Any] = {"_index": index_name}
+                source = {vector_field: embedding, text_field: text, **metadata}
+                if is_aoss:
+                    source["id"] = _id
+                else:
+                    action["_id"] = _id
+                yield (
+                    orjson.dumps({"index": action}).decode(),
+                    orjson.dumps(source, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
+                )
+
+    def _bulk_ingest_embeddings(
+        self,
+        client: OpenSearch,
+        actions: Iterable[tuple[str, str]],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 1 * 1024 * 1024,
+        total: int | None = None,
+    ) -> tuple[int, list[dict]]:
+        """Stream index actions into OpenSearch with bulk requests.
+
+        Actions are consumed as the bulk requests are sent, so that documents are indexed while
+        the following ones are still being embedded. A failed document does not stop the others.
+
+        Args:
+            client: OpenSearch client instance
+            actions: Serialized bulk index actions and sources, one per document
+            chunk_size: Maximum number of documents per bulk request
+            max_chunk_bytes: Maximum size per bulk request chunk
+            total: Number of documents to index, shown in the progress logs
+
         Returns:
-            List of document IDs that were successfully ingested
+            The number of indexed documents and the bulk response items of the failed ones
         """
-        if not mapping:
-            mapping = {}
-
-        requests = []
-        return_ids = []
-
-        for i, text in enumerate(texts):
-            metadata = metadatas[i] if metadatas else {}
-            _id = ids[i] if ids else str(uuid.uuid4())
-            request = {
-                "_op_type": "index",
-                "_index": index_name,
-                vector_field: embeddings[i],
-                text_field: text,
-                **metadata,
-            }
-            if is_aoss:
-                request["id"] = _id
+        indexed = 0
+        failures: list[dict] = []
+        next_report = chunk_size
+        for ok, item in helpers.streaming_bulk(
+            client,
+            actions,
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            raise_on_error=False,
+            raise_on_exception=False,
+            expand_action_callback=_expand_serialized_action,
+        ):
+            if ok:
+                indexed += 1
             else:
-                request["_id"] = _id
-            requests.append(request)
-            return_ids.append(_id)
-        if metadatas:
-            self.log(f"Sample metadata: {metadatas[0] if metadatas else {}}")
-        helpers.bulk(client, requests, max_chunk_bytes=max_chunk_bytes)
-        return return_ids
+                failures.append(item)
+            processed = indexed + len(failures)
+            if processed >= next_report and processed != total:
+                next_report += chunk_size
+                of_total = f" of {total}" if total is not None else ""
+                self.log(f"Processed {processed}{of_total} documents: {indexed} indexed, {len(failures)} failed.")
+        return indexed, failures
 
     # ---------- auth / client ----------
     def _build_auth_kwargs(self) -> dict[str, Any]:
@@ -442,10 +517,10 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         """Process and ingest documents into the OpenSearch vector store.
 
         This method handles the complete document ingestion pipeline:
-        - Prepares document data and metadata
-        - Generates vector embeddings
-        - Creates appropriate index mappings
-        - Bulk inserts documents with vectors
+        - Prepares document data and metadata in batches
+        - Generates vector embeddings, a few batches at a time in worker threads
+        - Streams the embedded batches into bulk inserts while the next ones are embedded
+        - Reports the documents that failed to index
 
         Args:
             client: OpenSearch client for performing operations
@@ -458,15 +533,11 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
             self.log("No documents to ingest.")
             return
 
-        # Extract texts and metadata from documents
-        texts = []
-        metadatas = []
         # Process docs_metadata table input into a dict
         additional_metadata = {}
         if hasattr(self, "docs_metadata") and self.docs_metadata:
             logger.debug(f"[LF] Docs metadata {self.docs_metadata}")
             if isinstance(self.docs_metadata[-1], Data):
-                logger.debug(f"[LF] Docs metadata is a Data object {self.docs_metadata}")
                 self.docs_metadata = self.docs_metadata[-1].data
                 logger.debug(f"[LF] Docs metadata is a Data object {self.docs_metadata}")
                 additional_metadata.update(self.docs_metadata)
@@ -479,30 +550,10 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
             if value == "None":
                 additional_metadata[key] = None
         logger.debug(f"[LF] Additional metadata {additional_metadata}")
-        for doc_obj in docs:
-            data_copy = json.loads(doc_obj.model_dump_json())
-            text = data_copy.pop(doc_obj.text_key, doc_obj.default_value)
-            texts.append(text)
-
-            # Merge additional metadata from table input
-            data_copy.update(additional_metadata)
-
-            metadatas.append(data_copy)
-        self.log(metadatas)
         if not self.embedding:
             msg = "Embedding handle is required to embed documents."
             raise ValueError(msg)
 
-        # Generate embeddings
-        vectors = self.embedding.embed_documents(texts)
-
-        if not vectors:
-            self.log("No vectors generated from documents.")
-            return
-
-        # Get vector dimension for mapping
-        dim = len(vectors[0]) if vectors else 768  # default fallback
-
         # Check for AOSS
         auth_kwargs = self._build_auth_kwargs()
         is_aoss = self._is_aoss_enabled(auth_kwargs.get("http_auth"))
@@ -511,37 +562,75 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
         engine = getattr(self, "engine", "jvector")
         self._validate_aoss_with_engines(is_aoss=is_aoss, engine=engine)
 
-        # Create mapping with proper KNN settings
-        space_type = getattr(self, "space_type", "l2")
-        ef_construction = getattr(self, "ef_construction", 512)
-        m = getattr(self, "m", 16)
-
-        mapping = self._default_text_mapping(
-            dim=dim,
-            engine=engine,
-            space_type=space_type,
-            ef_construction=ef_construction,
-            m=m,
-            vector_field=self.vector_field,
-        )
-
-        self.log(f"Indexing {len(texts)} documents into '{self.index_name}' with proper KNN mapping...")
+        batch_size = max(1, self.ingest_batch_size or 500)
+        batches = self._embed_batches(self._document_batches(docs, additional_metadata, batch_size))
+        first_batch = next(batches, None)
+        if first_batch is None or not first_batch[2]:
+            batches.close()
+            self.log("No vectors generated from documents.")
+            return
+        self._ensure_index(client, dim=len(first_batch[2][0]), engine=engine)
+        self.log(f"Sample metadata: {first_batch[1][0] if first_batch[1] else {}}")
+        self.log(f"Indexing {len(docs)} documents into '{self.index_name}' in batches of {batch_size}...")
 
-        # Use the LangChain-style bulk ingestion
-        return_ids = self._bulk_ingest_embeddings(
-            client=client,
+        actions = self._bulk_actions(
             index_name=self.index_name,
-            embeddings=vectors,
-            texts=texts,
-            metadatas=metadatas,
+            batches=chain([first_batch], batches),
             vector_field=self.vector_field,
             text_field="text",
-            mapping=mapping,
             is_aoss=is_aoss,
         )
-        self.log(metadatas)
-
-        self.log(f"Successfully indexed {len(return_ids)} documents.")
+        try:
+            indexed, failures = self._bulk_ingest_embeddings(client, actions, chunk_size=batch_size, total=len(docs))
+        finally:
+            batches.close()
+
+        if failures:
+            self.log(f"Failed to index {len(failures)} documents: {failures[:MAX_REPORTED_FAILURES]}")
+            if not indexed:
+                msg = f"Failed to index all {len(failures)} documents. First failure: {failures[0]}"
+                raise ValueError(msg)
+        self.log(f"Successfully indexed {indexed} documents.")
+
+    def _document_batches(
+        self, docs: list[Data], additional_metadata: dict, batch_size: int
+    ) -> Iterator[tuple[list[str], list[dict]]]:
+        """Yield the texts and metadata dictionaries of the documents, ``batch_size`` documents at a time."""
+        documents = iter(docs)
+        while batch := list(islice(documents, batch_size)):
+            texts = []
+            metadatas = []
+            for doc_obj in batch:
+                data_copy = doc_obj.model_dump(mode="json")
+                texts.append(data_copy.pop(doc_obj.text_key, doc_obj.default_value))
+                # Merge additional metadata from table input
+                data_copy.update(additional_metadata)
+                metadatas.append(data_copy)
+            yield texts, metadatas
+
+    def _embed_batches(
+        self, batches: Iterable[tuple[list[str], list[dict]]]
+    ) -> Iterator[tuple[list[str], list[dict], list[list[float]]]]:
+        """Embed the batches in worker threads and yield them with their vectors, in order.
+
+        Up to ``embedding_concurrency`` batches are embedded ahead of the one being indexed,
+        which bounds the number of vectors held in memory.
+        """
+        concurrency = max(1, self.embedding_concurrency or 1)
+        pending: deque = deque()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="opensearch-embed") as executor:
+            try:
+                for texts, metadatas in batches:
+                    pending.append((texts, metadatas, executor.submit(self.embedding.embed_documents, texts)))
+                    if len(pending) > concurrency:
+                        texts, metadatas, future = pending.popleft()
+                        yield texts, metadatas, future.result()
+                while pending:
+                    texts, metadatas, future = pending.popleft()
+                    yield texts, metadatas, future.result()
+            finally:
+                for *_, future in pending:
+                    future.cancel()
 
     # ---------- helpers for filters ----------
     def _is_placeholder_term(self, term_obj: dict) -> bool:
@@ -787,3 +876,7 @@ class OpenSearchVectorStoreComponent(LCVectorStoreComponent):
             self.log(f"update_build_config error: {e}")
 
         return build_config
+
+
+def _expand_serialized_action(action: tuple[str, str]) -> tuple[str, str]:
+    return action
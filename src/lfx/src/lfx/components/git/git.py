@@ -1,3 +1,4 @@
+import asyncio
 import re
 import tempfile
 from contextlib import asynccontextmanager
@@ -6,7 +7,9 @@ from pathlib import Path
 
 import anyio
 from langchain_community.document_loaders.git import GitLoader
+from langchain_core.documents import Document
 
+from lfx.base.git.mirror import get_git_blob_cache, get_git_mirror_cache, iter_blobs
 from lfx.custom.custom_component.component import Component
 from lfx.io import DropdownInput, MessageTextInput, Output
 from lfx.schema.data import Data
@@ -255,7 +258,48 @@ class GitLoaderComponent(Component):
             file_filter=combined_filter,
         )
 
+    def load_remote_documents(self) -> list[Data]:
+        """Load the files of the remote repository from its mirror.
+
+        Files are filtered like the ones of local repositories, but their text and the result of the
+        content filter are cached by blob SHA, so unchanged files are not read again.
+        """
+        file_filter_patterns = getattr(self, "file_filter", None)
+        content_filter_pattern = getattr(self, "content_filter", None)
+        content_regex = None
+        if content_filter_pattern:
+            try:
+                content_regex = re.compile(content_filter_pattern, re.MULTILINE)
+            except (re.error, TypeError, ValueError):
+                # No file matches an invalid pattern
+                return []
+
+        blob_cache = get_git_blob_cache()
+        data = []
+        with get_git_mirror_cache().open(self.clone_url, getattr(self, "branch", None) or None) as (repo, commit):
+            for file_path, sha in iter_blobs(repo, commit):
+                if file_filter_patterns and not self.check_file_patterns(file_path, file_filter_patterns):
+                    continue
+                text = blob_cache.get_text(repo, sha)
+                if text is None:
+                    continue
+                if content_regex and not blob_cache.matches(sha, text, content_regex):
+                    continue
+                file_name = Path(file_path).name
+                metadata = {
+                    "source": file_path,
+                    "file_path": file_path,
+                    "file_name": file_name,
+                    "file_type": Path(file_name).suffix,
+                }
+                data.append(Data.from_document(Document(page_content=text, metadata=metadata)))
+        return data
+
     async def load_documents(self) -> list[Data]:
+        if getattr(self, "repo_source", None) == "Remote":
+            data = await asyncio.to_thread(self.load_remote_documents)
+            self.status = data
+            return data
         gitloader = await self.build_gitloader()
         data = [Data.from_document(doc) async for doc in gitloader.alazy_load()]
         self.status = data
@@ -9,6 +9,8 @@ from langflow.services.database.models.user.crud import get_user_by_id
 from pydantic import SecretStr
 
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.models.model_registry import fingerprint
+from lfx.base.vectorstores.registry import CachedQueryEmbeddings, VectorStoreRegistry, vector_store_registry
 from lfx.custom import Component
 from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
 from lfx.log.logger import logger
@@ -178,6 +180,30 @@ class KnowledgeRetrievalComponent(Component):
         msg = f"Embedding provider '{provider}' is not supported for retrieval."
         raise NotImplementedError(msg)
 
+    def _vector_store_key(self, kb_path: Path, metadata: dict) -> str:
+        """Return the key of the knowledge base's vector store in the vector store registry."""
+        runtime_api_key = self.api_key.get_secret_value() if isinstance(self.api_key, SecretStr) else self.api_key
+        api_key = runtime_api_key or metadata.get("api_key")
+        embedding_config = {
+            "provider": metadata.get("embedding_provider"),
+            "model": metadata.get("embedding_model"),
+            "chunk_size": metadata.get("chunk_size"),
+            "api_key": fingerprint(api_key) if api_key else None,
+        }
+        return VectorStoreRegistry.make_key(kb_path, self.knowledge_base, embedding_config)
+
+    def _open_vector_store(self, kb_path: Path, metadata: dict) -> Chroma:
+        """Open the knowledge base's Chroma collection with a query embedding cache in front of its embedder."""
+        embedding_function = CachedQueryEmbeddings(
+            self._build_embeddings(metadata),
+            model_key=f"{metadata.get('embedding_provider')}:{metadata.get('embedding_model')}",
+        )
+        return Chroma(
+            persist_directory=str(kb_path),
+            embedding_function=embedding_function,
+            collection_name=self.knowledge_base,
+        )
+
     async def retrieve_data(self) -> DataFrame:
         """Retrieve data from the selected knowledge base by reading the Chroma collection.
 
@@ -201,14 +227,11 @@ class KnowledgeRetrievalComponent(Component):
             msg = f"Metadata not found for knowledge base: {self.knowledge_base}. Ensure it has been indexed."
             raise ValueError(msg)
 
-        # Build the embedder for the knowledge base
-        embedding_function = self._build_embeddings(metadata)
-
-        # Load vector store
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            embedding_function=embedding_function,
-            collection_name=self.knowledge_base,
+        # Reuse the vector store opened by a previous run with the same embedding configuration
+        chroma = vector_store_registry.get_or_create(
+            self._vector_store_key(kb_path, metadata),
+            kb_path,
+            lambda: self._open_vector_store(kb_path, metadata),
         )
 
         # If a search query is provided, perform a similarity search
@@ -89,8 +89,11 @@ class FlowToolComponent(LCToolComponent):
             flow_data.data["data"],
             user_id=str(self.user_id),
         )
+        cache_scope = None
         try:
             graph.set_run_id(self.graph.run_id)
+            # Calls of the tool within this run reuse the prepared flow instead of sharing this graph
+            cache_scope = self.graph.run_id
         except Exception:  # noqa: BLE001
             logger.warning("Failed to set run_id", exc_info=True)
         inputs = get_flow_inputs(graph)
@@ -104,6 +107,7 @@ class FlowToolComponent(LCToolComponent):
             flow_id=str(flow_data.id),
             user_id=str(self.user_id),
             session_id=self.graph.session_id if hasattr(self, "graph") else None,
+            cache_scope=cache_scope,
         )
         description_repr = repr(tool.description).strip("'")
         args_str = "\n".join([f"- {arg_name}: {arg_data['description']}" for arg_name, arg_data in tool.args.items()])
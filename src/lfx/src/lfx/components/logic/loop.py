@@ -1,8 +1,16 @@
+import copy
+from typing import Any
+
 from lfx.custom.custom_component.component import Component
-from lfx.inputs.inputs import HandleInput
+from lfx.custom.eval import reuse_component_classes
+from lfx.graph.edge.base import CycleEdge
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.constants import Finish
+from lfx.inputs.inputs import BoolInput, HandleInput, IntInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.template.field.base import Output
+from lfx.utils.async_helpers import bounded_map
 
 
 class LoopComponent(Component):
@@ -20,6 +28,23 @@ class LoopComponent(Component):
             info="The initial list of Data objects or DataFrame to iterate over.",
             input_types=["DataFrame"],
         ),
+        BoolInput(
+            name="parallel",
+            display_name="Parallel",
+            info=(
+                "Run the loop body for several items at once instead of one after another. "
+                "Each item runs on its own copy of the loop body components and the results keep the input order."
+            ),
+            value=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of items processed at once in parallel mode.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -64,6 +89,10 @@ class LoopComponent(Component):
 
     def item_output(self) -> Data:
         """Output the next item in the list or stop if done."""
+        if self.parallel:
+            # The loop body is run by done_output for every item at once
+            self.stop("item")
+            return Data(text="")
         self.initialize_data()
         current_item = Data(text="")
 
@@ -94,8 +123,10 @@ class LoopComponent(Component):
             if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
                 self.graph.run_manager.run_map[item_dependency_id].append(self._id)
 
-    def done_output(self) -> DataFrame:
+    async def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
+        if self.parallel:
+            return await self.run_parallel()
         self.initialize_data()
 
         if self.evaluate_stop_loop():
@@ -127,3 +158,112 @@ class LoopComponent(Component):
             aggregated.append(loop_input)
             self.update_ctx({f"{self._id}_aggregated": aggregated})
         return aggregated
+
+    def _loop_body(self) -> tuple[set[str], list[CycleEdge], CycleEdge]:
+        """Return the vertices of the loop body, the edges entering it from ``item`` and the edge closing it.
+
+        The body is made of the vertices that are reachable from the ``item`` output and lead back to
+        the ``item`` input. Branches that leave the body are not part of it.
+        """
+        graph = self.graph
+        entry_edges = [
+            edge for edge in graph.edges if edge.source_id == self._id and edge.source_handle.name == "item"
+        ]
+        feedback_edge = next(
+            (edge for edge in graph.edges if edge.target_id == self._id and edge.target_param == "item"), None
+        )
+        if not entry_edges or feedback_edge is None:
+            msg = "Parallel mode requires the Item output to be connected back to the Loop through the loop body."
+            raise ValueError(msg)
+
+        def reachable(start: list[str], neighbors: dict[str, list[str]]) -> set[str]:
+            seen: set[str] = set()
+            stack = list(start)
+            while stack:
+                vertex_id = stack.pop()
+                if vertex_id == self._id or vertex_id in seen:
+                    continue
+                seen.add(vertex_id)
+                stack.extend(neighbors.get(vertex_id, []))
+            return seen
+
+        # The adjacency maps of the graph are consumed while it runs, so they are rebuilt from its edges
+        predecessor_map, successor_map = graph.build_adjacency_maps(graph.edges)
+        forward = reachable([edge.target_id for edge in entry_edges], successor_map)
+        backward = reachable([feedback_edge.source_id], predecessor_map)
+        return forward & backward, entry_edges, feedback_edge
+
+    async def _external_inputs(self, body: set[str]) -> dict[str, dict[str, Any]]:
+        """Resolve the inputs that body vertices receive from vertices outside the loop."""
+        external: dict[str, dict[str, Any]] = {}
+        for edge in self.graph.edges:
+            if edge.target_id not in body or edge.source_id in body or edge.source_id == self._id:
+                continue
+            source = self.graph.get_vertex(edge.source_id)
+            if not source.built:
+                msg = (
+                    f"{source.display_name} must run before the Loop to be used inside the loop body "
+                    "in parallel mode."
+                )
+                raise ValueError(msg)
+            target = self.graph.get_vertex(edge.target_id)
+            external.setdefault(edge.target_id, {})[edge.target_param] = await source.get_result(
+                target, target_handle_name=edge.target_param
+            )
+        return external
+
+    async def run_parallel(self) -> DataFrame:
+        """Run the loop body for every item with bounded concurrency and aggregate the results in input order.
+
+        Every item runs on a graph of its own, built from a copy of the loop body, so iterations do not
+        share vertex or component state. A failing item yields a row with its ``error`` instead of
+        aborting the other items.
+        """
+        data_list = self._validate_data(self.data)
+        body, entry_edges, feedback_edge = self._loop_body()
+        external_inputs = await self._external_inputs(body)
+        payload = {
+            "nodes": [self.graph.get_vertex(vertex_id).to_data() for vertex_id in body],
+            "edges": [
+                edge.to_data() for edge in self.graph.edges if edge.source_id in body and edge.target_id in body
+            ],
+        }
+        # Component code is compiled once and shared by the graphs of every iteration
+        component_classes: dict[str, type] = {}
+
+        async def run_iteration(item: Data) -> Data:
+            with reuse_component_classes(component_classes):
+                # No flow_id, so the iteration graphs do not replace the flow's graph in the chat cache
+                graph = Graph.from_payload(
+                    copy.deepcopy(payload), user_id=self.user_id, context=dict(self.graph.context)
+                )
+                graph.session_id = self.graph.session_id
+                graph.prepare()
+                params = {vertex_id: dict(inputs) for vertex_id, inputs in external_inputs.items()}
+                for edge in entry_edges:
+                    params.setdefault(edge.target_id, {})[edge.target_param] = item
+                # Injected after prepare() so the vertices keep them when they are built
+                for vertex_id, vertex_params in params.items():
+                    graph.get_vertex(vertex_id).update_raw_params(vertex_params, overwrite=True)
+                while not isinstance(await graph.astep(), Finish):
+                    pass
+            return graph.get_vertex(feedback_edge.source_id).results[feedback_edge.source_handle.name]
+
+        failures: list[str] = []
+
+        async def run_safely(item: Data) -> Data:
+            try:
+                result = await run_iteration(item)
+            except Exception as e:  # noqa: BLE001
+                failures.append(str(e))
+                return Data(data={"error": str(e)})
+            return result if isinstance(result, Data) else Data(data={"result": result})
+
+        aggregated = [
+            result
+            async for result in bounded_map(run_safely, data_list, max_concurrency=max(self.max_concurrency, 1))
+        ]
+        if failures:
+            self.log(f"{len(failures)} of {len(data_list)} items failed: {failures[0]}")
+        self.start("done")
+        return DataFrame(aggregated)
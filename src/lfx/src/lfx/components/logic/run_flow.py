@@ -60,6 +60,13 @@ class RunFlowComponent(RunFlowBaseComponent):
                         tweaks[node] = {}
                     tweaks[node][name] = self._attributes[field]
 
+        try:
+            # Invocations within the same run reuse the prepared subflow instead of reloading it.
+            # The subflow keeps a run id of its own.
+            cache_scope = self.graph.run_id
+        except ValueError:
+            cache_scope = None
+
         return await run_flow(
             inputs=None,
             output_type="all",
@@ -67,5 +74,6 @@ class RunFlowComponent(RunFlowBaseComponent):
             flow_name=flow_name_selected,
             tweaks=tweaks,
             user_id=str(self.user_id),
+            cache_scope=cache_scope,
             session_id=self.graph.session_id or self.session_id,
         )
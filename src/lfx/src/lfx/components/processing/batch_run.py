@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from typing import TYPE_CHECKING, Any, cast
 
+import orjson
+import pandas as pd
 import toml  # type: ignore[import-untyped]
 
-from lfx.custom.custom_component.component import Component
-from lfx.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from lfx.base.models.rate_limit import AsyncTokenBucket, backoff_delay, is_rate_limit_error
+from lfx.custom.custom_component.component_with_cache import ComponentWithCache
+from lfx.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from lfx.log.logger import logger
 from lfx.schema.dataframe import DataFrame
+from lfx.services.cache.utils import CacheMiss
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
 
+# Rough number of characters per token, used to charge the token budget before the call
+CHARS_PER_TOKEN = 4
 
-class BatchRunComponent(Component):
+
+class BatchRunComponent(ComponentWithCache):
     display_name = "Batch Run"
     description = "Runs an LLM on each row of a DataFrame column. If no column is specified, all columns are used."
     documentation: str = "https://docs.langflow.org/components-processing#batch-run"
@@ -65,6 +74,34 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="Number of rows sent to the model at once. Completed chunks are kept so a failed run can resume.",
+            value=100,
+            advanced=True,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="Maximum number of model requests per minute. Use 0 for no limit.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="tokens_per_minute",
+            display_name="Tokens per Minute",
+            info="Maximum number of estimated input tokens sent to the model per minute. Use 0 for no limit.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Number of times a chunk is retried when the model provider rejects it for rate limits.",
+            value=5,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -110,9 +147,71 @@ class BatchRunComponent(Component):
                 "processing_status": "failed",
             }
 
+    def _format_user_texts(self, rows: pd.DataFrame, col_name: str) -> list[str]:
+        """Return the text sent to the model for each row."""
+        if col_name:
+            return rows[col_name].astype(str).tolist()
+        return [self._format_row_as_toml(cast("dict[str, Any]", row)) for row in rows.to_dict(orient="records")]
+
+    def _input_hash(self, df: DataFrame, model: Runnable, system_msg: str, col_name: str, chunk_size: int) -> str:
+        """Hash everything that determines the rows produced by a run, to find the checkpoint of a previous run."""
+        model_name = getattr(model, "model_name", None) or getattr(model, "model", None)
+        digest = hashlib.sha256(
+            orjson.dumps(
+                [type(model).__name__, str(model_name), system_msg, col_name, self.output_column_name, chunk_size],
+                default=str,
+            )
+        )
+        digest.update(orjson.dumps([str(column) for column in df.columns]))
+        try:
+            digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        except TypeError:
+            # Cells holding unhashable values such as lists or dicts
+            digest.update(df.to_json(orient="split", default_handler=str).encode())
+        return digest.hexdigest()
+
+    async def _run_chunk(
+        self,
+        model: Runnable,
+        conversations: list[list[dict[str, str]]],
+        request_bucket: AsyncTokenBucket | None,
+        token_bucket: AsyncTokenBucket | None,
+    ) -> list[Any]:
+        """Send a chunk of conversations to the model within the rate limits, retrying when it is rate limited."""
+        estimated_tokens = sum(len(message["content"]) for messages in conversations for message in messages)
+        estimated_tokens //= CHARS_PER_TOKEN
+        attempt = 0
+        while True:
+            if request_bucket is not None:
+                await request_bucket.acquire(len(conversations))
+            if token_bucket is not None:
+                await token_bucket.acquire(estimated_tokens)
+            try:
+                responses = await model.abatch(conversations)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                for bucket in (request_bucket, token_bucket):
+                    if bucket is not None:
+                        bucket.slow_down()
+                delay = backoff_delay(attempt, e)
+                attempt += 1
+                await logger.awarning(f"Rate limited by the model provider, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                continue
+            for bucket in (request_bucket, token_bucket):
+                if bucket is not None:
+                    bucket.speed_up()
+            return responses
+
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are sent to the model in chunks of ``chunk_size``, within the request and token budgets.
+        The rows of completed chunks are kept in the shared component cache under a hash of the
+        inputs, so running the component again with the same inputs resumes after the last
+        completed chunk.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - All original columns
@@ -128,6 +227,7 @@ class BatchRunComponent(Component):
         system_msg = self.system_message or ""
         df: DataFrame = self.df
         col_name = self.column_name or ""
+        chunk_size = max(self.chunk_size or 0, 1)
 
         # Validate inputs first
         if not isinstance(df, DataFrame):
@@ -139,24 +239,18 @@ class BatchRunComponent(Component):
             raise ValueError(msg)
 
         try:
-            # Determine text input for each row
-            if col_name:
-                user_texts = df[col_name].astype(str).tolist()
-            else:
-                user_texts = [
-                    self._format_row_as_toml(cast("dict[str, Any]", row)) for row in df.to_dict(orient="records")
-                ]
-
-            total_rows = len(user_texts)
+            total_rows = len(df)
             await logger.ainfo(f"Processing {total_rows} rows with batch run")
 
-            # Prepare the batch of conversations
-            conversations = [
-                [{"role": "system", "content": system_msg}, {"role": "user", "content": text}]
-                if system_msg
-                else [{"role": "user", "content": text}]
-                for text in user_texts
-            ]
+            cache = self._shared_component_cache
+            checkpoint_key = f"batch_run:{self._input_hash(df, model, system_msg, col_name, chunk_size)}"
+            checkpoint = cache.get(checkpoint_key) if cache is not None else None
+            # Copied, so that two runs of the same inputs never append to the same list
+            rows: list[dict[str, Any]] = (
+                [] if checkpoint is None or isinstance(checkpoint, CacheMiss) else list(checkpoint["rows"])
+            )
+            if rows:
+                self.log(f"Resuming from row {len(rows)}/{total_rows}", name="progress")
 
             # Configure the model with project info and callbacks
             model = model.with_config(
@@ -166,34 +260,35 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
+            request_bucket = AsyncTokenBucket(self.requests_per_minute) if self.requests_per_minute > 0 else None
+            token_bucket = AsyncTokenBucket(self.tokens_per_minute) if self.tokens_per_minute > 0 else None
+
+            for start in range(len(rows), total_rows, chunk_size):
+                chunk = df.iloc[start : start + chunk_size]
+                conversations = [
+                    [{"role": "system", "content": system_msg}, {"role": "user", "content": text}]
+                    if system_msg
+                    else [{"role": "user", "content": text}]
+                    for text in self._format_user_texts(chunk, col_name)
+                ]
+                responses = await self._run_chunk(model, conversations, request_bucket, token_bucket)
+
+                for idx, (original_row, response) in enumerate(
+                    zip(chunk.to_dict(orient="records"), responses, strict=False), start=start
+                ):
+                    response_text = response.content if hasattr(response, "content") else str(response)
+                    row = self._create_base_row(
+                        cast("dict[str, Any]", original_row), model_response=response_text, batch_index=idx
+                    )
+                    self._add_metadata(row, success=True, system_msg=system_msg)
+                    rows.append(row)
 
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
-
-            # Build the final data with enhanced metadata
-            rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
-                row = self._create_base_row(
-                    cast("dict[str, Any]", original_row), model_response=response_text, batch_index=idx
-                )
-                self._add_metadata(row, success=True, system_msg=system_msg)
-                rows.append(row)
-
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    await logger.ainfo(f"Processed {idx + 1}/{total_rows} rows")
+                if cache is not None:
+                    cache.set(checkpoint_key, {"rows": rows})
+                self.log(f"Processed {len(rows)}/{total_rows} rows", name="progress")
 
+            if cache is not None:
+                cache.delete(checkpoint_key)
             await logger.ainfo("Batch processing completed successfully")
             return DataFrame(rows)
 
@@ -5,6 +5,7 @@ from lfx.io import BoolInput, DropdownInput, MessageTextInput, Output, SecretStr
 from lfx.log.logger import logger
 from lfx.schema import Data
 from lfx.schema.dataframe import DataFrame
+from lfx.utils.request_utils import borrow_http_client
 
 
 class TavilyExtractComponent(Component):
@@ -48,10 +49,10 @@ class TavilyExtractComponent(Component):
         Output(display_name="DataFrame", name="dataframe", method="fetch_content"),
     ]
 
-    def run_model(self) -> DataFrame:
-        return self.fetch_content_dataframe()
+    async def run_model(self) -> DataFrame:
+        return await self.fetch_content_dataframe()
 
-    def fetch_content(self) -> list[Data]:
+    async def fetch_content(self) -> list[Data]:
         """Fetches and processes extracted content into a list of Data objects."""
         try:
             # Split URLs by comma and clean them
@@ -73,9 +74,9 @@ class TavilyExtractComponent(Component):
                 "include_images": self.include_images,
             }
 
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
+            async with borrow_http_client() as client:
+                response = await client.post(url, json=payload, headers=headers, timeout=90.0)
+            response.raise_for_status()
 
         except httpx.TimeoutException as exc:
             error_message = f"Request timed out (90s): {exc}"
@@ -112,6 +113,6 @@ class TavilyExtractComponent(Component):
             self.status = data_results
             return data_results
 
-    def fetch_content_dataframe(self) -> DataFrame:
-        data = self.fetch_content()
+    async def fetch_content_dataframe(self) -> DataFrame:
+        data = await self.fetch_content()
         return DataFrame(data)
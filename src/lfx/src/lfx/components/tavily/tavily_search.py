@@ -6,6 +6,7 @@ from lfx.log.logger import logger
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.template.field.base import Output
+from lfx.utils.request_utils import borrow_http_client
 
 
 class TavilySearchComponent(Component):
@@ -111,7 +112,7 @@ class TavilySearchComponent(Component):
         Output(display_name="DataFrame", name="dataframe", method="fetch_content_dataframe"),
     ]
 
-    def fetch_content(self) -> list[Data]:
+    async def fetch_content(self) -> list[Data]:
         try:
             # Only process domains if they're provided
             include_domains = None
@@ -160,8 +161,8 @@ class TavilySearchComponent(Component):
                 payload["time_range"] = self.time_range
 
             # Add timeout handling
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(url, json=payload, headers=headers)
+            async with borrow_http_client() as client:
+                response = await client.post(url, json=payload, headers=headers, timeout=90.0)
 
             response.raise_for_status()
             search_results = response.json()
@@ -207,6 +208,6 @@ class TavilySearchComponent(Component):
             self.status = data_results
             return data_results
 
-    def fetch_content_dataframe(self) -> DataFrame:
-        data = self.fetch_content()
+    async def fetch_content_dataframe(self) -> DataFrame:
+        data = await self.fetch_content()
         return DataFrame(data)
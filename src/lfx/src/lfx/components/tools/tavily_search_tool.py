@@ -10,6 +10,8 @@ from lfx.field_typing import Tool
 from lfx.inputs.inputs import BoolInput, DropdownInput, IntInput, MessageTextInput, SecretStrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
+from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.request_utils import borrow_http_client
 
 # Add at the top with other constants
 MAX_CHUNKS_PER_SOURCE = 3
@@ -175,7 +177,7 @@ Note: Check 'Advanced' for all options.
         ),
     ]
 
-    def run_model(self) -> list[Data]:
+    async def run_model(self) -> list[Data]:
         # Convert string values to enum instances with validation
         try:
             search_depth_enum = (
@@ -221,7 +223,7 @@ Note: Check 'Advanced' for all options.
         if self.exclude_domains:
             exclude_domains = [domain.strip() for domain in self.exclude_domains.split(",") if domain.strip()]
 
-        return self._tavily_search(
+        return await self._atavily_search(
             self.query,
             search_depth=search_depth_enum,
             topic=topic_enum,
@@ -241,10 +243,14 @@ Note: Check 'Advanced' for all options.
             name="tavily_search",
             description="Perform a web search using the Tavily API.",
             func=self._tavily_search,
+            coroutine=self._atavily_search,
             args_schema=TavilySearchSchema,
         )
 
-    def _tavily_search(
+    def _tavily_search(self, query: str, **kwargs) -> list[Data]:
+        return run_until_complete(self._atavily_search(query, **kwargs))
+
+    async def _atavily_search(
         self,
         query: str,
         *,
@@ -300,8 +306,8 @@ Note: Check 'Advanced' for all options.
                 "time_range": time_range.value if time_range else None,
             }
 
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(url, json=payload, headers=headers)
+            async with borrow_http_client() as client:
+                response = await client.post(url, json=payload, headers=headers, timeout=90.0)
 
             response.raise_for_status()
             search_results = response.json()
@@ -479,6 +479,29 @@ class CustomComponent(BaseComponent):
             raise TypeError(msg)
         return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
+    async def prefetch_variables(self, names: list[str], session) -> None:
+        """Loads the variables with the specified names for the current user at once.
+
+        The variable service caches them, so that the ``get_variable`` calls that follow do not
+        query the database one by one. Does nothing when the user id is not set or the variable
+        service cannot load variables in batches; ``get_variable`` reports those errors.
+        """
+        if not self.user_id or not isinstance(self.user_id, str | uuid.UUID):
+            return
+        if hasattr(self, "graph") and self.graph and hasattr(self.graph, "context"):
+            context = self.graph.context
+            if context and "request_variables" in context:
+                names = [name for name in names if name not in context["request_variables"]]
+
+        get_variables = getattr(get_variable_service(), "get_variables", None)
+        if not names or get_variables is None:
+            return
+        try:
+            user_id = uuid.UUID(self.user_id) if isinstance(self.user_id, str) else self.user_id
+        except ValueError:
+            return
+        await get_variables(user_id=user_id, names=names, session=session)
+
     async def list_key_names(self):
         """Lists the names of the variables for the current user.
 
@@ -541,6 +564,7 @@ class CustomComponent(BaseComponent):
             tweaks=tweaks,
             user_id=str(self.user_id),
             run_id=self.graph.run_id,
+            cache_scope=self.graph.run_id,
         )
 
     def list_flows(self) -> list[Data]:
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
 from lfx.custom import validate
@@ -5,8 +8,30 @@ from lfx.custom import validate
 if TYPE_CHECKING:
     from lfx.custom.custom_component.custom_component import CustomComponent
 
+_component_classes: ContextVar[dict[str, type] | None] = ContextVar("component_classes", default=None)
+
+
+@contextmanager
+def reuse_component_classes(component_classes: dict[str, type]) -> Iterator[dict[str, type]]:
+    """Reuse the classes in ``component_classes`` instead of evaluating the same code again.
+
+    Classes evaluated inside the block are added to ``component_classes``, so a graph that is built
+    repeatedly from the same payload only compiles its components once.
+    """
+    token = _component_classes.set(component_classes)
+    try:
+        yield component_classes
+    finally:
+        _component_classes.reset(token)
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
     """Evaluate custom component code."""
+    component_classes = _component_classes.get()
+    if component_classes is not None and (cached_class := component_classes.get(code)) is not None:
+        return cached_class
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    class_object = validate.create_class(code, class_name)
+    if component_classes is not None:
+        component_classes[code] = class_object
+    return class_object
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, cast
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
+from lfx.graph.graph.execution_plan import ExecutionPlanCache, execution_plan_cache
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from lfx.graph.graph.state_model import create_state_model_from_graph
@@ -2134,23 +2135,42 @@ class Graph:
         stop_component_id: str | None = None,
         start_component_id: str | None = None,
     ) -> list[str]:
-        """Sorts the vertices in the graph."""
+        """Sorts the vertices in the graph.
+
+        The layers are cached under a hash of the graph topology and the start and stop
+        components, so sorting the same flow again skips the sort.
+        """
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
+        vertices_ids = self.get_vertex_ids()
+        plan_key = ExecutionPlanCache.make_key(
+            vertices_ids,
+            self.in_degree_map,
+            self.successor_map,
+            self.predecessor_map,
+            self.cycle_vertices,
             is_cyclic=self.is_cyclic,
+            start_component_id=start_component_id,
+            stop_component_id=stop_component_id,
         )
+        plan = execution_plan_cache.get(plan_key)
+        if plan is None:
+            first_layer, remaining_layers = get_sorted_vertices(
+                vertices_ids=vertices_ids,
+                cycle_vertices=self.cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            )
+            execution_plan_cache.set(plan_key, first_layer, remaining_layers)
+        else:
+            first_layer, remaining_layers = plan
 
         self.increment_run_count()
         self._sorted_vertices_layers = [first_layer, *remaining_layers]
@@ -2283,13 +2303,3 @@ class Graph:
             predecessor_map[edge.target_id].append(edge.source_id)
             successor_map[edge.source_id].append(edge.target_id)
         return predecessor_map, successor_map
-
-    def __to_dict(self) -> dict[str, dict[str, list[str]]]:
-        """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
@@ -0,0 +1,96 @@
+"""Cache of the execution plans computed by ``Graph.sort_vertices``.
+
+Sorting a graph into layers walks its vertices several times, and the same flow is usually sorted
+again on every run. The layers only depend on the topology of the graph and on the start and stop
+components, so they are cached under a hash of those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+ExecutionPlan = tuple[list[str], list[list[str]]]
+
+
+class ExecutionPlanCache:
+    """LRU cache of the first layer and remaining layers of sorted graphs.
+
+    Args:
+        max_size: Maximum number of plans kept.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self._plans: OrderedDict[str, tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        vertices_ids: Iterable[str],
+        in_degree_map: Mapping[str, int],
+        successor_map: Mapping[str, list[str]],
+        predecessor_map: Mapping[str, list[str]],
+        cycle_vertices: Iterable[str],
+        *,
+        is_cyclic: bool,
+        start_component_id: str | None = None,
+        stop_component_id: str | None = None,
+    ) -> str:
+        """Return a structural hash of everything the layers of a graph are computed from.
+
+        The order of successors and predecessors is kept, since it decides the order of the
+        vertices within a layer.
+        """
+        payload = orjson.dumps(
+            {
+                "vertices": sorted(vertices_ids),
+                "in_degree": in_degree_map,
+                "successors": {vertex_id: ids for vertex_id, ids in successor_map.items() if ids},
+                "predecessors": {vertex_id: ids for vertex_id, ids in predecessor_map.items() if ids},
+                "cycle_vertices": sorted(cycle_vertices),
+                "is_cyclic": is_cyclic,
+                "start": start_component_id,
+                "stop": stop_component_id,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=list,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> ExecutionPlan | None:
+        """Return a copy of the plan stored under ``key``, or None."""
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                return None
+            self._plans.move_to_end(key)
+        first_layer, remaining_layers = plan
+        return list(first_layer), [list(layer) for layer in remaining_layers]
+
+    def set(self, key: str, first_layer: list[str], remaining_layers: list[list[str]]) -> None:
+        """Store a plan under ``key``. The layers are copied, so the caller can keep mutating them."""
+        plan = (tuple(first_layer), tuple(tuple(layer) for layer in remaining_layers))
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every plan."""
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+execution_plan_cache = ExecutionPlanCache()
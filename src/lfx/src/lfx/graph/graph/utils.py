@@ -1,6 +1,6 @@
 import copy
-from collections import defaultdict, deque
-from collections.abc import Callable
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import networkx as nx
@@ -516,6 +516,18 @@ def layered_topological_sort(
             # or (is_input_vertex and is_input_vertex(vertex_id))
         )
 
+    # Number of times each vertex is waiting in the queue, so that membership checks are O(1)
+    queued = Counter(queue)
+
+    def enqueue(vertex_id: str) -> None:
+        queue.append(vertex_id)
+        queued[vertex_id] += 1
+
+    def dequeue() -> str:
+        vertex_id = queue.popleft()
+        queued[vertex_id] -= 1
+        return vertex_id
+
     layers: list[list[str]] = []
     visited = set()
     cycle_counts = dict.fromkeys(vertices_ids, 0)
@@ -527,7 +539,7 @@ def layered_topological_sort(
         first_layer_vertices = set()
         layer_size = len(queue)
         for _ in range(layer_size):
-            vertex_id = queue.popleft()
+            vertex_id = dequeue()
             if vertex_id not in first_layer_vertices:
                 first_layer_vertices.add(vertex_id)
                 visited.add(vertex_id)
@@ -544,18 +556,18 @@ def layered_topological_sort(
 
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0:
-                    queue.append(neighbor)
+                    enqueue(neighbor)
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
                         if (
-                            predecessor not in queue
+                            not queued[predecessor]
                             and predecessor not in first_layer_vertices
                             and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
                         ):
-                            queue.append(predecessor)
+                            enqueue(predecessor)
 
         current_layer += 1  # Next layer
 
@@ -564,7 +576,7 @@ def layered_topological_sort(
         layers.append([])  # Start a new layer
         layer_size = len(queue)
         for _ in range(layer_size):
-            vertex_id = queue.popleft()
+            vertex_id = dequeue()
             if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
                 if vertex_id not in visited:
                     visited.add(vertex_id)
@@ -581,7 +593,7 @@ def layered_topological_sort(
 
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0 and neighbor not in visited:
-                    queue.append(neighbor)
+                    enqueue(neighbor)
                     # # If this is a cycle vertex, reset its in_degree to allow it to appear again
                     # if neighbor in cycle_vertices and neighbor in visited:
                     #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
@@ -590,11 +602,11 @@ def layered_topological_sort(
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
-                        if predecessor not in queue and (
+                        if not queued[predecessor] and (
                             predecessor not in visited
                             or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
                         ):
-                            queue.append(predecessor)
+                            enqueue(predecessor)
 
         current_layer += 1  # Next layer
 
@@ -863,17 +875,13 @@ def get_sorted_vertices(
             graph_dict=graph_dict,
         )
         # Then get all vertices that can reach any reachable vertex
-        connected_vertices = set()
-        for vertex in reachable_vertices:
-            connected_vertices.update(
-                filter_vertices_up_to_vertex(
-                    vertices_ids,
-                    vertex,
-                    get_vertex_predecessors=get_vertex_predecessors,
-                    get_vertex_successors=get_vertex_successors,
-                    graph_dict=graph_dict,
-                )
-            )
+        connected_vertices = filter_vertices_up_to_vertices(
+            vertices_ids,
+            reachable_vertices,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
         vertices_ids = list(connected_vertices)
 
     # Get the layers
@@ -928,13 +936,41 @@ def filter_vertices_up_to_vertex(
         get_vertex_predecessors: Function to get predecessors of a vertex
         get_vertex_successors: Function to get successors of a vertex
         graph_dict: Dictionary containing graph information
-        parent_node_map: Map of vertex IDs to their parent node IDs
 
     Returns:
         Set of vertex IDs that are predecessors of the given vertex
     """
+    return filter_vertices_up_to_vertices(
+        vertices_ids,
+        [vertex_id],
+        get_vertex_predecessors=get_vertex_predecessors,
+        get_vertex_successors=get_vertex_successors,
+        graph_dict=graph_dict,
+    )
+
+
+def filter_vertices_up_to_vertices(
+    vertices_ids: list[str],
+    target_ids: Iterable[str],
+    get_vertex_predecessors: Callable[[str], list[str]] | None = None,
+    get_vertex_successors: Callable[[str], list[str]] | None = None,
+    graph_dict: dict[str, Any] | None = None,
+) -> set[str]:
+    """Filter vertices up to any of the given vertices, visiting each vertex once.
+
+    Args:
+        vertices_ids: List of vertex IDs to filter
+        target_ids: IDs of the vertices to filter up to
+        get_vertex_predecessors: Function to get predecessors of a vertex
+        get_vertex_successors: Function to get successors of a vertex
+        graph_dict: Dictionary containing graph information
+
+    Returns:
+        Set of vertex IDs that are predecessors of any of the given vertices, including them
+    """
     vertices_set = set(vertices_ids)
-    if vertex_id not in vertices_set:
+    targets = [target_id for target_id in target_ids if target_id in vertices_set]
+    if not targets:
         return set()
 
     # Build predecessor map if not provided
@@ -946,17 +982,13 @@ def filter_vertices_up_to_vertex(
         def get_vertex_predecessors(v):
             return graph_dict[v]["predecessors"]
 
-    # Build successor map if not provided
-    if get_vertex_successors is None:
-        if graph_dict is None:
-            return set()
-
-        def get_vertex_successors(v):
-            return graph_dict[v]["successors"]
+    # Without successors there is nothing to filter against
+    if get_vertex_successors is None and graph_dict is None:
+        return set()
 
-    # Start with the target vertex
-    filtered_vertices = {vertex_id}
-    queue = deque([vertex_id])
+    # Start with the target vertices
+    filtered_vertices = set(targets)
+    queue = deque(targets)
 
     # Process vertices in breadth-first order
     while queue:
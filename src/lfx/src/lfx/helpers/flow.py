@@ -90,6 +90,7 @@ async def load_flow(
     flow_id: str | None = None,
     flow_name: str | None = None,
     tweaks: dict | None = None,  # noqa: ARG001
+    cache_scope: str | None = None,  # noqa: ARG001
 ) -> Graph:
     """Load a flow by ID or name.
 
@@ -101,6 +102,8 @@ async def load_flow(
         flow_id: The flow ID to load.
         flow_name: The flow name to load.
         tweaks: Optional tweaks to apply to the flow.
+        cache_scope: Optional key, such as the run ID of the parent flow, under which loads reuse
+            the prepared flow.
 
     Returns:
         The loaded flow graph.
@@ -125,6 +128,7 @@ async def run_flow(
     run_id: str | None = None,
     session_id: str | None = None,
     graph: Graph | None = None,
+    cache_scope: str | None = None,  # noqa: ARG001
 ) -> list[RunOutputs]:
     """Run a flow with given inputs.
 
@@ -138,6 +142,7 @@ async def run_flow(
         run_id: Optional run ID.
         session_id: Optional session ID.
         graph: Optional pre-loaded graph.
+        cache_scope: Optional key under which loading the flow reuses the prepared flow.
 
     Returns:
         List of run outputs.
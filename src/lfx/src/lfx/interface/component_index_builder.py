@@ -0,0 +1,257 @@
+"""Incremental, process-parallel builder for the built-in component index.
+
+Building templates for ``lfx.components`` means importing every module and calling
+``create_component_template`` for every class, which is GIL-bound work that threads barely
+overlap. This module shards the modules across a process pool and keeps a build cache with a
+content hash per module, covering the component modules it imports, so that on the next start
+only modules whose source or imported components changed are built again. It is used in dev
+mode (``LFX_DEV``) and when no prebuilt index is available.
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from lfx.log.logger import logger
+from lfx.utils.helpers import write_bytes_atomic
+
+# Below this number of modules the process pool startup costs more than it saves
+PROCESS_POOL_MIN_MODULES = 16
+BUILD_CACHE_FILENAME = "component_index_build.json"
+COMPONENTS_PACKAGE = "lfx.components"
+
+ModuleResult = tuple[str, dict] | None
+
+
+def _get_build_cache_path() -> Path:
+    from lfx.interface.components import _get_cache_path
+
+    return _get_cache_path().parent / BUILD_CACHE_FILENAME
+
+
+def get_module_path(module_finder: Any, modname: str, *, is_package: bool) -> Path | None:
+    """Return the source file of a module found by ``pkgutil.walk_packages`` without importing it."""
+    finder_path = getattr(module_finder, "path", None)
+    if not finder_path:
+        return None
+    name = modname.rsplit(".", 1)[-1]
+    return Path(finder_path) / name / "__init__.py" if is_package else Path(finder_path) / f"{name}.py"
+
+
+def _resolve_component_module(modname: str, module_paths: dict[str, Path | None]) -> Path | None:
+    """Return the source file of a module of ``lfx.components``, or None if ``modname`` is not one."""
+    if modname in module_paths:
+        return module_paths[modname]
+    if not modname.startswith(f"{COMPONENTS_PACKAGE}."):
+        return None
+    import lfx.components
+
+    base = Path(lfx.components.__file__).parent.joinpath(*modname.split(".")[2:])
+    for candidate in (base.parent / f"{base.name}.py", base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_component_modules(modname: str, path: Path, source: bytes) -> set[str]:
+    """Return the names that ``source`` imports from ``lfx.components``, including through relative imports.
+
+    Names imported with ``from x import y`` are returned both as ``x`` and ``x.y``, since ``y`` may be a module.
+    """
+    # Most components import nothing from the package, skip parsing them
+    if COMPONENTS_PACKAGE.encode() not in source and b"from ." not in source:
+        return set()
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return set()
+    package = modname if path.name == "__init__.py" else modname.rpartition(".")[0]
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package.rsplit(".", node.level - 1)[0]
+                module = f"{base}.{node.module}" if node.module else base
+            else:
+                module = node.module or ""
+            names.add(module)
+            names.update(f"{module}.{alias.name}" for alias in node.names)
+    # Importing a module also runs the __init__ of every package above it
+    modules = set()
+    for name in names:
+        parts = name.split(".")
+        modules.update(".".join(parts[:i]) for i in range(3, len(parts) + 1))
+    return {name for name in modules if name.startswith(f"{COMPONENTS_PACKAGE}.")}
+
+
+def hash_module_files(module_paths: dict[str, Path | None]) -> dict[str, str | None]:
+    """Hash the source of each module together with the component modules it imports.
+
+    Components that build on other components (e.g. an agent subclassing ``AgentComponent``)
+    change when the module they import changes, so the hash of every module of
+    ``lfx.components`` a module imports, directly or not, is folded into its own.
+    Modules without a readable source get ``None``.
+    """
+    file_hashes: dict[str, str | None] = {}
+    imports: dict[str, set[str]] = {}
+    pending = list(module_paths)
+    while pending:
+        modname = pending.pop()
+        if modname in file_hashes:
+            continue
+        path = _resolve_component_module(modname, module_paths)
+        try:
+            source = path.read_bytes() if path else None
+        except OSError:
+            source = None
+        file_hashes[modname] = hashlib.sha256(source).hexdigest() if source is not None else None
+        imports[modname] = set()
+        if source is not None:
+            imported = _imported_component_modules(modname, path, source)
+            imports[modname] = {name for name in imported if _resolve_component_module(name, module_paths)}
+            pending.extend(imports[modname])
+
+    hashes: dict[str, str | None] = {}
+    for modname in module_paths:
+        if file_hashes[modname] is None:
+            hashes[modname] = None
+            continue
+        dependencies: set[str] = set()
+        stack = list(imports[modname])
+        while stack:
+            dependency = stack.pop()
+            if dependency in dependencies or dependency == modname:
+                continue
+            dependencies.add(dependency)
+            stack.extend(imports[dependency])
+        digest = hashlib.sha256(file_hashes[modname].encode())
+        for dependency in sorted(dependencies):
+            digest.update(f"{dependency}:{file_hashes[dependency]}".encode())
+        hashes[modname] = digest.hexdigest()
+    return hashes
+
+
+def get_dependencies_fingerprint() -> str:
+    """Fingerprint the lfx sources that component templates depend on.
+
+    Templates are also shaped by the base classes, inputs and template code outside
+    ``lfx.components``; any change there invalidates every cached module.
+    """
+    import lfx
+
+    package_dir = Path(lfx.__file__).parent
+    components_dir = package_dir / "components"
+    digest = hashlib.sha256(f"{sys.version_info[:2]}".encode())
+    for path in sorted(package_dir.rglob("*.py")):
+        if components_dir in path.parents:
+            continue
+        stat = path.stat()
+        digest.update(f"{path.relative_to(package_dir)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def load_build_cache(fingerprint: str) -> dict[str, dict]:
+    """Return the cached ``modname -> {"hash", "result"}`` entries if they were built against ``fingerprint``."""
+    try:
+        cache = orjson.loads(_get_build_cache_path().read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache.get("modules", {})
+
+
+def save_build_cache(fingerprint: str, modules: dict[str, dict]) -> None:
+    try:
+        payload = orjson.dumps({"fingerprint": fingerprint, "modules": modules})
+        write_bytes_atomic(_get_build_cache_path(), payload)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Failed to save component build cache: {e}")
+
+
+def _process_module_shard(modnames: list[str]) -> list[tuple[str, ModuleResult]]:
+    """Build the templates of a shard of modules. Runs inside a worker process."""
+    from lfx.interface.components import _process_single_module
+
+    return [(modname, _process_single_module(modname)) for modname in modnames]
+
+
+def _build_in_processes(module_names: list[str]) -> dict[str, ModuleResult]:
+    max_workers = min(os.cpu_count() or 1, len(module_names))
+    # Round-robin sharding spreads the heavy provider packages across workers
+    shards = [module_names[i::max_workers] for i in range(max_workers)]
+    results: dict[str, ModuleResult] = {}
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        for shard_results in executor.map(_process_module_shard, shards):
+            results.update(shard_results)
+    return results
+
+
+async def _build_in_threads(module_names: list[str]) -> dict[str, ModuleResult | BaseException]:
+    from lfx.interface import components
+
+    tasks = [asyncio.to_thread(components._process_single_module, modname) for modname in module_names]
+    module_results = await asyncio.gather(*tasks, return_exceptions=True)
+    return dict(zip(module_names, module_results, strict=True))
+
+
+async def build_modules(module_names: list[str]) -> dict[str, ModuleResult | BaseException]:
+    """Build the templates of the given modules, in a process pool when there are enough of them."""
+    if len(module_names) < PROCESS_POOL_MIN_MODULES or (os.cpu_count() or 1) == 1:
+        return await _build_in_threads(module_names)
+    try:
+        return await asyncio.to_thread(_build_in_processes, module_names)
+    except Exception as e:  # noqa: BLE001
+        await logger.awarning(f"Process-parallel component build failed, falling back to threads: {e}")
+        return await _build_in_threads(module_names)
+
+
+async def build_component_modules(module_paths: dict[str, Path | None]) -> dict[str, ModuleResult | BaseException]:
+    """Build the templates of every module, reusing cached results for modules whose source is unchanged.
+
+    Args:
+        module_paths: Mapping of module name to its source file, in the order results should be merged.
+
+    Returns:
+        Mapping of module name to ``(top_level, components)``, ``None`` or the exception raised while building it.
+    """
+    fingerprint, hashes = await asyncio.gather(
+        asyncio.to_thread(get_dependencies_fingerprint),
+        asyncio.to_thread(hash_module_files, module_paths),
+    )
+    cached_modules = await asyncio.to_thread(load_build_cache, fingerprint)
+
+    results: dict[str, ModuleResult | BaseException] = {}
+    to_build = []
+    for modname in module_paths:
+        entry = cached_modules.get(modname)
+        if hashes[modname] is not None and entry and entry.get("hash") == hashes[modname]:
+            result = entry.get("result")
+            results[modname] = tuple(result) if result else None
+        else:
+            to_build.append(modname)
+
+    await logger.adebug(f"Reusing {len(results)} cached component modules, building {len(to_build)}")
+    if to_build:
+        built = await build_modules(to_build)
+        results.update(built)
+        for modname, result in built.items():
+            # Failed imports are not cached, they may succeed once a missing dependency is installed
+            if hashes[modname] is None or result is None or isinstance(result, BaseException):
+                continue
+            cached_modules[modname] = {"hash": hashes[modname], "result": result}
+        await asyncio.to_thread(save_build_cache, fingerprint, cached_modules)
+
+    return {modname: results[modname] for modname in module_paths}
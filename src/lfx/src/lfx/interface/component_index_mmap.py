@@ -0,0 +1,101 @@
+"""Compact, memory-mapped component index shared read-only across worker processes.
+
+The JSON component index has to be fully parsed by every worker, and its SHA256 checked, which
+means every worker pays the parsing cost at startup. This module stores the same data in a
+binary file that is built once from the verified JSON index and then opened with ``mmap`` by
+every worker, so the raw bytes live in the shared OS page cache and a category is only decoded,
+with a single ``orjson.loads`` of its own slice, when a worker first needs it.
+
+File layout::
+
+    MAGIC (8 bytes) | directory length (u64, little endian) | directory (JSON) | data
+
+The directory maps every category to the ``[offset, length]`` of its JSON-encoded
+``component name -> template`` object inside the data section, and holds the number of
+components and the SHA256 of the data section, which is checked when the file is opened.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import struct
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from lfx.utils.helpers import write_bytes_atomic
+
+MAGIC = b"LFXCIDX3"
+_HEADER = struct.Struct("<8sQ")
+
+
+class MappedComponentIndex:
+    """Read-only view over a component index file opened with ``mmap``."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, directory_length = _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                msg = f"Invalid component index file: {path}"
+                raise ValueError(msg)
+            directory_end = _HEADER.size + directory_length
+            directory = orjson.loads(self._mmap[_HEADER.size : directory_end])
+            if _HEADER.size + directory_length + directory["data_length"] != len(self._mmap):
+                msg = f"Truncated component index file: {path}"
+                raise ValueError(msg)
+            if hashlib.sha256(memoryview(self._mmap)[directory_end:]).hexdigest() != directory["sha256"]:
+                msg = f"Component index file failed the integrity check: {path}"
+                raise ValueError(msg)
+        except Exception:
+            self._mmap.close()
+            raise
+        self._data_start = directory_end
+        self._view = memoryview(self._mmap)
+        self.version: str | None = directory.get("version")
+        self.num_components: int = directory["num_components"]
+        self.categories: dict[str, tuple[int, int]] = {
+            category: (offset, length) for category, offset, length in directory["categories"]
+        }
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def category(self, name: str) -> dict[str, Any]:
+        """Decode the ``component name -> template`` dict of one category."""
+        offset, length = self.categories[name]
+        start = self._data_start + offset
+        return orjson.loads(self._view[start : start + length])
+
+    def modules_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the ``category -> components`` dict, as plain dicts."""
+        return {category: self.category(category) for category in self.categories}
+
+
+def write_mapped_component_index(modules_dict: dict[str, dict[str, Any]], path: Path, version: str | None) -> None:
+    """Write ``modules_dict`` as a memory-mappable index file.
+
+    The file is moved into place atomically, so other workers never map a partial file.
+    """
+    data = bytearray()
+    categories = []
+    for category, components in modules_dict.items():
+        encoded = orjson.dumps(components)
+        categories.append([category, len(data), len(encoded)])
+        data += encoded
+    directory = orjson.dumps(
+        {
+            "version": version,
+            "categories": categories,
+            "num_components": sum(len(components) for components in modules_dict.values()),
+            "data_length": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+    )
+
+    header = _HEADER.pack(MAGIC, len(directory))
+    write_bytes_atomic(path, b"".join((header, directory, data)))
@@ -13,7 +13,10 @@ import orjson
 
 from lfx.constants import BASE_COMPONENTS_PATH
 from lfx.custom.utils import abuild_custom_components, create_component_template
+from lfx.interface.component_index_builder import build_component_modules, get_module_path
+from lfx.interface.component_index_mmap import MAGIC, MappedComponentIndex, write_mapped_component_index
 from lfx.log.logger import logger
+from lfx.utils.helpers import write_bytes_atomic
 
 if TYPE_CHECKING:
     from lfx.services.settings.service import SettingsService
@@ -31,6 +34,25 @@ class ComponentCache:
         """
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Built-in categories that have not been decoded from the shared mapped index yet
+        self.mapped_index: MappedComponentIndex | None = None
+
+    def get_category(self, name: str) -> dict[str, Any] | None:
+        """Return the components of one category, decoding it from the mapped index on first access."""
+        if self.all_types_dict is None:
+            return None
+        if name not in self.all_types_dict and self.mapped_index is not None and name in self.mapped_index.categories:
+            self.all_types_dict[name] = self.mapped_index.category(name)
+        return self.all_types_dict.get(name)
+
+    def load_all_categories(self) -> dict[str, Any] | None:
+        """Decode every category not accessed yet, so ``all_types_dict`` holds all the components."""
+        if self.mapped_index is not None and self.all_types_dict is not None:
+            builtin = {name: self.get_category(name) for name in self.mapped_index.categories}
+            # Keep the built-in categories first, and custom categories overriding them, as when merged eagerly
+            self.all_types_dict = {**builtin, **self.all_types_dict}
+            self.mapped_index = None
+        return self.all_types_dict
 
 
 # Singleton instance
@@ -83,8 +105,6 @@ def _read_component_index(custom_path: str | None = None) -> dict | None:
         The index dictionary if valid, None otherwise
     """
     try:
-        import lfx
-
         # Determine index location
         if custom_path:
             # Check if it's a URL
@@ -115,8 +135,7 @@ def _read_component_index(custom_path: str | None = None) -> dict | None:
                     return None
         else:
             # Use built-in index
-            pkg_dir = Path(inspect.getfile(lfx)).parent
-            index_path = pkg_dir / "_assets" / "component_index.json"
+            index_path = _get_builtin_index_path()
 
             if not index_path.exists():
                 return None
@@ -143,10 +162,8 @@ def _read_component_index(custom_path: str | None = None) -> dict | None:
             return None
 
         # Version check: ensure index matches installed langflow version
-        from importlib.metadata import version
-
-        installed_version = version("langflow")
-        if blob.get("version") != installed_version:
+        installed_version = _get_installed_langflow_version()
+        if installed_version is not None and blob.get("version") != installed_version:
             logger.debug(
                 f"Component index version mismatch: index={blob.get('version')}, installed={installed_version}"
             )
@@ -157,6 +174,106 @@ def _read_component_index(custom_path: str | None = None) -> dict | None:
     return blob
 
 
+def _get_installed_langflow_version() -> str | None:
+    """Get the installed langflow version, or None in an lfx-only install."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("langflow")
+    except PackageNotFoundError:
+        return None
+
+
+def _get_builtin_index_path() -> Path:
+    """Get the path of the component index shipped with the lfx package."""
+    import lfx
+
+    return Path(inspect.getfile(lfx)).parent / "_assets" / "component_index.json"
+
+
+def _modules_dict_from_entries(entries: list) -> dict:
+    """Reconstruct the ``category -> components`` dictionary from index entries."""
+    modules_dict: dict = {}
+    for top_level, components in entries:
+        if top_level not in modules_dict:
+            modules_dict[top_level] = {}
+        modules_dict[top_level].update(components)
+    return modules_dict
+
+
+def _get_mapped_index_path(source_path: Path, version: str) -> Path:
+    """Get the path of the memory-mapped copy of a JSON index.
+
+    The name encodes the source file and its size, mtime, the installed version and the file
+    format, so a changed source or an upgrade produces a new file instead of reusing a stale one.
+    """
+    stat = source_path.stat()
+    source_key = hashlib.sha256(str(source_path.resolve()).encode()).hexdigest()[:12]
+    stamp = f"{stat.st_size}:{stat.st_mtime_ns}:{version}:{MAGIC.decode()}"
+    stamp_key = hashlib.sha256(stamp.encode()).hexdigest()[:12]
+    return _get_cache_path().parent / f"component_index_{source_key}_{stamp_key}.lfxidx"
+
+
+def _load_mapped_component_index(custom_path: str | None = None) -> MappedComponentIndex | dict | None:
+    """Load a component index through its shared memory-mapped copy, building the copy if needed.
+
+    The first process to start after an install or index change reads the JSON index once,
+    checking its SHA256 like ``_read_component_index`` always does, and writes the compact copy;
+    every later process maps the file and checks the SHA256 the copy holds of its data. A copy
+    that fails that check is rebuilt. Returns None for URL sources or when the index is
+    unavailable, in which case the caller falls back to reading the JSON index directly.
+
+    Args:
+        custom_path: Optional custom path to the index file. If None, uses the built-in index.
+
+    Returns:
+        The mapped index, whose categories are decoded on access, the ``category -> components``
+        dictionary when the copy was just built from it, or None.
+    """
+    if custom_path and custom_path.startswith(("http://", "https://")):
+        return None
+    try:
+        from importlib.metadata import version
+
+        source_path = Path(custom_path) if custom_path else _get_builtin_index_path()
+        if not source_path.exists():
+            return None
+        # The copy belongs to the lfx install that built it, which also exists without langflow
+        installed_version = version("lfx")
+        mapped_path = _get_mapped_index_path(source_path, installed_version)
+        if mapped_path.exists():
+            try:
+                mapped_index = MappedComponentIndex(mapped_path)
+            except ValueError as e:
+                logger.warning(f"Rebuilding memory-mapped component index: {e}")
+            else:
+                if mapped_index.version == installed_version:
+                    return mapped_index
+        index = _read_component_index(custom_path)
+        if not index or "entries" not in index:
+            return None
+        modules_dict = _modules_dict_from_entries(index["entries"])
+        try:
+            write_mapped_component_index(modules_dict, mapped_path, installed_version)
+        except OSError as e:
+            logger.debug(f"Failed to write memory-mapped component index: {e}")
+            return modules_dict
+        _remove_stale_mapped_indexes(mapped_path)
+        logger.debug(f"Saved memory-mapped component index: {mapped_path}")
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Memory-mapped component index unavailable: {type(e).__name__}: {e}")
+        return None
+    return modules_dict
+
+
+def _remove_stale_mapped_indexes(mapped_path: Path) -> None:
+    """Remove mapped copies of the same source that were built for an older version of it."""
+    source_prefix = mapped_path.name.rsplit("_", 1)[0]
+    for stale_path in mapped_path.parent.glob(f"{source_prefix}_*.lfxidx"):
+        if stale_path != mapped_path:
+            stale_path.unlink(missing_ok=True)
+
+
 def _get_cache_path() -> Path:
     """Get the path for the cached component index in the user's cache directory."""
     from platformdirs import user_cache_dir
@@ -201,9 +318,9 @@ def _save_generated_index(modules_dict: dict) -> None:
         payload = orjson.dumps(index, option=orjson.OPT_SORT_KEYS)
         index["sha256"] = hashlib.sha256(payload).hexdigest()
 
-        # Write to cache
+        # Write to cache atomically so concurrent readers never see a partial file
         json_bytes = orjson.dumps(index, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
-        cache_path.write_bytes(json_bytes)
+        write_bytes_atomic(cache_path, json_bytes)
 
         logger.debug(f"Saved generated component index to cache: {cache_path}")
     except Exception as e:  # noqa: BLE001
@@ -213,7 +330,7 @@ def _save_generated_index(modules_dict: dict) -> None:
 async def _send_telemetry(
     telemetry_service: Any,
     index_source: str,
-    modules_dict: dict,
+    modules_dict: dict | MappedComponentIndex,
     dev_mode: bool,  # noqa: FBT001
     target_modules: list[str] | None,
     start_time_ms: int,
@@ -234,7 +351,10 @@ async def _send_telemetry(
     try:
         # Calculate metrics
         num_modules = len(modules_dict)
-        num_components = sum(len(components) for components in modules_dict.values())
+        if isinstance(modules_dict, MappedComponentIndex):
+            num_components = modules_dict.num_components
+        else:
+            num_components = sum(len(components) for components in modules_dict.values())
         load_time_ms = int(time.time() * 1000) - start_time_ms
         filtered_modules = ",".join(target_modules) if target_modules else None
 
@@ -257,7 +377,10 @@ async def _send_telemetry(
 
 
 async def import_langflow_components(
-    settings_service: Optional["SettingsService"] = None, telemetry_service: Any | None = None
+    settings_service: Optional["SettingsService"] = None,
+    telemetry_service: Any | None = None,
+    *,
+    keep_mapped_index: bool = False,
 ):
     """Asynchronously discovers and loads all built-in Langflow components with module-level parallelization.
 
@@ -272,10 +395,22 @@ async def import_langflow_components(
     Args:
         settings_service: Optional settings service to get custom index path
         telemetry_service: Optional telemetry service to log component loading metrics
+        keep_mapped_index: Return the memory-mapped index itself under "components" when the components
+            come from one, instead of decoding all of its categories
 
     Returns:
         A dictionary with a "components" key mapping top-level package names to their component templates.
     """
+    modules_dict = await _import_langflow_components(settings_service, telemetry_service)
+    if isinstance(modules_dict, MappedComponentIndex) and not keep_mapped_index:
+        modules_dict = modules_dict.modules_dict()
+    return {"components": modules_dict}
+
+
+async def _import_langflow_components(
+    settings_service: Optional["SettingsService"], telemetry_service: Any | None
+) -> dict | MappedComponentIndex:
+    """Load the built-in components, returning the memory-mapped index as is when they come from one."""
     # Start timer for telemetry
     start_time_ms = int(time.time() * 1000)
     index_source = None
@@ -292,22 +427,20 @@ async def import_langflow_components(
             custom_index_path = settings_service.settings.components_index_path
             await logger.adebug(f"Using custom component index: {custom_index_path}")
 
-        index = _read_component_index(custom_index_path)
-        if index and "entries" in index:
+        modules_dict = _load_mapped_component_index(custom_index_path)
+        if modules_dict is None:
+            index = _read_component_index(custom_index_path)
+            if index and "entries" in index:
+                modules_dict = _modules_dict_from_entries(index["entries"])
+        if modules_dict is not None:
             source = custom_index_path or "built-in index"
             await logger.adebug(f"Loading components from {source}")
             index_source = "builtin"
-            # Reconstruct modules_dict from index entries
-            modules_dict = {}
-            for top_level, components in index["entries"]:
-                if top_level not in modules_dict:
-                    modules_dict[top_level] = {}
-                modules_dict[top_level].update(components)
             await logger.adebug(f"Loaded {len(modules_dict)} component categories from index")
             await _send_telemetry(
                 telemetry_service, index_source, modules_dict, dev_mode_enabled, target_modules, start_time_ms
             )
-            return {"components": modules_dict}
+            return modules_dict
 
         # Index failed to load in production - try cache before building
         await logger.adebug("Prebuilt index not available, checking cache")
@@ -315,20 +448,19 @@ async def import_langflow_components(
             cache_path = _get_cache_path()
             if cache_path.exists():
                 await logger.adebug(f"Attempting to load from cache: {cache_path}")
-                index = _read_component_index(str(cache_path))
-                if index and "entries" in index:
+                modules_dict = _load_mapped_component_index(str(cache_path))
+                if modules_dict is None:
+                    index = _read_component_index(str(cache_path))
+                    if index and "entries" in index:
+                        modules_dict = _modules_dict_from_entries(index["entries"])
+                if modules_dict is not None:
                     await logger.adebug("Loading components from cached index")
                     index_source = "cache"
-                    modules_dict = {}
-                    for top_level, components in index["entries"]:
-                        if top_level not in modules_dict:
-                            modules_dict[top_level] = {}
-                        modules_dict[top_level].update(components)
                     await logger.adebug(f"Loaded {len(modules_dict)} component categories from cache")
                     await _send_telemetry(
                         telemetry_service, index_source, modules_dict, dev_mode_enabled, target_modules, start_time_ms
                     )
-                    return {"components": modules_dict}
+                    return modules_dict
         except Exception as e:  # noqa: BLE001
             await logger.adebug(f"Cache load failed: {e}")
 
@@ -342,11 +474,13 @@ async def import_langflow_components(
         import lfx.components as components_pkg
     except ImportError as e:
         await logger.aerror(f"Failed to import langflow.components package: {e}", exc_info=True)
-        return {"components": modules_dict}
+        return modules_dict
 
-    # Collect all module names to process
-    module_names = []
-    for _, modname, _ in pkgutil.walk_packages(components_pkg.__path__, prefix=components_pkg.__name__ + "."):
+    # Collect all module names to process, with their source files for change detection
+    module_paths: dict[str, Path | None] = {}
+    for module_finder, modname, is_package in pkgutil.walk_packages(
+        components_pkg.__path__, prefix=components_pkg.__name__ + "."
+    ):
         # Skip if the module is in the deactivated folder
         if "deactivated" in modname:
             continue
@@ -358,27 +492,24 @@ async def import_langflow_components(
             if len(parts) > MIN_MODULE_PARTS and parts[2].lower() not in target_modules:
                 continue
 
-        module_names.append(modname)
+        module_paths[modname] = get_module_path(module_finder, modname, is_package=is_package)
 
     if target_modules:
         await logger.adebug(f"LFX_DEV module filter active: loading only {target_modules}")
-        await logger.adebug(f"Found {len(module_names)} modules matching filter")
+        await logger.adebug(f"Found {len(module_paths)} modules matching filter")
 
-    if not module_names:
-        return {"components": modules_dict}
+    if not module_paths:
+        return modules_dict
 
-    # Create tasks for parallel module processing
-    tasks = [asyncio.to_thread(_process_single_module, modname) for modname in module_names]
-
-    # Wait for all modules to be processed
+    # Build changed modules in parallel (process pool for large builds), reusing cached results otherwise
     try:
-        module_results = await asyncio.gather(*tasks, return_exceptions=True)
+        module_results = await build_component_modules(module_paths)
     except Exception as e:  # noqa: BLE001
         await logger.aerror(f"Error during parallel module processing: {e}", exc_info=True)
-        return {"components": modules_dict}
+        return modules_dict
 
     # Merge results from all modules
-    for result in module_results:
+    for result in module_results.values():
         if isinstance(result, Exception):
             await logger.awarning(f"Module processing failed: {result}")
             continue
@@ -401,7 +532,7 @@ async def import_langflow_components(
         telemetry_service, index_source, modules_dict, dev_mode_enabled, target_modules, start_time_ms
     )
 
-    return {"components": modules_dict}
+    return modules_dict
 
 
 def _process_single_module(modname: str) -> tuple[str, dict] | None:
@@ -502,16 +633,15 @@ async def _determine_loading_strategy(settings_service: "SettingsService") -> di
     return component_cache.all_types_dict
 
 
-async def get_and_cache_all_types_dict(
+async def cache_component_types(
     settings_service: "SettingsService",
     telemetry_service: Any | None = None,
-):
-    """Retrieves and caches the complete dictionary of component types and templates.
+) -> None:
+    """Loads the component types into the cache without decoding the whole component index.
 
-    Supports both full and partial (lazy) loading. If the cache is empty, loads built-in Langflow
-    components and either fully loads all components or loads only their metadata, depending on the
-    lazy loading setting. Merges built-in and custom components into the cache and returns the
-    resulting dictionary.
+    When the built-in components come from the shared memory-mapped index, only the index is
+    opened here and each category is decoded by ``component_cache.get_category`` when first
+    needed, so workers that never list every component don't hold all the templates in memory.
 
     Args:
         settings_service: Settings service instance
@@ -520,20 +650,45 @@ async def get_and_cache_all_types_dict(
     if component_cache.all_types_dict is None:
         await logger.adebug("Building components cache")
 
-        langflow_components = await import_langflow_components(settings_service, telemetry_service)
+        langflow_components = await import_langflow_components(
+            settings_service, telemetry_service, keep_mapped_index=True
+        )
         custom_components_dict = await _determine_loading_strategy(settings_service)
 
         # Flatten custom dict if it has a "components" wrapper
         custom_flat = custom_components_dict.get("components", custom_components_dict) or {}
 
         # Merge built-in and custom components (no wrapper at cache level)
-        component_cache.all_types_dict = {
-            **langflow_components["components"],
-            **custom_flat,
-        }
-        component_count = sum(len(comps) for comps in component_cache.all_types_dict.values())
+        builtin_components = langflow_components["components"]
+        if isinstance(builtin_components, MappedComponentIndex):
+            component_cache.mapped_index = builtin_components
+            component_cache.all_types_dict = dict(custom_flat)
+            component_count = builtin_components.num_components
+        else:
+            component_cache.mapped_index = None
+            component_cache.all_types_dict = {**builtin_components, **custom_flat}
+            component_count = sum(len(comps) for comps in builtin_components.values())
+        component_count += sum(len(comps) for comps in custom_flat.values())
         await logger.adebug(f"Loaded {component_count} components")
-    return component_cache.all_types_dict
+
+
+async def get_and_cache_all_types_dict(
+    settings_service: "SettingsService",
+    telemetry_service: Any | None = None,
+):
+    """Retrieves and caches the complete dictionary of component types and templates.
+
+    Supports both full and partial (lazy) loading. If the cache is empty, loads built-in Langflow
+    components and either fully loads all components or loads only their metadata, depending on the
+    lazy loading setting. Merges built-in and custom components into the cache and returns the
+    resulting dictionary, with every category of the component index decoded.
+
+    Args:
+        settings_service: Settings service instance
+        telemetry_service: Optional telemetry service for tracking component loading metrics
+    """
+    await cache_component_types(settings_service, telemetry_service)
+    return component_cache.load_all_categories()
 
 
 async def aget_all_types_dict(components_paths: list[str]):
@@ -764,22 +919,18 @@ async def get_type_dict(component_type: str, settings_service: Optional["Setting
 
     # Make sure all_types_dict is loaded (at least partially)
     if component_cache.all_types_dict is None:
-        await get_and_cache_all_types_dict(settings_service)
+        await cache_component_types(settings_service)
 
-    # Check if component type exists in the cache
-    if (
-        component_cache.all_types_dict
-        and "components" in component_cache.all_types_dict
-        and component_type in component_cache.all_types_dict["components"]
-    ):
-        # If in lazy mode, ensure all components of this type are fully loaded
-        if settings_service.settings.lazy_load_components:
-            for component_name in list(component_cache.all_types_dict["components"][component_type].keys()):
-                await ensure_component_loaded(component_type, component_name, settings_service)
+    type_dict = component_cache.get_category(component_type)
+    if type_dict is None:
+        return {}
 
-        return component_cache.all_types_dict["components"][component_type]
+    # If in lazy mode, ensure all components of this type are fully loaded
+    if settings_service.settings.lazy_load_components:
+        for component_name in list(type_dict.keys()):
+            await ensure_component_loaded(component_type, component_name, settings_service)
 
-    return {}
+    return type_dict
 
 
 # TypeError: unhashable type: 'list'
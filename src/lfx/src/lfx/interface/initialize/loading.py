@@ -126,6 +126,36 @@ def load_from_env_vars(params, load_from_db_fields):
     return params
 
 
+def get_load_from_db_variable_names(params: dict, load_from_db_fields) -> list[str]:
+    """Return the names of the global variables the load_from_db fields and table columns refer to."""
+    names = []
+    for field in load_from_db_fields:
+        if field.startswith("table:"):
+            table_field_name = field[6:]
+            columns = params.get(f"{table_field_name}_load_from_db_columns") or []
+            for row in params.get(table_field_name) or []:
+                if isinstance(row, dict):
+                    names.extend(row.get(column_name) for column_name in columns)
+        else:
+            names.append(params.get(field))
+    return list(dict.fromkeys(name for name in names if name and isinstance(name, str)))
+
+
+async def prefetch_load_from_db_variables(custom_component: CustomComponent, names: list[str], session) -> None:
+    """Load the variables of a component with one query, so that resolving its fields hits the cache.
+
+    Errors are only logged, resolving each field reports them.
+    """
+    from lfx.custom.custom_component.custom_component import CustomComponent
+
+    if not names or not isinstance(custom_component, CustomComponent):
+        return
+    try:
+        await custom_component.prefetch_variables(names, session)
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Could not prefetch variables: {e}")
+
+
 async def update_table_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params: dict,
@@ -223,6 +253,9 @@ async def update_params_with_load_from_db_fields(
         if is_noop_session:
             logger.debug("Loading variables from environment variables because database is not available.")
             return load_from_env_vars(params, load_from_db_fields)
+        await prefetch_load_from_db_variables(
+            custom_component, get_load_from_db_variable_names(params, load_from_db_fields), session
+        )
         for field in load_from_db_fields:
             # Check if this is a table field (using our naming convention)
             if field.startswith("table:"):
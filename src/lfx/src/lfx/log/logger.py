@@ -1,15 +1,20 @@
 """Logging configuration for Langflow using structlog."""
 
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from collections import deque
+import traceback
+from bisect import bisect_left
+from collections.abc import Iterator
 from datetime import datetime
+from functools import partialmethod
 from pathlib import Path
-from threading import Lock, Semaphore
-from typing import Any, TypedDict
+from threading import Event, Lock, Semaphore, Thread
+from typing import Any, TextIO, TypedDict
 
 import orjson
 import structlog
@@ -29,6 +34,86 @@ LOG_LEVEL_MAP = {
     "CRITICAL": logging.CRITICAL,
 }
 
+# Map the methods of bound loggers to the level they log at
+METHOD_TO_LEVEL = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "msg": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+
+class LogRingBuffer:
+    """Fixed capacity buffer of ``(timestamp, message)`` entries, oldest first.
+
+    Once full, each new entry overwrites the oldest one. Entries are written in time order, so
+    lookups by timestamp bisect instead of scanning the buffer.
+    """
+
+    __slots__ = ("_items", "_size", "_start")
+
+    def __init__(self, capacity: int = 0):
+        self._items: list[Any] = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> tuple[int, str]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            msg = "ring buffer index out of range"
+            raise IndexError(msg)
+        return self._items[(self._start + index) % len(self._items)]
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return iter(self.slice(0, self._size))
+
+    def append(self, entry: tuple[int, str]) -> None:
+        capacity = len(self._items)
+        if capacity == 0:
+            return
+        if self._size < capacity:
+            self._items[(self._start + self._size) % capacity] = entry
+            self._size += 1
+        else:
+            self._items[self._start] = entry
+            self._start = (self._start + 1) % capacity
+
+    def slice(self, start: int, stop: int) -> list[tuple[int, str]]:
+        """Return the entries from position ``start`` up to ``stop``, oldest first."""
+        start, stop = max(start, 0), min(stop, self._size)
+        if start >= stop:
+            return []
+        capacity = len(self._items)
+        first = (self._start + start) % capacity
+        last = first + stop - start
+        if last <= capacity:
+            return self._items[first:last]
+        return self._items[first:] + self._items[: last - capacity]
+
+    def bisect(self, timestamp: int) -> int:
+        """Return the position of the first entry at or after ``timestamp``."""
+        return bisect_left(range(self._size), timestamp, key=lambda index: self[index][0])
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, keeping the most recent entries that fit."""
+        entries = self.slice(self._size - capacity, self._size) if capacity > 0 else []
+        self._items = entries + [None] * (capacity - len(entries))
+        self._start = 0
+        self._size = len(entries)
+
 
 class SizedLogBuffer:
     """A buffer for storing log messages for the log retrieval API."""
@@ -42,7 +127,7 @@ class SizedLogBuffer:
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
         """
-        self.buffer: deque = deque()
+        self.buffer = LogRingBuffer()
 
         self._max_readers = max_readers
         self._wlock = Lock()
@@ -73,9 +158,8 @@ class SizedLogBuffer:
             epoch = int(timestamp * 1000)
 
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
+            if self.buffer.capacity != self.max:
+                self.buffer.resize(self.max)
             self.buffer.append((epoch, log_entry))
 
     def __len__(self) -> int:
@@ -84,51 +168,33 @@ class SizedLogBuffer:
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries after a timestamp."""
-        rc = {}
-
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+                start = self.buffer.bisect(timestamp)
+                return dict(self.buffer.slice(start, start + lines))
         finally:
             self._rsemaphore.release()
 
-        return rc
-
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries before a timestamp."""
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+                max_index = self.buffer.bisect(timestamp)
+                if max_index < len(self.buffer):
+                    return dict(self.buffer.slice(max_index - lines, max_index))
         finally:
             self._rsemaphore.release()
+        return self.get_last_n(lines)
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         """Get the last n log entries."""
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+                size = len(self.buffer)
+                return dict(self.buffer.slice(size - last_idx if last_idx > 0 else 0, size))
         finally:
             self._rsemaphore.release()
 
@@ -190,6 +256,218 @@ def buffer_writer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -
     return event_dict
 
 
+class _StreamSink:
+    """Writes rendered records as lines to a text stream."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def write(self, _method_name: str, line: str) -> None:
+        self.stream.write(line + "\n")
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class _StdlibSink:
+    """Passes rendered records to a standard library logger, e.g. for the rotating log file."""
+
+    def __init__(self, stdlib_logger: logging.Logger) -> None:
+        self.logger = stdlib_logger
+
+    def write(self, method_name: str, line: str) -> None:
+        self.logger.log(METHOD_TO_LEVEL.get(method_name, logging.INFO), line)
+
+    def flush(self) -> None:
+        # Logging handlers flush after each record
+        return
+
+
+class LogWriter:
+    """Renders and writes log records on a single background thread.
+
+    Logging calls only put their event on a bounded queue. The writer takes records off the
+    queue in batches, renders them and writes them, flushing each output once per batch. When
+    the queue is full, callers wait up to ``put_timeout`` seconds for room before the record is
+    dropped, and the number of dropped records is reported in the log.
+    """
+
+    def __init__(self, max_queue_size: int = 10_000, batch_size: int = 512, put_timeout: float = 0.5) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.put_timeout = put_timeout
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._queue: queue.Queue = queue.Queue(max_queue_size)
+        self._thread: Thread | None = None
+        self._pid: int | None = None
+        self._start_lock = Lock()
+
+    def submit(self, sink: Any, method_name: str, renderer: Any, payload: Any) -> None:
+        """Queue a record: an event dict rendered later with ``renderer``, or an already rendered line."""
+        if self._pid != os.getpid():
+            self._start()
+        record = (sink, method_name, renderer, payload)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self._queue.put(record, timeout=self.put_timeout)
+            except queue.Full:
+                self.dropped += 1
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until the records queued so far are written. Returns False on timeout."""
+        if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+            return True
+        done = Event()
+        try:
+            self._queue.put((None, "", None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # After a fork the writer thread of the parent does not exist in the child
+            self._queue = queue.Queue(self.max_queue_size)
+            self._thread = Thread(target=self._run, name="lfx-log-writer", daemon=True)
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def _run(self) -> None:
+        records = self._queue
+        while True:
+            batch = [records.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch: list[tuple]) -> None:
+        sinks: dict[int, Any] = {}
+        for sink, method_name, renderer, payload in batch:
+            if sink is None:
+                self._flush_sinks(sinks)
+                payload.set()
+                continue
+            try:
+                if self.dropped > self._reported_dropped:
+                    dropped, self._reported_dropped = self.dropped - self._reported_dropped, self.dropped
+                    sink.write("warning", f"{dropped} log records were dropped because the log writer fell behind")
+                sink.write(method_name, payload if renderer is None else renderer(None, method_name, payload))
+                sinks[id(sink)] = sink
+            except Exception:  # noqa: BLE001
+                traceback.print_exc(file=sys.__stderr__)
+        self._flush_sinks(sinks)
+
+    @staticmethod
+    def _flush_sinks(sinks: dict[int, Any]) -> None:
+        for sink in sinks.values():
+            try:
+                sink.flush()
+            except Exception:  # noqa: BLE001
+                traceback.print_exc(file=sys.__stderr__)
+        sinks.clear()
+
+
+# background writer shared by all queued loggers
+log_writer = LogWriter()
+
+
+def flush_logs(timeout: float | None = 5.0) -> bool:
+    """Wait until the log records queued so far are written."""
+    return log_writer.flush(timeout)
+
+
+atexit.register(flush_logs)
+
+
+class QueuedLogger:
+    """structlog logger handing records to the log writer instead of writing them."""
+
+    def __init__(self, sink: Any) -> None:
+        self.sink = sink
+
+    def _submit(self, method_name: str, renderer: Any, payload: Any) -> None:
+        log_writer.submit(self.sink, method_name, renderer, payload)
+
+    debug = partialmethod(_submit, "debug")
+    info = partialmethod(_submit, "info")
+    msg = partialmethod(_submit, "info")
+    warning = partialmethod(_submit, "warning")
+    warn = partialmethod(_submit, "warning")
+    error = partialmethod(_submit, "error")
+    exception = partialmethod(_submit, "error")
+    critical = partialmethod(_submit, "critical")
+    fatal = partialmethod(_submit, "critical")
+
+
+class QueuedLoggerFactory:
+    """Creates queued loggers writing to a stream, or to standard library logging when ``stream`` is None."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream
+        self._stream_sink = _StreamSink(stream) if stream is not None else None
+
+    def __call__(self, *args: Any) -> QueuedLogger:
+        if self._stream_sink is not None:
+            return QueuedLogger(self._stream_sink)
+        return QueuedLogger(_StdlibSink(logging.getLogger(args[0] if args else None)))
+
+
+class DeferredRenderer:
+    """Last processor of a queued pipeline: hands the event to the log writer, which renders it.
+
+    Events carrying exception info are rendered right away, because the exception is only
+    available on the thread that logged it.
+    """
+
+    def __init__(self, renderer: Any) -> None:
+        self.renderer = renderer
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict[str, Any]) -> tuple[tuple, dict]:
+        if event_dict.get("exc_info"):
+            return (None, self.renderer(logger, method_name, event_dict)), {}
+        return (self.renderer, event_dict), {}
+
+
+def _direct_async_method(name: str):
+    async def method(self, event: str, *args: Any, **kw: Any) -> Any:
+        return getattr(self, name)(event, *args, **kw)
+
+    method.__name__ = f"a{name}"
+    return method
+
+
+async def _alog(self, level: int, event: str, *args: Any, **kw: Any) -> Any:
+    return self.log(level, event, *args, **kw)
+
+
+_non_blocking_wrapper_classes: dict[int, type] = {}
+
+
+def make_non_blocking_bound_logger(min_level: int) -> type:
+    """Return a filtering bound logger whose async methods log without hopping to a thread.
+
+    structlog runs enabled async calls in the default executor so that writing does not block
+    the event loop. With a queued pipeline the calling thread only queues the record, so the
+    async methods call the synchronous ones directly.
+    """
+    if min_level not in _non_blocking_wrapper_classes:
+        base = structlog.make_filtering_bound_logger(min_level)
+        methods: dict[str, Any] = {"alog": _alog, "non_blocking": True}
+        for name, level in METHOD_TO_LEVEL.items():
+            if level >= min_level:
+                methods[f"a{name}"] = _direct_async_method(name)
+        _non_blocking_wrapper_classes[min_level] = type(f"NonBlocking{base.__name__}", (base,), methods)
+    return _non_blocking_wrapper_classes[min_level]
+
+
 class LogConfig(TypedDict):
     """Configuration for logging."""
 
@@ -210,12 +488,21 @@ def configure(
     log_rotation: str | None = None,
     cache: bool | None = None,
     output_file=None,
+    log_queue: bool | None = None,
 ) -> None:
-    """Configure the logger."""
-    # Early-exit only if structlog is configured AND current min level matches the requested one.
+    """Configure the logger.
+
+    With ``log_queue`` (the default, or LANGFLOW_LOG_QUEUE), enabled records are rendered and
+    written by the background log writer, and async log calls do not hop to a thread.
+    """
+    if log_queue is None:
+        log_queue = os.getenv("LANGFLOW_LOG_QUEUE", "true").lower() == "true"
+
+    # Early-exit only if structlog is configured AND current min level and pipeline match the requested ones.
     cfg = structlog.get_config() if structlog.is_configured() else {}
     wrapper_class = cfg.get("wrapper_class")
     current_min_level = getattr(wrapper_class, "min_level", None)
+    current_queue = getattr(wrapper_class, "non_blocking", False)
     if os.getenv("LANGFLOW_LOG_LEVEL", "").upper() in VALID_LOG_LEVELS and log_level is None:
         log_level = os.getenv("LANGFLOW_LOG_LEVEL")
 
@@ -224,7 +511,7 @@ def configure(
         log_level_str = log_level
 
     requested_min_level = LOG_LEVEL_MAP.get(log_level_str.upper(), logging.ERROR)
-    if current_min_level == requested_min_level:
+    if current_min_level == requested_min_level and current_queue == log_queue:
         return
 
     if log_level is None:
@@ -256,7 +543,9 @@ def configure(
                     structlog.processors.CallsiteParameter.FILENAME,
                     structlog.processors.CallsiteParameter.FUNC_NAME,
                     structlog.processors.CallsiteParameter.LINENO,
-                ]
+                ],
+                # The async methods of the non-blocking logger are defined here
+                additional_ignores=[__name__],
             )
         )
 
@@ -270,44 +559,54 @@ def configure(
 
     # Configure output based on environment
     if log_env.lower() == "container" or log_env.lower() == "container_json":
-        processors.append(structlog.processors.JSONRenderer())
+        renderer = structlog.processors.JSONRenderer()
     elif log_env.lower() == "container_csv":
         # Include callsite fields in key order when DEV is enabled
         key_order = ["timestamp", "level", "event"]
         if DEV:
             key_order += ["filename", "func_name", "lineno"]
 
-        processors.append(structlog.processors.KeyValueRenderer(key_order=key_order, drop_missing=True))
+        renderer = structlog.processors.KeyValueRenderer(key_order=key_order, drop_missing=True)
     else:
         # Use rich console for pretty printing based on environment variable
         log_stdout_pretty = os.getenv("LANGFLOW_PRETTY_LOGS", "true").lower() == "true"
         if log_stdout_pretty:
             # If custom format is provided, use KeyValueRenderer with custom format
             if log_format:
-                processors.append(structlog.processors.KeyValueRenderer())
+                renderer = structlog.processors.KeyValueRenderer()
             else:
-                processors.append(structlog.dev.ConsoleRenderer(colors=True))
+                renderer = structlog.dev.ConsoleRenderer(colors=True)
         else:
-            processors.append(structlog.processors.JSONRenderer())
+            renderer = structlog.processors.JSONRenderer()
+
+    processors.append(DeferredRenderer(renderer) if log_queue else renderer)
 
     # Get numeric log level
     numeric_level = LOG_LEVEL_MAP.get(log_level.upper(), logging.ERROR)
 
     # Create wrapper class and attach the min level for later comparison
-    wrapper_class = structlog.make_filtering_bound_logger(numeric_level)
+    if log_queue:
+        wrapper_class = make_non_blocking_bound_logger(numeric_level)
+    else:
+        wrapper_class = structlog.make_filtering_bound_logger(numeric_level)
     wrapper_class.min_level = numeric_level
 
     # Configure structlog
     # Default to stdout for backward compatibility, unless output_file is specified
     log_output_file = output_file if output_file is not None else sys.stdout
 
+    if log_queue:
+        logger_factory: Any = QueuedLoggerFactory(None if log_file else log_output_file)
+    elif log_file:
+        logger_factory = structlog.stdlib.LoggerFactory()
+    else:
+        logger_factory = structlog.PrintLoggerFactory(file=log_output_file)
+
     structlog.configure(
         processors=processors,
         wrapper_class=wrapper_class,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=log_output_file)
-        if not log_file
-        else structlog.stdlib.LoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=cache if cache is not None else True,
     )
 
@@ -358,7 +657,9 @@ def configure(
     if disable:
         # In structlog, we can set a very high filter level to effectively disable logging
         structlog.configure(
-            wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+            wrapper_class=make_non_blocking_bound_logger(logging.CRITICAL)
+            if log_queue
+            else structlog.make_filtering_bound_logger(logging.CRITICAL),
         )
 
     logger.debug("Logger set up with log level: %s", log_level)
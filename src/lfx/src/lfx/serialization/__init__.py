@@ -1,5 +1,5 @@
 """Serialization module for lfx package."""
 
-from .serialization import serialize, serialize_or_str
+from .serialization import serialize, serialize_or_str, serialize_to_json
 
-__all__ = ["serialize", "serialize_or_str"]
+__all__ = ["serialize", "serialize_or_str", "serialize_to_json"]
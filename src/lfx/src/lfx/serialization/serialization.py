@@ -1,18 +1,34 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+import dataclasses
+import json
+from collections.abc import AsyncIterator, Callable, Generator, Iterable, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import partial
 from typing import Any, cast
 from uuid import UUID
 
 import numpy as np
+import orjson
 import pandas as pd
 from langchain_core.documents import Document
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
 
 from lfx.log.logger import logger
+from lfx.schema.dataframe import dataframe_to_records
 from lfx.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
 
+# Size counted for numbers, booleans and None against the byte budget
+_SCALAR_SIZE = 8
+# Rows converted at a time when serializing a DataFrame
+_DATAFRAME_CHUNK_ROWS = 256
+# Number of types whose handler is remembered before the cache is reset
+_MAX_CACHED_HANDLERS = 1024
+# Key added to a dictionary whose items were truncated
+TRUNCATED_KEY = "..."
+# Replaces containers nested deeper than the depth budget
+MAX_DEPTH_MARKER = "... [max depth reached]"
+
 
 def get_max_text_length() -> int:
     """Return the maximum allowed text length for serialization."""
@@ -35,50 +51,94 @@ class _UnserializableSentinel:
 UNSERIALIZABLE_SENTINEL = _UnserializableSentinel()
 
 
-def _serialize_str(obj: str, max_length: int | None, _) -> str:
-    """Truncates a string to the specified maximum length, appending an ellipsis if truncation occurs.
-
-    Parameters:
-        obj (str): The string to be truncated.
-        max_length (int | None): The maximum allowed length of the string. If None, no truncation is performed.
+class _Budget:
+    """Limits of a single serialize() call and the output size left to it.
 
-    Returns:
-        str: The original or truncated string, with an ellipsis appended if truncated.
+    The output size is estimated while walking the object, from the length of strings and keys
+    and a fixed size for other values, so that serialization stops descending once it is spent.
     """
+
+    __slots__ = ("max_depth", "max_items", "max_length", "remaining")
+
+    def __init__(
+        self,
+        max_length: int | None,
+        max_items: int | None,
+        max_bytes: int | None,
+        max_depth: int | None,
+    ) -> None:
+        self.max_length = max_length
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.remaining = max_bytes
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining is not None and self.remaining <= 0
+
+    def too_deep(self, depth: int) -> bool:
+        return self.max_depth is not None and depth >= self.max_depth
+
+    def item_limit(self, size: int) -> int:
+        return size if self.max_items is None else min(size, self.max_items)
+
+
+Handler = Callable[[Any, _Budget, int], Any]
+
+
+def _spend(budget: _Budget, size: int) -> None:
+    if budget.remaining is not None:
+        budget.remaining -= size
+
+
+def _serialize_str(obj: str, budget: _Budget, _depth: int) -> str:
+    """Truncates a string to the maximum length left in the budget, appending an ellipsis if truncation occurs."""
+    max_length = budget.max_length
+    if budget.remaining is not None:
+        max_length = max(budget.remaining, 0) if max_length is None else min(max_length, max(budget.remaining, 0))
+        budget.remaining -= min(len(obj), max_length) + 2
     if max_length is None or len(obj) <= max_length:
         return obj
     return obj[:max_length] + "..."
 
 
-def _serialize_bytes(obj: bytes, max_length: int | None, _) -> str:
-    """Decode bytes to string and truncate if max_length provided."""
-    if max_length is not None:
-        return (
-            obj[:max_length].decode("utf-8", errors="ignore") + "..."
-            if len(obj) > max_length
-            else obj.decode("utf-8", errors="ignore")
-        )
-    return obj.decode("utf-8", errors="ignore")
+def _serialize_bytes(obj: bytes, budget: _Budget, depth: int) -> str:
+    """Decode bytes to string and truncate if a maximum length applies."""
+    max_length = budget.max_length if budget.remaining is None else max(budget.remaining, 0)
+    if budget.max_length is not None:
+        max_length = min(max_length, budget.max_length)
+    # A character takes at most 4 bytes, so only the start of long values needs decoding
+    if max_length is not None and len(obj) > 4 * (max_length + 1):
+        obj = obj[: 4 * (max_length + 1)]
+    return _serialize_str(obj.decode("utf-8", errors="ignore"), budget, depth)
 
 
-def _serialize_datetime(obj: datetime, *_) -> str:
+def _serialize_scalar(obj: Any, budget: _Budget, _depth: int) -> Any:
+    """Return numbers, booleans and None as they are."""
+    _spend(budget, _SCALAR_SIZE)
+    return obj
+
+
+def _serialize_datetime(obj: datetime, budget: _Budget, _depth: int) -> str:
     """Convert datetime to UTC ISO format."""
+    _spend(budget, 34)
     return obj.replace(tzinfo=timezone.utc).isoformat()
 
 
-def _serialize_decimal(obj: Decimal, *_) -> float:
+def _serialize_decimal(obj: Decimal, budget: _Budget, depth: int) -> float:
     """Convert Decimal to float."""
-    return float(obj)
+    return _serialize_scalar(float(obj), budget, depth)
 
 
-def _serialize_uuid(obj: UUID, *_) -> str:
+def _serialize_uuid(obj: UUID, budget: _Budget, _depth: int) -> str:
     """Convert UUID to string."""
+    _spend(budget, 38)
     return str(obj)
 
 
-def _serialize_document(obj: Document, max_length: int | None, max_items: int | None) -> Any:
+def _serialize_document(obj: Document, budget: _Budget, depth: int) -> Any:
     """Serialize Langchain Document recursively."""
-    return serialize(obj.to_json(), max_length, max_items)
+    return _serialize_value(obj.to_json(), budget, depth)
 
 
 def _serialize_iterator(_: AsyncIterator | Generator | Iterator, *__) -> str:
@@ -86,42 +146,109 @@ def _serialize_iterator(_: AsyncIterator | Generator | Iterator, *__) -> str:
     return "Unconsumed Stream"
 
 
-def _serialize_pydantic(obj: BaseModel, max_length: int | None, max_items: int | None) -> Any:
-    """Handle modern Pydantic models."""
-    serialized = obj.model_dump()
-    return {k: serialize(v, max_length, max_items) for k, v in serialized.items()}
+def _serialize_items(items: Iterable[tuple[Any, Any]], size: int, budget: _Budget, depth: int) -> dict | str:
+    """Serialize the values of key-value pairs into a dictionary, stopping at the item and byte budgets."""
+    if budget.too_deep(depth):
+        return MAX_DEPTH_MARKER
+    _spend(budget, 2)
+    limit = budget.item_limit(size)
+    sized = budget.remaining is not None
+    result: dict = {}
+    for index, (key, value) in enumerate(items):
+        if index >= limit or (sized and budget.remaining <= 0):
+            result[TRUNCATED_KEY] = f"[truncated {size - index} items]"
+            break
+        if sized:
+            budget.remaining -= len(key) + 4 if isinstance(key, str) else _SCALAR_SIZE
+        result[key] = _serialize_value(value, budget, depth + 1)
+    return result
+
+
+def _serialize_dict(obj: dict, budget: _Budget, depth: int) -> dict | str:
+    """Recursively process dictionary values."""
+    return _serialize_items(obj.items(), len(obj), budget, depth)
 
 
-def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items: int | None) -> Any:
-    """Backwards-compatible handling for Pydantic v1 models."""
-    if hasattr(obj, "to_json"):
-        return serialize(obj.to_json(), max_length, max_items)
-    return serialize(obj.dict(), max_length, max_items)
+def _serialize_sequence(obj: Iterable, size: int, budget: _Budget, depth: int) -> list | str:
+    """Serialize the items of a sequence of ``size`` items, stopping at the item and byte budgets.
 
+    ``obj`` may only hold the first items of the sequence, the others are counted as truncated.
+    """
+    if budget.too_deep(depth):
+        return MAX_DEPTH_MARKER
+    _spend(budget, 2)
+    limit = budget.item_limit(size)
+    sized = budget.remaining is not None
+    result = []
+    index = 0
+    for item in obj:
+        if index >= limit or (sized and budget.remaining <= 0):
+            break
+        result.append(_serialize_value(item, budget, depth + 1))
+        index += 1
+    if index < size:
+        result.append(f"... [truncated {size - index} items]")
+    return result
+
+
+def _serialize_list_tuple(obj: list | tuple, budget: _Budget, depth: int) -> list | str:
+    """Truncate long lists and process items recursively."""
+    return _serialize_sequence(obj, len(obj), budget, depth)
 
-def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
-    """Recursively process dictionary values."""
-    return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
 
+def _serialize_pydantic_dump(obj: BaseModel, budget: _Budget, depth: int) -> Any:
+    """Handle Pydantic models whose serializers change their output, through ``model_dump()``."""
+    serialized = obj.model_dump()
+    if not isinstance(serialized, dict):
+        return _serialize_value(serialized, budget, depth)
+    return _serialize_dict(serialized, budget, depth)
 
-def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
-    """Truncate long lists and process items recursively."""
-    if max_items is not None and len(obj) > max_items:
-        truncated = list(obj)[:max_items]
-        truncated.append(f"... [truncated {len(obj) - max_items} items]")
-        obj = truncated
-    return [serialize(item, max_length, max_items) for item in obj]
 
+def _serialize_pydantic_fields(field_names: tuple[str, ...], obj: BaseModel, budget: _Budget, depth: int) -> Any:
+    """Handle modern Pydantic models by reading their fields, without dumping the whole model first."""
+    items = [(name, getattr(obj, name)) for name in field_names]
+    if obj.__pydantic_extra__:
+        items.extend(obj.__pydantic_extra__.items())
+    for index, (name, value) in enumerate(items):
+        # Pydantic turns dataclasses into dictionaries, which instances are not serialized as
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            items[index] = (name, obj.model_dump(include={name})[name])
+    return _serialize_items(items, len(items), budget, depth)
+
+
+def _pydantic_handler(cls: type[BaseModel]) -> Handler:
+    """Return the handler for a Pydantic model class.
+
+    Models are read field by field unless their serializers change what ``model_dump()`` returns.
+    """
+    if getattr(cls, "__pydantic_root_model__", False):
+        return _serialize_pydantic_dump
+    decorators = cls.__pydantic_decorators__
+    serializers = (*decorators.model_serializers.values(), *decorators.field_serializers.values())
+    if any(serializer.info.when_used not in {"json", "json-unless-none"} for serializer in serializers):
+        return _serialize_pydantic_dump
+    field_names = tuple(name for name, field in cls.model_fields.items() if not field.exclude)
+    return partial(_serialize_pydantic_fields, field_names + tuple(cls.model_computed_fields))
 
-def _serialize_primitive(obj: Any, *_) -> Any:
-    """Handle primitive types without conversion."""
-    if obj is None or isinstance(obj, int | float | bool | complex):
-        return obj
-    return UNSERIALIZABLE_SENTINEL
 
+def _serialize_pydantic_v1(obj: BaseModelV1, budget: _Budget, depth: int) -> Any:
+    """Backwards-compatible handling for Pydantic v1 models."""
+    if hasattr(obj, "to_json"):
+        return _serialize_value(obj.to_json(), budget, depth)
+    return _serialize_value(obj.dict(), budget, depth)
 
-def _serialize_instance(obj: Any, *_) -> str:
+
+def _serialize_instance(obj: Any, budget: _Budget, _depth: int) -> str:
     """Handle regular class instances by converting to string."""
+    serialized = str(obj)
+    _spend(budget, len(serialized) + 2)
+    return serialized
+
+
+def _serialize_class(obj: type, *_) -> str:
+    """Handle classes, generic aliases and other types."""
+    if issubclass(obj, BaseModel | BaseModelV1) or hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):
+        return repr(obj)
     return str(obj)
 
 
@@ -134,115 +261,130 @@ def _truncate_value(value: Any, max_length: int | None, max_items: int | None) -
     return value
 
 
-def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: int | None) -> list[dict]:
-    """Serialize pandas DataFrame to a dictionary format."""
-    if max_items is not None and len(obj) > max_items:
-        obj = obj.head(max_items)
-
-    data = obj.to_dict(orient="records")
+def _serialize_dataframe(obj: pd.DataFrame, budget: _Budget, depth: int) -> list | str:
+    """Serialize pandas DataFrame to a list of records, converting only the rows within the budget.
 
-    return serialize(data, max_length, max_items)
-
-
-def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None) -> dict:
+    Like other sequences, a truncated DataFrame ends with a marker counting the rows left out.
+    """
+    if budget.too_deep(depth):
+        return MAX_DEPTH_MARKER
+    size = len(obj)
+    limit = budget.item_limit(size)
+    records: list = []
+    # Without a byte budget, every row within the item limit is needed
+    step = _DATAFRAME_CHUNK_ROWS if budget.remaining is not None else max(limit, 1)
+    for start in range(0, limit, step):
+        chunk = obj.iloc[start : min(start + step, limit)]
+        for row in dataframe_to_records(chunk):
+            if budget.exhausted:
+                break
+            records.append(_serialize_items(row.items(), len(row), budget, depth + 1))
+        if budget.exhausted:
+            break
+    if len(records) < size:
+        records.append(f"... [truncated {size - len(records)} items]")
+    return records
+
+
+def _serialize_series(obj: pd.Series, budget: _Budget, _depth: int) -> dict:
     """Serialize pandas Series to a dictionary format."""
-    if max_items is not None and len(obj) > max_items:
-        obj = obj.head(max_items)
-    return {index: _truncate_value(value, max_length, max_items) for index, value in obj.items()}
-
-
-def _is_numpy_type(obj: Any) -> bool:
-    """Check if an object is a numpy type by checking its type's module name."""
-    return hasattr(type(obj), "__module__") and type(obj).__module__ == np.__name__
-
-
-def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | None) -> Any:
+    if budget.max_items is not None and len(obj) > budget.max_items:
+        obj = obj.head(budget.max_items)
+    result = {}
+    for index, value in obj.items():
+        if budget.exhausted:
+            break
+        truncated = _truncate_value(value, budget.max_length, budget.max_items)
+        _spend(budget, len(truncated) + 2 if isinstance(truncated, str) else _SCALAR_SIZE)
+        result[index] = truncated
+    return result
+
+
+def _serialize_numpy_type(obj: Any, budget: _Budget, depth: int) -> Any:
     """Serialize numpy types."""
     try:
-        # For single-element arrays
+        # For scalars and single-element arrays
         if obj.size == 1 and hasattr(obj, "item"):
-            return obj.item()
+            return _serialize_value(obj.item(), budget, depth)
 
         # For multi-element arrays
         if np.issubdtype(obj.dtype, np.number):
-            return obj.tolist()  # Convert to Python list
+            if budget.max_items is None and budget.remaining is None:
+                return obj.tolist()
+            # Only convert the elements that can fit
+            return _serialize_sequence(obj[: budget.item_limit(len(obj))].tolist(), len(obj), budget, depth)
         if np.issubdtype(obj.dtype, np.bool_):
             return bool(obj)
         if np.issubdtype(obj.dtype, np.complexfloating):
             return complex(cast("complex", obj))
         if np.issubdtype(obj.dtype, np.str_):
-            return _serialize_str(str(obj), max_length, max_items)
+            return _serialize_str(str(obj), budget, depth)
         if np.issubdtype(obj.dtype, np.bytes_) and hasattr(obj, "tobytes"):
-            return _serialize_bytes(obj.tobytes(), max_length, max_items)
+            return _serialize_bytes(obj.tobytes(), budget, depth)
         if np.issubdtype(obj.dtype, np.object_) and hasattr(obj, "item"):
-            return _serialize_instance(obj.item(), max_length, max_items)
+            return _serialize_instance(obj.item(), budget, depth)
     except Exception:  # noqa: BLE001
         return UNSERIALIZABLE_SENTINEL
     return UNSERIALIZABLE_SENTINEL
 
 
-def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
-    """Dispatch object to appropriate serializer."""
-    # Handle primitive types first
-    if obj is None:
-        return obj
-    primitive = _serialize_primitive(obj, max_length, max_items)
-    if primitive is not UNSERIALIZABLE_SENTINEL:
-        return primitive
-
-    match obj:
-        case str():
-            return _serialize_str(obj, max_length, max_items)
-        case bytes():
-            return _serialize_bytes(obj, max_length, max_items)
-        case datetime():
-            return _serialize_datetime(obj, max_length, max_items)
-        case Decimal():
-            return _serialize_decimal(obj, max_length, max_items)
-        case UUID():
-            return _serialize_uuid(obj, max_length, max_items)
-        case Document():
-            return _serialize_document(obj, max_length, max_items)
-        case AsyncIterator() | Generator() | Iterator():
-            return _serialize_iterator(obj, max_length, max_items)
-        case BaseModel():
-            return _serialize_pydantic(obj, max_length, max_items)
-        case BaseModelV1():
-            return _serialize_pydantic_v1(obj, max_length, max_items)
-        case dict():
-            return _serialize_dict(obj, max_length, max_items)
-        case pd.DataFrame():
-            return _serialize_dataframe(obj, max_length, max_items)
-        case pd.Series():
-            return _serialize_series(obj, max_length, max_items)
-        case list() | tuple():
-            return _serialize_list_tuple(obj, max_length, max_items)
-        case object() if _is_numpy_type(obj):
-            return _serialize_numpy_type(obj, max_length, max_items)
-        case object() if not isinstance(obj, type):  # Match any instance that's not a class
-            return _serialize_instance(obj, max_length, max_items)
-        case object() if hasattr(obj, "_name_"):  # Enum case
-            return f"{obj.__class__.__name__}.{obj._name_}"
-        case object() if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
-            return repr(obj)
-        case object() if hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):  # Type alias/generic case
-            return repr(obj)
-        case _:
-            # Handle numpy numeric types (int, float, bool, complex)
-            if hasattr(obj, "dtype"):
-                if np.issubdtype(obj.dtype, np.number) and hasattr(obj, "item"):
-                    return obj.item()
-                if np.issubdtype(obj.dtype, np.bool_):
-                    return bool(obj)
-                if np.issubdtype(obj.dtype, np.complexfloating):
-                    return complex(cast("complex", obj))
-                if np.issubdtype(obj.dtype, np.str_):
-                    return str(obj)
-                if np.issubdtype(obj.dtype, np.bytes_) and hasattr(obj, "tobytes"):
-                    return obj.tobytes().decode("utf-8", errors="ignore")
-                if np.issubdtype(obj.dtype, np.object_) and hasattr(obj, "item"):
-                    return serialize(obj.item())
-            return UNSERIALIZABLE_SENTINEL
+def _resolve_handler(cls: type) -> Handler:
+    """Choose the serializer for instances of ``cls``."""
+    if cls is type(None) or issubclass(cls, int | float | bool | complex):
+        return _serialize_scalar
+    if issubclass(cls, str):
+        return _serialize_str
+    if issubclass(cls, bytes):
+        return _serialize_bytes
+    if issubclass(cls, datetime):
+        return _serialize_datetime
+    if issubclass(cls, Decimal):
+        return _serialize_decimal
+    if issubclass(cls, UUID):
+        return _serialize_uuid
+    if issubclass(cls, Document):
+        return _serialize_document
+    if issubclass(cls, AsyncIterator | Generator | Iterator):
+        return _serialize_iterator
+    if issubclass(cls, BaseModel):
+        return _pydantic_handler(cls)
+    if issubclass(cls, BaseModelV1):
+        return _serialize_pydantic_v1
+    if issubclass(cls, dict):
+        return _serialize_dict
+    if issubclass(cls, pd.DataFrame):
+        return _serialize_dataframe
+    if issubclass(cls, pd.Series):
+        return _serialize_series
+    if issubclass(cls, list | tuple):
+        return _serialize_list_tuple
+    if cls.__module__ == np.__name__:
+        return _serialize_numpy_type
+    if issubclass(cls, type):
+        return _serialize_class
+    return _serialize_instance
+
+
+# Handler chosen for each concrete type, so that type checks run once per type
+_handlers: dict[type, Handler] = {}
+
+
+def _handler_for(cls: type) -> Handler:
+    handler = _handlers.get(cls)
+    if handler is None:
+        if len(_handlers) >= _MAX_CACHED_HANDLERS:
+            _handlers.clear()
+        handler = _handlers[cls] = _resolve_handler(cls)
+    return handler
+
+
+def _serialize_value(obj: Any, budget: _Budget, depth: int) -> Any:
+    """Serialize a nested value, keeping it as is when it cannot be serialized."""
+    try:
+        result = (_handlers.get(type(obj)) or _handler_for(type(obj)))(obj, budget, depth)
+    except Exception:  # noqa: BLE001
+        return "[Unserializable Object]"
+    return obj if result is UNSERIALIZABLE_SENTINEL else result
 
 
 def serialize(
@@ -250,51 +392,36 @@ def serialize(
     max_length: int | None = None,
     max_items: int | None = None,
     *,
+    max_bytes: int | None = None,
+    max_depth: int | None = None,
     to_str: bool = False,
 ) -> Any:
     """Unified serialization with optional truncation support.
 
-    Coordinates specialized serializers through a dispatcher pattern.
-    Maintains recursive processing for nested structures.
+    Walks the object once with the serializer cached for each type, and enforces the limits while
+    walking: nothing past a truncated collection or an exhausted budget is converted.
 
     Args:
         obj: Object to serialize
         max_length: Maximum length for string values, None for no truncation
-        max_items: Maximum items in list-like structures, None for no truncation
+        max_items: Maximum items in list-like structures and dictionaries, None for no truncation
+        max_bytes: Approximate size of the whole output in JSON, None for no limit. Once it is
+            spent, strings are truncated and collections end with a truncation marker.
+        max_depth: Maximum nesting of collections, deeper ones are replaced by a marker. None for no limit.
         to_str: If True, return a string representation of the object if serialization fails
     """
     if obj is None:
         return None
+    budget = _Budget(max_length, max_items, max_bytes, max_depth)
     try:
-        # First try type-specific serialization
-        result = _serialize_dispatcher(obj, max_length, max_items)
-        if result is not UNSERIALIZABLE_SENTINEL:  # Special check for None since it's a valid result
+        result = _handler_for(type(obj))(obj, budget, 0)
+        if result is not UNSERIALIZABLE_SENTINEL:
             return result
-
-        # Handle class-based Pydantic types and other types
-        if isinstance(obj, type):
-            if issubclass(obj, BaseModel | BaseModelV1):
-                return repr(obj)
-            return str(obj)  # Handle other class types
-
-        # Handle type aliases and generic types
-        if hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):  # Type alias or generic type check
-            try:
-                return repr(obj)
-            except Exception:  # noqa: BLE001
-                logger.debug(f"Error serializing object: {obj}", exc_info=True)
-
-        # Fallback to common serialization patterns
-        if hasattr(obj, "model_dump"):
-            return serialize(obj.model_dump(), max_length, max_items)
-        if hasattr(obj, "dict") and not isinstance(obj, type):
-            return serialize(obj.dict(), max_length, max_items)
-
         # Final fallback to string conversion only if explicitly requested
         if to_str:
             return str(obj)
-
     except Exception:  # noqa: BLE001
+        logger.debug(f"Error serializing object of type {type(obj).__name__}", exc_info=True)
         return "[Unserializable Object]"
     return obj
 
@@ -312,3 +439,28 @@ def serialize_or_str(
         max_items: Maximum items in list-like structures, None for no truncation
     """
     return serialize(obj, max_length, max_items, to_str=True)
+
+
+def serialize_to_json(
+    obj: Any,
+    max_length: int | None = None,
+    max_items: int | None = None,
+    *,
+    max_bytes: int | None = None,
+    max_depth: int | None = None,
+) -> bytes:
+    """Serialize an object with serialize() and return it as JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        max_length: Maximum length for string values, None for no truncation
+        max_items: Maximum items in list-like structures and dictionaries, None for no truncation
+        max_bytes: Approximate size of the output, None for no limit
+        max_depth: Maximum nesting of collections, None for no limit
+    """
+    serialized = serialize(obj, max_length, max_items, max_bytes=max_bytes, max_depth=max_depth, to_str=True)
+    try:
+        return orjson.dumps(serialized, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    except orjson.JSONEncodeError:
+        # e.g. integers that do not fit in 64 bits
+        return json.dumps(serialized, default=str).encode()
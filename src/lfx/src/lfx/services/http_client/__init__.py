@@ -0,0 +1,6 @@
+"""Shared HTTP client service for lfx package."""
+
+from lfx.services.http_client.factory import HTTPClientServiceFactory
+from lfx.services.http_client.service import HTTPClientService
+
+__all__ = ["HTTPClientService", "HTTPClientServiceFactory"]
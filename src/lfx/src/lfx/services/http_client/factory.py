@@ -0,0 +1,28 @@
+"""Factory for creating the shared HTTP client service."""
+
+from lfx.services.factory import ServiceFactory
+from lfx.services.http_client.service import HTTPClientService
+
+
+class HTTPClientServiceFactory(ServiceFactory):
+    """Factory for creating HTTPClientService instances."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.service_class = HTTPClientService
+
+    def create(self, **kwargs) -> HTTPClientService:  # noqa: ARG002
+        """Create an HTTPClientService configured from the settings service."""
+        from lfx.services.deps import get_settings_service
+
+        settings_service = get_settings_service()
+        if settings_service is None:
+            return HTTPClientService()
+        settings = settings_service.settings
+        return HTTPClientService(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            max_connections_per_host=settings.http_client_max_connections_per_host,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+            http2=settings.http_client_http2,
+        )
@@ -0,0 +1,147 @@
+"""Process-wide pooled HTTP client shared by web-facing components."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+from lfx.log.logger import logger
+from lfx.services.base import Service
+
+
+class _ReleasingByteStream(httpx.AsyncByteStream):
+    """Response stream that releases a per-host slot once the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._semaphore: asyncio.Semaphore | None = semaphore
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+                self._semaphore = None
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that caps the number of in-flight requests per host.
+
+    A slot is held from the moment the request is sent until its response is closed, so
+    streamed responses count against the limit for as long as they are being read.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[tuple[bytes, bytes, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._max_per_host <= 0:
+            return await self._transport.handle_async_request(request)
+        key = (request.url.raw_scheme, request.url.raw_host, request.url.port)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self._max_per_host)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # The body is already in memory, nothing is left to read from the host
+            semaphore.release()
+            return response
+        response.stream = _ReleasingByteStream(response.stream, semaphore)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HTTPClientService(Service):
+    """Hands out pooled ``httpx.AsyncClient`` instances shared across components and runs.
+
+    Connections, keep-alive and TLS sessions are reused between requests instead of being set up
+    for every component build. ``httpx`` connections are bound to the event loop that opened them,
+    so one client is kept per running event loop. Clients never persist cookies, since they are
+    shared by every flow and user of the process.
+    """
+
+    name = "http_client_service"
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_connections_per_host: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ) -> None:
+        super().__init__()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2 and _http2_available()
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+        return httpx.AsyncClient(
+            transport=HostLimitedTransport(transport, self.max_connections_per_host),
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the shared client of the running event loop.
+
+        The client is owned by the service: use it directly and do not close it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._clients[loop] = self._create_client()
+            return client
+
+    async def teardown(self) -> None:
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for loop, client in clients:
+            if loop is current_loop:
+                await client.aclose()
+            elif not loop.is_closed() and loop.is_running():
+                # Connections must be closed on the loop that opened them
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                logger.debug("Dropping HTTP client of a closed event loop")
@@ -198,6 +198,9 @@ class Settings(BaseSettings):
     """Whether to store environment variables as Global Variables in the database."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
+    variable_cache_ttl: float = 10.0
+    """Seconds each worker keeps decrypted Global Variables in memory. Updates and deletions clear the values
+    cached by the worker making them, other workers see them after at most this long. Set to 0 to disable."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
     frontend_timeout: int = 0
@@ -269,6 +272,26 @@ class Settings(BaseSettings):
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
     """The polling interval in milliseconds for synchronizing flows from the file system."""
+    subflow_graph_cache_size: int = 0
+    """The number of prepared subflows kept per worker for Run Flow and Sub Flow components.
+    Subflows are always reused within a single run; set this above 0 to also reuse them across runs."""
+    query_embedding_cache_size: int = 1024
+    """The number of search query embeddings kept in memory per worker by retrieval components."""
+    query_embedding_cache_dir: str | None = None
+    """Directory where search query embeddings are also kept, so that they are shared by the workers of a host
+    and survive restarts. Requires diskcache. Disabled when not set."""
+    git_mirror_cache_dir: str | None = None
+    """Directory where the Git component keeps mirrors of remote repositories between runs.
+    Defaults to a git_mirrors directory in the config directory."""
+    git_mirror_cache_max_size: int = 2048
+    """The maximum size in megabytes of the Git repository mirrors. The least recently used ones are deleted
+    beyond it."""
+    run_state_ttl: float = 3600.0
+    """Seconds the state service keeps the state of a run after it was last changed or read."""
+    run_state_max_runs: int = 10000
+    """The maximum number of runs whose state is kept in memory. The least recently used ones are dropped beyond it."""
+    run_state_async_observers: bool = False
+    """Notify state observers from a background thread instead of the thread that changed the state."""
     ssl_cert_file: str | None = None
     """Path to the SSL certificate file on the local system."""
     ssl_key_file: str | None = None
@@ -280,6 +303,18 @@ class Settings(BaseSettings):
     """Maximum number of items to store and display in the UI. Lists longer than this
     will be truncated when displayed in the UI. Does not affect data passed between components nor outputs."""
 
+    # Shared HTTP client used by web-facing components
+    http_client_max_connections: int = 100
+    """The maximum number of open connections of the shared HTTP client, per event loop."""
+    http_client_max_keepalive_connections: int = 20
+    """The maximum number of idle connections the shared HTTP client keeps alive."""
+    http_client_max_connections_per_host: int = 20
+    """The maximum number of concurrent requests to a single host. Set to 0 to disable the limit."""
+    http_client_keepalive_expiry: float = 30.0
+    """The number of seconds an idle connection is kept alive."""
+    http_client_http2: bool = True
+    """If set to True, the shared HTTP client negotiates HTTP/2 with servers that support it."""
+
     # MCP Server
     mcp_server_enabled: bool = True
     """If set to False, Langflow will not enable the MCP server."""
@@ -305,6 +340,16 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    job_event_log: Literal["memory", "sqlite", "redis"] = "memory"
+    """Where build events are kept. With 'memory' they are only available from the worker running the build.
+    With 'sqlite' (workers on one host) or 'redis' (any host) any worker can serve them, so multiple workers
+    can run without sticky sessions."""
+    job_event_log_path: str | None = None
+    """Path of the SQLite job event log. Defaults to job_events.db in the config directory."""
+    job_event_log_max_events: int = 10_000
+    """Number of events kept per build in the job event log."""
+    job_event_log_ttl: int = 3600
+    """Seconds the events of a build are kept in the job event log after its last event."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
@@ -1,5 +1,10 @@
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable
 from contextlib import asynccontextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 if hasattr(asyncio, "timeout"):
 
@@ -40,3 +45,43 @@ def run_until_complete(coro):
     with concurrent.futures.ThreadPoolExecutor() as executor:
         future = executor.submit(run_in_new_loop)
         return future.result()
+
+
+async def bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    max_concurrency: int,
+    key: Callable[[T], Hashable] | None = None,
+    max_per_key: int | None = None,
+) -> AsyncIterator[R]:
+    """Run ``func`` over ``items`` concurrently and yield the results in input order.
+
+    At most ``max_concurrency`` calls run at once, and at most ``max_per_key`` of them share the
+    same ``key(item)``, e.g. the host of a URL. Each result is yielded as soon as it and every
+    result before it are done. Calls that have not finished are cancelled when the iteration
+    stops early or one of them raises.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    key_semaphores: dict[Hashable, asyncio.Semaphore] = {}
+
+    async def run(item: T) -> R:
+        if key is None or not max_per_key:
+            async with semaphore:
+                return await func(item)
+        item_key = key(item)
+        key_semaphore = key_semaphores.get(item_key)
+        if key_semaphore is None:
+            key_semaphore = key_semaphores[item_key] = asyncio.Semaphore(max_per_key)
+        # Wait for the key before taking a global slot, so busy keys do not starve the others
+        async with key_semaphore, semaphore:
+            return await func(item)
+
+    tasks = [asyncio.create_task(run(item)) for item in items]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import mimetypes
-from typing import TYPE_CHECKING
+import os
+import tempfile
+from pathlib import Path
 
 from lfx.utils.constants import EXTENSION_TO_CONTENT_TYPE
 
-if TYPE_CHECKING:
-    from pathlib import Path
+# Permissions of the files written by write_bytes_atomic
+ATOMIC_WRITE_MODE = 0o644
 
 
 def get_mime_type(file_path: str | Path) -> str:
@@ -32,3 +34,23 @@ def get_mime_type(file_path: str | Path) -> str:
 
 def build_content_type_from_extension(extension: str):
     return EXTENSION_TO_CONTENT_TYPE.get(extension.lower(), "application/octet-stream")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temporary sibling file and an atomic rename.
+
+    Readers in other processes either see the previous file or the complete new one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file as 0600, make it readable by the other workers. The mode is
+        # fixed rather than derived from the umask, which can only be read by changing it for
+        # every thread of the process.
+        Path(tmp_name).chmod(ATOMIC_WRITE_MODE)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -1,4 +1,9 @@
-from lfx.services.deps import get_settings_service
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from lfx.services.deps import get_http_client_service, get_settings_service
 
 DEFAULT_USER_AGENT = "Langflow"
 
@@ -16,3 +21,17 @@ def get_user_agent():
     except (AttributeError, TypeError):
         pass
     return DEFAULT_USER_AGENT
+
+
+@asynccontextmanager
+async def borrow_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Borrow the pooled client of the HTTP client service.
+
+    Falls back to a short-lived client when the service is not available.
+    """
+    http_client_service = get_http_client_service()
+    if http_client_service is not None:
+        yield http_client_service.get_client()
+        return
+    async with httpx.AsyncClient() as client:
+        yield client
@@ -0,0 +1,97 @@
+"""Tests for the registry of language model instances."""
+
+import asyncio
+
+from lfx.base.models.model_registry import ModelInstanceRegistry
+
+
+class Factory:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> object:
+        self.calls += 1
+        return object()
+
+
+PARAMS = {"model_name": "gpt-4o-mini", "temperature": 0.1, "api_key": "sk-first"}
+
+
+def test_same_params_share_an_instance():
+    registry = ModelInstanceRegistry()
+    factory = Factory()
+
+    first = registry.get_or_create("OpenAI", dict(PARAMS), factory, secret_names=["api_key"])
+    second = registry.get_or_create("OpenAI", dict(PARAMS), factory, secret_names=["api_key"])
+
+    assert first is second
+    assert factory.calls == 1
+
+
+def test_changed_params_or_credentials_build_a_new_instance():
+    registry = ModelInstanceRegistry()
+    factory = Factory()
+    first = registry.get_or_create("OpenAI", dict(PARAMS), factory, secret_names=["api_key"])
+
+    for provider, params in [
+        ("OpenAI", {**PARAMS, "temperature": 0.5}),
+        ("OpenAI", {**PARAMS, "api_key": "sk-other"}),
+        ("Groq", dict(PARAMS)),
+    ]:
+        assert registry.get_or_create(provider, params, factory, secret_names=["api_key"]) is not first
+    assert factory.calls == 4
+
+
+def test_key_does_not_contain_credentials():
+    key = ModelInstanceRegistry.make_key("OpenAI", dict(PARAMS), ["api_key"])
+    assert "sk-first" not in key
+    assert key != ModelInstanceRegistry.make_key("OpenAI", {**PARAMS, "api_key": "sk-other"}, ["api_key"])
+
+
+def test_expired_instances_are_rebuilt():
+    registry = ModelInstanceRegistry(ttl=0)
+    factory = Factory()
+
+    first = registry.get_or_create("OpenAI", dict(PARAMS), factory)
+    assert registry.get_or_create("OpenAI", dict(PARAMS), factory) is not first
+
+
+def test_least_recently_used_instance_is_dropped():
+    registry = ModelInstanceRegistry(max_size=2)
+    factory = Factory()
+    first = registry.get_or_create("OpenAI", {"model_name": "a"}, factory)
+    registry.get_or_create("OpenAI", {"model_name": "b"}, factory)
+    # Using "a" again makes "b" the least recently used
+    registry.get_or_create("OpenAI", {"model_name": "a"}, factory)
+    registry.get_or_create("OpenAI", {"model_name": "c"}, factory)
+
+    assert len(registry) == 2
+    assert registry.get_or_create("OpenAI", {"model_name": "a"}, factory) is first
+    assert factory.calls == 3
+
+
+def test_invalidate_drops_instances_built_with_a_value():
+    registry = ModelInstanceRegistry()
+    factory = Factory()
+    first = registry.get_or_create("OpenAI", dict(PARAMS), factory, secret_names=["api_key"])
+    registry.get_or_create("OpenAI", {**PARAMS, "api_key": "sk-other"}, factory, secret_names=["api_key"])
+
+    assert registry.invalidate("sk-unknown") == 0
+    assert registry.invalidate("sk-first") == 1
+    assert len(registry) == 1
+    assert registry.get_or_create("OpenAI", dict(PARAMS), factory, secret_names=["api_key"]) is not first
+
+
+def test_instances_are_not_shared_across_event_loops():
+    registry = ModelInstanceRegistry()
+    factory = Factory()
+
+    async def get_model():
+        return registry.get_or_create("OpenAI", dict(PARAMS), factory)
+
+    async def get_twice():
+        return await get_model(), await get_model()
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+    assert asyncio.run(get_model()) is not first
@@ -0,0 +1,56 @@
+"""Tests for the language model rate limiting helpers."""
+
+import time
+
+import httpx
+import pytest
+from lfx.base.models.rate_limit import AsyncTokenBucket, backoff_delay, is_rate_limit_error, retry_after
+
+
+async def test_token_bucket_limits_rate():
+    bucket = AsyncTokenBucket(rate_per_minute=600, capacity=1)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # The first token is available at once, the next three take 0.1s each
+    assert time.monotonic() - start == pytest.approx(0.3, abs=0.1)
+
+
+async def test_token_bucket_lets_oversized_amounts_through_in_debt():
+    bucket = AsyncTokenBucket(rate_per_minute=600, capacity=1)
+    await bucket.acquire(3)
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.3, abs=0.1)
+
+
+def test_token_bucket_slows_down_and_recovers():
+    bucket = AsyncTokenBucket(rate_per_minute=60)
+    bucket.slow_down()
+    assert bucket.rate == pytest.approx(0.5)
+    for _ in range(10):
+        bucket.speed_up()
+    assert bucket.rate == pytest.approx(1)
+
+
+def test_is_rate_limit_error():
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(429, headers={"retry-after": "7"}, request=request)
+
+    class RateLimitError(Exception):
+        pass
+
+    assert is_rate_limit_error(httpx.HTTPStatusError("Too many requests", request=request, response=response))
+    assert is_rate_limit_error(RateLimitError())
+    assert not is_rate_limit_error(ValueError())
+
+
+def test_backoff_delay_uses_retry_after():
+    request = httpx.Request("GET", "https://example.com")
+    error = httpx.HTTPStatusError(
+        "Too many requests", request=request, response=httpx.Response(429, headers={"retry-after": "7"})
+    )
+    assert retry_after(error) == 7
+    assert backoff_delay(0, error) == 7
+    assert 0 <= backoff_delay(3) <= 8
+    assert backoff_delay(10, cap=5) <= 5
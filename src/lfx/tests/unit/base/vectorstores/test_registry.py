@@ -0,0 +1,106 @@
+"""Tests for the vector store registry and the query embedding cache."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from lfx.base.vectorstores.registry import CachedQueryEmbeddings, QueryEmbeddingCache, VectorStoreRegistry
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.queries.append(text)
+        return [float(len(text)), 0.0]
+
+
+def test_repeated_queries_are_embedded_once():
+    embeddings = CountingEmbeddings()
+    cached = CachedQueryEmbeddings(embeddings, model_key="fake:model", cache=QueryEmbeddingCache())
+
+    assert cached.embed_query("hello") == [5.0, 0.0]
+    assert cached.embed_query("hello") == [5.0, 0.0]
+    assert cached.embed_query("world!") == [6.0, 0.0]
+    assert embeddings.queries == ["hello", "world!"]
+    # Documents are not cached
+    assert cached.embed_documents(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+
+
+async def test_async_queries_share_the_cache():
+    embeddings = CountingEmbeddings()
+    cached = CachedQueryEmbeddings(embeddings, model_key="fake:model", cache=QueryEmbeddingCache())
+
+    assert cached.embed_query("hello") == await cached.aembed_query("hello")
+    assert embeddings.queries == ["hello"]
+
+
+def test_query_embeddings_are_kept_per_model():
+    cache = QueryEmbeddingCache(max_size=2)
+    cache.set("model-a", "query", [1.0])
+    cache.set("model-b", "query", [2.0])
+    assert cache.get("model-a", "query") == [1.0]
+
+    cache.set("model-c", "query", [3.0])
+    assert cache.get("model-b", "query") is None
+    assert cache.get("model-a", "query") == [1.0]
+    assert len(cache) == 2
+
+
+def test_query_embeddings_survive_in_the_disk_tier(tmp_path):
+    pytest.importorskip("diskcache")
+    QueryEmbeddingCache(directory=tmp_path).set("model", "query", [0.5, 0.25])
+
+    assert QueryEmbeddingCache(directory=tmp_path).get("model", "query") == [0.5, 0.25]
+
+
+def test_registry_reuses_and_invalidates_stores():
+    registry = VectorStoreRegistry(max_size=2)
+    opened = []
+
+    def factory():
+        opened.append(object())
+        return opened[-1]
+
+    key = VectorStoreRegistry.make_key("/kb/docs", "docs", {"model": "m", "api_key": "fp"})
+    assert registry.get_or_create(key, "/kb/docs", factory) is registry.get_or_create(key, "/kb/docs", factory)
+    assert len(opened) == 1
+
+    other_model = VectorStoreRegistry.make_key("/kb/docs", "docs", {"model": "n", "api_key": "fp"})
+    assert other_model != key
+    registry.get_or_create(other_model, "/kb/docs", factory)
+    assert len(opened) == 2
+
+    assert registry.invalidate("/kb/docs") == 2
+    registry.get_or_create(key, "/kb/docs", factory)
+    assert len(opened) == 3
+
+
+def test_least_recently_used_store_is_dropped():
+    registry = VectorStoreRegistry(max_size=1)
+    registry.get_or_create("a", "/kb/a", object)
+    registry.get_or_create("b", "/kb/b", object)
+
+    assert len(registry) == 1
+    assert registry.invalidate("/kb/a") == 0
+
+
+def test_store_is_reopened_when_its_signature_changes():
+    registry = VectorStoreRegistry()
+    opened = []
+
+    def factory():
+        opened.append(object())
+        return opened[-1]
+
+    first = registry.get_or_create("index", "/kb/index", factory, signature=(1, 100))
+    assert registry.get_or_create("index", "/kb/index", factory, signature=(1, 100)) is first
+    assert len(opened) == 1
+
+    second = registry.get_or_create("index", "/kb/index", factory, signature=(2, 120))
+    assert second is not first
+    assert registry.get_or_create("index", "/kb/index", factory, signature=(2, 120)) is second
+    assert len(opened) == 2
+    assert len(registry) == 1
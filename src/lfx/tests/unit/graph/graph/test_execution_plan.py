@@ -0,0 +1,95 @@
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.graph import Graph
+from lfx.graph.graph import utils
+from lfx.graph.graph.execution_plan import ExecutionPlanCache, execution_plan_cache
+
+
+def make_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    return Graph(chat_input, chat_output)
+
+
+def test_sort_vertices_reuses_the_plan_of_an_identical_graph(monkeypatch):
+    execution_plan_cache.clear()
+    calls = []
+    get_sorted_vertices = utils.get_sorted_vertices
+
+    def counting_get_sorted_vertices(*args, **kwargs):
+        calls.append(kwargs.get("start_component_id"))
+        return get_sorted_vertices(*args, **kwargs)
+
+    monkeypatch.setattr("lfx.graph.graph.base.get_sorted_vertices", counting_get_sorted_vertices)
+
+    first_graph = make_graph()
+    first_layer = first_graph.sort_vertices()
+    sorts = len(calls)
+    second_graph = make_graph()
+    assert second_graph.sort_vertices() == first_layer
+    assert second_graph.vertices_layers == first_graph.vertices_layers
+    assert len(calls) == sorts
+
+    # A different start component is a different plan
+    second_graph.sort_vertices(start_component_id="chat_output")
+    assert len(calls) == sorts + 1
+
+
+def test_cached_plan_is_not_shared_with_callers():
+    cache = ExecutionPlanCache()
+    first_layer, remaining_layers = ["a"], [["b"], ["c"]]
+    cache.set("key", first_layer, remaining_layers)
+    remaining_layers.pop()
+
+    plan = cache.get("key")
+    assert plan == (["a"], [["b"], ["c"]])
+    plan[1].pop()
+    assert cache.get("key") == (["a"], [["b"], ["c"]])
+
+
+def test_least_recently_used_plan_is_dropped():
+    cache = ExecutionPlanCache(max_size=2)
+    cache.set("a", ["a"], [])
+    cache.set("b", ["b"], [])
+    cache.get("a")
+    cache.set("c", ["c"], [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (["a"], [])
+    assert len(cache) == 2
+
+
+def test_plan_key_depends_on_topology():
+    def key(successor_map, **kwargs):
+        predecessor_map = {}
+        for source, targets in successor_map.items():
+            for target in targets:
+                predecessor_map.setdefault(target, []).append(source)
+        in_degree_map = {vertex: len(predecessor_map.get(vertex, [])) for vertex in successor_map}
+        return ExecutionPlanCache.make_key(
+            successor_map, in_degree_map, successor_map, predecessor_map, [], is_cyclic=False, **kwargs
+        )
+
+    chain = {"A": ["B"], "B": ["C"], "C": []}
+    assert key(chain) == key({"C": [], "B": ["C"], "A": ["B"]})
+    assert key(chain) != key({"A": ["C"], "B": ["C"], "C": []})
+    assert key(chain) != key(chain, stop_component_id="B")
+    assert key(chain) != key(chain, start_component_id="B")
+
+
+def test_layered_topological_sort_large_fan_in():
+    # A vertex with many predecessors used to make every queue membership check linear
+    sources = [f"source-{i}" for i in range(2000)]
+    successor_map = {source: ["sink"] for source in sources} | {"sink": []}
+    predecessor_map = {"sink": sources} | {source: [] for source in sources}
+    in_degree_map = {source: 0 for source in sources} | {"sink": len(sources)}
+
+    layers = utils.layered_topological_sort(
+        vertices_ids={*sources, "sink"},
+        in_degree_map=in_degree_map,
+        successor_map=successor_map,
+        predecessor_map=predecessor_map,
+    )
+
+    assert sorted(layers[0]) == sorted(sources)
+    assert layers[1:] == [["sink"]]
@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 from langchain_core.documents import Document
 from lfx.schema.data import Data
-from lfx.schema.dataframe import DataFrame
+from lfx.schema.dataframe import DataFrame, DataFrameBuffer, dataframe_to_records
 
 
 @pytest.fixture
@@ -71,3 +71,56 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_records_match_pandas(self):
+        """Test that rows are converted like pandas converts them."""
+        frame = DataFrame(
+            {
+                "text": ["a", "b", None],
+                "count": [1, 2, 3],
+                "score": [0.5, 1.5, 2.5],
+                "flag": [True, False, True],
+                "when": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            }
+        )
+        records = dataframe_to_records(frame)
+        assert records == frame.to_dict(orient="records")
+        assert type(records[0]["count"]) is int
+        assert dataframe_to_records(DataFrame(index=range(2))) == [{}, {}]
+        assert frame.to_data_list()[1] == Data(data=records[1])
+
+    def test_buffer_builds_the_dataframe_once(self, dataframe_with_metadata):
+        """Test that rows appended to a buffer are added to the DataFrame when it is needed."""
+        buffer = DataFrameBuffer(dataframe_with_metadata)
+        buffer.append({"name": "Bob", "text": "name is Bob"})
+        buffer.extend([Data(data={"name": "Alice", "text": "name is Alice"})])
+        assert len(buffer) == 4
+
+        frame = buffer.to_dataframe()
+        assert isinstance(frame, DataFrame)
+        assert frame["name"].tolist() == ["John", "Jane", "Bob", "Alice"]
+        assert buffer.to_dataframe() is frame
+
+        buffer.append({"name": "Eve", "text": "name is Eve"})
+        assert buffer.to_dataframe()["name"].tolist() == ["John", "Jane", "Bob", "Alice", "Eve"]
+        assert frame["name"].tolist() == ["John", "Jane", "Bob", "Alice"]
+
+    def test_empty_buffer(self):
+        """Test that an empty buffer builds an empty DataFrame with its text key."""
+        frame = DataFrameBuffer(text_key="content").to_dataframe()
+        assert isinstance(frame, DataFrame)
+        assert frame.empty
+        assert frame.text_key == "content"
+
+    def test_with_arrow_strings(self):
+        """Test that only text columns are stored as Arrow strings."""
+        pytest.importorskip("pyarrow")
+        frame = DataFrame({"text": ["a", "b", None], "count": [1, 2, 3], "mixed": ["a", 1, None]}, text_key="text")
+        arrow_frame = frame.with_arrow_strings()
+
+        assert str(arrow_frame["text"].dtype) == "string"
+        assert arrow_frame["count"].dtype == frame["count"].dtype
+        assert arrow_frame["mixed"].dtype == object
+        assert arrow_frame.text_key == "text"
+        assert [doc.page_content for doc in arrow_frame.to_lc_documents()[:2]] == ["a", "b"]
+        assert frame["text"].dtype == object
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+
+import numpy as np
+import orjson
+import pandas as pd
+from lfx.schema.data import Data
+from lfx.schema.message import Message
+from lfx.serialization.serialization import (
+    MAX_DEPTH_MARKER,
+    TRUNCATED_KEY,
+    serialize,
+    serialize_to_json,
+)
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Model(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+    point: Point
+    secret: str = Field(default="hidden", exclude=True)
+
+    @computed_field
+    @property
+    def upper_name(self) -> str:
+        return self.name.upper()
+
+
+class ModelWithSerializer(BaseModel):
+    value: int
+
+    @field_serializer("value")
+    def double(self, value: int) -> int:
+        return value * 2
+
+
+class TestPydanticModels:
+    def test_fields_are_read_like_model_dump(self):
+        model = Model(name="test", point=Point(1, 2), extra_field=[1, 2])
+
+        assert serialize(model) == model.model_dump()
+
+    def test_serializers_are_applied(self):
+        assert serialize(ModelWithSerializer(value=2)) == {"value": 4}
+
+    def test_data_and_message(self):
+        data = Data(data={"text": "hello", "nested": {"values": [1, 2, 3]}})
+        message = Message(text="hello", sender="User", sender_name="User")
+
+        assert serialize(data) == data.model_dump()
+        assert serialize(message)["text"] == "hello"
+
+
+class TestBudget:
+    def test_dicts_are_item_limited(self):
+        result = serialize({f"key_{index}": index for index in range(10)}, max_items=3)
+
+        assert list(result) == ["key_0", "key_1", "key_2", TRUNCATED_KEY]
+        assert result[TRUNCATED_KEY] == "[truncated 7 items]"
+
+    def test_max_depth_replaces_deeper_collections(self):
+        nested = {"a": {"b": {"c": {"d": 1}}}, "value": 1}
+
+        result = serialize(nested, max_depth=2)
+
+        assert result == {"a": {"b": MAX_DEPTH_MARKER}, "value": 1}
+
+    def test_max_bytes_stops_descending(self):
+        payload = [{"text": "x" * 100, "index": index} for index in range(1_000)]
+
+        result = serialize(payload, max_bytes=1_000)
+
+        assert len(orjson.dumps(result)) < 2_000
+        assert result[-1].startswith("... [truncated")
+        assert len(result) < 20
+
+    def test_max_bytes_truncates_strings(self):
+        result = serialize({"text": "x" * 1_000}, max_bytes=100)
+
+        assert result["text"].endswith("...")
+        assert len(result["text"]) < 110
+
+    def test_dataframe_only_converts_rows_within_budget(self):
+        frame = pd.DataFrame({"a": range(10_000), "b": ["text"] * 10_000})
+
+        limited = serialize(frame, max_items=300)
+        assert len(limited) == 301
+        assert limited[-1] == "... [truncated 9700 items]"
+        budgeted = serialize(frame, max_bytes=500)
+        assert len(budgeted) < 50
+        assert budgeted[-1] == f"... [truncated {10_000 - len(budgeted) + 1} items]"
+        assert serialize(frame.head(2)) == [{"a": 0, "b": "text"}, {"a": 1, "b": "text"}]
+
+    def test_numpy_arrays_are_item_limited(self):
+        result = serialize(np.arange(10), max_items=4)
+
+        assert result == [0, 1, 2, 3, "... [truncated 6 items]"]
+
+    def test_no_limits_keeps_everything(self):
+        payload = {"values": list(range(5_000)), "text": "x" * 10_000}
+
+        assert serialize(payload) == payload
+
+
+class TestSerializeToJson:
+    def test_returns_json_bytes(self):
+        payload = {"frame": pd.DataFrame({"a": [1, 2]}), 1: np.float32(0.5), "complex": 1 + 2j}
+
+        assert orjson.loads(serialize_to_json(payload)) == {
+            "frame": [{"a": 1}, {"a": 2}],
+            "1": 0.5,
+            "complex": "(1+2j)",
+        }
+
+    def test_applies_limits(self):
+        result = orjson.loads(serialize_to_json({"values": list(range(100))}, max_items=2))
+
+        assert result == {"values": [0, 1, "... [truncated 98 items]"]}
+
+    def test_falls_back_for_large_integers(self):
+        assert orjson.loads(serialize_to_json({"value": 2**70})) == {"value": 2**70}
+
+    def test_serializes_unknown_objects_as_strings(self):
+        class Custom:
+            def __str__(self) -> str:
+                return "custom"
+
+        assert serialize_to_json(Custom()) == b'"custom"'
@@ -0,0 +1,109 @@
+"""Tests for the pooled HTTP client service."""
+
+import asyncio
+
+import httpx
+from lfx.services.http_client.service import HostLimitedTransport, HTTPClientService
+
+
+async def test_get_client_is_shared_within_a_loop():
+    service = HTTPClientService()
+    try:
+        client = service.get_client()
+        assert service.get_client() is client
+        assert not client.is_closed
+    finally:
+        await service.teardown()
+    assert client.is_closed
+
+
+def test_get_client_is_per_event_loop():
+    service = HTTPClientService()
+
+    async def get_client():
+        return service.get_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+
+
+async def test_recreates_closed_client():
+    service = HTTPClientService()
+    client = service.get_client()
+    await client.aclose()
+    try:
+        assert service.get_client() is not client
+    finally:
+        await service.teardown()
+
+
+async def test_cookies_are_not_persisted():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"set-cookie": "session=secret; Path=/"}, request=request)
+
+    service = HTTPClientService()
+    client = service.get_client()
+    client._transport = HostLimitedTransport(httpx.MockTransport(handler), 2)
+    try:
+        await client.get("https://example.com/")
+        assert not client.cookies
+    finally:
+        await service.teardown()
+
+
+async def test_host_limited_transport_caps_in_flight_requests():
+    in_flight = {"example.com": 0, "other.com": 0}
+    peak = dict.fromkeys(in_flight, 0)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(
+            *(client.get(f"https://{host}/") for host in ("example.com", "other.com") for _ in range(6))
+        )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert peak == {"example.com": 2, "other.com": 2}
+
+
+async def test_host_limited_transport_releases_slot_on_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("boom", request=request)
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=1)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(3):
+            try:
+                await client.get("https://example.com/")
+            except httpx.ConnectError:
+                pass
+        # A leaked slot would block this request forever
+        transport._transport = httpx.MockTransport(lambda request: httpx.Response(200, request=request))
+        response = await asyncio.wait_for(client.get("https://example.com/"), timeout=1)
+    assert response.status_code == 200
+
+
+async def test_host_limited_transport_holds_slot_while_streaming():
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b"chunk"
+
+    transport = HostLimitedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, stream=Body(), request=request)), max_per_host=1
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://example.com/") as response:
+            second = asyncio.ensure_future(client.get("https://example.com/"))
+            await asyncio.sleep(0.01)
+            assert not second.done()
+            await response.aread()
+        response = await asyncio.wait_for(second, timeout=1)
+    assert response.content == b"chunk"
@@ -2,15 +2,22 @@
 
 import hashlib
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import orjson
 import pytest
+from lfx.interface.component_index_builder import build_component_modules, hash_module_files
+from lfx.interface.component_index_mmap import MappedComponentIndex, write_mapped_component_index
 from lfx.interface.components import (
+    ComponentCache,
     _get_cache_path,
+    _load_mapped_component_index,
     _parse_dev_mode,
     _read_component_index,
     _save_generated_index,
+    cache_component_types,
+    component_cache,
+    get_and_cache_all_types_dict,
     import_langflow_components,
 )
 
@@ -413,3 +420,302 @@ class TestImportLangflowComponents:
         # Should return empty dict, not raise
         assert "components" in result
         assert len(result["components"]) == 0
+
+
+class TestMappedComponentIndex:
+    """Tests for the memory-mapped component index."""
+
+    @pytest.fixture
+    def modules_dict(self):
+        return {
+            "category1": {
+                "comp1": {"display_name": "Component 1", "template": {"code": {"value": "x"}}},
+                "comp2": {"display_name": "Component 2", "template": {}},
+            },
+            "category2": {"comp3": {"display_name": "Component 3", "template": {}}},
+        }
+
+    def test_round_trip(self, tmp_path, modules_dict):
+        """Test that the mapped index returns the same templates that were written."""
+        index_path = tmp_path / "index.lfxidx"
+        write_mapped_component_index(modules_dict, index_path, "0.1.12")
+
+        mapped = MappedComponentIndex(index_path)
+        result = mapped.modules_dict()
+
+        assert mapped.version == "0.1.12"
+        assert len(mapped) == 2
+        assert mapped.num_components == 3
+        assert list(result) == ["category1", "category2"]
+        assert result == modules_dict
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_categories_are_plain_dicts(self, tmp_path, modules_dict):
+        """Test that categories serialize completely, like the dicts built from the JSON index."""
+        import json
+
+        index_path = tmp_path / "index.lfxidx"
+        write_mapped_component_index(modules_dict, index_path, "0.1.12")
+        result = MappedComponentIndex(index_path).modules_dict()
+
+        assert all(type(category) is dict for category in result.values())
+        assert orjson.loads(orjson.dumps({"components": result})) == {"components": modules_dict}
+        assert json.loads(json.dumps(result)) == modules_dict
+
+    def test_category_is_decoded_on_its_own(self, tmp_path, modules_dict):
+        """Test that a single category can be decoded without the others."""
+        index_path = tmp_path / "index.lfxidx"
+        write_mapped_component_index(modules_dict, index_path, "0.1.12")
+        mapped = MappedComponentIndex(index_path)
+
+        assert list(mapped.categories) == ["category1", "category2"]
+        assert mapped.category("category2") == modules_dict["category2"]
+
+    def test_tampered_file_raises(self, tmp_path, modules_dict):
+        """Test that a file whose data does not match its SHA256 is rejected."""
+        index_path = tmp_path / "index.lfxidx"
+        write_mapped_component_index(modules_dict, index_path, "0.1.12")
+        content = index_path.read_bytes()
+        index_path.write_bytes(content.replace(b"Component 1", b"Component X"))
+
+        with pytest.raises(ValueError, match="integrity check"):
+            MappedComponentIndex(index_path)
+
+    def test_invalid_file_raises(self, tmp_path):
+        """Test that files without the expected header are rejected."""
+        index_path = tmp_path / "index.lfxidx"
+        index_path.write_bytes(b"not an index file")
+
+        with pytest.raises(ValueError, match="Invalid component index file"):
+            MappedComponentIndex(index_path)
+
+    def test_load_mapped_index_builds_once(self, tmp_path, monkeypatch):
+        """Test that the JSON index is only parsed when building the mapped copy."""
+        index = {
+            "version": "0.1.12",
+            "entries": [["category1", {"comp1": {"template": {}}}]],
+        }
+        payload = orjson.dumps(index, option=orjson.OPT_SORT_KEYS)
+        index["sha256"] = hashlib.sha256(payload).hexdigest()
+        custom_file = tmp_path / "custom_index.json"
+        custom_file.write_bytes(orjson.dumps(index))
+        monkeypatch.setattr("lfx.interface.components._get_cache_path", lambda: tmp_path / "cache" / "index.json")
+
+        with (
+            patch("lfx.interface.components._read_component_index", wraps=_read_component_index) as mock_read,
+            patch("importlib.metadata.version", return_value="0.1.12"),
+        ):
+            first = _load_mapped_component_index(str(custom_file))
+            second = _load_mapped_component_index(str(custom_file))
+
+        # The process that builds the copy keeps the dict it has, later ones map the copy
+        assert first == {"category1": {"comp1": {"template": {}}}}
+        assert isinstance(second, MappedComponentIndex)
+        assert second.modules_dict() == first
+        assert mock_read.call_count == 1
+        assert len(list((tmp_path / "cache").glob("*.lfxidx"))) == 1
+
+    def test_load_mapped_index_rebuilds_tampered_copy(self, tmp_path, monkeypatch):
+        """Test that a mapped copy failing its integrity check is rebuilt from the verified JSON index."""
+        index = {
+            "version": "0.1.12",
+            "entries": [["category1", {"comp1": {"display_name": "Component 1"}}]],
+        }
+        payload = orjson.dumps(index, option=orjson.OPT_SORT_KEYS)
+        index["sha256"] = hashlib.sha256(payload).hexdigest()
+        custom_file = tmp_path / "custom_index.json"
+        custom_file.write_bytes(orjson.dumps(index))
+        monkeypatch.setattr("lfx.interface.components._get_cache_path", lambda: tmp_path / "cache" / "index.json")
+
+        with patch("importlib.metadata.version", return_value="0.1.12"):
+            _load_mapped_component_index(str(custom_file))
+            (mapped_path,) = (tmp_path / "cache").glob("*.lfxidx")
+            mapped_path.write_bytes(mapped_path.read_bytes().replace(b"Component 1", b"Component X"))
+            result = _load_mapped_component_index(str(custom_file))
+
+        assert result == {"category1": {"comp1": {"display_name": "Component 1"}}}
+        MappedComponentIndex(mapped_path)
+
+    def test_load_mapped_index_without_langflow(self, tmp_path, monkeypatch):
+        """Test that the mapped copy is built and reused in an install of lfx without langflow."""
+        from importlib.metadata import PackageNotFoundError
+
+        index = {"version": "1.7.0", "entries": [["category1", {"comp1": {"template": {}}}]]}
+        payload = orjson.dumps(index, option=orjson.OPT_SORT_KEYS)
+        index["sha256"] = hashlib.sha256(payload).hexdigest()
+        custom_file = tmp_path / "custom_index.json"
+        custom_file.write_bytes(orjson.dumps(index))
+        monkeypatch.setattr("lfx.interface.components._get_cache_path", lambda: tmp_path / "cache" / "index.json")
+
+        def lfx_only_version(package):
+            if package == "lfx":
+                return "0.2.0"
+            raise PackageNotFoundError(package)
+
+        with patch("importlib.metadata.version", side_effect=lfx_only_version):
+            _load_mapped_component_index(str(custom_file))
+            mapped = _load_mapped_component_index(str(custom_file))
+
+        assert isinstance(mapped, MappedComponentIndex)
+        assert mapped.version == "0.2.0"
+
+    def test_load_mapped_index_skips_urls(self):
+        """Test that URL sources are not memory-mapped."""
+        assert _load_mapped_component_index("https://example.com/index.json") is None
+
+
+class TestComponentCacheCategories:
+    """Tests for decoding the categories of a mapped index through the component cache."""
+
+    @pytest.fixture
+    def mapped_index(self, tmp_path):
+        index_path = tmp_path / "index.lfxidx"
+        write_mapped_component_index(
+            {
+                "category1": {"comp1": {"display_name": "Component 1"}},
+                "category2": {"comp2": {"display_name": "Component 2"}},
+                "custom": {"builtin": {"display_name": "Built-in"}},
+            },
+            index_path,
+            "0.1.12",
+        )
+        return MappedComponentIndex(index_path)
+
+    @pytest.fixture
+    def settings_service(self):
+        settings_service = Mock()
+        settings_service.settings.lazy_load_components = False
+        settings_service.settings.components_path = []
+        return settings_service
+
+    @pytest.fixture(autouse=True)
+    def clear_component_cache(self):
+        yield
+        component_cache.all_types_dict = None
+        component_cache.mapped_index = None
+
+    def test_category_is_decoded_on_first_access(self, mapped_index):
+        """Test that only the categories asked for are decoded, once each."""
+        cache = ComponentCache()
+        cache.all_types_dict = {}
+        cache.mapped_index = mapped_index
+
+        with patch.object(mapped_index, "category", wraps=mapped_index.category) as mock_category:
+            first = cache.get_category("category2")
+            second = cache.get_category("category2")
+
+        assert first is second
+        assert first == {"comp2": {"display_name": "Component 2"}}
+        mock_category.assert_called_once_with("category2")
+        assert list(cache.all_types_dict) == ["category2"]
+        assert cache.get_category("missing") is None
+
+    def test_load_all_categories_keeps_custom_overrides(self, mapped_index):
+        """Test that loading every category keeps the built-in order and the custom categories overriding them."""
+        cache = ComponentCache()
+        cache.all_types_dict = {"custom": {"mine": {}}, "extra": {"other": {}}}
+        cache.mapped_index = mapped_index
+        cache.get_category("category2")
+
+        result = cache.load_all_categories()
+
+        assert list(result) == ["category1", "category2", "custom", "extra"]
+        assert result["custom"] == {"mine": {}}
+        assert result["category1"] == {"comp1": {"display_name": "Component 1"}}
+        assert cache.mapped_index is None
+
+    @pytest.mark.asyncio
+    async def test_cache_component_types_keeps_mapped_index(self, mapped_index, settings_service):
+        """Test that caching the component types does not decode the categories of a mapped index."""
+        with (
+            patch(
+                "lfx.interface.components._import_langflow_components",
+                new=AsyncMock(return_value=mapped_index),
+            ),
+            patch.object(mapped_index, "category", wraps=mapped_index.category) as mock_category,
+        ):
+            await cache_component_types(settings_service)
+            assert component_cache.all_types_dict == {}
+            assert mock_category.call_count == 0
+
+            all_types = await get_and_cache_all_types_dict(settings_service)
+
+        assert mock_category.call_count == 3
+        assert all_types == mapped_index.modules_dict()
+
+
+class TestComponentIndexBuilder:
+    """Tests for the incremental component index build."""
+
+    @pytest.fixture
+    def module_paths(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("lfx.interface.components._get_cache_path", lambda: tmp_path / "cache" / "index.json")
+        paths = {}
+        for name in ("mod_a", "mod_b"):
+            path = tmp_path / f"{name}.py"
+            path.write_text(f"# {name}")
+            paths[f"lfx.components.{name}"] = path
+        return paths
+
+    @staticmethod
+    def _fake_process(modname):
+        return (modname.rsplit(".", 1)[-1], {modname: {"template": {}}})
+
+    @pytest.mark.asyncio
+    async def test_unchanged_modules_are_reused(self, module_paths):
+        """Test that a second build only rebuilds modules whose source changed."""
+        with patch("lfx.interface.components._process_single_module", side_effect=self._fake_process) as mock_process:
+            first = await build_component_modules(module_paths)
+            assert mock_process.call_count == 2
+
+            module_paths["lfx.components.mod_b"].write_text("# changed")
+            second = await build_component_modules(module_paths)
+
+        assert mock_process.call_count == 3
+        assert mock_process.call_args.args == ("lfx.components.mod_b",)
+        assert first == second
+        assert list(second) == list(module_paths)
+
+    @pytest.mark.asyncio
+    async def test_failed_modules_are_not_cached(self, module_paths):
+        """Test that modules that failed to build are retried on the next build."""
+        with patch("lfx.interface.components._process_single_module", return_value=None) as mock_process:
+            await build_component_modules(module_paths)
+            await build_component_modules(module_paths)
+
+        assert mock_process.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_modules_importing_a_changed_module_are_rebuilt(self, module_paths):
+        """Test that a module is rebuilt when a component module it imports changes."""
+        module_paths["lfx.components.mod_b"].write_text("from lfx.components.mod_a import ComponentA\n")
+        with patch("lfx.interface.components._process_single_module", side_effect=self._fake_process) as mock_process:
+            await build_component_modules(module_paths)
+            module_paths["lfx.components.mod_a"].write_text("# changed")
+            await build_component_modules(module_paths)
+
+        rebuilt = [call.args[0] for call in mock_process.call_args_list[2:]]
+        assert sorted(rebuilt) == ["lfx.components.mod_a", "lfx.components.mod_b"]
+
+    def test_hash_covers_relative_and_transitive_imports(self, tmp_path):
+        """Test that relative imports resolve and imports of imported modules are folded in too."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        paths = {
+            "lfx.components.pkg": package / "__init__.py",
+            "lfx.components.pkg.base": package / "base.py",
+            "lfx.components.pkg.middle": package / "middle.py",
+            "lfx.components.pkg.leaf": package / "leaf.py",
+        }
+        paths["lfx.components.pkg"].write_text("")
+        paths["lfx.components.pkg.base"].write_text("class Base: ...\n")
+        paths["lfx.components.pkg.middle"].write_text("from .base import Base\n")
+        paths["lfx.components.pkg.leaf"].write_text("from lfx.components.pkg import middle\n")
+
+        before = hash_module_files(paths)
+        paths["lfx.components.pkg.base"].write_text("class Base:\n    changed = True\n")
+        after = hash_module_files(paths)
+
+        assert after["lfx.components.pkg.middle"] != before["lfx.components.pkg.middle"]
+        assert after["lfx.components.pkg.leaf"] != before["lfx.components.pkg.leaf"]
+        assert after["lfx.components.pkg"] == before["lfx.components.pkg"]
@@ -0,0 +1,33 @@
+"""Test the helper utility functions."""
+
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+from lfx.utils.helpers import ATOMIC_WRITE_MODE, write_bytes_atomic
+
+
+class TestWriteBytesAtomic:
+    """Test the write_bytes_atomic function."""
+
+    def test_writes_and_replaces_file(self, tmp_path):
+        """Test that the file is written, replaced and no temporary file is left."""
+        path = tmp_path / "nested" / "file.bin"
+
+        write_bytes_atomic(path, b"first")
+        write_bytes_atomic(path, b"second")
+
+        assert path.read_bytes() == b"second"
+        assert [file.name for file in path.parent.iterdir()] == ["file.bin"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_sets_fixed_mode_without_touching_umask(self, tmp_path):
+        """Test that the file gets a fixed mode and the umask of the process is never changed."""
+        path = tmp_path / "file.bin"
+
+        with patch.object(os, "umask", side_effect=AssertionError("umask changed")):
+            write_bytes_atomic(path, b"data")
+
+        assert stat.S_IMODE(path.stat().st_mode) == ATOMIC_WRITE_MODE